@@ -1,15 +1,20 @@
 from __future__ import annotations  # 타입 힌트 전방 참조 허용.
 
 import argparse  # CLI 인자 파싱.
+import json  # 조회 결과 출력.
 import logging  # 로깅.
 import sys  # 종료 코드.
 import time  # interval 모드 대기.
+from datetime import datetime, timedelta  # 조회 날짜 범위.
+from pathlib import Path  # 재처리 출력 경로.
+from typing import Optional  # 타입 힌트.
 
-from src.core.config import load_config  # 설정 로더.
+from src.core.config import AppConfig, load_config  # 설정 로더.
 from src.core.logging import setup_logging  # 로깅 설정.
-from src.infrastructure.browser import BrowserController  # 브라우저 컨트롤러.
+from src.infrastructure.browser import BrowserSlot  # 브라우저(건강 확인/교체).
 from src.infrastructure.checkpoint import CheckpointStore  # 체크포인트.
 from src.infrastructure.parser import NoticeParser  # 파서.
+from src.infrastructure.query import NoticeQuery  # 조회 조건.
 from src.infrastructure.repository import NoticeRepository  # 저장소.
 from src.service.crawler_service import CrawlerService  # 서비스.
 
@@ -27,6 +32,39 @@ def parse_args() -> argparse.Namespace:  # CLI 인자 파싱 함수.
         help="필터: knd=실공고,stts=등록공고,pgst=입찰개시",
     )
     parser.add_argument("-r", "--reset", action="store_true")  # 체크포인트 초기화.
+    parser.add_argument(
+        "--drain-retries",
+        action="store_true",
+        help="페이지 수집 없이 재시도 대기열(crawl.retry_queue_path)의 보강 호출만 처리",
+    )
+    sub = parser.add_subparsers(dest="command")  # 하위 명령(없으면 수집).
+    query = sub.add_parser("query", help="수집된 목록 공고 조회(JSON Lines 출력)")
+    query.add_argument("--key", default=None, help="입찰공고번호(bid_pbanc_no)")
+    query.add_argument("--agency", default=None, help="기관명(grp_nm) 정확히 일치")
+    query.add_argument("--inst", default=None, help="기관 식별자(pbanc_inst_unty_grp_no)")
+    query.add_argument("--posted-from", default=None, help="게시일 시작(YYYYMMDD)")
+    query.add_argument("--posted-to", default=None, help="게시일 끝(YYYYMMDD, 포함)")
+    query.add_argument("--closing-from", default=None, help="마감일 시작(YYYYMMDD)")
+    query.add_argument("--closing-to", default=None, help="마감일 끝(YYYYMMDD, 포함)")
+    query.add_argument("--closing-within", type=int, default=None, help="지금부터 N일 안에 마감")
+    query.add_argument("--open", action="store_true", help="마감 전 공고만")
+    query.add_argument("--knd", default=None, help="공고종류: 실공고/모의공고 또는 코드")
+    query.add_argument("--stts", default=None, help="공고구분: 등록공고/변경공고/... 또는 코드")
+    query.add_argument("--pgst", default=None, help="진행상태: 입찰개시/개찰완료/... 또는 코드")
+    query.add_argument("--order", choices=["closing", "posted"], default="closing")
+    query.add_argument("--limit", type=int, default=50, help="페이지 크기")
+    query.add_argument("--cursor", default=None, help="이전 조회의 next_cursor(JSON)")
+    query.add_argument("--all", action="store_true", help="모든 페이지 출력")
+    query.add_argument("--reindex", action="store_true", help="누적 목록에서 조회 색인 재구성")
+    search = sub.add_parser("search", help="공고명/공지/첨부 파일명 전문 검색(관련도 순 공고 키)")
+    search.add_argument("text", help="검색어(공백으로 나눈 단어는 모두 포함)")
+    search.add_argument("--limit", type=int, default=20, help="최대 공고 수")
+    search.add_argument("--reindex", action="store_true", help="누적 목록/첨부에서 빠진 검색 문서 채우기")
+    reprocess = sub.add_parser("reprocess", help="스냅샷 보관소에서 네트워크 없이 새 저장소 재구성")
+    reprocess.add_argument("output", help="새 저장소 디렉터리(비어 있어야 함)")
+    reprocess.add_argument("--snapshot-dir", default=None, help="스냅샷 경로(기본: crawl.snapshot_dir)")
+    reprocess.add_argument("--workers", type=int, default=None, help="워커 프로세스 수(기본: CPU 수)")
+    reprocess.add_argument("--chunk-pages", type=int, default=32, help="워커 한 번에 넘길 목록 페이지 수")
     return parser.parse_args()  # 파싱 결과 반환.
 
 
@@ -96,12 +134,135 @@ def parse_filter(value: str, logger: logging.Logger) -> dict[str, str]:
     return result
 
 
+def parse_day(value: Optional[str], logger: logging.Logger, inclusive_end: bool = False) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        day = datetime.strptime(value, "%Y%m%d")
+    except ValueError:
+        logger.error("날짜 형식 오류: %s (예: 20260206)", value)
+        sys.exit(2)
+    return day + timedelta(days=1) if inclusive_end else day
+
+
+def build_query(args: argparse.Namespace, logger: logging.Logger) -> NoticeQuery:
+    codes: dict[str, Optional[str]] = {}
+    for name, value, mapping in (
+        ("knd", args.knd, KND_MAP),
+        ("stts", args.stts, STTS_MAP),
+        ("pgst", args.pgst, PGST_MAP),
+    ):
+        codes[name] = None
+        if value:
+            codes[name] = normalize_filter_value(value, mapping)
+            if not codes[name]:
+                logger.error("%s 값 오류: %s (가능: %s)", name, value, ", ".join(mapping.keys()))
+                sys.exit(2)
+    now = datetime.now()
+    closing_from = parse_day(args.closing_from, logger)
+    closing_to = parse_day(args.closing_to, logger, inclusive_end=True)
+    if args.open or args.closing_within is not None:
+        closing_from = max(closing_from, now) if closing_from else now
+    if args.closing_within is not None:
+        closing_to = now + timedelta(days=args.closing_within)
+    return NoticeQuery(
+        bid_pbanc_no=args.key,
+        grp_nm=args.agency,
+        pbanc_inst_unty_grp_no=args.inst,
+        posted_from=parse_day(args.posted_from, logger),
+        posted_to=parse_day(args.posted_to, logger, inclusive_end=True),
+        closing_from=closing_from,
+        closing_to=closing_to,
+        pbanc_knd_cd=codes["knd"],
+        pbanc_stts_cd=codes["stts"],
+        bid_pbanc_pgst_cd=codes["pgst"],
+        order_by="slpr_rcpt_ddln_dt" if args.order == "closing" else "pbanc_pstg_dt",
+    )
+
+
+def run_query(args: argparse.Namespace, repo: NoticeRepository, logger: logging.Logger) -> None:
+    if args.reindex:
+        repo.reindex()
+    query = build_query(args, logger)
+    started = time.perf_counter()
+    if args.all:
+        count = 0
+        for row in repo.iter_notices(query, args.limit):
+            print(json.dumps(row, ensure_ascii=False))
+            count += 1
+        logger.info("조회 완료 건수=%s 소요=%.1fms", count, (time.perf_counter() - started) * 1000)
+        return
+    cursor = tuple(json.loads(args.cursor)) if args.cursor else None
+    page = repo.query(query, args.limit, cursor)  # type: ignore[arg-type]
+    for row in page.rows:
+        print(json.dumps(row, ensure_ascii=False))
+    logger.info("조회 완료 건수=%s 소요=%.1fms", len(page.rows), (time.perf_counter() - started) * 1000)
+    if page.next_cursor is not None:
+        logger.info("다음 페이지: --cursor '%s'", json.dumps(page.next_cursor, ensure_ascii=False))
+
+
+def run_search(args: argparse.Namespace, repo: NoticeRepository, logger: logging.Logger) -> None:
+    if args.reindex:
+        repo.reindex_search()
+    started = time.perf_counter()
+    hits = repo.search(args.text, args.limit)
+    for hit in hits:
+        print(
+            json.dumps(
+                {
+                    "bid_pbanc_no": hit.bid_pbanc_no,
+                    "bid_pbanc_ord": hit.bid_pbanc_ord,
+                    "score": round(hit.score, 4),
+                    "sources": list(hit.sources),
+                },
+                ensure_ascii=False,
+            )
+        )
+    logger.info("검색 완료 건수=%s 소요=%.1fms", len(hits), (time.perf_counter() - started) * 1000)
+
+
+def run_reprocess(args: argparse.Namespace, config: AppConfig, logger: logging.Logger) -> None:
+    output = Path(args.output)
+    if output.exists() and any(output.iterdir()):
+        logger.error("재처리 출력 디렉터리가 비어 있지 않습니다: %s", output)
+        sys.exit(2)
+    crawl = config.crawl.model_copy(
+        update={"snapshot_enabled": False, "watchlist_path": None, "retry_queue_path": None}
+    )
+    storage = config.storage.model_copy(update={"stream_target": None})  # 재구성 행은 실시간 소비자에게 보내지 않는다.
+    repo = NoticeRepository(str(output / Path(config.sqlite_path).name), storage)
+    checkpoint = CheckpointStore(str(output / "checkpoint.json"))  # 재처리는 체크포인트를 쓰지 않는다.
+    service = CrawlerService(crawl, repo, NoticeParser(crawl.selectors), checkpoint)
+    started = time.perf_counter()
+    try:
+        result = service.reprocess(args.snapshot_dir or config.crawl.snapshot_dir, args.workers, args.chunk_pages)
+        repo.end_run()
+    finally:
+        service.close()
+        repo.close()
+    logger.info("재처리 결과=%s 소요=%.1fs", result, time.perf_counter() - started)
+
+
 def main() -> None:  # 메인 진입점.
     args = parse_args()  # 인자 파싱.
     config = load_config(args.config)  # 설정 로드.
     setup_logging(config.log_level)  # 로깅 설정 적용.
     logger = logging.getLogger("main")  # 로거 생성.
 
+    if args.command in ("query", "search"):  # 조회/검색은 브라우저 없이 저장소만 연다.
+        repo = NoticeRepository(config.sqlite_path, config.storage)
+        try:
+            if args.command == "query":
+                run_query(args, repo, logger)
+            else:
+                run_search(args, repo, logger)
+        finally:
+            repo.close()
+        return
+    if args.command == "reprocess":  # 재처리도 브라우저 없이 스냅샷만 읽는다.
+        run_reprocess(args, config, logger)
+        return
+
     filters = parse_filter(args.filter, logger)
     if "pbancKndCd" in filters:
         config.crawl.list_api_payload["pbancKndCd"] = filters["pbancKndCd"]
@@ -116,30 +277,48 @@ def main() -> None:  # 메인 진입점.
         config.crawl.list_filter_bid_pbanc_pgst_cd = filters["bidPbancPgstCd"]
         logger.info("CLI 필터 적용: 진행상태=%s", filters["bidPbancPgstCd"])
 
-    repo = NoticeRepository(config.sqlite_path)  # 저장소 초기화.
+    repo = NoticeRepository(config.sqlite_path, config.storage)  # 저장소 초기화.
     parser = NoticeParser(config.crawl.selectors)  # 파서 초기화.
-    checkpoint = CheckpointStore(config.checkpoint_path)  # 체크포인트 저장소.
+    checkpoint = CheckpointStore(config.checkpoint_path, stale_days=config.checkpoint_stale_days)  # 체크포인트 저장소.
     service = CrawlerService(config.crawl, repo, parser, checkpoint)  # 서비스 초기화.
 
-    with BrowserController(config.crawl) as browser:  # 브라우저 컨텍스트 시작.
-        page = browser.new_page()  # 새 페이지 생성.
+    with BrowserSlot(config.crawl) as browser:  # 실행마다 건강한 페이지를 받는다(요청 수/오류/메모리로 교체).
         try:
+            if args.drain_retries:  # 대기열만 처리(다음 시도 시각을 기다리지 않음).
+                if not config.crawl.retry_queue_path:
+                    logger.warning("crawl.retry_queue_path가 설정되지 않아 처리할 대기열이 없습니다.")
+                result = browser.run(lambda page: service.drain_retries(page, due_only=False))
+                repo.end_run()
+                logger.info("재시도 대기열 처리 결과=%s", result)
+                return
             if args.mode == "once":  # 단발 실행.
                 if args.reset:
-                    checkpoint.clear()
+                    service.walk_checkpoint().clear()  # 현재 수집 조건의 진행만 지운다.
                     logger.info("체크포인트 초기화")
-                service.run(page, args.pages)  # 크롤링 실행.
+                browser.run(lambda page: service.run(page, args.pages, browser.renew))  # 크롤링 실행.
+                repo.end_run()  # 실행 단위 산출물 확정.
             else:  # interval 실행.
                 while True:  # 반복 실행.
                     logger.info("주기 실행 시작")  # 시작 로그.
                     if args.reset:
-                        checkpoint.clear()
+                        service.walk_checkpoint().clear()
                         logger.info("체크포인트 초기화")
-                    service.run(page, args.pages)  # 크롤링 실행.
+                    try:
+                        browser.run(lambda page: service.run(page, args.pages, browser.renew))  # 크롤링 실행.
+                    except Exception:  # 한 주기가 실패해도 브라우저를 교체하며 다음 주기로 넘어간다.
+                        logger.exception("주기 실행 실패")
+                    repo.end_run()  # 실행 단위 산출물 확정.
+                    logger.info("브라우저 상태=%s", browser.stats())
                     logger.info("주기 대기=%s초", args.interval)  # 대기 로그.
                     time.sleep(args.interval)  # 설정된 시간만큼 대기.
         except KeyboardInterrupt:
             logger.info("사용자 중단(Ctrl+C)으로 종료합니다.")
+        finally:
+            service.close()  # 헤지 작업 스레드 정리.
+            try:
+                repo.end_run()  # 중단/실패해도 이미 저장한 행은 표시용 CSV/Parquet에 반영한다.
+            finally:
+                repo.close()  # 키 인덱스 등 저장소 자원 정리.
 
 
 if __name__ == "__main__":  # 스크립트 직접 실행 시.
@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.core.config import CrawlConfig, Selectors, StorageConfig
+from src.domain.models import BidNoticeListItem
+from src.infrastructure.bloom import BloomFilter, BloomFilteredKeys
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.key_index import KeyIndex
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.query import INDEX_COLUMNS, NoticeIndex, NoticeQuery
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.search import NoticeSearch
+from src.infrastructure.snapshot import SnapshotStore
+from src.infrastructure.watchlist import KeywordAutomaton
+from src.service.crawler_service import CrawlerService
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Storage/dedupe micro benchmarks.")
+    sub = parser.add_subparsers(dest="suite", required=True)
+    dedupe = sub.add_parser("dedupe", help="Seen-key memory and lookup throughput")
+    dedupe.add_argument("--keys", type=int, default=200_000)
+    dedupe.add_argument("--fp-rate", type=float, default=0.01)
+    dedupe.add_argument("--lookups", type=int, default=50_000)
+    write = sub.add_parser("write", help="CSV write throughput per writer mode")
+    write.add_argument("--rows", type=int, default=50_000)
+    write.add_argument("--page-size", type=int, default=10)
+    write.add_argument("--group-commit-rows", type=int, default=1_000)
+    query = sub.add_parser("query", help="Indexed notice query latency")
+    query.add_argument("--rows", type=int, default=1_000_000)
+    query.add_argument("--agencies", type=int, default=2_000)
+    search = sub.add_parser("search", help="Full-text search latency (FTS5, 2-gram)")
+    search.add_argument("--rows", type=int, default=200_000)
+    watchlist = sub.add_parser("watchlist", help="Keyword watchlist matching throughput")
+    watchlist.add_argument("--patterns", type=int, default=10_000)
+    watchlist.add_argument("--rows", type=int, default=100_000)
+    watchlist.add_argument("--naive-rows", type=int, default=2_000)
+    reprocess = sub.add_parser("reprocess", help="Snapshot archive reprocessing throughput per worker count")
+    reprocess.add_argument("--pages", type=int, default=2_000)
+    reprocess.add_argument("--workers", type=int, default=4)
+    return parser.parse_args()
+
+
+def _make_keys(count: int, offset: int = 0) -> list[tuple[str, str]]:
+    return [(f"R26BK{index + offset:08d}", f"{index % 3:03d}") for index in range(count)]
+
+
+def _rate(count: int, func: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    return count / elapsed if elapsed > 0 else float("inf")
+
+
+def _per_million(value: float, count: int) -> float:
+    return value * 1_000_000 / count
+
+
+def bench_dedupe(args: argparse.Namespace) -> dict[str, Any]:
+    keys = _make_keys(args.keys)
+    misses = _make_keys(args.lookups, offset=args.keys * 10)
+    hits = random.sample(keys, min(args.lookups, len(keys)))
+
+    tracemalloc.start()
+    seen = set(_make_keys(args.keys))  # CSV에서 읽은 것처럼 문자열/튜플을 새로 만든다.
+    set_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bloom = BloomFilter(args.keys, args.fp_rate)
+    bloom.update(keys)
+    false_positives = sum(1 for key in misses if key in bloom)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        index = KeyIndex(str(tmp_path / "bench.db"))
+        indexed = index.table("bench", ("bid_pbanc_no", "bid_pbanc_ord"), tmp_path / "bench.csv")
+        for key in keys:
+            indexed.add(key)
+        indexed.commit()
+        filtered = BloomFilteredKeys(indexed, tmp_path / "bench.bloom", args.keys, args.fp_rate)
+        db_bytes = sum(path.stat().st_size for path in tmp_path.glob("bench.db*"))
+        result = {
+            "keys": args.keys,
+            "memory_bytes_per_million": {
+                "set": round(_per_million(set_bytes, args.keys)),
+                "bloom": round(_per_million(bloom.size_bytes, args.keys)),
+                "sqlite_on_disk": round(_per_million(db_bytes, args.keys)),
+            },
+            "bloom_false_positive_rate": false_positives / len(misses),
+            "lookups_per_sec": {
+                "set_miss": round(_rate(len(misses), lambda: [key in seen for key in misses])),
+                "sqlite_miss": round(_rate(len(misses), lambda: [key in indexed for key in misses])),
+                "bloom_sqlite_miss": round(_rate(len(misses), lambda: [key in filtered for key in misses])),
+                "sqlite_hit": round(_rate(len(hits), lambda: [key in indexed for key in hits])),
+                "bloom_sqlite_hit": round(_rate(len(hits), lambda: [key in filtered for key in hits])),
+            },
+        }
+        index.close()
+    return result
+
+
+def _make_list_items(count: int) -> list[BidNoticeListItem]:
+    return [
+        BidNoticeListItem(
+            bid_pbanc_no=f"R26BK{index:08d}",
+            bid_pbanc_ord="000",
+            bid_pbanc_nm=f"벤치마크 공고 {index}",
+            bid_pbanc_num=f"R26BK{index:08d}-000",
+            pbanc_stts_cd="공400001",
+            pbanc_stts_cd_nm="등록공고",
+            prcm_bsne_se_cd="A",
+            prcm_bsne_se_cd_nm="용역",
+            bid_mthd_cd="B",
+            bid_mthd_cd_nm="일반경쟁",
+            std_ctrt_mthd_cd="C",
+            std_ctrt_mthd_cd_nm="일반",
+            scsbd_mthd_cd="D",
+            scsbd_mthd_cd_nm="적격심사",
+            grp_nm="벤치마크기관",
+            pbanc_pstg_dt="2026/02/06 19:11",
+            slpr_rcpt_ddln_dt="2026/02/07 10:00",
+            pbanc_knd_cd="공440002",
+            pbanc_knd_cd_nm="실공고",
+            pbanc_stts_grid_cd_nm="입찰개시",
+            row_num=index % 10 + 1,
+            tot_cnt=count,
+            current_page=index // 10 + 1,
+            record_count_per_page=10,
+            next_row_yn="Y",
+        )
+        for index in range(count)
+    ]
+
+
+def bench_write(args: argparse.Namespace) -> dict[str, Any]:
+    items = _make_list_items(args.rows)
+    pages = [items[start : start + args.page_size] for start in range(0, len(items), args.page_size)]
+    group_commit = args.group_commit_rows
+    modes = {  # (설정, 페이지마다 flush 여부)
+        "simple": (StorageConfig(view_mode="off"), True),
+        "buffered_checkpoint": (StorageConfig(view_mode="off", writer_mode="buffered"), True),
+        "buffered_group_commit": (
+            StorageConfig(view_mode="off", writer_mode="buffered", group_commit_rows=group_commit),
+            False,
+        ),
+        "buffered_group_commit_fsync": (
+            StorageConfig(view_mode="off", writer_mode="buffered", group_commit_rows=group_commit, fsync=True),
+            False,
+        ),
+        "segments_gzip": (StorageConfig(view_mode="off", output_format="segments"), True),
+        "segments_gzip_group_commit": (
+            StorageConfig(view_mode="off", output_format="segments", group_commit_rows=group_commit),
+            False,
+        ),
+    }
+    rows_per_sec: dict[str, int] = {}
+    bytes_on_disk: dict[str, int] = {}
+    for label, (storage, flush_per_page) in modes.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = NoticeRepository(str(Path(tmp) / "nuri.db"), storage)
+
+            def _run() -> None:
+                for batch in pages:
+                    repo.save_list_items(batch)
+                    if flush_per_page:
+                        repo.flush()  # 서비스처럼 페이지마다 체크포인트 전에 확정한다.
+                repo.flush()
+
+            rows_per_sec[label] = round(_rate(len(items), _run))
+            repo.close()
+            outputs = [*Path(tmp).glob("*.csv"), *Path(tmp).glob("segments/*/*.csv.*")]
+            bytes_on_disk[label] = sum(path.stat().st_size for path in outputs)
+    return {
+        "rows": args.rows,
+        "page_size": args.page_size,
+        "rows_per_sec": rows_per_sec,
+        "bytes_on_disk": bytes_on_disk,
+    }
+
+
+def bench_query(args: argparse.Namespace) -> dict[str, Any]:
+    base = datetime(2026, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        index = NoticeIndex(str(Path(tmp) / "nuri.db"))
+        started = time.perf_counter()
+        batch: list[SimpleNamespace] = []
+        for row in range(args.rows):
+            fields = dict.fromkeys(INDEX_COLUMNS)
+            fields.update(
+                bid_pbanc_no=f"R26BK{row:08d}",
+                bid_pbanc_ord="000",
+                grp_nm=f"기관{row % args.agencies:05d}",
+                pbanc_pstg_dt=base + timedelta(minutes=row % 525_600),
+                slpr_rcpt_ddln_dt=base + timedelta(minutes=row % 525_600 + 14 * 1440),
+                pbanc_stts_cd="공400001",
+            )
+            batch.append(SimpleNamespace(**fields))
+            if len(batch) >= 50_000:
+                index.upsert(batch)
+                batch = []
+        index.upsert(batch)
+        load_sec = time.perf_counter() - started
+        week_start = base + timedelta(days=180)
+        query = NoticeQuery(
+            grp_nm="기관00042",
+            closing_from=week_start,
+            closing_to=week_start + timedelta(days=7),
+            pbanc_stts_cd="공400001",
+        )
+        timings = []
+        for _ in range(20):
+            started = time.perf_counter()
+            found = index.search(query, limit=100).rows
+            timings.append((time.perf_counter() - started) * 1000)
+        index.close()
+    timings.sort()
+    return {
+        "rows": args.rows,
+        "load_rows_per_sec": round(args.rows / load_sec),
+        "agency_closing_week": {
+            "matches": len(found),
+            "p50_ms": round(timings[10], 3),
+            "max_ms": round(timings[-1], 3),
+        },
+    }
+
+
+_TITLE_WORDS = ("정보시스템", "유지관리", "용역", "청사", "시설", "공사", "물품", "구매", "도로", "보수", "설계", "감리")
+
+
+def bench_search(args: argparse.Namespace) -> dict[str, Any]:
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        search = NoticeSearch(str(Path(tmp) / "nuri.db"))
+        started = time.perf_counter()
+        batch: list[SimpleNamespace] = []
+        for row in range(args.rows):
+            title = " ".join(rng.sample(_TITLE_WORDS, 3)) + f" {row % 97}차"
+            batch.append(SimpleNamespace(bid_pbanc_no=f"R26BK{row:08d}", bid_pbanc_ord="000", bid_pbanc_nm=title))
+            if len(batch) >= 50_000:
+                search.index("list", batch)
+                batch = []
+        search.index("list", batch)
+        load_sec = time.perf_counter() - started
+        results: dict[str, dict[str, Any]] = {}
+        for text in ("정보시스템 유지관리", "공사", "도로 보수 설계"):
+            timings = []
+            for _ in range(20):
+                started = time.perf_counter()
+                hits = search.search(text, limit=20)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            results[text] = {"hits": len(hits), "p50_ms": round(timings[10], 3), "max_ms": round(timings[-1], 3)}
+        search.close()
+    return {"rows": args.rows, "index_rows_per_sec": round(args.rows / load_sec), "queries": results}
+
+
+def _hangul_word(rng: random.Random, syllables: int) -> str:
+    return "".join(chr(0xAC00 + rng.randrange(0, 11172, 28)) for _ in range(syllables))
+
+
+def bench_watchlist(args: argparse.Namespace) -> dict[str, Any]:
+    rng = random.Random(11)
+    patterns = [_hangul_word(rng, rng.randint(2, 4)) for _ in range(args.patterns)]
+    titles = []
+    for _ in range(args.rows):
+        words = [_hangul_word(rng, rng.randint(2, 5)) for _ in range(6)]
+        if rng.random() < 0.05:
+            words[rng.randrange(6)] = rng.choice(patterns)
+        titles.append(" ".join(words))
+    started = time.perf_counter()
+    automaton = KeywordAutomaton(patterns)
+    build_ms = (time.perf_counter() - started) * 1000
+    matched = 0
+
+    def _automaton() -> None:
+        nonlocal matched
+        matched = sum(1 for title in titles if automaton.find(title))
+
+    def _naive() -> None:
+        for title in titles[: args.naive_rows]:
+            [pattern for pattern in patterns if pattern in title]
+
+    automaton_rate = _rate(args.rows, _automaton)
+    naive_rate = _rate(args.naive_rows, _naive)  # 감시어 수 × 행 수라 일부 행만 잰다.
+    return {
+        "patterns": len(automaton),
+        "rows": args.rows,
+        "build_ms": round(build_ms, 1),
+        "matched_rows": matched,
+        "rows_per_sec": {"automaton": round(automaton_rate), "naive_substring": round(naive_rate)},
+    }
+
+
+def _raw_list_row(row: int) -> dict[str, Any]:
+    return {
+        "bidPbancNo": f"R26BK{row:08d}",
+        "bidPbancOrd": "000",
+        "bidClsfNo": "0",
+        "bidPrgrsOrd": "000",
+        "bidPbancNm": f"정보시스템 유지관리 {row}",
+        "bidPbancNum": f"R26BK{row:08d}-000",
+        "pbancSttsCd": "공400001",
+        "pbancSttsCdNm": "등록공고",
+        "prcmBsneSeCd": "A",
+        "prcmBsneSeCdNm": "용역",
+        "bidMthdCd": "B",
+        "bidMthdCdNm": "일반경쟁",
+        "stdCtrtMthdCd": "C",
+        "stdCtrtMthdCdNm": "일반",
+        "scsbdMthdCd": "D",
+        "scsbdMthdCdNm": "적격심사",
+        "pbancPstgDt": "2026/02/06 19:11",
+        "pbancKndCd": "공440002",
+        "pbancKndCdNm": "실공고",
+        "grpNm": f"기관{row % 2000:04d}",
+        "slprRcptDdlnDt": "2026/02/20 10:00",
+        "pbancSttsGridCdNm": "입찰개시",
+        "rowNum": str(row),
+        "totCnt": "0",
+        "currentPage": "1",
+        "recordCountPerPage": "10",
+        "nextRowYn": "Y",
+    }
+
+
+def bench_reprocess(args: argparse.Namespace) -> dict[str, Any]:
+    config = CrawlConfig(
+        base_url="https://example.com",
+        list_url="https://example.com/list",
+        detail_api_url="https://example.com/detail",
+        max_pages=1,
+        timeout_ms=1000,
+        retry_count=1,
+        retry_backoff_sec=0.0,
+        user_agent="benchmark",
+        selectors=Selectors(list_row="tr", list_link="a"),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_dir = Path(tmp) / "raw"
+        store = SnapshotStore(str(snapshot_dir), "packed")
+        for page in range(args.pages):
+            rows = [_raw_list_row(page * 10 + offset) for offset in range(10)]
+            day = f"2026{page // 100 % 12 + 1:02d}01"  # 하루 100페이지씩.
+            store.save(f"list_{day}", f"page_{page % 100 + 1}", {"ErrorCode": 0, "result": rows})
+            for row in rows:
+                detail = {"ErrorCode": 0, "result": {"bidPbancMap": {**row, "picIdNm": "담당자"}}}
+                store.save("detail_20260201", f"{row['bidPbancNo']}_000", detail)
+        store.close()
+        results: dict[str, float] = {}
+        for workers in sorted({1, args.workers}):
+            output = Path(tmp) / f"out{workers}"
+            repo = NoticeRepository(str(output / "nuri.db"), StorageConfig(view_mode="off", writer_mode="buffered"))
+            service = CrawlerService(config, repo, NoticeParser(config.selectors), CheckpointStore(str(output / "cp")))
+            started = time.perf_counter()
+            service.reprocess(str(snapshot_dir), workers=workers)
+            repo.close()
+            results[f"workers_{workers}"] = round(args.pages * 10 / (time.perf_counter() - started))
+    return {"pages": args.pages, "rows": args.pages * 10, "rows_per_sec": results}
+
+
+def main() -> None:
+    args = parse_args()
+    suites = {
+        "dedupe": bench_dedupe,
+        "write": bench_write,
+        "query": bench_query,
+        "search": bench_search,
+        "watchlist": bench_watchlist,
+        "reprocess": bench_reprocess,
+    }
+    print(json.dumps(suites[args.suite](args), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
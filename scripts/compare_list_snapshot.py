@@ -3,25 +3,45 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
+import shutil
 import sys
+import tempfile
+import zlib
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Optional
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.domain.models import BidNoticeListItem
+from src.infrastructure.segments import iter_table_rows
+from src.infrastructure.snapshot import iter_snapshots
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Compare snapshot list JSON with CSV output.")
-    parser.add_argument("--snapshot-dir", default="data/raw", help="Directory with list_YYYYMMDD_page_*.json")
-    parser.add_argument("--csv", default="data/bid_notice_list.csv", help="CSV path to compare")
-    parser.add_argument("--ignore-extra", action="store_true", help="Ignore CSV rows not in snapshot")
+    parser.add_argument(
+        "--snapshot-dir",
+        default="data/raw",
+        help="Snapshot directory (list_YYYYMMDD_page_*.json files and/or packs/)",
+    )
+    parser.add_argument("--csv", default="data/bid_notice_list.csv", help="CSV path (or segment directory) to compare")
+    parser.add_argument("--ignore-extra", action="store_true", help="Do not list CSV rows missing from snapshots")
     parser.add_argument("--sample", type=int, default=5, help="Sample mismatch count")
-    parser.add_argument("--report", default=None, help="Optional JSON report output path")
+    parser.add_argument("--report", default=None, help="Optional JSON Lines report output path (streamed)")
+    parser.add_argument(
+        "--partitions",
+        type=int,
+        default=64,
+        help="Key hash partitions; a worker holds one partition of snapshot rows in memory",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Compare processes (default: CPU count)")
+    parser.add_argument("--spill-dir", default=None, help="Directory for partition spill files (default: system temp)")
     return parser.parse_args()
 
 
@@ -82,97 +102,218 @@ def normalize_row(raw: dict[str, Any], mapping: dict[str, str]) -> BidNoticeList
     return BidNoticeListItem(**mapped)
 
 
-def load_snapshots(snapshot_dir: Path, mapping: dict[str, str]) -> tuple[dict[tuple[str, str], dict[str, Any]], int]:
-    rows: dict[tuple[str, str], dict[str, Any]] = {}
-    dupes = 0
-    for path in sorted(snapshot_dir.glob("list_*_page_*.json")):
-        payload = json.loads(path.read_text())
-        for raw in payload.get("body", {}).get("result", []):
-            item = normalize_row(raw, mapping)
-            key = (item.bid_pbanc_no, item.bid_pbanc_ord)
-            if key in rows:
-                dupes += 1
-            rows[key] = item.model_dump()
-    return rows, dupes
+def csv_form(item: BidNoticeListItem) -> dict[str, str]:
+    """저장소가 CSV에 쓰는 문자열 형태(`csv.DictWriter`와 같이 None은 빈 문자열). CSV 행은 다시 검증하지 않는다."""
+    return {name: "" if value is None else str(value) for name, value in item.model_dump().items()}
 
 
-def normalize_empty(value: Any) -> Any:
-    if value == "":
-        return None
-    return value
+def partition_of(bid_pbanc_no: Any, bid_pbanc_ord: Any, partitions: int) -> int:
+    # 프로세스마다 달라지는 hash() 대신 crc32로 양쪽이 같은 파티션에 모이게 한다.
+    return zlib.crc32(f"{bid_pbanc_no}\t{bid_pbanc_ord}".encode("utf-8")) % partitions
 
 
-def compare_rows(
-    raw_rows: dict[tuple[str, str], dict[str, Any]],
-    csv_rows: dict[tuple[str, str], dict[str, Any]],
-    sample_count: int,
-) -> tuple[Counter, dict[str, tuple[tuple[str, str], Any, Any]]]:
-    mismatch = Counter()
-    samples: dict[str, tuple[tuple[str, str], Any, Any]] = {}
-    for key in raw_rows.keys() & csv_rows.keys():
-        raw_row = raw_rows[key]
-        csv_row = csv_rows[key]
-        for field, raw_val in raw_row.items():
-            csv_val = normalize_empty(csv_row.get(field))
-            if raw_val != csv_val:
-                mismatch[field] += 1
-                if field not in samples and len(samples) < sample_count:
-                    samples[field] = (key, raw_val, csv_val)
-    return mismatch, samples
-
-
-def load_csv(csv_path: Path) -> dict[tuple[str, str], dict[str, Any]]:
-    import csv
-
-    rows: dict[tuple[str, str], dict[str, Any]] = {}
-    with csv_path.open() as fp:
-        reader = csv.DictReader(fp)
-        for row in reader:
-            item = BidNoticeListItem(**row)
-            rows[(item.bid_pbanc_no, item.bid_pbanc_ord)] = item.model_dump()
-    return rows
+@dataclass
+class PartitionResult:
+    snapshot_rows: int = 0
+    csv_rows: int = 0
+    raw_dupes: int = 0
+    invalid_rows: int = 0
+    missing_in_csv: int = 0
+    extra_in_csv: int = 0
+    mismatch: Counter = field(default_factory=Counter)
+    samples: dict[str, list[Any]] = field(default_factory=dict)
 
 
-def main() -> None:
-    args = parse_args()
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
-    logger = logging.getLogger("compare")
+class _PartitionWriter:
+    """키 해시 파티션별 JSONL 파일. 한 번에 한 행만 메모리에 두고 기록한다."""
 
-    snapshot_dir = Path(args.snapshot_dir)
-    csv_path = Path(args.csv)
-    mapping = build_mapping()
+    def __init__(self, directory: Path, prefix: str, partitions: int) -> None:
+        self.paths = [directory / f"{prefix}-{index:04d}.jsonl" for index in range(partitions)]
+        self._files: list[IO[str]] = [path.open("w", encoding="utf-8") for path in self.paths]
+        self.rows = 0
 
-    raw_rows, dupes = load_snapshots(snapshot_dir, mapping)
-    csv_rows = load_csv(csv_path)
+    def write(self, partition: int, record: Any) -> None:
+        self._files[partition].write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.rows += 1
 
-    raw_keys = set(raw_rows.keys())
-    csv_keys = set(csv_rows.keys())
+    def close(self) -> None:
+        for fp in self._files:
+            fp.close()
 
-    missing_in_csv = raw_keys - csv_keys
-    extra_in_csv = csv_keys - raw_keys
 
-    mismatch, samples = compare_rows(raw_rows, csv_rows, args.sample)
+def spill_snapshots(snapshot_dir: Path, mapping: dict[str, str], writer: _PartitionWriter, partitions: int) -> None:
+    """목록 스냅샷 행을 매핑만 해서 파티션 파일로 보낸다. 검증은 파티션 워커가 한다."""
+    for entry, payload in iter_snapshots(str(snapshot_dir), kind="list"):
+        if not entry.key.startswith("page_"):
+            continue
+        for raw in payload.get("body", {}).get("result", []):
+            mapped = {mapping[k]: v for k, v in raw.items() if k in mapping}
+            writer.write(partition_of(mapped.get("bid_pbanc_no"), mapped.get("bid_pbanc_ord"), partitions), mapped)
 
-    logger.info("snapshot_rows=%s csv_rows=%s raw_dupes=%s", len(raw_rows), len(csv_rows), dupes)
-    logger.info("missing_in_csv=%s extra_in_csv=%s", len(missing_in_csv), len(extra_in_csv))
-    logger.info("mismatch_fields=%s", dict(mismatch))
-    if samples:
-        logger.info("mismatch_samples=%s", samples)
 
-    if args.ignore_extra:
-        extra_in_csv = set()
+def spill_csv(csv_path: Path, writer: _PartitionWriter, partitions: int) -> None:
+    for row in iter_table_rows(csv_path):  # CSV 또는 data/segments/{이름}/ 압축 세그먼트.
+        writer.write(partition_of(row.get("bid_pbanc_no"), row.get("bid_pbanc_ord"), partitions), row)
 
-    report = {
-        "snapshot_rows": len(raw_rows),
-        "csv_rows": len(csv_rows),
-        "raw_dupes": dupes,
-        "missing_in_csv": sorted(list(missing_in_csv)),
-        "extra_in_csv": sorted(list(extra_in_csv)),
-        "mismatch_fields": dict(mismatch),
-        "mismatch_samples": {k: [v[0], v[1], v[2]] for k, v in samples.items()},
-    }
+
+def compare_partition(
+    snapshot_part: Path,
+    csv_part: Path,
+    report_part: Path,
+    sample_count: int,
+    ignore_extra: bool = False,
+) -> PartitionResult:
+    """파티션 하나를 비교한다. 스냅샷 쪽만 메모리에 올리고 CSV 쪽은 한 줄씩 흘려 보낸다."""
+    result = PartitionResult()
+    raw_rows: dict[tuple[str, str], dict[str, str]] = {}
+    with report_part.open("w", encoding="utf-8") as report, snapshot_part.open(encoding="utf-8") as fp:
+        for line in fp:
+            mapped = json.loads(line)
+            try:
+                item = BidNoticeListItem(**mapped)
+            except Exception as exc:  # noqa: BLE001 - 검증 실패 행은 보고서에 남기고 계속한다.
+                result.invalid_rows += 1
+                key = [mapped.get("bid_pbanc_no"), mapped.get("bid_pbanc_ord")]
+                report.write(json.dumps({"type": "invalid", "key": key, "error": str(exc)}, ensure_ascii=False) + "\n")
+                continue
+            key = (item.bid_pbanc_no, item.bid_pbanc_ord)
+            if key in raw_rows:
+                result.raw_dupes += 1
+            raw_rows[key] = csv_form(item)  # 같은 키는 나중 스냅샷이 이긴다.
+        result.snapshot_rows = len(raw_rows)
+        seen: set[tuple[str, str]] = set()
+        extra: list[tuple[str, str]] = []
+        with csv_part.open(encoding="utf-8") as fp:
+            for line in fp:
+                csv_row = json.loads(line)
+                key = (csv_row.get("bid_pbanc_no") or "", csv_row.get("bid_pbanc_ord") or "")
+                if key in seen:
+                    continue
+                seen.add(key)
+                raw_row = raw_rows.get(key)
+                if raw_row is None:
+                    extra.append(key)
+                    continue
+                for name, raw_val in raw_row.items():
+                    csv_val = csv_row.get(name) or ""  # 이전 CSV에 없던 열은 빈 값으로 본다.
+                    if raw_val != csv_val:
+                        result.mismatch[name] += 1
+                        if name not in result.samples and len(result.samples) < sample_count:
+                            result.samples[name] = [list(key), raw_val, csv_val]
+        result.csv_rows = len(seen)
+        missing = sorted(raw_rows.keys() - seen)
+        result.missing_in_csv = len(missing)
+        result.extra_in_csv = len(extra)
+        for key in missing:
+            report.write(json.dumps({"type": "missing_in_csv", "key": list(key)}, ensure_ascii=False) + "\n")
+        if not ignore_extra:
+            for key in sorted(extra):
+                report.write(json.dumps({"type": "extra_in_csv", "key": list(key)}, ensure_ascii=False) + "\n")
+    return result
+
+
+def compare(
+    snapshot_dir: Path,
+    csv_path: Path,
+    partitions: int = 64,
+    workers: Optional[int] = None,
+    sample_count: int = 5,
+    report_path: Optional[Path] = None,
+    ignore_extra: bool = False,
+    spill_dir: Optional[Path] = None,
+) -> dict[str, Any]:
+    """스냅샷과 CSV를 키 해시 파티션 파일로 흘려 보낸 뒤 파티션별로 병렬 비교한다.
+
+    메모리는 워커마다 스냅샷 한 파티션 분량이다. 보고서(JSONL)는 파티션 순서대로 이어 붙이고 마지막 줄에 요약을 쓴다.
+    """
+    partitions = max(1, partitions)
+    mapping = build_mapping()
+    summary = PartitionResult()
+    with tempfile.TemporaryDirectory(prefix="compare-", dir=spill_dir) as tmp:
+        directory = Path(tmp)
+        snapshot_writer = _PartitionWriter(directory, "snapshot", partitions)
+        csv_writer = _PartitionWriter(directory, "csv", partitions)
+        try:
+            spill_snapshots(snapshot_dir, mapping, snapshot_writer, partitions)
+            spill_csv(csv_path, csv_writer, partitions)
+        finally:
+            snapshot_writer.close()
+            csv_writer.close()
+        report_parts = [directory / f"report-{index:04d}.jsonl" for index in range(partitions)]
+        tasks = list(zip(snapshot_writer.paths, csv_writer.paths, report_parts))
+        workers = min(workers or os.cpu_count() or 1, partitions)
+        if workers <= 1:
+            results = [compare_partition(*task, sample_count, ignore_extra) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        compare_partition,
+                        *zip(*tasks),
+                        [sample_count] * partitions,
+                        [ignore_extra] * partitions,
+                    )
+                )
+        for result in results:
+            summary.snapshot_rows += result.snapshot_rows
+            summary.csv_rows += result.csv_rows
+            summary.raw_dupes += result.raw_dupes
+            summary.invalid_rows += result.invalid_rows
+            summary.missing_in_csv += result.missing_in_csv
+            summary.extra_in_csv += result.extra_in_csv
+            summary.mismatch.update(result.mismatch)
+            for name, sample in result.samples.items():
+                if name not in summary.samples and len(summary.samples) < sample_count:
+                    summary.samples[name] = sample
+        report = {
+            "type": "summary",
+            "snapshot_rows": summary.snapshot_rows,
+            "csv_rows": summary.csv_rows,
+            "raw_dupes": summary.raw_dupes,
+            "invalid_rows": summary.invalid_rows,
+            "missing_in_csv": summary.missing_in_csv,
+            "extra_in_csv": summary.extra_in_csv,
+            "mismatch_fields": dict(summary.mismatch),
+            "mismatch_samples": summary.samples,
+            "partitions": partitions,
+        }
+        if report_path is not None:
+            with report_path.open("w", encoding="utf-8") as out:
+                for part in report_parts:
+                    with part.open(encoding="utf-8") as fp:
+                        shutil.copyfileobj(fp, out)
+                out.write(json.dumps(report, ensure_ascii=False) + "\n")
+    return report
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    logger = logging.getLogger("compare")
+
+    report = compare(
+        Path(args.snapshot_dir),
+        Path(args.csv),
+        partitions=args.partitions,
+        workers=args.workers,
+        sample_count=args.sample,
+        report_path=Path(args.report) if args.report else None,
+        ignore_extra=args.ignore_extra,
+        spill_dir=Path(args.spill_dir) if args.spill_dir else None,
+    )
+
+    logger.info(
+        "snapshot_rows=%s csv_rows=%s raw_dupes=%s invalid_rows=%s",
+        report["snapshot_rows"],
+        report["csv_rows"],
+        report["raw_dupes"],
+        report["invalid_rows"],
+    )
+    logger.info("missing_in_csv=%s extra_in_csv=%s", report["missing_in_csv"], report["extra_in_csv"])
+    logger.info("mismatch_fields=%s", report["mismatch_fields"])
+    if report["mismatch_samples"]:
+        logger.info("mismatch_samples=%s", report["mismatch_samples"])
     if args.report:
-        Path(args.report).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
         logger.info("report_saved path=%s", args.report)
 
 
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.infrastructure.snapshot import PACK_DIR, PackedSnapshotArchive, iter_file_entries
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Move per-response snapshot JSON files into packed archives.")
+    parser.add_argument("--snapshot-dir", default="data/raw", help="Directory with {type}_{YYYYMMDD}_{key}.json files")
+    parser.add_argument("--max-pack-bytes", type=int, default=256 << 20)
+    parser.add_argument("--delete", action="store_true", help="Delete each JSON file after it is indexed")
+    return parser.parse_args()
+
+
+def migrate(snapshot_dir: Path, max_pack_bytes: int = 256 << 20, delete: bool = False) -> dict[str, int]:
+    """개별 JSON 파일을 팩으로 옮긴다. 이미 팩에 있는 (유형, 날짜, 키)는 건너뛰므로 다시 실행해도 된다."""
+    archive = PackedSnapshotArchive(snapshot_dir / PACK_DIR, max_pack_bytes)
+    known = archive.keys()
+    entries = sorted(iter_file_entries(snapshot_dir), key=lambda entry: (entry.date, entry.kind, entry.key))
+    migrated = 0
+    skipped = 0
+    try:
+        for entry in entries:
+            if (entry.kind, entry.date, entry.key) in known:
+                skipped += 1
+            else:
+                payload = json.loads(entry.path.read_text(encoding="utf-8"))
+                if isinstance(payload, dict) and "body" in payload:
+                    archive.append(entry.kind, entry.date, entry.key, payload["body"], payload.get("meta"))
+                else:
+                    archive.append(entry.kind, entry.date, entry.key, payload)
+                migrated += 1
+            if delete:
+                entry.path.unlink()  # 인덱스에 기록된 뒤에만 지운다.
+    finally:
+        archive.close()
+    return {
+        "files": len(entries),
+        "migrated": migrated,
+        "skipped": skipped,
+        "blobs": archive.stored_blobs,
+        "deduplicated": archive.deduplicated,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    result = migrate(Path(args.snapshot_dir), args.max_pack_bytes, args.delete)
+    logging.getLogger("migrate").info(
+        "files=%s migrated=%s skipped=%s blobs=%s deduplicated=%s deleted=%s",
+        result["files"],
+        result["migrated"],
+        result["skipped"],
+        result["blobs"],
+        result["deduplicated"],
+        args.delete,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Optional
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.core.config import load_config
-from src.infrastructure.browser import BrowserController
+from src.core.config import AppConfig, load_config
+from src.infrastructure.browser import BrowserPool
 from src.infrastructure.checkpoint import CheckpointStore
 from src.infrastructure.parser import NoticeParser
 from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.resilience import ResiliencePolicy
+from src.infrastructure.transport import HttpTransport, InFlightRequests, SharedTransport, TransportResponse
 from src.service.crawler_service import CrawlerService
 
 
@@ -42,6 +46,13 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--config", default="config.yaml")
     parser.add_argument("--max-pages", type=int, default=2)
     parser.add_argument("--output-dir", default="data/verify")
+    parser.add_argument(
+        "--transport",
+        choices=["http", "browser"],
+        default="http",
+        help="http: shared urllib transport with concurrent jobs, browser: pool of Playwright pages, one per job",
+    )
+    parser.add_argument("--jobs", type=int, default=3, help="Filter combos run concurrently")
     return parser.parse_args()
 
 
@@ -66,22 +77,119 @@ def reset_dir(base: Path) -> None:
         checkpoint_path.unlink()
 
 
-def scan_entities(paths: Iterable[Path]) -> dict[str, int]:
-    hits: dict[str, int] = {}
-    for path in paths:
-        if not path.exists():
-            continue
+class EntityScanner:
+    """저장 리스너. 새로 기록되는 행의 문자열 값에서 남은 HTML 엔티티를 바로 센다(CSV 재검사 없음)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits: dict[str, int] = {}
+
+    def __call__(self, name: str, items: list[Any], owners: Any = None) -> None:
         count = 0
-        with path.open() as fp:
-            reader = csv.DictReader(fp)
-            for row in reader:
-                for value in row.values():
-                    if not value:
-                        continue
-                    if ENTITY_RE.search(value):
-                        count += 1
-        hits[path.name] = count
-    return hits
+        for item in items:
+            for value in item.model_dump().values():
+                if isinstance(value, str) and ENTITY_RE.search(value):
+                    count += 1
+        with self._lock:
+            self.hits[f"{name}.csv"] = self.hits.get(f"{name}.csv", 0) + count
+
+
+def response_ok(response: TransportResponse) -> bool:
+    """200이고 `ErrorCode == 0`인 응답만 다른 작업과 공유한다. 오류 응답은 재시도가 다시 보내게 둔다."""
+    if response.status != 200:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    return not isinstance(body, dict) or body.get("ErrorCode", 0) == 0
+
+
+def combo_config(config: AppConfig, combo: FilterCombo, run_dir: Path) -> AppConfig:
+    job = config.model_copy(deep=True)  # 작업마다 독립된 설정(동시 실행 중 공유 변경 방지).
+    job.sqlite_path = str(run_dir / "nuri.db")
+    job.checkpoint_path = str(run_dir / "checkpoint.json")
+    job.crawl.retry_queue_path = None  # 검증 실행의 실패는 운영 재시도 대기열에 남기지 않는다.
+    job.crawl.list_api_payload["pbancKndCd"] = combo.pbanc_knd_cd or ""
+    job.crawl.list_api_payload["pbancSttsCd"] = combo.pbanc_stts_cd or ""
+    job.crawl.list_api_payload["bidPbancPgstCd"] = combo.bid_pbanc_pgst_cd or ""
+    job.crawl.list_filter_pbanc_knd_cd = combo.pbanc_knd_cd
+    job.crawl.list_filter_pbanc_stts_cd = combo.pbanc_stts_cd
+    job.crawl.list_filter_bid_pbanc_pgst_cd = combo.bid_pbanc_pgst_cd
+    return job
+
+
+def run_combo(
+    config: AppConfig,
+    combo: FilterCombo,
+    output_root: Path,
+    transport: Any,
+    max_pages: int,
+    resilience: Optional[ResiliencePolicy] = None,
+) -> dict[str, Any]:
+    run_dir = output_root / combo.label()
+    reset_dir(run_dir)
+    job = combo_config(config, combo, run_dir)
+    repo = NoticeRepository(job.sqlite_path, job.storage)
+    scanner = EntityScanner()
+    repo.add_listener(scanner)
+    checkpoint = CheckpointStore(job.checkpoint_path)
+    service = CrawlerService(job.crawl, repo, NoticeParser(job.crawl.selectors), checkpoint, resilience)
+    started = time.perf_counter()
+    try:
+        service.run(transport, max_pages)  # API 경로는 `page.request.post`만 쓰므로 전송 계층을 그대로 넘긴다.
+        repo.end_run()
+    finally:
+        repo.close()
+    elapsed = round(time.perf_counter() - started, 2)
+    return {"combo": combo.label(), "entity_hits": scanner.hits, "elapsed_sec": elapsed}
+
+
+def run_jobs(
+    config: AppConfig,
+    combos: list[FilterCombo],
+    output_root: Path,
+    transport: SharedTransport,
+    max_pages: int,
+    jobs: int,
+    resilience: Optional[ResiliencePolicy] = None,
+) -> list[dict[str, Any]]:
+    """필터 조합들을 `jobs`개까지 동시에 실행한다. 모든 작업이 `transport`의 진행 중 요청 맵과
+    `resilience`(엔드포인트별 차단기)를 공유한다."""
+    output_root.mkdir(parents=True, exist_ok=True)
+    resilience = resilience or ResiliencePolicy.from_config(config.crawl)
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="verify") as executor:
+        futures = [
+            executor.submit(run_combo, config, combo, output_root, transport, max_pages, resilience)
+            for combo in combos
+        ]
+        return [future.result() for future in futures]
+
+
+def run_browser_jobs(
+    config: AppConfig,
+    combos: list[FilterCombo],
+    output_root: Path,
+    pool: BrowserPool,
+    max_pages: int,
+    resilience: Optional[ResiliencePolicy] = None,
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """필터 조합을 브라우저 풀의 슬롯에서 동시에 실행한다. 페이지는 슬롯 스레드에서만 쓸 수 있으므로
+    전송 계층은 작업마다 그 슬롯의 `page.request`로 만들고, 진행 중 요청 맵은 모든 슬롯이 함께 쓴다.
+    같은 요청은 먼저 보낸 슬롯의 결과를 다른 슬롯이 기다려 받는다."""
+    output_root.mkdir(parents=True, exist_ok=True)
+    resilience = resilience or ResiliencePolicy.from_config(config.crawl)
+    flights = InFlightRequests()
+
+    def _job(combo: FilterCombo) -> Callable[[Any], dict[str, Any]]:
+        def _run(page: Any) -> dict[str, Any]:
+            transport = SharedTransport(page.request, response_ok, flights)
+            return run_combo(config, combo, output_root, transport, max_pages, resilience)
+
+        return _run
+
+    futures = [pool.submit(_job(combo)) for combo in combos]
+    return [future.result() for future in futures], flights.stats()
 
 
 def main() -> None:
@@ -89,55 +197,36 @@ def main() -> None:
     config = load_config(args.config)
     config.crawl.snapshot_enabled = False
     config.crawl.snapshot_only_list = False
+    if not config.crawl.list_api_url:
+        raise SystemExit("verify_live_filters requires crawl.list_api_url (API path)")
 
     output_root = Path(args.output_dir)
-    output_root.mkdir(parents=True, exist_ok=True)
-
     combos = build_combos()
-    results: list[dict[str, object]] = []
-
-    with BrowserController(config.crawl) as browser:
-        page = browser.new_page()
-        for combo in combos:
-            run_dir = output_root / combo.label()
-            reset_dir(run_dir)
-
-            config.sqlite_path = str(run_dir / "nuri.db")
-            config.checkpoint_path = str(run_dir / "checkpoint.json")
-
-            config.crawl.list_api_payload["pbancKndCd"] = combo.pbanc_knd_cd or ""
-            config.crawl.list_api_payload["pbancSttsCd"] = combo.pbanc_stts_cd or ""
-            config.crawl.list_api_payload["bidPbancPgstCd"] = combo.bid_pbanc_pgst_cd or ""
-
-            config.crawl.list_filter_pbanc_knd_cd = combo.pbanc_knd_cd
-            config.crawl.list_filter_pbanc_stts_cd = combo.pbanc_stts_cd
-            config.crawl.list_filter_bid_pbanc_pgst_cd = combo.bid_pbanc_pgst_cd
-
-            repo = NoticeRepository(config.sqlite_path)
-            parser = NoticeParser(config.crawl.selectors)
-            checkpoint = CheckpointStore(config.checkpoint_path)
-            service = CrawlerService(config.crawl, repo, parser, checkpoint)
-
-            service.run(page, args.max_pages)
-
-            csv_paths = [
-                run_dir / "bid_notice_list.csv",
-                run_dir / "bid_notice_detail.csv",
-                run_dir / "bid_notice_noce.csv",
-                run_dir / "bid_notice_attachment.csv",
-                run_dir / "bid_opening_summary.csv",
-                run_dir / "bid_opening_result.csv",
-            ]
-            entity_hits = scan_entities(csv_paths)
-            results.append(
-                {
-                    "combo": combo.label(),
-                    "entity_hits": entity_hits,
-                }
-            )
-
+    started = time.perf_counter()
+    resilience = ResiliencePolicy.from_config(config.crawl)
+    browser: list[dict[str, Any]] = []
+    try:
+        if args.transport == "http":
+            transport = SharedTransport(HttpTransport(config.crawl.user_agent, config.crawl.timeout_ms), response_ok)
+            results = run_jobs(config, combos, output_root, transport, args.max_pages, args.jobs, resilience)
+            requests = transport.stats()
+        else:
+            with BrowserPool(config.crawl, args.jobs) as pool:  # 슬롯마다 자기 스레드의 브라우저 페이지로 실행.
+                results, requests = run_browser_jobs(config, combos, output_root, pool, args.max_pages, resilience)
+                browser = pool.stats()
+    finally:
+        resilience.close()
+    summary = {
+        "transport": args.transport,
+        "jobs": args.jobs,
+        "elapsed_sec": round(time.perf_counter() - started, 2),
+        "requests": requests,
+        "resilience": resilience.report(),
+        "browser": browser,
+        "combos": results,
+    }
     (output_root / "summary.json").write_text(
-        json.dumps(results, ensure_ascii=False, indent=2),
+        json.dumps(summary, ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
 
@@ -40,11 +40,45 @@ class CrawlConfig(BaseModel):
     retry_count: int
     retry_backoff_sec: float
     user_agent: str
+    retry_backoff_max_sec: float = 30.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_sec: float = 30.0
+    rate_limits: dict[str, float] = Field(default_factory=dict)  # 엔드포인트별 초당 호출 상한(list/detail/...).
+    rate_limit_burst: float = 1.0
+    concurrency_initial: int = 4
+    concurrency_min: int = 1
+    concurrency_max: int = 16
+    latency_p95_tolerance: float = 2.0
+    hedge_enabled: bool = False  # 상세/공지/첨부/개찰 POST 복제 요청(스레드 안전한 전송 계층에서만).
+    hedge_budget_ratio: float = 0.05
+    hedge_min_delay_sec: float = 0.05
+    hedge_via_http: bool = False  # 동기 Playwright 대신 urllib 전송으로 헤지(브라우저 쿠키/세션을 쓰지 않음).
+    adaptive_timeout_path: Optional[str] = None  # 엔드포인트별 지연 표본(JSON). 없으면 모든 호출에 `timeout_ms`.
+    timeout_quantile: float = 0.99
+    timeout_multiplier: float = 3.0
+    timeout_floor_ms: int = 1000
+    timeout_ceiling_ms: Optional[int] = None  # 없으면 `timeout_ms`.
+    browser_context_max_requests: int = 500  # 컨텍스트를 새로 만드는 페이지 요청 수(API 수집은 목록 페이지마다 확인).
+    browser_context_max_errors: int = 3
+    browser_context_max_memory_mb: float = 512.0
     search_range_days: Optional[int] = None
     snapshot_enabled: bool = False
     snapshot_dir: str = "data/snapshots"
     snapshot_mode: str = "unexpected"
     snapshot_only_list: bool = False
+    snapshot_format: str = "packed"
+    snapshot_pack_max_bytes: int = 256 << 20
+    async_persistence: bool = False
+    persistence_queue_size: int = 4
+    checkpoint_every_notices: int = 5
+    checkpoint_every_sec: float = 2.0
+    retry_queue_path: Optional[str] = None
+    retry_queue_base_sec: float = 300.0
+    retry_queue_max_sec: float = 86400.0
+    retry_queue_max_attempts: int = 8
+    retry_queue_batch: int = 200
+    watchlist_path: Optional[str] = None
+    watchlist_output: str = "data/watchlist_matches.jsonl"
     list_filter_pbanc_knd_cd: Optional[str] = None
     list_filter_pbanc_stts_cd: Optional[str] = None
     list_filter_bid_pbanc_pgst_cd: Optional[str] = None
@@ -61,11 +95,40 @@ class CrawlConfig(BaseModel):
     selectors: Selectors
 
 
+class StorageConfig(BaseModel):
+    dedupe_backend: str = "sqlite"
+    dedupe_bloom_enabled: bool = False
+    dedupe_bloom_fp_rate: float = 0.01
+    dedupe_bloom_capacity: int = 1_000_000
+    view_mode: str = "deferred"
+    parquet_enabled: bool = False
+    parquet_dir: Optional[str] = None
+    parquet_compression: str = "zstd"
+    writer_mode: str = "simple"
+    writer_buffer_bytes: int = 1 << 16
+    group_commit_rows: int = 0
+    group_commit_sec: float = 0.0
+    fsync: bool = False
+    output_format: str = "csv"
+    segment_compression: str = "gzip"
+    segment_max_bytes: int = 64 << 20
+    segment_rotate_daily: bool = True
+    history_enabled: bool = False
+    query_index_enabled: bool = True
+    search_enabled: bool = False
+    stream_target: Optional[str] = None
+    stream_buffer_records: int = 10_000
+    stream_overflow: str = "drop"
+    stream_spill_path: Optional[str] = None
+
+
 class AppConfig(BaseModel):
     crawl: CrawlConfig
     sqlite_path: str
     checkpoint_path: str = "data/checkpoint.json"
+    checkpoint_stale_days: float = 7.0
     log_level: str
+    storage: StorageConfig = Field(default_factory=StorageConfig)
 
 
 def load_config(path: str) -> AppConfig:
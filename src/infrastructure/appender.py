@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import csv
+import logging
+import os
+from operator import attrgetter
+from pathlib import Path
+from typing import IO, Any, Optional, Sequence
+
+
+class CsvAppender:
+    """CSV 파일 하나에 대한 상시 열린 버퍼 기록기. 행은 모델 속성에서 바로 직렬화한다."""
+
+    def __init__(self, path: Path, model_type: type, buffer_bytes: int = 1 << 16) -> None:
+        self._path = path
+        self._fieldnames = list(model_type.model_fields.keys())  # type: ignore[attr-defined]
+        self._getter = attrgetter(*self._fieldnames)
+        self._buffer_bytes = buffer_bytes
+        self._fp: Optional[IO[str]] = None
+        self._writer: Any = None
+        self._logger = logging.getLogger("appender")
+        self.pending_rows = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def append(self, items: Sequence[Any]) -> int:
+        if not items:
+            return 0
+        writer = self._open()
+        getter = self._getter
+        writer.writerows(getter(item) for item in items)
+        self.pending_rows += len(items)
+        return len(items)
+
+    def flush(self, fsync: bool = False) -> int:
+        """버퍼를 OS로 내보내고(선택적으로 fsync) 확정된 행 수를 반환한다."""
+        flushed = self.pending_rows
+        if self._fp is not None:
+            self._fp.flush()
+            if fsync:
+                os.fsync(self._fp.fileno())
+        self.pending_rows = 0
+        return flushed
+
+    def close(self) -> None:
+        if self._fp is not None:
+            self.flush()
+            self._fp.close()
+            self._fp = None
+            self._writer = None
+
+    def _open(self) -> Any:
+        if self._writer is None:
+            write_header = not self._path.exists() or self._path.stat().st_size == 0
+            self._fp = self._path.open("a", newline="", encoding="utf-8", buffering=self._buffer_bytes)
+            self._writer = csv.writer(self._fp)
+            if write_header:
+                self._writer.writerow(self._fieldnames)
+            self._logger.debug("CSV 기록기 열림 경로=%s", self._path)
+        return self._writer
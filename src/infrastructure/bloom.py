@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import struct
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.infrastructure.key_index import IndexedKeys
+
+_MAGIC = b"RBLM"
+_HEADER = struct.Struct("<4sIQIQdQQ")  # magic, version, bits, hashes, capacity, fp_rate, key_count, watermark.
+_VERSION = 1
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 기반 블룸 필터. 거짓 음성은 없고 거짓 양성만 설정 비율로 허용한다."""
+
+    def __init__(self, capacity: int, fp_rate: float) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1")
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.capacity = capacity
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def __contains__(self, key: tuple[str, ...]) -> bool:
+        bits = self._bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def add(self, key: tuple[str, ...]) -> None:
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, keys: Iterable[tuple[str, ...]]) -> None:
+        for key in keys:
+            self.add(key)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def save(self, path: Path, key_count: int, watermark: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as fp:
+            fp.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _VERSION,
+                    self.num_bits,
+                    self.num_hashes,
+                    self.capacity,
+                    self.fp_rate,
+                    key_count,
+                    watermark,
+                )
+            )
+            fp.write(self._bits)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> tuple["BloomFilter", int, int]:
+        with path.open("rb") as fp:
+            magic, version, num_bits, num_hashes, capacity, fp_rate, key_count, watermark = _HEADER.unpack(
+                fp.read(_HEADER.size)
+            )
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"Invalid bloom filter file: {path}")
+            bloom = cls.__new__(cls)
+            bloom.fp_rate = fp_rate
+            bloom.num_bits = num_bits
+            bloom.num_hashes = num_hashes
+            bloom.capacity = capacity
+            bloom._bits = bytearray(fp.read())
+        if len(bloom._bits) != (num_bits + 7) // 8:
+            raise ValueError(f"Truncated bloom filter file: {path}")
+        return bloom, key_count, watermark
+
+    def _positions(self, key: tuple[str, ...]) -> Iterable[int]:
+        digest = hashlib.blake2b("\x1f".join(key).encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        h2 |= 1
+        num_bits = self.num_bits
+        return ((h1 + i * h2) % num_bits for i in range(self.num_hashes))
+
+
+class BloomFilteredKeys:
+    """영속 키 인덱스 앞단의 블룸 필터. 필터에 걸린 키만 SQLite 점조회로 확정한다."""
+
+    def __init__(
+        self,
+        inner: IndexedKeys,
+        path: Path,
+        capacity: int,
+        fp_rate: float,
+    ) -> None:
+        self._inner = inner
+        self._path = path
+        self._logger = logging.getLogger("bloom")
+        self.lookups = 0
+        self.exact_checks = 0
+        self._bloom = self._load(capacity, fp_rate)
+
+    def __contains__(self, key: tuple[str, ...]) -> bool:
+        self.lookups += 1
+        if key not in self._bloom:
+            return False
+        self.exact_checks += 1
+        return key in self._inner
+
+    def __len__(self) -> int:
+        return len(self._inner)
+
+    def add(self, key: tuple[str, ...]) -> None:
+        self._bloom.add(key)
+        self._inner.add(key)
+
+    def begin(self) -> None:
+        self._inner.begin()
+
+    def release(self) -> None:
+        self._inner.release()
+
+    def commit(self) -> None:
+        self._inner.commit()
+
+    def rollback(self) -> None:
+        self._inner.rollback()  # 필터에 남은 키는 거짓 양성일 뿐이므로 그대로 둔다.
+
+    @property
+    def bloom(self) -> BloomFilter:
+        return self._bloom
+
+    def close(self) -> None:
+        if len(self._inner) > self._bloom.capacity:
+            self._logger.warning(
+                "블룸 필터 용량 초과 키=%s 용량=%s (다음 실행에서 재구성)", len(self._inner), self._bloom.capacity
+            )
+            return
+        self._bloom.save(self._path, len(self._inner), self._inner.watermark)
+
+    def _load(self, capacity: int, fp_rate: float) -> BloomFilter:
+        loaded: Optional[BloomFilter] = None
+        if self._path.exists():
+            try:
+                bloom, key_count, watermark = BloomFilter.load(self._path)
+                if (
+                    key_count == len(self._inner)
+                    and watermark == self._inner.watermark
+                    and bloom.fp_rate == fp_rate
+                    and bloom.capacity >= len(self._inner)
+                ):
+                    loaded = bloom
+            except (OSError, ValueError, struct.error) as exc:
+                self._logger.warning("블룸 필터 로드 실패 경로=%s 오류=%s", self._path, exc)
+            # 정상 종료 시에만 다시 기록되므로, 비정상 종료 뒤에는 파일이 없어 재구성된다.
+            self._path.unlink()
+        if loaded is not None:
+            return loaded
+        bloom = BloomFilter(max(capacity, len(self._inner) * 2), fp_rate)
+        bloom.update(self._inner)
+        self._logger.info(
+            "블룸 필터 재구성 경로=%s 키=%s 크기=%sB", self._path, len(self._inner), bloom.size_bytes
+        )
+        return bloom
@@ -1,41 +1,295 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, TypeVar
 
 from src.core.config import CrawlConfig
 
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from playwright.sync_api import sync_playwright
 
+T = TypeVar("T")
 
-class BrowserController:
-    def __init__(self, config: CrawlConfig) -> None:
+# `page.request`(APIRequestContext)에서 요청 하나를 보내는 메서드.
+_REQUEST_METHODS = frozenset({"fetch", "get", "post", "put", "patch", "delete", "head"})
+
+
+class _CountedRequest:
+    """`page.request` 대리 객체. 요청을 보낼 때마다 슬롯에 알린다."""
+
+    def __init__(self, inner: Any, on_request: Callable[[], None]) -> None:
+        self._inner = inner
+        self._on_request = on_request
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._inner, name)
+        if name not in _REQUEST_METHODS:
+            return attr
+
+        def _send(*args: Any, **kwargs: Any) -> Any:
+            self._on_request()
+            return attr(*args, **kwargs)
+
+        return _send
+
+
+class _CountedPage:
+    """페이지 대리 객체. `goto`와 `page.request`의 요청 수를 슬롯에 알리고, 나머지는 페이지 그대로 쓴다."""
+
+    def __init__(self, page: Any, on_request: Callable[[], None]) -> None:
+        self._page = page
+        self._on_request = on_request
+        self._request: Optional[_CountedRequest] = None
+
+    @property
+    def request(self) -> _CountedRequest:
+        if self._request is None:
+            self._request = _CountedRequest(self._page.request, self._on_request)
+        return self._request
+
+    def goto(self, *args: Any, **kwargs: Any) -> Any:
+        self._on_request()
+        return self._page.goto(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._page, name)
+
+
+class BrowserSlot:
+    """브라우저 하나와 컨텍스트/페이지 하나. 동기 Playwright 객체이므로 처음 쓴 스레드에서만 쓴다.
+
+    작업(`run`)이 끝날 때마다 건강 상태를 본다. 컨텍스트에서 보낸 페이지 요청(`goto`, `page.request.*`) 수가
+    `browser_context_max_requests`에 이르거나, 연속 실패한 작업이 `browser_context_max_errors`개이거나,
+    렌더러 JS 힙이 `browser_context_max_memory_mb`를 넘으면 컨텍스트를 새로 만든다. 페이지가 죽었거나 브라우저
+    연결이 끊겼으면 브라우저부터 다시 띄운다. 작업 중에는 작업이 `renew(page)`를 부른 경계(예: API 수집의
+    목록 페이지 사이)에서만 요청 수/메모리 기준으로 교체한다. 부르지 않으면 작업 중인 페이지 상태를 지킨다.
+    """
+
+    def __init__(self, config: CrawlConfig, name: str = "slot-0", start: Optional[Callable[[], Any]] = None) -> None:
         self._config = config
+        self.name = name
+        self._start = start or (lambda: sync_playwright().start())
         self._logger = logging.getLogger("browser")
-        self._playwright: Playwright | None = None
-        self._browser: Browser | None = None
-        self._context: BrowserContext | None = None
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._context: Any = None
+        self._page: Any = None
+        self._counted: Optional[_CountedPage] = None
+        self._cdp: Any = None
+        self._crashed = False
+        self._context_requests = 0
+        self._consecutive_errors = 0
+        self.jobs = 0
+        self.requests = 0
+        self.errors = 0
+        self.recycles = 0
+        self.restarts = 0
+        self.memory_mb: Optional[float] = None
+
+    def __enter__(self) -> "BrowserSlot":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+        return None
 
-    def __enter__(self) -> "BrowserController":
-        self._playwright = sync_playwright().start()
+    def run(self, fn: Callable[[Any], T]) -> T:
+        """건강한 페이지로 `fn(page)`를 실행하고 결과에 따라 컨텍스트/브라우저를 교체한다."""
+        page = self._open()
+        try:
+            result = fn(page)
+        except Exception:
+            self._finish(ok=False)
+            raise
+        self._finish(ok=True)
+        return result
+
+    def renew(self, page: Any) -> Any:
+        """작업 중 경계에서 부른다. 요청 수나 메모리가 기준을 넘었으면 컨텍스트를 바꾼 새 페이지를, 아니면 그대로
+        반환한다. 페이지 상태(이동한 화면, 입력값)가 필요 없는 구간에서만 쓴다."""
+        if page is not self._counted:
+            return page
+        reason = self._exhausted()
+        if reason is None:
+            return page
+        self._recycle(reason)
+        return self._open()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "slot": self.name,
+            "jobs": self.jobs,
+            "requests": self.requests,
+            "errors": self.errors,
+            "recycles": self.recycles,
+            "restarts": self.restarts,
+            "memory_mb": self.memory_mb,
+        }
+
+    def close(self) -> None:
+        self._close_context()
+        self._close_browser()
+
+    def _open(self) -> Any:
+        if self._counted is not None:
+            return self._counted
+        if self._browser is None or not self._browser.is_connected():
+            self._launch()
+        try:
+            self._new_context()
+        except Exception as exc:  # 브라우저가 컨텍스트를 만들지 못하면 브라우저째 다시 띄운다.
+            self._logger.warning("컨텍스트 생성 실패로 브라우저 재시작 슬롯=%s 오류=%s", self.name, exc)
+            self.restarts += 1
+            self._close_context()
+            self._close_browser()
+            self._launch()
+            self._new_context()
+        return self._counted
+
+    def _launch(self) -> None:
+        if self._browser is not None:  # 작업 사이에 연결이 끊긴 브라우저.
+            self.restarts += 1
+            self._close_browser()
+        self._playwright = self._start()
         self._browser = self._playwright.chromium.launch()
+        self._logger.info("브라우저 시작 슬롯=%s 재시작=%s", self.name, self.restarts)
+
+    def _new_context(self) -> None:
         self._context = self._browser.new_context(user_agent=self._config.user_agent)
         self._context.set_default_timeout(self._config.timeout_ms)
-        self._logger.info("브라우저 컨텍스트 준비됨")
+        self._page = self._context.new_page()
+        self._counted = _CountedPage(self._page, self._count_request)
+        self._page.on("crash", lambda _page: self._mark_crashed())
+        self._crashed = False
+        self._context_requests = 0
+        self._consecutive_errors = 0
+        try:  # 메모리 측정은 Chromium CDP로만 한다. 안 되면 측정 없이 쓴다.
+            self._cdp = self._context.new_cdp_session(self._page)
+            self._cdp.send("Performance.enable")
+        except Exception:
+            self._cdp = None
+
+    def _mark_crashed(self) -> None:
+        self._crashed = True
+
+    def _count_request(self) -> None:
+        self.requests += 1
+        self._context_requests += 1
+
+    def _finish(self, ok: bool) -> None:
+        self.jobs += 1
+        if ok:
+            self._consecutive_errors = 0
+        else:
+            self.errors += 1
+            self._consecutive_errors += 1
+        if self._crashed or self._page.is_closed():
+            self._recycle("crash", restart=True)
+        elif not self._browser.is_connected():
+            self._recycle("disconnected", restart=True)
+        elif self._consecutive_errors >= self._config.browser_context_max_errors:
+            self._recycle(f"연속오류 {self._consecutive_errors}")
+        else:
+            reason = self._exhausted()
+            if reason is not None:
+                self._recycle(reason)
+
+    def _exhausted(self) -> Optional[str]:
+        """요청 수나 메모리 기준을 넘었으면 교체 원인을 반환한다."""
+        if self._context_requests >= self._config.browser_context_max_requests:
+            return f"요청 {self._context_requests}"
+        self.memory_mb = self._measure_memory()
+        if self.memory_mb is not None and self.memory_mb >= self._config.browser_context_max_memory_mb:
+            return f"메모리 {self.memory_mb:.0f}MB"
+        return None
+
+    def _measure_memory(self) -> Optional[float]:
+        if self._cdp is None:
+            return None
+        try:
+            metrics = self._cdp.send("Performance.getMetrics")["metrics"]
+        except Exception:
+            return None
+        heap = next((metric["value"] for metric in metrics if metric["name"] == "JSHeapUsedSize"), None)
+        return None if heap is None else round(heap / (1024 * 1024), 1)
+
+    def _recycle(self, reason: str, restart: bool = False) -> None:
+        self.recycles += 1
+        self._logger.info(
+            "브라우저 컨텍스트 교체 슬롯=%s 원인=%s 브라우저재시작=%s 누적요청=%s", self.name, reason, restart, self.requests
+        )
+        self._close_context()
+        if restart:
+            self._close_browser()
+            self.restarts += 1
+
+    def _close_context(self) -> None:
+        context, self._context, self._page, self._counted, self._cdp = self._context, None, None, None, None
+        if context is not None:
+            try:
+                context.close()
+            except Exception as exc:  # 죽은 컨텍스트는 닫기도 실패할 수 있다.
+                self._logger.debug("컨텍스트 닫기 실패 슬롯=%s 오류=%s", self.name, exc)
+
+    def _close_browser(self) -> None:
+        browser, playwright = self._browser, self._playwright
+        self._browser, self._playwright = None, None
+        for closer in (browser.close if browser else None, playwright.stop if playwright else None):
+            if closer is None:
+                continue
+            try:
+                closer()
+            except Exception as exc:
+                self._logger.debug("브라우저 종료 실패 슬롯=%s 오류=%s", self.name, exc)
+
+
+class BrowserPool:
+    """동시 작업에 페이지를 나눠 주는 풀. 슬롯(`BrowserSlot`)마다 전용 스레드가 있고, `submit(fn)`한 작업은
+    빈 슬롯의 스레드에서 `fn(page)`로 실행된다. 동기 Playwright 객체는 스레드를 넘나들 수 없기 때문이다.
+    """
+
+    def __init__(self, config: CrawlConfig, size: int, start: Optional[Callable[[], Any]] = None) -> None:
+        self._slots = [BrowserSlot(config, f"slot-{index}", start) for index in range(max(1, size))]
+        self._jobs: queue.Queue[Optional[tuple[Callable[[Any], Any], Future[Any]]]] = queue.Queue()
+        self._threads: list[threading.Thread] = []
+
+    def __enter__(self) -> "BrowserPool":
+        for slot in self._slots:
+            thread = threading.Thread(target=self._work, args=(slot,), name=f"browser-{slot.name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
-        if self._context is not None:
-            self._context.close()
-        if self._browser is not None:
-            self._browser.close()
-        if self._playwright is not None:
-            self._playwright.stop()
-        self._logger.info("브라우저 컨텍스트 종료됨")
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
         return None
 
-    def new_page(self) -> Any:
-        if self._context is None:
-            raise RuntimeError("BrowserController not initialized")
-        page: Page = self._context.new_page()
-        return page
+    def submit(self, fn: Callable[[Any], T]) -> Future[T]:
+        if not self._threads:
+            raise RuntimeError("BrowserPool not started")
+        future: Future[T] = Future()
+        self._jobs.put((fn, future))
+        return future
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [slot.stats() for slot in self._slots]
+
+    def _work(self, slot: BrowserSlot) -> None:
+        with slot:  # 브라우저는 이 스레드에서 열고 닫는다.
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                fn, future = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(slot.run(fn))
+                except BaseException as exc:
+                    future.set_exception(exc)
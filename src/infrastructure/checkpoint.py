@@ -1,36 +1,198 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
+
+if os.name == "nt":  # pragma: no cover - Windows 전용 잠금.
+    import msvcrt
+else:
+    import fcntl
+
+_PROCESS_LOCKS: dict[str, threading.Lock] = {}
+_PROCESS_LOCKS_GUARD = threading.Lock()
 
 
 @dataclass
 class CrawlCheckpoint:
     current_page: int
+    done_keys: tuple[tuple[str, str], ...] = ()  # 현재 페이지에서 보강·저장까지 끝난 공고 키.
+    dates: Optional[dict[str, str]] = None  # 이 진행이 쓰던 실제 날짜 범위(상대 날짜 모드).
+    finished: bool = False  # 마지막 페이지까지 끝난 진행.
+
+
+def walk_key(query: dict[str, Any]) -> str:
+    """수집 조건의 해시. 같은 조건이면 같은 진행을 이어받는다.
+
+    조건에는 실행 날짜에 따라 바뀌는 값(상대 날짜 범위의 실제 날짜)을 넣지 않는다. 넣으면 자정을 넘긴 재개가
+    다른 조건으로 보여 처음부터 다시 수집한다.
+    """
+    blob = json.dumps(query, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=8).hexdigest()
 
 
 class CheckpointStore:
-    def __init__(self, path: str) -> None:
+    """수집 조건(walk)별 진행을 한 파일(`{"walks": {키: {...}}}`)에 나눠 기록한다.
+
+    갱신은 잠금 파일(`.lock`)을 잡은 채 읽기 → 자기 항목만 수정 → 임시 파일 fsync → 교체로 하므로,
+    같은 파일을 쓰는 여러 프로세스/스레드가 서로의 진행을 덮어쓰지 않는다.
+    `walk`가 빈 문자열이면 조건 구분 없는 기본 항목이다.
+
+    저장할 때마다 다른 조건 중 끝난 진행과 `stale_days`일 넘게 갱신되지 않은 진행을 지운다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        walk: str = "",
+        query: Optional[dict[str, Any]] = None,
+        dates: Optional[dict[str, str]] = None,
+        stale_days: float = 7.0,
+    ) -> None:
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._walk = walk
+        self._query = query
+        self._dates = dates
+        self._stale_days = stale_days
+        self._logger = logging.getLogger("checkpoint")
+
+    @property
+    def walk(self) -> str:
+        return self._walk
+
+    @property
+    def dates(self) -> Optional[dict[str, str]]:
+        return self._dates
+
+    def for_walk(
+        self,
+        walk: str,
+        query: Optional[dict[str, Any]] = None,
+        dates: Optional[dict[str, str]] = None,
+    ) -> "CheckpointStore":
+        """같은 파일에서 다른 수집 조건의 진행을 다루는 저장소. `query`는 확인용, `dates`는 재개용으로 함께 기록된다."""
+        return CheckpointStore(str(self._path), walk, query, dates, self._stale_days)
 
     def load(self) -> Optional[CrawlCheckpoint]:
-        if not self._path.exists():
+        """이 조건의 진행. 조건 구분이 없던 이전 형식의 진행은 기록된 조건(`query`)이 이 조건과 같을 때만 옮겨
+        이어받고, 아니면(조건이 없던 형식 포함) 버린다. 다른 조건이 먼저 읽어 가로채지 않게 하기 위해서다."""
+        walks = self._read()
+        entry = walks.get(self._walk)
+        if entry is None and self._walk and "" in walks:
+            with self._locked():
+                walks = self._read()
+                entry = walks.get(self._walk)
+                legacy = walks.pop("", None)
+                if entry is None and legacy is not None:
+                    recorded = legacy.get("query")
+                    if isinstance(recorded, dict) and walk_key(recorded) == self._walk:
+                        entry = walks[self._walk] = legacy
+                        self._logger.info("이전 형식 체크포인트를 조건 %s로 옮김 페이지=%s", self._walk, legacy.get("current_page"))
+                    else:
+                        self._logger.warning(
+                            "조건이 맞지 않는 이전 형식 체크포인트를 버림 페이지=%s (처음부터 수집)", legacy.get("current_page")
+                        )
+                self._write(walks)
+        if not entry:
             return None
-        data = json.loads(self._path.read_text(encoding="utf-8"))
-        current_page = int(data.get("current_page", 0))
+        current_page = int(entry.get("current_page", 0))
         if current_page <= 0:
             return None
-        return CrawlCheckpoint(current_page=current_page)
+        done_keys = tuple((str(key[0]), str(key[1])) for key in entry.get("done_keys", []))
+        dates = entry.get("dates")
+        return CrawlCheckpoint(
+            current_page=current_page,
+            done_keys=done_keys,
+            dates=dict(dates) if dates else None,
+            finished=bool(entry.get("finished", False)),
+        )
 
     def save(self, checkpoint: CrawlCheckpoint) -> None:
-        payload = {"current_page": checkpoint.current_page}
-        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
-        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
-        tmp_path.replace(self._path)
+        """공고 단위 진행은 서비스가 묶어서 저장한다."""
+        entry: dict[str, Any] = {
+            "current_page": checkpoint.current_page,
+            "done_keys": [list(key) for key in checkpoint.done_keys],
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        if self._query is not None:
+            entry["query"] = self._query
+        dates = checkpoint.dates or self._dates
+        if dates:
+            entry["dates"] = dates
+        if checkpoint.finished:
+            entry["finished"] = True
+        with self._locked():
+            walks = self._read()
+            self._prune(walks)
+            walks[self._walk] = entry
+            self._write(walks)
+
+    def finish(self, current_page: int) -> None:
+        """마지막 페이지까지 끝났음을 기록한다. 다음 실행은 처음부터 시작하고, 다른 조건의 저장 때 정리된다."""
+        self.save(CrawlCheckpoint(current_page=current_page, finished=True))
 
     def clear(self) -> None:
-        if self._path.exists():
-            self._path.unlink()
+        """이 수집 조건의 진행만 지운다. 다른 조건의 진행은 그대로 둔다."""
+        with self._locked():
+            walks = self._read()
+            if walks.pop(self._walk, None) is not None:
+                self._write(walks)
+
+    def walks(self) -> dict[str, dict[str, Any]]:
+        return self._read()
+
+    def _prune(self, walks: dict[str, dict[str, Any]]) -> None:
+        cutoff = (datetime.now() - timedelta(days=self._stale_days)).isoformat(timespec="seconds")
+        for walk in list(walks):
+            entry = walks[walk]
+            if walk == self._walk or walk == "":  # 이전 형식 항목은 처음 읽는 조건이 옮기거나 버린다.
+                continue
+            updated_at = str(entry.get("updated_at", ""))
+            if entry.get("finished") or (updated_at and updated_at < cutoff):
+                del walks[walk]
+                self._logger.debug("체크포인트 정리 조건=%s 완료=%s 갱신=%s", walk, entry.get("finished", False), updated_at)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if not self._path.exists():
+            return {}
+        data = json.loads(self._path.read_text(encoding="utf-8"))
+        if "walks" not in data:  # 조건 구분이 없던 이전 형식은 기본 항목으로 읽는다.
+            return {"": data} if data.get("current_page") else {}
+        return dict(data["walks"])
+
+    def _write(self, walks: dict[str, dict[str, Any]]) -> None:
+        tmp_path = self._path.with_suffix(self._path.suffix + f".{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            fp.write(json.dumps({"walks": walks}, ensure_ascii=False))
+            fp.flush()
+            os.fsync(fp.fileno())
+        tmp_path.replace(self._path)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """프로세스 안(스레드)과 프로세스 사이(잠금 파일) 모두에서 읽기-수정-쓰기를 직렬화한다."""
+        lock_path = self._path.with_suffix(self._path.suffix + ".lock")
+        with _PROCESS_LOCKS_GUARD:
+            thread_lock = _PROCESS_LOCKS.setdefault(str(lock_path.resolve()), threading.Lock())
+        with thread_lock, lock_path.open("a+b") as handle:
+            if os.name == "nt":  # pragma: no cover
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if os.name == "nt":  # pragma: no cover
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
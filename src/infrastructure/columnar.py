@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+import os
+import typing
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+_POSTED_CACHE_SIZE = 100_000
+_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+PostedLookup = Callable[[list[tuple[str, str]]], dict[tuple[str, str], datetime]]
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - 선택 의존성.
+        raise RuntimeError("parquet_enabled requires pyarrow (pip install pyarrow)") from exc
+    return pyarrow
+
+
+class ParquetSink:
+    """저장 행을 `pbanc_pstg_dt` 연/월로 분할한 Parquet 파일에 타입을 유지한 채 기록한다.
+
+    게시일이 없는 행(개찰결과 등)은 같은 공고의 게시일을 따른다. 이번 실행에서 관측한 목록 행(`observe`)에서 먼저
+    찾고, 없으면 `posted_lookup`(조회 색인)으로 지난 실행의 목록 행을 찾는다.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        compression: str = "zstd",
+        posted_lookup: Optional[PostedLookup] = None,
+    ) -> None:
+        self._pa = _import_pyarrow()
+        self._base_dir = base_dir
+        self._compression = compression
+        self._logger = logging.getLogger("columnar")
+        self._run_id = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+        self._schemas: dict[str, Any] = {}
+        self._writers: dict[tuple[str, str, str], Any] = {}
+        self._posted: OrderedDict[tuple[str, str], datetime] = OrderedDict()
+        self._posted_lookup = posted_lookup
+
+    def observe(self, items: Iterable[Any]) -> None:
+        """중복 제거 전의 목록 행에서 게시일을 기억한다. 이미 저장된 공고의 개찰결과도 파티션을 찾게 한다."""
+        for item in items:
+            posted = getattr(item, "pbanc_pstg_dt", None)
+            if isinstance(posted, datetime):
+                self._remember((str(item.bid_pbanc_no or ""), str(item.bid_pbanc_ord or "")), posted)
+
+    def write(self, name: str, model_type: type, rows: list[dict[str, Any]]) -> int:
+        """한 번의 저장(페이지) 묶음을 파티션별 row group 하나로 기록한다."""
+        if not rows:
+            return 0
+        schema = self._schema(name, model_type)
+        self._resolve_missing(rows)
+        partitions: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for row in rows:
+            posted = self._posted_at(row)
+            if posted is None:
+                partition = (_NULL_PARTITION, _NULL_PARTITION)
+            else:
+                partition = (f"{posted.year:04d}", f"{posted.month:02d}")
+            partitions.setdefault(partition, []).append(row)
+        for (year, month), batch in partitions.items():
+            table = self._pa.Table.from_pylist(batch, schema=schema)
+            self._writer(name, year, month, schema).write_table(table)
+        self._logger.debug("Parquet 저장 완료 이름=%s 행=%s 파티션=%s", name, len(rows), len(partitions))
+        return len(rows)
+
+    def close(self) -> None:
+        """열린 파일을 모두 닫아 footer를 기록한다. 다음 기록은 새 part 파일로 시작한다."""
+        for writer in self._writers.values():
+            writer.close()
+        if self._writers:
+            self._logger.info("Parquet 파일 확정 건수=%s 경로=%s", len(self._writers), self._base_dir)
+        self._writers = {}
+        self._run_id = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+
+    def _posted_at(self, row: dict[str, Any]) -> Optional[datetime]:
+        key = _row_key(row)
+        posted = row.get("pbanc_pstg_dt")
+        if isinstance(posted, datetime):
+            self._remember(key, posted)
+            return posted
+        return self._posted.get(key)  # 개찰결과처럼 게시일이 없는 행은 같은 공고의 목록 행을 따른다.
+
+    def _resolve_missing(self, rows: list[dict[str, Any]]) -> None:
+        if self._posted_lookup is None:
+            return
+        missing = {
+            _row_key(row)
+            for row in rows
+            if not isinstance(row.get("pbanc_pstg_dt"), datetime) and _row_key(row) not in self._posted
+        }
+        if not missing:
+            return
+        for key, posted in self._posted_lookup(sorted(missing)).items():
+            self._remember(key, posted)
+
+    def _remember(self, key: tuple[str, str], posted: datetime) -> None:
+        self._posted[key] = posted
+        self._posted.move_to_end(key)
+        if len(self._posted) > _POSTED_CACHE_SIZE:
+            self._posted.popitem(last=False)
+
+    def _writer(self, name: str, year: str, month: str, schema: Any) -> Any:
+        key = (name, year, month)
+        writer = self._writers.get(key)
+        if writer is None:
+            directory = self._base_dir / name / f"year={year}" / f"month={month}"
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"part-{self._run_id}.parquet"
+            writer = self._pa.parquet.ParquetWriter(str(path), schema, compression=self._compression)
+            self._writers[key] = writer
+        return writer
+
+    def _schema(self, name: str, model_type: type) -> Any:
+        schema = self._schemas.get(name)
+        if schema is None:
+            fields = [
+                self._pa.field(field_name, self._arrow_type(info.annotation), nullable=True)
+                for field_name, info in model_type.model_fields.items()  # type: ignore[attr-defined]
+            ]
+            schema = self._pa.schema(fields)
+            self._schemas[name] = schema
+        return schema
+
+    def _arrow_type(self, annotation: Any) -> Any:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if typing.get_origin(annotation) is typing.Union and len(args) == 1:
+            annotation = args[0]
+        if annotation is datetime:
+            return self._pa.timestamp("s")
+        if annotation is bool:
+            return self._pa.bool_()
+        if annotation is int:
+            return self._pa.int64()
+        if annotation is float:
+            return self._pa.float64()
+        return self._pa.string()
+
+
+def _row_key(row: dict[str, Any]) -> tuple[str, str]:
+    return (str(row.get("bid_pbanc_no") or ""), str(row.get("bid_pbanc_ord") or ""))
+
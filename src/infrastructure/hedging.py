@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyWindow:
+    """최근 `size`건의 응답 시간(초). `min_samples`건이 쌓이기 전에는 분위수를 내지 않는다."""
+
+    def __init__(self, size: int = 200, min_samples: int = 20) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def add(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+
+    def samples(self) -> list[float]:
+        with self._lock:
+            return list(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(len(ordered) * q) - 1))]
+
+
+class HedgeBudget:
+    """복제 요청 예산. 원 호출마다 `ratio`개씩(최대 `cap`개) 쌓이고 복제 요청 하나가 1개를 쓴다.
+
+    길게 보면 복제 요청은 원 호출의 `ratio` 비율을 넘지 않는다.
+    """
+
+    def __init__(self, ratio: float, cap: float = 10.0) -> None:
+        self._ratio = ratio
+        self._cap = max(1.0, cap)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def earn(self) -> None:
+        with self._lock:
+            self._tokens = min(self._cap, self._tokens + self._ratio)
+
+    def spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class Hedger:
+    """멱등 POST의 꼬리 지연을 줄인다. 호출이 엔드포인트의 최근 p95를 넘기면 같은 요청을 하나 더 보내고
+    먼저 성공한 응답을 쓴다. 이미 보낸 진 쪽 호출은 멈출 수 없다(진행 중인 urllib 호출은 취소되지 않는다).
+    응답이 오면 버리고, 그동안 작업 스레드 하나를 차지한다. 풀이 차서 아직 시작하지 못한 복제 요청만 취소된다.
+
+    복제 요청은 모든 엔드포인트가 함께 쓰는 `HedgeBudget`(원 호출의 `budget_ratio`)을 넘지 않는다.
+    호출은 작업 스레드에서 돌므로 스레드 안전한 전송 계층에서만 쓴다.
+    """
+
+    def __init__(
+        self,
+        budget_ratio: float = 0.05,
+        min_delay_sec: float = 0.05,
+        quantile: float = 0.95,
+        window: int = 200,
+        min_samples: int = 20,
+        workers: int = 16,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._budget = HedgeBudget(budget_ratio)
+        self._min_delay_sec = min_delay_sec
+        self._quantile = quantile
+        self._window_size = window
+        self._min_samples = min_samples
+        self._workers = workers
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows: dict[str, LatencyWindow] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.denied = 0
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """복제 요청을 보낼 대기 시간. 표본이 모자라면 `None`(헤지하지 않음)."""
+        threshold = self._window(endpoint).quantile(self._quantile)
+        return None if threshold is None else max(self._min_delay_sec, threshold)
+
+    def call(self, endpoint: str, fn: Callable[[], T], duplicate: Optional[Callable[[], T]] = None) -> T:
+        """`fn`을 호출한다. 지연이 기준을 넘으면 `duplicate`(기본: `fn`)를 한 번 더 보내 먼저 성공한 결과를 반환한다."""
+        window = self._window(endpoint)
+        delay = self.delay(endpoint)
+        self._budget.earn()
+        with self._lock:
+            self.calls += 1
+        started = self._clock()
+        if delay is None:  # 기준을 배우는 동안은 호출 스레드에서 그대로 부른다.
+            result = fn()
+            window.add(self._clock() - started)
+            return result
+
+        primary = self._pool().submit(fn)
+        primary.add_done_callback(lambda future: self._observe(window, future, started))
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+        if not self._budget.spend():
+            with self._lock:
+                self.denied += 1
+            return primary.result()
+
+        backup = self._pool().submit(duplicate or fn)
+        with self._lock:
+            self.hedged += 1
+        pending: set[Future[T]] = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is backup:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        return primary.result()  # 둘 다 실패하면 원 호출의 오류를 그대로 던진다.
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"calls": self.calls, "hedged": self.hedged, "hedge_wins": self.hedge_wins, "denied": self.denied}
+
+    def close(self) -> None:
+        """작업 스레드를 정리한다. 진행 중인 호출은 끝까지 돌고, 이후 호출은 새 풀을 연다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _observe(self, window: LatencyWindow, future: Future[T], started: float) -> None:
+        if not future.cancelled() and future.exception() is None:  # 원 호출의 실제 지연만 기준에 넣는다.
+            window.add(self._clock() - started)
+
+    def _window(self, endpoint: str) -> LatencyWindow:
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None:
+                window = self._windows[endpoint] = LatencyWindow(self._window_size, self._min_samples)
+            return window
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="hedge")
+            return self._executor
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+from src.infrastructure.key_index import KeyIndex, connect_sqlite
+
+# 수집 시점마다 바뀌는 페이징 메타. 내용 변경으로 보지 않는다.
+VOLATILE_FIELDS = frozenset({"row_num", "tot_cnt", "current_page", "record_count_per_page", "next_row_yn"})
+
+_KEY_SEP = "\x1f"
+_BATCH = 500
+
+
+def history_key(key: tuple[str, ...]) -> str:
+    return _KEY_SEP.join(key)
+
+
+class NoticeHistory:
+    """키별 현재 버전(`notice_current`)과 대체된 이전 버전(`notice_history`, SCD2)을 SQLite에 유지한다.
+
+    유효 시각은 마이크로초 단위이며 키마다 단조 증가한다. `shared`를 주면 키 인덱스의 연결/잠금을 함께 쓰고
+    확정은 키 인덱스 쪽에서 한다.
+    """
+
+    def __init__(self, db_path: str, shared: Optional[KeyIndex] = None) -> None:
+        self._logger = logging.getLogger("history")
+        self._owns_conn = shared is None
+        self._lock = threading.RLock() if shared is None else shared.lock
+        self._conn = connect_sqlite(db_path) if shared is None else shared.connection
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS notice_current ("
+            "tbl TEXT NOT NULL, key TEXT NOT NULL, content_hash TEXT NOT NULL, "
+            "valid_from TEXT NOT NULL, payload TEXT NOT NULL, PRIMARY KEY (tbl, key)) WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS notice_history ("
+            "tbl TEXT NOT NULL, key TEXT NOT NULL, valid_from TEXT NOT NULL, valid_to TEXT NOT NULL, "
+            "content_hash TEXT NOT NULL, payload TEXT NOT NULL, PRIMARY KEY (tbl, key, valid_from)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def record(
+        self,
+        table: str,
+        keys: tuple[str, ...],
+        items: Iterable[Any],
+        observed_at: Optional[datetime] = None,
+    ) -> int:
+        """관측한 행을 현재 버전과 비교해 바뀐 행만 기록한다. 신규/변경 건수를 반환한다."""
+        valid_from = _timestamp(observed_at or datetime.now())
+        latest: dict[str, tuple[str, str]] = {}
+        for item in items:
+            row = item.model_dump(mode="json")
+            key = history_key(tuple(str(row.get(k) or "").strip() for k in keys))
+            payload = json.dumps(
+                {name: value for name, value in row.items() if name not in VOLATILE_FIELDS},
+                ensure_ascii=False,
+                sort_keys=True,
+            )
+            latest[key] = (hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest(), payload)
+        if not latest:
+            return 0
+        with self._lock:
+            current = self._current_hashes(table, list(latest))
+            changed = 0
+            for key, (content_hash, payload) in latest.items():
+                previous = current.get(key)
+                if previous is not None and previous[0] == content_hash:
+                    continue
+                version_from = valid_from
+                if previous is not None:  # 이전 버전을 이력으로 옮기고 유효 종료 시각을 닫는다.
+                    if version_from <= previous[1]:  # 같은 시각(또는 시계 역행)에 다시 바뀌어도 이력을 덮어쓰지 않는다.
+                        version_from = _timestamp(datetime.fromisoformat(previous[1]) + timedelta(microseconds=1))
+                    self._conn.execute(
+                        "INSERT INTO notice_history "
+                        "SELECT tbl, key, valid_from, ?, content_hash, payload FROM notice_current "
+                        "WHERE tbl = ? AND key = ?",
+                        (version_from, table, key),
+                    )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO notice_current VALUES (?, ?, ?, ?, ?)",
+                    (table, key, content_hash, version_from, payload),
+                )
+                changed += 1
+            self._commit()
+        if changed:
+            self._logger.debug("이력 반영 테이블=%s 신규/변경=%s 관측=%s", table, changed, len(latest))
+        return changed
+
+    def current(self, table: str, key: tuple[str, ...]) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT valid_from, payload FROM notice_current WHERE tbl = ? AND key = ?",
+                (table, history_key(key)),
+            ).fetchone()
+        return _version(row[0], None, row[1]) if row else None
+
+    def as_of(self, table: str, key: tuple[str, ...], at: datetime) -> Optional[dict[str, Any]]:
+        """`at` 시점에 유효했던 버전. 처음 관측하기 전이면 None."""
+        point = _timestamp(at)
+        joined = history_key(key)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT valid_from, payload FROM notice_current WHERE tbl = ? AND key = ? AND valid_from <= ?",
+                (table, joined, point),
+            ).fetchone()
+            if row is not None:
+                return _version(row[0], None, row[1])
+            row = self._conn.execute(
+                "SELECT valid_from, valid_to, payload FROM notice_history "
+                "WHERE tbl = ? AND key = ? AND valid_from <= ? AND valid_to > ? "
+                "ORDER BY valid_from DESC LIMIT 1",
+                (table, joined, point, point),
+            ).fetchone()
+        return _version(row[0], row[1], row[2]) if row else None
+
+    def versions(self, table: str, key: tuple[str, ...]) -> list[dict[str, Any]]:
+        """이전 버전부터 현재 버전까지 시간 순서대로 반환한다."""
+        joined = history_key(key)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT valid_from, valid_to, payload FROM notice_history "
+                "WHERE tbl = ? AND key = ? ORDER BY valid_from",
+                (table, joined),
+            ).fetchall()
+        versions = [_version(*row) for row in rows]
+        latest = self.current(table, key)
+        if latest is not None:
+            versions.append(latest)
+        return versions
+
+    def close(self) -> None:
+        if not self._owns_conn:
+            return  # 공유 연결은 키 인덱스가 확정하고 닫는다.
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    def _commit(self) -> None:
+        if self._owns_conn:
+            self._conn.commit()
+
+    def _current_hashes(self, table: str, keys: list[str]) -> dict[str, tuple[str, str]]:
+        """키별 (내용 해시, 유효 시작 시각)."""
+        hashes: dict[str, tuple[str, str]] = {}
+        for start in range(0, len(keys), _BATCH):
+            batch = keys[start : start + _BATCH]
+            placeholders = ", ".join("?" for _ in batch)
+            rows = self._conn.execute(
+                f"SELECT key, content_hash, valid_from FROM notice_current WHERE tbl = ? AND key IN ({placeholders})",
+                (table, *batch),
+            ).fetchall()
+            hashes.update((key, (content_hash, valid_from)) for key, content_hash, valid_from in rows)
+        return hashes
+
+
+def _timestamp(at: datetime) -> str:
+    return at.isoformat(timespec="microseconds")
+
+
+def _version(valid_from: str, valid_to: Optional[str], payload: str) -> dict[str, Any]:
+    return {"valid_from": valid_from, "valid_to": valid_to, "data": json.loads(payload)}
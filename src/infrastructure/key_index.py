@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import csv
+import io
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Protocol, Union
+
+
+def connect_sqlite(db_path: str) -> sqlite3.Connection:
+    """`nuri.db` 공용 연결 설정. 저장 스레드에서도 쓰므로 스레드 검사는 끄고 호출 측에서 잠근다."""
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class KeySource(Protocol):
+    """키 인덱스가 따라가는 원본. 워터마크 단위는 원본마다 다르다(CSV는 바이트, 세그먼트는 행 수).
+
+    `base`는 앞에 이어 붙인 원본(세그먼트 전환 전 CSV)의 크기다. 없으면 0이고, 워터마크와 따로 기록한다.
+    """
+
+    def base(self) -> int: ...
+
+    def watermark(self) -> int: ...
+
+    def read_keys(self, keys: tuple[str, ...], offset: int, base: int = 0) -> Iterable[tuple[str, ...]]: ...
+
+
+class CsvKeySource:
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def base(self) -> int:
+        return 0
+
+    def watermark(self) -> int:
+        return self._path.stat().st_size if self._path.exists() else 0
+
+    def read_keys(self, keys: tuple[str, ...], offset: int, base: int = 0) -> Iterable[tuple[str, ...]]:
+        return _read_keys(self._path, keys, offset)
+
+
+class KeyIndex:
+    """중복 방지 키를 SQLite에 영속화한다. 시작 시 CSV 전체를 다시 읽지 않는다."""
+
+    def __init__(self, db_path: str) -> None:
+        self._path = Path(db_path)
+        self._logger = logging.getLogger("key_index")
+        self._lock = threading.RLock()
+        self._conn = connect_sqlite(db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS key_index_meta ("
+            "name TEXT PRIMARY KEY, watermark INTEGER NOT NULL, key_count INTEGER NOT NULL)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(key_index_meta)")}
+        if "base" not in columns:  # 이전 형식: 워터마크 하나만 있었다.
+            self._conn.execute("ALTER TABLE key_index_meta ADD COLUMN base INTEGER NOT NULL DEFAULT 0")
+        self._conn.commit()
+
+    def table(self, name: str, keys: tuple[str, ...], source: Union[Path, KeySource]) -> "IndexedKeys":
+        if isinstance(source, Path):
+            source = CsvKeySource(source)
+        return IndexedKeys(self, name, keys, source)
+
+    def commit(self) -> None:
+        """연결을 함께 쓰는 색인(조회/이력/검색)의 변경을 확정한다. 대기 중인 키가 없을 때만 호출한다."""
+        with self._lock:
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self._conn
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._lock
+
+
+class IndexedKeys:
+    """`set[tuple[str, ...]]`과 같은 `in`/`add` 인터페이스를 갖는 키 테이블 뷰."""
+
+    def __init__(self, index: KeyIndex, name: str, keys: tuple[str, ...], source: KeySource) -> None:
+        self._index = index
+        self._conn = index.connection
+        self._lock = index.lock
+        self._name = name
+        self._keys = keys
+        self._source = source
+        self._table = f"keys_{name}"
+        columns = ", ".join(f"k{i} TEXT NOT NULL" for i in range(len(keys)))
+        primary = ", ".join(f"k{i}" for i in range(len(keys)))
+        where = " AND ".join(f"k{i} = ?" for i in range(len(keys)))
+        placeholders = ", ".join("?" for _ in keys)
+        self._select_sql = f"SELECT 1 FROM {self._table} WHERE {where} LIMIT 1"
+        self._insert_sql = f"INSERT OR IGNORE INTO {self._table} VALUES ({placeholders})"
+        self._logger = logging.getLogger("key_index")
+        with self._lock:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table} ({columns}, PRIMARY KEY ({primary})) WITHOUT ROWID"
+            )
+            row = self._conn.execute(
+                "SELECT base, watermark, key_count FROM key_index_meta WHERE name = ?", (name,)
+            ).fetchone()
+            self._base, self._watermark, self._count = (int(row[0]), int(row[1]), int(row[2])) if row else (0, 0, 0)
+            self._sync_with_source()
+        self._savepoint_count: Optional[int] = None
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return self._conn.execute(self._select_sql, key).fetchone() is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[tuple[str, ...]]:
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT * FROM {self._table}")
+            while True:
+                rows = cursor.fetchmany(10000)
+                if not rows:
+                    break
+                for row in rows:
+                    yield tuple(row)
+
+    @property
+    def watermark(self) -> int:
+        return self._watermark
+
+    def add(self, key: tuple[str, ...]) -> None:
+        with self._lock:
+            if self._conn.execute(self._insert_sql, key).rowcount:
+                self._count += 1
+
+    def commit(self) -> None:
+        """원본 기록이 끝난 뒤 호출한다. 현재 원본 위치(CSV 크기/세그먼트 행 수)를 워터마크로 함께 기록한다."""
+        with self._lock:
+            self._base = self._source.base()
+            self._watermark = self._source.watermark()
+            self._write_meta()
+            self._conn.commit()
+            self._savepoint_count = None  # COMMIT은 열린 SAVEPOINT도 함께 끝낸다.
+
+    def begin(self) -> None:
+        """이 테이블만 되돌릴 수 있게 SAVEPOINT를 연다. 연결은 다른 테이블/색인의 미확정 변경과 함께 쓴다."""
+        with self._lock:
+            if not self._conn.in_transaction:  # 바깥 트랜잭션이 없으면 RELEASE가 곧 COMMIT이 되므로 먼저 연다.
+                self._conn.execute("BEGIN")
+            self._conn.execute(f"SAVEPOINT {self._table}")
+            self._savepoint_count = self._count
+
+    def release(self) -> None:
+        """`begin()` 이후의 추가를 바깥 트랜잭션에 남긴다. 확정은 `commit()`에서 한다."""
+        with self._lock:
+            if self._savepoint_count is not None:
+                self._conn.execute(f"RELEASE SAVEPOINT {self._table}")
+                self._savepoint_count = None
+
+    def rollback(self) -> None:
+        """`begin()` 이후 이 테이블에 추가한 키만 되돌린다. 다른 테이블의 대기 중인 키는 그대로 둔다."""
+        with self._lock:
+            if self._savepoint_count is None:
+                return
+            self._conn.execute(f"ROLLBACK TO SAVEPOINT {self._table}")
+            self._conn.execute(f"RELEASE SAVEPOINT {self._table}")
+            self._count = self._savepoint_count
+            self._savepoint_count = None
+
+    def _write_meta(self) -> None:
+        self._conn.execute(
+            "INSERT INTO key_index_meta (name, base, watermark, key_count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET base = excluded.base, watermark = excluded.watermark, "
+            "key_count = excluded.key_count",
+            (self._name, self._base, self._watermark, self._count),
+        )
+
+    def _sync_with_source(self) -> None:
+        base = self._source.base()
+        size = self._source.watermark()
+        if base < self._base or size < self._watermark:  # 원본이 삭제/교체되면 인덱스를 재구성한다.
+            self._logger.info(
+                "키 인덱스 재구성 이름=%s 워터마크=%s/%s 크기=%s/%s", self._name, self._base, self._watermark, base, size
+            )
+            self._conn.execute(f"DELETE FROM {self._table}")
+            self._base = 0
+            self._watermark = 0
+            self._count = 0
+        if base > self._base or size > self._watermark:  # 인덱스 이후에 추가된 구간만 읽어 반영한다.
+            added = 0
+            for key in self._source.read_keys(self._keys, self._watermark, self._base):
+                if self._conn.execute(self._insert_sql, key).rowcount:
+                    added += 1
+            self._count += added
+            self._logger.info(
+                "키 인덱스 동기화 이름=%s 시작=%s 끝=%s 앞원본=%s 추가=%s", self._name, self._watermark, size, base, added
+            )
+            self._base = base
+            self._watermark = size
+        self._write_meta()
+        self._conn.commit()
+
+
+def _read_keys(path: Path, keys: tuple[str, ...], offset: int) -> Iterable[tuple[str, ...]]:
+    with path.open("rb") as fp:
+        header = next(csv.reader([fp.readline().decode("utf-8")]), [])
+        if offset > 0:
+            fp.seek(offset)
+        text = io.TextIOWrapper(fp, encoding="utf-8", newline="")
+        reader = csv.DictReader(text, fieldnames=header)
+        for row in reader:
+            yield tuple((row.get(k) or "").strip() for k in keys)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, Optional
+
+from src.infrastructure.key_index import KeyIndex, connect_sqlite
+
+# 조회 인덱스에 두는 목록 컬럼. 날짜는 ISO 문자열(비교 가능), 없으면 빈 문자열로 둔다.
+INDEX_COLUMNS = (
+    "bid_pbanc_no",
+    "bid_pbanc_ord",
+    "bid_pbanc_nm",
+    "bid_pbanc_num",
+    "grp_nm",
+    "pbanc_inst_unty_grp_no",
+    "pbanc_pstg_dt",
+    "slpr_rcpt_ddln_dt",
+    "pbanc_stts_cd",
+    "pbanc_stts_cd_nm",
+    "pbanc_knd_cd",
+    "bid_pbanc_pgst_cd",
+    "pbanc_stts_grid_cd_nm",
+    "prcm_bsne_se_cd_nm",
+)
+_ORDER_COLUMNS = ("pbanc_pstg_dt", "slpr_rcpt_ddln_dt")
+_EQUALITY_COLUMNS = (
+    "bid_pbanc_no",
+    "grp_nm",
+    "pbanc_inst_unty_grp_no",
+    "pbanc_stts_cd",
+    "pbanc_knd_cd",
+    "bid_pbanc_pgst_cd",
+)
+_SELECTIVE_COLUMNS = ("bid_pbanc_no", "grp_nm", "pbanc_inst_unty_grp_no")
+_BATCH = 400  # 키 하나에 자리표시자 2개(SQLite 기본 한도 999).
+_INDEXES = {
+    "idx_notice_grp_ddln": ("grp_nm", "slpr_rcpt_ddln_dt"),
+    "idx_notice_inst_ddln": ("pbanc_inst_unty_grp_no", "slpr_rcpt_ddln_dt"),
+    "idx_notice_stts_ddln": ("pbanc_stts_cd", "slpr_rcpt_ddln_dt"),
+    "idx_notice_pgst_ddln": ("bid_pbanc_pgst_cd", "slpr_rcpt_ddln_dt"),
+    "idx_notice_ddln": ("slpr_rcpt_ddln_dt",),
+    "idx_notice_pstg": ("pbanc_pstg_dt",),
+}
+
+
+@dataclass
+class NoticeQuery:
+    """조회 조건. 값이 있는 조건만 AND로 결합한다. 날짜 범위는 [from, to)."""
+
+    bid_pbanc_no: Optional[str] = None
+    grp_nm: Optional[str] = None
+    pbanc_inst_unty_grp_no: Optional[str] = None
+    posted_from: Optional[datetime] = None
+    posted_to: Optional[datetime] = None
+    closing_from: Optional[datetime] = None
+    closing_to: Optional[datetime] = None
+    pbanc_stts_cd: Optional[str] = None
+    pbanc_knd_cd: Optional[str] = None
+    bid_pbanc_pgst_cd: Optional[str] = None
+    order_by: str = "slpr_rcpt_ddln_dt"
+
+
+@dataclass
+class QueryPage:
+    rows: list[dict[str, Any]]
+    next_cursor: Optional[tuple[str, str, str]]
+
+
+class NoticeIndex:
+    """목록 공고의 최신 상태를 `notice_index` 테이블에 유지하고 색인 조회를 제공한다.
+
+    `shared`를 주면 키 인덱스의 연결/잠금을 함께 쓴다. 이때 변경은 키와 같은 트랜잭션에 들어가고
+    확정(commit)은 키 인덱스 쪽에서 한다. 연결을 따로 열면 버퍼 모드에서 열려 있는 키 트랜잭션과 잠금이 충돌한다.
+    """
+
+    def __init__(self, db_path: str, shared: Optional[KeyIndex] = None) -> None:
+        self._logger = logging.getLogger("query")
+        self._owns_conn = shared is None
+        self._lock = threading.RLock() if shared is None else shared.lock
+        self._conn = connect_sqlite(db_path) if shared is None else shared.connection
+        columns = ", ".join(f"{name} TEXT NOT NULL DEFAULT ''" for name in INDEX_COLUMNS)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS notice_index ({columns}, "
+            "PRIMARY KEY (bid_pbanc_no, bid_pbanc_ord)) WITHOUT ROWID"
+        )
+        for index_name, index_columns in _INDEXES.items():
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON notice_index ({', '.join(index_columns)})"
+            )
+        self._conn.commit()
+        placeholders = ", ".join("?" for _ in INDEX_COLUMNS)
+        self._upsert_sql = f"INSERT OR REPLACE INTO notice_index VALUES ({placeholders})"
+        self._getter = attrgetter(*INDEX_COLUMNS)
+
+    def upsert(self, items: Iterable[Any]) -> int:
+        """목록 모델을 반영한다. 같은 키는 마지막 관측으로 덮어쓴다."""
+        getter = self._getter
+        values = [tuple(_text(value) for value in getter(item)) for item in items]
+        if not values:
+            return 0
+        with self._lock:
+            self._conn.executemany(self._upsert_sql, values)
+            self._commit()
+        return len(values)
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM notice_index").fetchone()[0])
+
+    def posted_dates(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], datetime]:
+        """공고 키별 게시일시. 색인에 없거나 게시일이 비어 있는 키는 빠진다."""
+        posted: dict[tuple[str, str], datetime] = {}
+        with self._lock:
+            for start in range(0, len(keys), _BATCH):
+                batch = keys[start : start + _BATCH]
+                condition = " OR ".join("(bid_pbanc_no = ? AND bid_pbanc_ord = ?)" for _ in batch)
+                rows = self._conn.execute(
+                    f"SELECT bid_pbanc_no, bid_pbanc_ord, pbanc_pstg_dt FROM notice_index WHERE {condition}",
+                    [value for key in batch for value in key],
+                ).fetchall()
+                posted.update(((no, ord_), datetime.fromisoformat(value)) for no, ord_, value in rows if value)
+        return posted
+
+    def search(
+        self,
+        query: NoticeQuery,
+        limit: int = 100,
+        cursor: Optional[tuple[str, str, str]] = None,
+    ) -> QueryPage:
+        """키셋 페이지네이션. `next_cursor`를 다음 호출에 넘기면 이어서 조회한다."""
+        if query.order_by not in _ORDER_COLUMNS:
+            raise ValueError(f"Unsupported order_by: {query.order_by}")
+        where, params = _conditions(query)
+        if cursor is not None:
+            where.append(f"({query.order_by}, bid_pbanc_no, bid_pbanc_ord) > (?, ?, ?)")
+            params.extend(cursor)
+        sql = "SELECT * FROM notice_index"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {query.order_by}, bid_pbanc_no, bid_pbanc_ord LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            db_cursor = self._conn.cursor()
+            db_cursor.row_factory = _dict_row  # 공유 연결의 row_factory는 건드리지 않는다.
+            rows = db_cursor.execute(sql, params).fetchall()
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = (last[query.order_by], last["bid_pbanc_no"], last["bid_pbanc_ord"])
+        return QueryPage(rows=rows, next_cursor=next_cursor)
+
+    def iter_notices(self, query: NoticeQuery, page_size: int = 500) -> Iterator[dict[str, Any]]:
+        cursor: Optional[tuple[str, str, str]] = None
+        while True:
+            page = self.search(query, page_size, cursor)
+            yield from page.rows
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM notice_index")
+            self._commit()
+
+    def close(self) -> None:
+        if not self._owns_conn:
+            return  # 공유 연결은 키 인덱스가 확정하고 닫는다.
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    def _commit(self) -> None:
+        if self._owns_conn:
+            self._conn.commit()
+
+
+def _conditions(query: NoticeQuery) -> tuple[list[str], list[Any]]:
+    where: list[str] = []
+    params: list[Any] = []
+    selective = any(getattr(query, column) for column in _SELECTIVE_COLUMNS)
+    for column in _EQUALITY_COLUMNS:
+        value = getattr(query, column)
+        if value:
+            # 통계가 없으면 플래너가 값 종류가 적은 상태 코드 인덱스를 고르므로, 기관/키 조건이 있으면 `+`로 제외한다.
+            prefix = "+" if selective and column not in _SELECTIVE_COLUMNS else ""
+            where.append(f"{prefix}{column} = ?")
+            params.append(value)
+    for column, start, end in (
+        ("pbanc_pstg_dt", query.posted_from, query.posted_to),
+        ("slpr_rcpt_ddln_dt", query.closing_from, query.closing_to),
+    ):
+        if start is not None:
+            where.append(f"{column} >= ?")
+            params.append(_text(start))
+        if end is not None:
+            where.append(f"{column} < ?")
+            params.append(_text(end))
+        if start is not None or end is not None:
+            where.append(f"{column} != ''")
+    return where, params
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    return str(value)
+
+
+def _dict_row(cursor: Any, row: tuple[Any, ...]) -> dict[str, Any]:
+    return {description[0]: value for description, value in zip(cursor.description, row)}
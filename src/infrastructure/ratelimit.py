@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+# 호출 결과. `overload`(타임아웃/5xx/429/ErrorCode)는 한도를 줄이고, `neutral`(파싱 오류 등)은 지연만 버린다.
+OK = "ok"
+OVERLOAD = "overload"
+NEUTRAL = "neutral"
+
+# `rate_limits` 키로 쓸 수 있는 엔드포인트(`ResiliencePolicy.call`에 넘기는 이름).
+ENDPOINTS = ("list", "detail", "noce", "attachment", "opening", "detail_popup")
+
+
+class TokenBucket:
+    """초당 `rate`개, 최대 `burst`개까지 쌓이는 토큰. 부족하면 토큰을 미리 예약하고 그만큼 잔다."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self._burst = max(1.0, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self._burst
+        self._updated = clock()
+
+    def acquire(self) -> float:
+        """토큰 하나를 쓰고 기다린 시간(초)을 반환한다. 여러 스레드가 불러도 예약 순서대로 흩어진다."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class AimdLimiter:
+    """동시 호출 한도를 AIMD로 조절한다. 성공 응답마다 `1/한도`씩(대략 한도만큼 성공하면 +1) 늘리고,
+    과부하 오류나 p95 지연이 기준(학습한 최저 p95 × `latency_tolerance`)을 넘으면 절반으로 줄인다.
+
+    줄이는 것은 한 창(RTT)에 한 번이다. 마지막으로 줄이기 전에 보낸 호출의 과부하/지연은 이미 반영한 혼잡을
+    다시 알리는 것이므로 한도를 더 줄이지 않는다(`acquire`가 돌려준 세대로 구분).
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        latency_tolerance: float = 2.0,
+        window: int = 50,
+        min_samples: int = 20,
+    ) -> None:
+        self.endpoint = endpoint
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self.limit = float(min(max(initial, self._minimum), self._maximum))
+        self._latency_tolerance = latency_tolerance
+        self._min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._baseline: Optional[float] = None
+        self._in_flight = 0
+        self._generation = 0  # 한도를 줄일 때마다 1씩 오른다.
+        self._cond = threading.Condition()
+        self._logger = logging.getLogger("ratelimit")
+        self.decreases = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> int:
+        """자리 하나를 얻고 지금 세대를 반환한다. `release`에 다시 넘긴다."""
+        with self._cond:
+            while self._in_flight >= math.floor(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+            return self._generation
+
+    def release(self, outcome: str, latency: float, generation: Optional[int] = None) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if generation is not None and generation != self._generation:
+                pass  # 마지막 감소 전에 보낸 호출. 그 혼잡은 이미 반영했고, 옛 한도에서 잰 지연은 기준에 넣지 않는다.
+            elif outcome == OVERLOAD:
+                self._decrease("오류")
+            elif outcome == OK:
+                self._latencies.append(latency)
+                p95 = self.p95()
+                baseline = self._baseline
+                if p95 is not None and baseline is not None and p95 > baseline * self._latency_tolerance:
+                    self._decrease(f"p95 {p95:.3f}s > 기준 {baseline:.3f}s")
+                else:
+                    if p95 is not None and (self._baseline is None or p95 < self._baseline):
+                        self._baseline = p95
+                    previous = math.floor(self.limit)
+                    self.limit = min(float(self._maximum), self.limit + 1.0 / self.limit)
+                    if math.floor(self.limit) != previous:
+                        self._logger.debug(
+                            "동시성 한도 증가 엔드포인트=%s 한도=%s", self.endpoint, math.floor(self.limit)
+                        )
+            self._cond.notify_all()
+
+    def p95(self) -> Optional[float]:
+        if len(self._latencies) < self._min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+
+    def _decrease(self, reason: str) -> None:
+        previous = math.floor(self.limit)
+        self.limit = max(float(self._minimum), self.limit / 2)
+        self._latencies.clear()
+        self._baseline = None  # 줄인 한도에서 기준 지연을 다시 배운다.
+        self._generation += 1
+        self.decreases += 1
+        self._logger.info(
+            "동시성 한도 감소 엔드포인트=%s 한도=%s->%s 원인=%s", self.endpoint, previous, math.floor(self.limit), reason
+        )
+
+
+class Slot:
+    """호출 하나의 자리. 호출 측이 결과를 적으면 자리를 돌려줄 때 한도에 반영한다(기본: 과부하)."""
+
+    __slots__ = ("outcome",)
+
+    def __init__(self) -> None:
+        self.outcome = OVERLOAD
+
+
+class Governor:
+    """엔드포인트별 토큰 버킷(호출률 상한)과 AIMD 동시성 한도를 함께 적용한다."""
+
+    def __init__(
+        self,
+        rates: Optional[dict[str, float]] = None,
+        burst: float = 1.0,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 16,
+        latency_tolerance: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        unknown = sorted(set(rates or {}) - set(ENDPOINTS))
+        if unknown:
+            raise ValueError(f"Unsupported rate_limits endpoint: {', '.join(unknown)} (expected one of {ENDPOINTS})")
+        self._rates = dict(rates or {})
+        self._burst = burst
+        self._initial = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: dict[str, Optional[TokenBucket]] = {}
+        self._limiters: dict[str, AimdLimiter] = {}
+
+    @contextmanager
+    def slot(self, endpoint: str) -> Iterator[Slot]:
+        """호출률 토큰과 동시성 자리를 얻는다. 토큰을 먼저 얻어 자리를 쥔 채 잠들지 않는다."""
+        bucket, limiter = self._endpoint(endpoint)
+        if bucket is not None:
+            bucket.acquire()
+        generation = limiter.acquire()
+        slot = Slot()
+        started = self._clock()
+        try:
+            yield slot
+        finally:
+            limiter.release(slot.outcome, self._clock() - started, generation)
+
+    def limits(self) -> dict[str, int]:
+        with self._lock:
+            return {endpoint: math.floor(limiter.limit) for endpoint, limiter in self._limiters.items()}
+
+    def _endpoint(self, endpoint: str) -> tuple[Optional[TokenBucket], AimdLimiter]:
+        with self._lock:
+            limiter = self._limiters.get(endpoint)
+            if limiter is None:
+                rate = self._rates.get(endpoint)
+                self._buckets[endpoint] = TokenBucket(rate, self._burst, self._clock, self._sleep) if rate else None
+                limiter = self._limiters[endpoint] = AimdLimiter(
+                    endpoint, self._initial, self._minimum, self._maximum, self._latency_tolerance
+                )
+            return self._buckets[endpoint], limiter
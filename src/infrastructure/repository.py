@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import csv
 import logging
+import time
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
+from src.core.config import StorageConfig
 from src.domain.models import (
     AttachmentItem,
     BidNoticeDetail,
@@ -13,6 +16,16 @@ from src.domain.models import (
     BidOpeningSummary,
     NoceItem,
 )
+from src.infrastructure.appender import CsvAppender
+from src.infrastructure.bloom import BloomFilteredKeys
+from src.infrastructure.columnar import ParquetSink
+from src.infrastructure.history import NoticeHistory
+from src.infrastructure.key_index import IndexedKeys, KeyIndex, KeySource
+from src.infrastructure.query import NoticeIndex, NoticeQuery, QueryPage
+from src.infrastructure.search import NoticeSearch, SearchHit
+from src.infrastructure.segments import SegmentKeySource, SegmentSet, SegmentWriter, iter_table_rows, segment_dir
+from src.infrastructure.stream import NdjsonSink
+from src.infrastructure.view import ViewMaterializer, view_fieldnames
 
 _LIST_UNIQUE_KEYS = ("bid_pbanc_no", "bid_pbanc_ord")
 _DETAIL_UNIQUE_KEYS = ("bid_pbanc_no", "bid_pbanc_ord", "bid_clsf_no", "bid_prgrs_ord")
@@ -21,11 +34,20 @@ _ATTACH_UNIQUE_KEYS = ("unty_atch_file_no", "atch_file_sqno")
 _OPENING_SUMMARY_UNIQUE_KEYS = ("bid_pbanc_no", "bid_pbanc_ord", "bid_clsf_no", "bid_prgrs_ord")
 _OPENING_RESULT_UNIQUE_KEYS = ("bid_pbanc_no", "bid_pbanc_ord", "bid_clsf_no", "bid_prgrs_ord", "ibx_onbs_rnkg")
 
+_COLUMNAR_TABLES = ("list", "detail", "opening_result")
+_HISTORY_TABLES = ("list", "detail", "opening_summary", "opening_result")
+_SEARCH_TABLES = ("list", "notice", "attachments")
+
+SeenKeys = Union[set[tuple[str, ...]], IndexedKeys, BloomFilteredKeys]
+# (테이블 이름, 새로 저장된 행, 행별 소유 공고 키 또는 None)
+SaveListener = Callable[[str, list[Any], Optional[list[Optional[tuple[str, str]]]]], None]
+
 
 class NoticeRepository:
-    """현재는 CSV 저장소이며, SQLite 저장은 추후 도입 예정이다."""
-    def __init__(self, sqlite_path: str) -> None:
+    """CSV 저장소이며, 중복 방지 키는 `sqlite_path`의 SQLite 인덱스에 영속화한다."""
+    def __init__(self, sqlite_path: str, storage: Optional[StorageConfig] = None) -> None:
         self._sqlite_path = sqlite_path
+        self._storage = storage or StorageConfig()
         self._logger = logging.getLogger("repository")
         self._data_dir = Path(sqlite_path).parent
         self._data_dir.mkdir(parents=True, exist_ok=True)
@@ -35,46 +57,393 @@ class NoticeRepository:
         self._attachment_path = self._data_dir / "attachments.csv"
         self._opening_summary_path = self._data_dir / "opening_summary.csv"
         self._opening_result_path = self._data_dir / "opening_result.csv"
-        self._list_seen = self._load_seen(self._list_path, _LIST_UNIQUE_KEYS)
-        self._detail_seen = self._load_seen(self._detail_path, _DETAIL_UNIQUE_KEYS)
-        self._noce_seen = self._load_seen(self._noce_path, _NOCE_UNIQUE_KEYS)
-        self._attachment_seen = self._load_seen(self._attachment_path, _ATTACH_UNIQUE_KEYS)
-        self._opening_summary_seen = self._load_seen(
-            self._opening_summary_path, _OPENING_SUMMARY_UNIQUE_KEYS
+        self._key_index: Optional[KeyIndex] = None
+        self._bloom_filters: list[BloomFilteredKeys] = []
+        if self._storage.dedupe_backend == "sqlite":
+            self._key_index = KeyIndex(sqlite_path)
+        elif self._storage.dedupe_backend != "memory":
+            raise ValueError(f"Unsupported dedupe_backend: {self._storage.dedupe_backend}")
+        elif self._storage.dedupe_bloom_enabled:
+            self._logger.warning("블룸 필터는 dedupe_backend=sqlite에서만 사용합니다. 설정을 무시합니다.")
+        if self._storage.view_mode not in ("deferred", "inline", "off"):
+            raise ValueError(f"Unsupported view_mode: {self._storage.view_mode}")
+        if self._storage.writer_mode not in ("simple", "buffered"):
+            raise ValueError(f"Unsupported writer_mode: {self._storage.writer_mode}")
+        if self._storage.output_format not in ("csv", "segments"):
+            raise ValueError(f"Unsupported output_format: {self._storage.output_format}")
+        self._appenders: Optional[dict[str, Union[CsvAppender, SegmentWriter]]] = None
+        if self._storage.writer_mode == "buffered" or self._storage.output_format == "segments":
+            self._appenders = {}  # 세그먼트는 항상 열린 스트림에 기록하고 flush()에서 확정한다.
+        self._pending_seen: dict[str, SeenKeys] = {}
+        self._last_flush = time.monotonic()
+        self._views = ViewMaterializer(self._data_dir) if self._storage.view_mode == "deferred" else None
+        self._history = NoticeHistory(sqlite_path, self._key_index) if self._storage.history_enabled else None
+        self._notice_index = (
+            NoticeIndex(sqlite_path, self._key_index) if self._storage.query_index_enabled else None
+        )
+        self._search = NoticeSearch(sqlite_path, self._key_index) if self._storage.search_enabled else None
+        self._listeners: list[SaveListener] = []
+        self._stream: Optional[NdjsonSink] = None
+        if self._storage.stream_target:
+            self._stream = NdjsonSink(
+                self._storage.stream_target,
+                self._storage.stream_buffer_records,
+                self._storage.stream_overflow,
+                self._storage.stream_spill_path or str(self._data_dir / "stream_spill.jsonl"),
+            )
+            self.add_listener(self._stream.emit)
+        self._parquet: Optional[ParquetSink] = None
+        if self._storage.parquet_enabled:
+            parquet_dir = self._storage.parquet_dir or str(self._data_dir / "parquet")
+            self._parquet = ParquetSink(
+                Path(parquet_dir),
+                self._storage.parquet_compression,
+                self._notice_index.posted_dates if self._notice_index is not None else None,
+            )
+        self._list_seen = self._open_seen("list", self._list_path, _LIST_UNIQUE_KEYS)
+        self._detail_seen = self._open_seen("detail", self._detail_path, _DETAIL_UNIQUE_KEYS)
+        self._noce_seen = self._open_seen("notice", self._noce_path, _NOCE_UNIQUE_KEYS)
+        self._attachment_seen = self._open_seen("attachments", self._attachment_path, _ATTACH_UNIQUE_KEYS)
+        self._opening_summary_seen = self._open_seen(
+            "opening_summary", self._opening_summary_path, _OPENING_SUMMARY_UNIQUE_KEYS
         )
-        self._opening_result_seen = self._load_seen(
-            self._opening_result_path, _OPENING_RESULT_UNIQUE_KEYS
+        self._opening_result_seen = self._open_seen(
+            "opening_result", self._opening_result_path, _OPENING_RESULT_UNIQUE_KEYS
         )
 
     def save_list_items(self, items: Iterable[BidNoticeListItem]) -> int:
-        rows = self._dedupe_rows([item.model_dump() for item in items], _LIST_UNIQUE_KEYS, self._list_seen)
-        return self._write_csv(self._list_path, rows, BidNoticeListItem)
+        return self._save_items(
+            "list",
+            self._list_path,
+            items,
+            _LIST_UNIQUE_KEYS,
+            self._list_seen,
+            BidNoticeListItem,
+        )
 
     def save_detail_items(self, items: Iterable[BidNoticeDetail]) -> int:
-        rows = self._dedupe_rows([item.model_dump() for item in items], _DETAIL_UNIQUE_KEYS, self._detail_seen)
-        return self._write_csv(self._detail_path, rows, BidNoticeDetail)
+        return self._save_items(
+            "detail",
+            self._detail_path,
+            items,
+            _DETAIL_UNIQUE_KEYS,
+            self._detail_seen,
+            BidNoticeDetail,
+        )
 
-    def save_noce_items(self, items: Iterable[NoceItem]) -> int:
-        rows = self._dedupe_rows([item.model_dump() for item in items], _NOCE_UNIQUE_KEYS, self._noce_seen)
-        return self._write_csv(self._noce_path, rows, NoceItem)
+    def save_noce_items(
+        self,
+        items: Iterable[NoceItem],
+        owners: Optional[list[tuple[str, str]]] = None,
+    ) -> int:
+        """`owners`는 각 공지가 속한 공고 키(bid_pbanc_no, bid_pbanc_ord). 전문 검색 색인 연결에만 쓴다."""
+        return self._save_items(
+            "notice",
+            self._noce_path,
+            items,
+            _NOCE_UNIQUE_KEYS,
+            self._noce_seen,
+            NoceItem,
+            owners,
+        )
 
-    def save_attachment_items(self, items: Iterable[AttachmentItem]) -> int:
-        rows = self._dedupe_rows(
-            [item.model_dump() for item in items], _ATTACH_UNIQUE_KEYS, self._attachment_seen
+    def save_attachment_items(
+        self,
+        items: Iterable[AttachmentItem],
+        owners: Optional[list[tuple[str, str]]] = None,
+    ) -> int:
+        """`owners`는 각 첨부가 속한 공고 키. 없으면 검색 색인은 상세의 첨부 그룹 키로 연결한다."""
+        return self._save_items(
+            "attachments",
+            self._attachment_path,
+            items,
+            _ATTACH_UNIQUE_KEYS,
+            self._attachment_seen,
+            AttachmentItem,
+            owners,
         )
-        return self._write_csv(self._attachment_path, rows, AttachmentItem)
 
     def save_opening_summary_items(self, items: Iterable[BidOpeningSummary]) -> int:
-        rows = self._dedupe_rows(
-            [item.model_dump() for item in items], _OPENING_SUMMARY_UNIQUE_KEYS, self._opening_summary_seen
+        return self._save_items(
+            "opening_summary",
+            self._opening_summary_path,
+            items,
+            _OPENING_SUMMARY_UNIQUE_KEYS,
+            self._opening_summary_seen,
+            BidOpeningSummary,
         )
-        return self._write_csv(self._opening_summary_path, rows, BidOpeningSummary)
 
     def save_opening_result_items(self, items: Iterable[BidOpeningResult]) -> int:
-        rows = self._dedupe_rows(
-            [item.model_dump() for item in items], _OPENING_RESULT_UNIQUE_KEYS, self._opening_result_seen
+        return self._save_items(
+            "opening_result",
+            self._opening_result_path,
+            items,
+            _OPENING_RESULT_UNIQUE_KEYS,
+            self._opening_result_seen,
+            BidOpeningResult,
         )
-        return self._write_csv(self._opening_result_path, rows, BidOpeningResult)
+
+    def query(
+        self,
+        query: NoticeQuery,
+        limit: int = 100,
+        cursor: Optional[tuple[str, str, str]] = None,
+    ) -> QueryPage:
+        """목록 공고 색인 조회. 다음 페이지는 반환된 `next_cursor`로 이어서 조회한다."""
+        return self._require_index().search(query, limit, cursor)
+
+    def iter_notices(self, query: NoticeQuery, page_size: int = 500) -> Iterator[dict[str, Any]]:
+        return self._require_index().iter_notices(query, page_size)
+
+    def reindex(self) -> int:
+        """누적 목록(CSV/세그먼트)에서 조회 색인을 다시 만든다. 색인 도입 전 데이터 반영용."""
+        index = self._require_index()
+        index.clear()
+        batch: list[BidNoticeListItem] = []
+        total = 0
+        skipped = 0
+        for row in iter_table_rows(self._list_path):
+            try:
+                batch.append(BidNoticeListItem(**{key: value for key, value in row.items() if value != ""}))
+            except ValueError:
+                skipped += 1
+                continue
+            if len(batch) >= 5000:
+                total += index.upsert(batch)
+                batch = []
+        total += index.upsert(batch)
+        self._commit_indexes()
+        self._logger.info("조회 색인 재구성 행=%s 건너뜀=%s", total, skipped)
+        return total
+
+    def reindex_search(self) -> int:
+        """누적 목록/상세/첨부(CSV/세그먼트)에서 검색 색인에 빠진 문서를 채운다. 색인 도입 전 데이터 반영용.
+
+        이미 색인된 문서는 저장 때 반영한 최신 제목을 지키기 위해 덮어쓰지 않는다. 공지는 CSV에 소유 공고가 없어
+        채우지 못한다.
+        """
+        search = self._require_search()
+        total = 0
+        skipped = 0
+        for name, path, model_type in (
+            ("detail", self._detail_path, BidNoticeDetail),
+            ("list", self._list_path, BidNoticeListItem),
+            ("attachments", self._attachment_path, AttachmentItem),
+        ):
+            batch: list[Any] = []
+            for row in iter_table_rows(path):
+                try:
+                    batch.append(model_type(**{key: value for key, value in row.items() if value != ""}))
+                except ValueError:
+                    skipped += 1
+                    continue
+                if len(batch) >= 5000:
+                    total += self._reindex_search_batch(search, name, batch)
+                    batch = []
+            total += self._reindex_search_batch(search, name, batch)
+        self._commit_indexes()
+        self._logger.info("검색 색인 보충 문서=%s 건너뜀=%s", total, skipped)
+        return total
+
+    def add_listener(self, listener: SaveListener) -> None:
+        """새로 저장된 행(중복 제거 이후)을 받을 콜백을 등록한다. 기록 직후 저장 스레드에서 호출된다."""
+        self._listeners.append(listener)
+
+    def search(self, text: str, limit: int = 20) -> list[SearchHit]:
+        """공고명/공지 제목·본문/첨부 파일명 전문 검색. 관련도 순으로 공고 키를 반환한다."""
+        return self._require_search().search(text, limit)
+
+    @property
+    def history(self) -> Optional[NoticeHistory]:
+        """`storage.history_enabled`일 때 공고 버전 이력(현재/시점 조회)."""
+        return self._history
+
+    def flush(self) -> int:
+        """버퍼 기록을 내보내고 중복 방지 키를 확정한다. 체크포인트를 전진하기 전에 호출한다."""
+        if self._appenders is None:
+            return 0  # simple 모드는 저장마다 이미 확정된다.
+        flushed = sum(appender.flush(self._storage.fsync) for appender in self._appenders.values())
+        for seen in self._pending_seen.values():
+            if not isinstance(seen, set):
+                seen.commit()  # 기록을 OS로 내보낸 뒤에 키를 확정해야 중단 시에도 누락이 없다.
+        self._pending_seen = {}
+        self._commit_indexes()
+        self._last_flush = time.monotonic()
+        if flushed:
+            self._logger.debug("그룹 커밋 완료 행=%s", flushed)
+        return flushed
+
+    def end_run(self) -> None:
+        """한 번의 수집 실행이 끝날 때 호출한다. 표시용 CSV를 반영하고 Parquet 파일을 확정한다."""
+        self.flush()
+        self.materialize_views()
+        if self._parquet is not None:
+            self._parquet.close()
+
+    def materialize_views(self) -> dict[str, int]:
+        if self._views is None:
+            return {}
+        return self._views.materialize(
+            path.name
+            for path in (
+                self._list_path,
+                self._detail_path,
+                self._noce_path,
+                self._attachment_path,
+                self._opening_summary_path,
+                self._opening_result_path,
+            )
+        )
+
+    def close(self) -> None:
+        """대기 중인 행/키를 확정하고 자원을 닫는다. 표시용 CSV 반영은 수집 경로가 `end_run()`으로 한다."""
+        self.flush()
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self._listeners = []
+        for appender in (self._appenders or {}).values():
+            appender.close()
+        if self._appenders is not None:
+            self._appenders = {}
+        for bloom in self._bloom_filters:
+            bloom.close()
+        self._bloom_filters = []
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+        if self._notice_index is not None:
+            self._notice_index.close()
+            self._notice_index = None
+        if self._search is not None:
+            self._search.close()
+            self._search = None
+        if self._key_index is not None:  # 공유 연결이므로 색인보다 나중에 닫는다.
+            self._key_index.close()
+            self._key_index = None
+
+    def _save_items(
+        self,
+        name: str,
+        path: Path,
+        items: Iterable[Any],
+        keys: tuple[str, ...],
+        seen: SeenKeys,
+        model_type: type,
+        owners: Optional[list[tuple[str, str]]] = None,
+    ) -> int:
+        items = list(items)
+        owner_of = {id(item): owner for item, owner in zip(items, owners)} if owners else None
+        if not isinstance(seen, set):
+            seen.begin()  # 실패 시 이 테이블의 키와 색인 변경만 되돌린다(다른 테이블의 대기 중인 변경은 유지).
+        try:
+            unique_items = self._dedupe_items(items, keys, seen)
+            if self._appenders is None:
+                saved = self._write_csv(path, [item.model_dump() for item in unique_items], model_type)
+            else:
+                saved = self._append_csv(name, path, unique_items, model_type)
+            self._write_indexes(name, keys, items, owners)  # 원본 기록이 성공한 뒤에만 반영한다.
+        except Exception:
+            if not isinstance(seen, set):
+                seen.rollback()
+            raise
+        if self._appenders is None:
+            if not isinstance(seen, set):
+                seen.commit()  # CSV 기록 이후에 키를 확정해야 중단 시에도 누락이 없다.
+        else:
+            if not isinstance(seen, set):
+                seen.release()
+            if unique_items:
+                self._pending_seen[name] = seen
+        if self._parquet is not None and name == "list":
+            self._parquet.observe(items)  # 이미 저장된 공고의 개찰결과도 게시월 파티션을 찾게 한다.
+        if self._parquet is not None and name in _COLUMNAR_TABLES:
+            self._parquet.write(name, model_type, [item.model_dump() for item in unique_items])
+        unique_owners = [owner_of.get(id(item)) for item in unique_items] if owner_of else None
+        if unique_items:
+            for listener in self._listeners:
+                try:
+                    listener(name, unique_items, unique_owners)
+                except Exception as exc:  # noqa: BLE001 - 부가 출력 실패가 저장을 막지 않게 한다.
+                    self._logger.warning("저장 리스너 실패 테이블=%s 오류=%s", name, exc)
+        self._commit_indexes()
+        if self._appenders is not None:
+            self._maybe_flush()
+        return saved
+
+    def _write_indexes(
+        self,
+        name: str,
+        keys: tuple[str, ...],
+        items: list[Any],
+        owners: Optional[list[tuple[str, str]]],
+    ) -> None:
+        """이력/조회/검색 색인을 갱신한다. 키 인덱스와 연결을 함께 쓰면 저장 실패 시 SAVEPOINT로 함께 되돌려진다."""
+        if self._history is not None and name in _HISTORY_TABLES:
+            self._history.record(name, keys, items)  # 이미 본 키라도 내용이 바뀌었으면 새 버전으로 남긴다.
+        if self._notice_index is not None and name == "list":
+            self._notice_index.upsert(items)  # 조회 색인은 마지막 관측 상태를 따른다.
+        if self._search is not None and name == "detail":
+            self._search.link_attachments(items)
+        if self._search is not None and name in _SEARCH_TABLES and items:
+            self._search.index(name, items, owners)  # 이미 본 문서도 덮어써 제목/본문 정정을 반영한다.
+
+    def _append_csv(self, name: str, path: Path, items: list[Any], model_type: type) -> int:
+        if not items:
+            return 0
+        appender = self._appenders.get(name) if self._appenders is not None else None
+        if appender is None:
+            appender = self._open_appender(path, model_type)
+            self._appenders[name] = appender  # type: ignore[index]
+        saved = appender.append(items)
+        self._logger.debug("CSV 버퍼 기록 경로=%s 행=%s", path, saved)
+        if self._storage.view_mode == "inline":
+            fieldnames = list(model_type.model_fields.keys())
+            self._write_view_csv(path, [item.model_dump() for item in items], fieldnames)
+        return saved
+
+    def _commit_indexes(self) -> None:
+        """키 인덱스 연결에 쌓인 색인 변경을 확정한다. 대기 중인 키가 있으면 flush()에서 키와 함께 확정한다."""
+        if self._key_index is not None and not self._pending_seen:
+            self._key_index.commit()
+
+    def _reindex_search_batch(self, search: NoticeSearch, name: str, batch: list[Any]) -> int:
+        if name == "detail":  # 첨부보다 먼저 첨부 그룹 키와 공고를 잇는다.
+            search.link_attachments(batch)
+            return 0
+        return search.index(name, batch, replace=False)
+
+    def _require_search(self) -> NoticeSearch:
+        if self._search is None:
+            raise RuntimeError("search requires storage.search_enabled")
+        return self._search
+
+    def _require_index(self) -> NoticeIndex:
+        if self._notice_index is None:
+            raise RuntimeError("query requires storage.query_index_enabled")
+        return self._notice_index
+
+    def _open_appender(self, path: Path, model_type: type) -> Union[CsvAppender, SegmentWriter]:
+        if self._storage.output_format == "segments":
+            return SegmentWriter(
+                segment_dir(self._data_dir, path.name),
+                model_type,
+                self._storage.segment_compression,
+                self._storage.segment_max_bytes,
+                self._storage.segment_rotate_daily,
+            )
+        return CsvAppender(path, model_type, self._storage.writer_buffer_bytes)
+
+    def _maybe_flush(self) -> None:
+        pending = sum(appender.pending_rows for appender in (self._appenders or {}).values())
+        if not pending:
+            return
+        rows = self._storage.group_commit_rows
+        seconds = self._storage.group_commit_sec
+        if (rows > 0 and pending >= rows) or (seconds > 0 and time.monotonic() - self._last_flush >= seconds):
+            self.flush()
 
     def _write_csv(self, path: Path, rows: list[dict[str, Any]], model_type: type) -> int:
         fieldnames = list(model_type.model_fields.keys())
@@ -88,7 +457,8 @@ class NoticeRepository:
             for row in rows:
                 writer.writerow({key: row.get(key) for key in fieldnames})
         self._logger.debug("CSV 저장 완료 경로=%s 행=%s", path, len(rows))
-        self._write_view_csv(path, rows, fieldnames)
+        if self._storage.view_mode == "inline":
+            self._write_view_csv(path, rows, fieldnames)
         return len(rows)
 
     def _write_view_csv(
@@ -100,44 +470,59 @@ class NoticeRepository:
         view_dir = source_path.parent / "view"
         view_dir.mkdir(parents=True, exist_ok=True)
         view_path = view_dir / source_path.name
-        view_fieldnames = [name for name in fieldnames if not name.endswith("_cd")]
+        columns = view_fieldnames(source_path.name, fieldnames)  # deferred 모드와 같은 표시 컬럼.
         file_exists = view_path.exists()
         with view_path.open("a", newline="", encoding="utf-8") as fp:
-            writer = csv.DictWriter(fp, fieldnames=view_fieldnames)
+            writer = csv.DictWriter(fp, fieldnames=columns)
             if not file_exists:
                 writer.writeheader()
             for row in rows:
-                writer.writerow({key: row.get(key) for key in view_fieldnames})
+                writer.writerow({key: row.get(key) for key in columns})
         self._logger.debug("VIEW CSV 저장 완료 경로=%s 행=%s", view_path, len(rows))
 
+    def _open_seen(self, name: str, path: Path, keys: tuple[str, ...]) -> SeenKeys:
+        if self._key_index is None:
+            return self._load_seen(path, keys)
+        source: Union[Path, KeySource] = path
+        if self._storage.output_format == "segments":
+            source = SegmentKeySource(path, SegmentSet(segment_dir(self._data_dir, path.name)))
+        indexed = self._key_index.table(name, keys, source)
+        if not self._storage.dedupe_bloom_enabled:
+            return indexed
+        bloom = BloomFilteredKeys(
+            indexed,
+            self._data_dir / "bloom" / f"{name}.bloom",
+            self._storage.dedupe_bloom_capacity,
+            self._storage.dedupe_bloom_fp_rate,
+        )
+        self._bloom_filters.append(bloom)
+        return bloom
+
     def _load_seen(self, path: Path, keys: tuple[str, ...]) -> set[tuple[str, ...]]:
-        if not path.exists():
-            return set()
         seen: set[tuple[str, ...]] = set()
-        with path.open("r", newline="", encoding="utf-8") as fp:
-            reader = csv.DictReader(fp)
-            for row in reader:
-                key = tuple((row.get(k) or "").strip() for k in keys)
-                seen.add(key)
+        for row in iter_table_rows(path):  # CSV와 대응하는 세그먼트를 함께 읽는다.
+            key = tuple((row.get(k) or "").strip() for k in keys)
+            seen.add(key)
         return seen
 
-    def _dedupe_rows(
+    def _dedupe_items(
         self,
-        rows: list[dict[str, Any]],
+        items: list[Any],
         keys: tuple[str, ...],
-        seen: set[tuple[str, ...]],
-    ) -> list[dict[str, Any]]:
-        if not rows:
+        seen: SeenKeys,
+    ) -> list[Any]:
+        if not items:
             return []
-        unique_rows: list[dict[str, Any]] = []
+        key_getter = attrgetter(*keys)
+        unique_items: list[Any] = []
         skipped = 0
-        for row in rows:
-            key = tuple((str(row.get(k) or "")).strip() for k in keys)
+        for item in items:
+            key = tuple(str(value or "").strip() for value in key_getter(item))
             if key in seen:
                 skipped += 1
                 continue
             seen.add(key)
-            unique_rows.append(row)
+            unique_items.append(item)
         if skipped:
             self._logger.info("중복 건너뜀 키=%s 건수=%s", keys, skipped)
-        return unique_rows
+        return unique_items
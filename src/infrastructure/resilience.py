@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Optional, TypeVar
+
+from tenacity import RetryCallState, Retrying, retry_if_exception, stop_after_attempt
+from tenacity.wait import wait_base
+
+from src.core.config import CrawlConfig
+from src.infrastructure.hedging import Hedger
+from src.infrastructure.ratelimit import NEUTRAL, OK, OVERLOAD, Governor
+from src.infrastructure.timeouts import AdaptiveTimeouts
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 재시도하고 차단기 실패로 세는 오류 분류. `parse`/`http_client`는 서버는 응답한 것이므로 둘 다 아니다.
+RETRYABLE_KINDS = frozenset({"transport", "api_error", "http_status"})
+
+
+class ApiError(RuntimeError):
+    """응답 본문의 `ErrorCode`가 0이 아니다(서버가 요청을 처리하지 못함)."""
+
+    def __init__(self, endpoint: str, code: Any, message: Any) -> None:
+        super().__init__(f"{endpoint}_api_error code={code} msg={message}")
+        self.code = code
+
+
+class HttpStatusError(RuntimeError):
+    def __init__(self, endpoint: str, status: int) -> None:
+        super().__init__(f"{endpoint}_http_error status={status}")
+        self.status = status
+
+
+class ParseError(ValueError):
+    """응답은 받았지만 파싱/검증에 실패했다. 같은 응답을 다시 받아도 결과가 같으므로 재시도하지 않는다."""
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, endpoint: str) -> None:
+        super().__init__(f"{endpoint}_circuit_open")
+        self.endpoint = endpoint
+
+
+def classify(exc: BaseException) -> str:
+    if isinstance(exc, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(exc, ParseError):
+        return "parse"
+    if isinstance(exc, ApiError):
+        return "api_error"
+    if isinstance(exc, HttpStatusError):
+        return "http_status" if exc.status == 429 or exc.status >= 500 else "http_client"
+    return "transport"  # 연결/타임아웃/잘린 본문 등 나머지는 일시 장애로 본다.
+
+
+def response_body(endpoint: str, resp: Any) -> dict[str, Any]:
+    """HTTP 상태(4xx/5xx)를 확인하고 JSON 본문을 반환한다. `ErrorCode`는 스냅샷 저장 뒤 `check_error_code`로."""
+    if resp.status >= 400:
+        raise HttpStatusError(endpoint, resp.status)
+    body = resp.json()
+    if not isinstance(body, dict):
+        raise ParseError(f"{endpoint}_invalid_body type={type(body).__name__}")
+    return body
+
+
+def check_error_code(endpoint: str, body: dict[str, Any]) -> dict[str, Any]:
+    if body.get("ErrorCode") != 0:
+        raise ApiError(endpoint, body.get("ErrorCode"), body.get("ErrorMsg"))
+    return body
+
+
+def parsing(fn: Callable[..., T], *args: Any) -> T:
+    """파서/매핑/요청 검증 호출의 예외를 `ParseError`로 바꿔 재시도 대상에서 뺀다."""
+    try:
+        return fn(*args)
+    except Exception as exc:
+        raise ParseError(f"{type(exc).__name__}: {exc}") from exc
+
+
+class DecorrelatedJitter(wait_base):
+    """`sleep = min(cap, uniform(base, 이전 sleep × 3))`. 여러 작업이 같은 박자로 재시도하지 않게 흩는다."""
+
+    def __init__(self, base: float, cap: float, rng: Optional[random.Random] = None) -> None:
+        self._base = base
+        self._cap = max(cap, base)
+        self._rng = rng or random.Random()
+        self._previous = base
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        self._previous = min(self._cap, self._rng.uniform(self._base, self._previous * 3))
+        return self._previous
+
+
+class ResilienceMetrics:
+    """상태 전이/실패 분류/차단 건수. 실행 요약 로그와 검증 스크립트 요약에 쓴다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.transitions: Counter[str] = Counter()
+        self.failures: Counter[str] = Counter()
+        self.short_circuited: Counter[str] = Counter()
+        self.retries: Counter[str] = Counter()
+
+    def count(self, counter: Counter[str], key: str) -> None:
+        with self._lock:
+            counter[key] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                "transitions": dict(self.transitions),
+                "failures": dict(self.failures),
+                "short_circuited": dict(self.short_circuited),
+                "retries": dict(self.retries),
+            }
+
+
+class CircuitBreaker:
+    """엔드포인트별 차단기. 연속 실패가 `failure_threshold`에 이르면 열고(`open`) 바로 실패시킨다.
+
+    `reset_timeout_sec`가 지나면 반열림(`half_open`)으로 바꿔 호출 하나만 시험으로 보내고,
+    성공하면 닫고 실패하면 다시 연다.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int,
+        reset_timeout_sec: float,
+        metrics: ResilienceMetrics,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.endpoint = endpoint
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout_sec = reset_timeout_sec
+        self._metrics = metrics
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger("resilience")
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self.state == OPEN and self._clock() - self._opened_at >= self._reset_timeout_sec:
+                self._transition(HALF_OPEN)
+            if self.state == OPEN or (self.state == HALF_OPEN and self._probing):
+                self._metrics.count(self._metrics.short_circuited, self.endpoint)
+                raise CircuitOpenError(self.endpoint)
+            if self.state == HALF_OPEN:
+                self._probing = True
+
+    def record(self, healthy: bool) -> None:
+        with self._lock:
+            self._probing = False
+            if healthy:
+                self._failures = 0
+                if self.state != CLOSED:
+                    self._transition(CLOSED)
+                return
+            self._failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self._failures >= self._failure_threshold):
+                self._opened_at = self._clock()
+                self._transition(OPEN)
+
+    def release(self) -> None:
+        with self._lock:
+            self._probing = False
+
+    def _transition(self, state: str) -> None:
+        self._metrics.count(self._metrics.transitions, f"{self.endpoint}:{self.state}->{state}")
+        level = logging.WARNING if state == OPEN else logging.INFO
+        self._logger.log(
+            level, "차단기 전이 엔드포인트=%s %s->%s 연속실패=%s", self.endpoint, self.state, state, self._failures
+        )
+        self.state = state
+
+
+class ResiliencePolicy:
+    """API 호출 공통 정책: 오류 분류에 따른 재시도, 비상관 지터 지수 백오프, 엔드포인트별 차단기.
+
+    여러 서비스(예: 동시에 도는 필터 조합 작업)가 같은 정책을 공유하면 차단기도 공유한다.
+    """
+
+    def __init__(
+        self,
+        attempts: int,
+        base_delay_sec: float,
+        max_delay_sec: float,
+        failure_threshold: int = 5,
+        reset_timeout_sec: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        governor: Optional[Governor] = None,
+        hedger: Optional[Hedger] = None,
+        timeouts: Optional[AdaptiveTimeouts] = None,
+    ) -> None:
+        self._attempts = max(1, attempts)
+        self._base_delay_sec = base_delay_sec
+        self._max_delay_sec = max_delay_sec
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_sec = reset_timeout_sec
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self.metrics = ResilienceMetrics()
+        self.governor = governor or Governor()  # 엔드포인트별 호출률/동시성 한도.
+        self.hedger = hedger  # 멱등 보강 호출의 복제 요청(없으면 끔). 공유하면 예산도 공유한다.
+        self.timeouts = timeouts  # 엔드포인트별 적응 타임아웃(없으면 `timeout_ms` 하나).
+
+    @classmethod
+    def from_config(cls, config: CrawlConfig) -> "ResiliencePolicy":
+        return cls(
+            config.retry_count,
+            config.retry_backoff_sec,
+            config.retry_backoff_max_sec,
+            config.circuit_failure_threshold,
+            config.circuit_reset_sec,
+            governor=Governor(
+                config.rate_limits,
+                config.rate_limit_burst,
+                config.concurrency_initial,
+                config.concurrency_min,
+                config.concurrency_max,
+                config.latency_p95_tolerance,
+            ),
+            hedger=Hedger(config.hedge_budget_ratio, config.hedge_min_delay_sec) if config.hedge_enabled else None,
+            timeouts=(
+                AdaptiveTimeouts(
+                    config.adaptive_timeout_path,
+                    config.timeout_floor_ms,
+                    config.timeout_ceiling_ms or config.timeout_ms,
+                    config.timeout_quantile,
+                    config.timeout_multiplier,
+                )
+                if config.adaptive_timeout_path
+                else None
+            ),
+        )
+
+    def close(self) -> None:
+        """복제 요청 작업 스레드를 정리한다. 정책을 만든 쪽이 실행을 마칠 때 호출한다."""
+        if self.hedger is not None:
+            self.hedger.close()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    endpoint, self._failure_threshold, self._reset_timeout_sec, self.metrics, self._clock
+                )
+            return breaker
+
+    def call(self, endpoint: str, fn: Callable[[], T]) -> T:
+        """`fn`을 정책대로 호출한다. 재시도하지 않는 오류와 마지막 실패는 그대로 다시 던진다."""
+        breaker = self.breaker(endpoint)
+
+        def _attempt() -> T:
+            breaker.before_call()
+            with self.governor.slot(endpoint) as slot:
+                try:
+                    result = fn()
+                except Exception as exc:
+                    kind = classify(exc)
+                    self.metrics.count(self.metrics.failures, f"{endpoint}:{kind}")
+                    breaker.record(kind not in RETRYABLE_KINDS)
+                    slot.outcome = OVERLOAD if kind in RETRYABLE_KINDS else NEUTRAL
+                    raise
+                except BaseException:  # 사용자 중단은 엔드포인트 상태와 무관하다.
+                    breaker.release()
+                    slot.outcome = NEUTRAL
+                    raise
+                breaker.record(True)
+                slot.outcome = OK
+                return result
+
+        retrying = Retrying(
+            stop=stop_after_attempt(self._attempts),
+            wait=DecorrelatedJitter(self._base_delay_sec, self._max_delay_sec),
+            retry=retry_if_exception(lambda exc: classify(exc) in RETRYABLE_KINDS),
+            before_sleep=lambda state: self.metrics.count(self.metrics.retries, endpoint),
+            sleep=self._sleep,
+            reraise=True,
+        )
+        return retrying(_attempt)
+
+    def states(self) -> dict[str, str]:
+        with self._lock:
+            return {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
+
+    def report(self) -> dict[str, Any]:
+        """지표 요약: 전이/실패/차단/재시도 건수, 차단기 상태, 현재 동시성 한도, 복제 요청 건수, 적응 타임아웃."""
+        report: dict[str, Any] = {
+            **self.metrics.snapshot(),
+            "breakers": self.states(),
+            "concurrency_limit": self.governor.limits(),
+        }
+        if self.hedger is not None:
+            report["hedging"] = self.hedger.stats()
+        if self.timeouts is not None:
+            report["timeouts_ms"] = self.timeouts.snapshot()
+        return report
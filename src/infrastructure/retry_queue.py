@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.infrastructure.key_index import connect_sqlite
+
+# 대기열에 넣는 보강 호출 종류.
+ENDPOINTS = ("detail", "noce", "attachment", "opening")
+
+
+@dataclass(frozen=True)
+class RetryEntry:
+    endpoint: str
+    bid_pbanc_no: str
+    bid_pbanc_ord: str
+    item: dict[str, Any]  # 목록 행(`BidNoticeListItem` 필드). 호출 페이로드와 상세 기본값을 다시 만든다.
+    context: dict[str, Any]  # 호출별 추가 값(예: 첨부의 `untyAtchFileNo`).
+    attempts: int
+    next_attempt_at: float
+    last_error: str
+
+
+class RetryQueue:
+    """재시도를 다 쓰고 실패한 보강 호출(호출 종류, 공고 키)을 SQLite에 남기는 영속 대기열.
+
+    같은 (호출 종류, 공고 키)는 한 줄이며, 실패할 때마다 시도 횟수를 올리고 다음 시도 시각을
+    `base_delay_sec * 2^(시도-1)`(최대 `max_delay_sec`) 뒤로 미룬다. `max_attempts`에 이르면
+    `dead`로 바꿔 더 시도하지 않는다. 기록은 바로 커밋하므로 체크포인트가 전진해도 잃지 않는다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        base_delay_sec: float = 300.0,
+        max_delay_sec: float = 86400.0,
+        max_attempts: int = 8,
+    ) -> None:
+        self._logger = logging.getLogger("retry_queue")
+        self._base_delay_sec = base_delay_sec
+        self._max_delay_sec = max_delay_sec
+        self._max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = connect_sqlite(db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS retry_queue ("
+            "endpoint TEXT NOT NULL, bid_pbanc_no TEXT NOT NULL, bid_pbanc_ord TEXT NOT NULL, "
+            "item TEXT NOT NULL, context TEXT NOT NULL, attempts INTEGER NOT NULL, "
+            "next_attempt_at REAL NOT NULL, status TEXT NOT NULL, last_error TEXT NOT NULL, "
+            "first_failed_at REAL NOT NULL, PRIMARY KEY (endpoint, bid_pbanc_no, bid_pbanc_ord)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def record(
+        self,
+        endpoint: str,
+        key: tuple[str, str],
+        item: dict[str, Any],
+        error: str,
+        context: Optional[dict[str, Any]] = None,
+        now: Optional[float] = None,
+    ) -> int:
+        """실패를 기록하고 누적 시도 횟수를 반환한다."""
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unsupported retry endpoint: {endpoint}")
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT attempts FROM retry_queue WHERE endpoint = ? AND bid_pbanc_no = ? AND bid_pbanc_ord = ?",
+                (endpoint, key[0], key[1]),
+            ).fetchone()
+            attempts = (row[0] if row else 0) + 1
+            delay = min(self._base_delay_sec * 2 ** (attempts - 1), self._max_delay_sec)
+            status = "dead" if attempts >= self._max_attempts else "pending"
+            self._conn.execute(
+                "INSERT INTO retry_queue VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (endpoint, bid_pbanc_no, bid_pbanc_ord) DO UPDATE SET "
+                "item = excluded.item, context = excluded.context, attempts = excluded.attempts, "
+                "next_attempt_at = excluded.next_attempt_at, status = excluded.status, "
+                "last_error = excluded.last_error",
+                (
+                    endpoint,
+                    key[0],
+                    key[1],
+                    json.dumps(item, ensure_ascii=False, default=str),
+                    json.dumps(context or {}, ensure_ascii=False),
+                    attempts,
+                    now + delay,
+                    status,
+                    error,
+                    now,
+                ),
+            )
+            self._conn.commit()
+        if status == "dead":
+            self._logger.error("재시도 포기 호출=%s 키=%s 시도=%s 오류=%s", endpoint, key, attempts, error)
+        return attempts
+
+    def due(
+        self, now: Optional[float] = None, limit: Optional[int] = None, include_waiting: bool = False
+    ) -> list[RetryEntry]:
+        """다음 시도 시각이 지난 항목(`include_waiting`이면 대기 중인 항목까지)을 시각 순으로 반환한다."""
+        now = time.time() if now is None else now
+        sql = (
+            "SELECT endpoint, bid_pbanc_no, bid_pbanc_ord, item, context, attempts, next_attempt_at, last_error "
+            "FROM retry_queue WHERE status = 'pending'"
+        )
+        params: list[Any] = []
+        if not include_waiting:
+            sql += " AND next_attempt_at <= ?"
+            params.append(now)
+        sql += " ORDER BY next_attempt_at, endpoint, bid_pbanc_no, bid_pbanc_ord"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            RetryEntry(row[0], row[1], row[2], json.loads(row[3]), json.loads(row[4]), row[5], row[6], row[7])
+            for row in rows
+        ]
+
+    def resolve(self, endpoint: str, key: tuple[str, str]) -> None:
+        """성공한 호출의 결과가 저장된 뒤에 지운다."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM retry_queue WHERE endpoint = ? AND bid_pbanc_no = ? AND bid_pbanc_ord = ?",
+                (endpoint, key[0], key[1]),
+            )
+            self._conn.commit()
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM retry_queue GROUP BY status").fetchall()
+        counts = {"pending": 0, "dead": 0}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Sequence
+
+from src.domain.models import BidNoticeKey
+from src.infrastructure.key_index import KeyIndex, connect_sqlite
+
+# 문서 종류별 (제목, 본문) 필드. 공고명/공지 제목/첨부 원본 파일명은 제목 칸에 둬 가중치를 높인다.
+_DOCUMENT_FIELDS = {
+    "list": ("bid_pbanc_nm", None),
+    "notice": ("pst_nm", "bulk_pst_cn"),
+    "attachments": ("orgnl_atch_file_nm", None),
+}
+_DOCUMENT_KEYS = {
+    "list": ("bid_pbanc_no", "bid_pbanc_ord"),
+    "notice": ("pst_no", "bbs_no"),
+    "attachments": ("unty_atch_file_no", "atch_file_sqno"),
+}
+_TITLE_WEIGHT = 5.0
+_BODY_WEIGHT = 1.0
+_BATCH = 500
+
+_TAG = re.compile(r"<[^>]+>")
+# 영문/숫자는 단어 그대로, 그 밖의 문자(한글/한자 등) 연속 구간은 2-gram으로 쪼갠다.
+_WORD = re.compile(r"[0-9A-Za-z]+|[^\W\d_A-Za-z]+")
+_ASCII = re.compile(r"[0-9A-Za-z]+")
+
+
+def bigram_text(text: Optional[str]) -> str:
+    """FTS 색인용 토큰 문자열. 두 글자 한국어 검색어(`용역`, `공사`)도 맞도록 2-gram을 쓴다."""
+    if not text:
+        return ""
+    tokens: list[str] = []
+    for word in _WORD.findall(_TAG.sub(" ", text)):
+        if _ASCII.fullmatch(word) or len(word) == 1:
+            tokens.append(word.lower())
+        else:
+            tokens.extend(word[index : index + 2] for index in range(len(word) - 1))
+    return " ".join(tokens)
+
+
+def match_expression(text: str) -> str:
+    """검색어를 FTS5 MATCH 식으로 바꾼다. 공백으로 나눈 단어는 AND, 단어 안의 2-gram은 구(phrase)로 묶는다."""
+    terms: list[str] = []
+    for word in _WORD.findall(text):
+        if _ASCII.fullmatch(word):
+            terms.append(f'"{word.lower()}"*')
+        elif len(word) == 1:
+            terms.append(f'"{word}"*')  # 한 글자는 그 글자로 시작하는 2-gram 전체와 맞춘다.
+        else:
+            terms.append('"' + bigram_text(word) + '"')
+    return " AND ".join(terms)
+
+
+@dataclass
+class SearchHit:
+    bid_pbanc_no: str
+    bid_pbanc_ord: str
+    score: float
+    sources: tuple[str, ...]
+
+    @property
+    def key(self) -> BidNoticeKey:
+        return BidNoticeKey(bid_pbanc_no=self.bid_pbanc_no, bid_pbanc_ord=self.bid_pbanc_ord)
+
+
+class NoticeSearch:
+    """공고명/공지/첨부 파일명 전문 검색 색인(`notice_fts`, FTS5). 문서 하나가 FTS 행 하나이고 공고 키로 묶어 순위를 낸다.
+
+    `shared`를 주면 키 인덱스의 연결/잠금을 함께 쓰고 확정은 키 인덱스 쪽에서 한다.
+    """
+
+    def __init__(self, db_path: str, shared: Optional[KeyIndex] = None) -> None:
+        self._logger = logging.getLogger("search")
+        self._owns_conn = shared is None
+        self._lock = threading.RLock() if shared is None else shared.lock
+        self._conn = connect_sqlite(db_path) if shared is None else shared.connection
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS notice_fts USING fts5("
+            "kind UNINDEXED, bid_pbanc_no UNINDEXED, bid_pbanc_ord UNINDEXED, title, body, "
+            "tokenize = 'unicode61 remove_diacritics 0')"
+        )
+        # `rank` 컬럼의 기본 순위 함수. ORDER BY rank LIMIT은 상위 N개만 정렬한다.
+        self._conn.execute(
+            "INSERT INTO notice_fts (notice_fts, rank) VALUES ('rank', ?)",
+            (f"bm25(0, 0, 0, {_TITLE_WEIGHT}, {_BODY_WEIGHT})",),
+        )
+        # 첨부는 상세의 첨부 그룹 키로만 공고와 연결된다.
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS notice_fts_attachment_owner ("
+            "unty_atch_file_no TEXT PRIMARY KEY, bid_pbanc_no TEXT NOT NULL, bid_pbanc_ord TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def index(
+        self,
+        kind: str,
+        items: Iterable[Any],
+        owners: Optional[Sequence[Optional[tuple[str, str]]]] = None,
+        replace: bool = True,
+    ) -> int:
+        """문서를 색인한다. 같은 문서 키는 덮어쓴다. `owners`는 공지처럼 공고 키가 행에 없는 문서의 소유 공고.
+
+        `replace=False`면 이미 색인된 문서는 그대로 두고 빠진 문서만 채운다(누적 데이터 재색인용).
+        """
+        title_field, body_field = _DOCUMENT_FIELDS[kind]
+        doc_keys = _DOCUMENT_KEYS[kind]
+        items = list(items)
+        with self._lock:
+            if kind == "attachments" and owners is None:
+                owners = self._attachment_owners(items)
+            rows: list[tuple[Any, ...]] = []
+            orphans = 0
+            for position, item in enumerate(items):
+                owner = _item_owner(item, kind, owners, position)
+                if owner is None:
+                    orphans += 1
+                    continue
+                doc_key = "\x1f".join(str(getattr(item, name) or "").strip() for name in doc_keys)
+                rows.append(
+                    (
+                        _rowid(kind, doc_key),
+                        kind,
+                        owner[0],
+                        owner[1],
+                        bigram_text(getattr(item, title_field)),
+                        bigram_text(getattr(item, body_field)) if body_field else "",
+                    )
+                )
+            if not replace:
+                existing = self._existing_rowids([row[0] for row in rows])
+                rows = [row for row in rows if row[0] not in existing]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO notice_fts (rowid, kind, bid_pbanc_no, bid_pbanc_ord, title, body) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._commit()
+        if orphans:
+            self._logger.debug("검색 색인 공고 키 없음 종류=%s 건수=%s", kind, orphans)
+        return len(rows)
+
+    def link_attachments(self, details: Iterable[Any]) -> None:
+        """상세의 첨부 그룹 키(`unty_atch_file_no`)와 공고 키를 기록한다. 첨부보다 먼저 저장돼야 한다."""
+        rows = [
+            (str(detail.unty_atch_file_no).strip(), detail.bid_pbanc_no, detail.bid_pbanc_ord)
+            for detail in details
+            if detail.unty_atch_file_no
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO notice_fts_attachment_owner VALUES (?, ?, ?)", rows)
+            self._commit()
+
+    def search(self, text: str, limit: int = 20) -> list[SearchHit]:
+        """bm25 순위(작을수록 관련도 높음)로 공고 키를 반환한다. 같은 공고의 여러 문서는 가장 좋은 점수로 묶는다."""
+        expression = match_expression(text)
+        if not expression:
+            return []
+        fetch = limit * 4  # 한 공고에 문서가 여럿일 수 있어 넉넉히 읽고 부족하면 늘린다.
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT bid_pbanc_no, bid_pbanc_ord, kind, rank FROM notice_fts "
+                    "WHERE notice_fts MATCH ? ORDER BY rank LIMIT ?",
+                    (expression, fetch),
+                ).fetchall()
+            hits: dict[tuple[str, str], SearchHit] = {}
+            for bid_pbanc_no, bid_pbanc_ord, kind, score in rows:
+                hit = hits.get((bid_pbanc_no, bid_pbanc_ord))
+                if hit is None:
+                    hits[(bid_pbanc_no, bid_pbanc_ord)] = SearchHit(bid_pbanc_no, bid_pbanc_ord, score, (kind,))
+                elif kind not in hit.sources:
+                    hit.sources += (kind,)
+            if len(hits) >= limit or len(rows) < fetch:
+                return list(hits.values())[:limit]
+            fetch *= 4
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM notice_fts").fetchone()[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM notice_fts")
+            self._commit()
+
+    def close(self) -> None:
+        if not self._owns_conn:
+            return  # 공유 연결은 키 인덱스가 확정하고 닫는다.
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    def _commit(self) -> None:
+        if self._owns_conn:
+            self._conn.commit()
+
+    def _existing_rowids(self, rowids: list[int]) -> set[int]:
+        existing: set[int] = set()
+        for start in range(0, len(rowids), _BATCH):
+            batch = rowids[start : start + _BATCH]
+            placeholders = ", ".join("?" for _ in batch)
+            rows = self._conn.execute(f"SELECT rowid FROM notice_fts WHERE rowid IN ({placeholders})", batch)
+            existing.update(row[0] for row in rows)
+        return existing
+
+    def _attachment_owners(self, items: list[Any]) -> list[Optional[tuple[str, str]]]:
+        groups = {str(item.unty_atch_file_no).strip() for item in items}
+        known: dict[str, tuple[str, str]] = {}
+        for group in groups:
+            row = self._conn.execute(
+                "SELECT bid_pbanc_no, bid_pbanc_ord FROM notice_fts_attachment_owner WHERE unty_atch_file_no = ?",
+                (group,),
+            ).fetchone()
+            if row is not None:
+                known[group] = (row[0], row[1])
+        return [known.get(str(item.unty_atch_file_no).strip()) for item in items]
+
+
+def _item_owner(
+    item: Any,
+    kind: str,
+    owners: Optional[Sequence[Optional[tuple[str, str]]]],
+    position: int,
+) -> Optional[tuple[str, str]]:
+    if kind == "list":
+        return (str(item.bid_pbanc_no).strip(), str(item.bid_pbanc_ord).strip())
+    if owners is None or position >= len(owners):
+        return None
+    return owners[position]
+
+
+def _rowid(kind: str, doc_key: str) -> int:
+    """문서 키에서 고정 rowid(부호 있는 64비트)를 만든다. 같은 문서를 다시 색인하면 덮어쓴다."""
+    digest = hashlib.blake2b(f"{kind}\x1f{doc_key}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+import os
+import zlib
+from datetime import date, datetime
+from operator import attrgetter
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Optional, Sequence
+
+from src.infrastructure.key_index import CsvKeySource
+
+MANIFEST_NAME = "manifest.json"
+_READ_CHUNK = 1 << 16
+
+
+class _Codec:
+    """스트리밍 압축기/해제기. 잘린 파일(기록 중/비정상 종료)도 확정된 구간까지는 읽을 수 있어야 한다."""
+
+    def __init__(self, compression: str) -> None:
+        self.name = compression
+        if compression == "gzip":
+            self.suffix = ".csv.gz"
+            self._zstd: Any = None
+        elif compression == "zstd":
+            self.suffix = ".csv.zst"
+            try:
+                import zstandard
+            except ImportError as exc:  # pragma: no cover - 선택 의존성.
+                raise RuntimeError("segment_compression=zstd requires zstandard (pip install zstandard)") from exc
+            self._zstd = zstandard
+        else:
+            raise ValueError(f"Unsupported segment_compression: {compression}")
+
+    def compressor(self) -> Any:
+        if self._zstd is None:
+            return zlib.compressobj(6, zlib.DEFLATED, 31)
+        return self._zstd.ZstdCompressor(level=3).compressobj()
+
+    def sync_flush(self, compressor: Any) -> bytes:
+        if self._zstd is None:
+            return compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressor.flush(self._zstd.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, compressor: Any) -> bytes:
+        if self._zstd is None:
+            return compressor.flush(zlib.Z_FINISH)
+        return compressor.flush(self._zstd.COMPRESSOBJ_FLUSH_FINISH)
+
+    def decompressor(self) -> Any:
+        if self._zstd is None:
+            return zlib.decompressobj(31)
+        return self._zstd.ZstdDecompressor().decompressobj()
+
+
+class SegmentWriter:
+    """테이블 하나를 압축 CSV 세그먼트로 기록한다. `CsvAppender`와 같은 append/flush/close 인터페이스."""
+
+    def __init__(
+        self,
+        directory: Path,
+        model_type: type,
+        compression: str = "gzip",
+        max_bytes: int = 64 << 20,
+        rotate_daily: bool = True,
+    ) -> None:
+        self._directory = directory
+        self._segments = SegmentSet(directory)
+        self._codec = _Codec(compression)
+        self._fieldnames = list(model_type.model_fields.keys())  # type: ignore[attr-defined]
+        self._getter = attrgetter(*self._fieldnames)
+        self._max_bytes = max_bytes
+        self._rotate_daily = rotate_daily
+        self._logger = logging.getLogger("segments")
+        self._manifest: Optional[dict[str, Any]] = None
+        self._fp: Optional[IO[bytes]] = None
+        self._compressor: Any = None
+        self._opened_on: Optional[date] = None
+        self._raw_bytes = 0
+        self._rows = 0
+        self.pending_rows = 0
+
+    @property
+    def path(self) -> Path:
+        return self._directory
+
+    def append(self, items: Sequence[Any]) -> int:
+        if not items:
+            return 0
+        if self._fp is not None and self._should_rotate():
+            self._close_segment()
+        if self._fp is None:
+            self._open_segment()
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(self._getter(item) for item in items)
+        data = buffer.getvalue().encode("utf-8")
+        self._write(data)
+        self._raw_bytes += len(data)
+        self.pending_rows += len(items)
+        return len(items)
+
+    def flush(self, fsync: bool = False) -> int:
+        """압축 블록을 닫아(sync flush) 여기까지를 읽을 수 있게 하고 매니페스트의 행 수를 확정한다."""
+        flushed = self.pending_rows
+        if self._fp is not None:
+            self._fp.write(self._codec.sync_flush(self._compressor))
+            self._fp.flush()
+            if fsync:
+                os.fsync(self._fp.fileno())
+            self._rows += self.pending_rows
+            self._update_current(closed=False, fsync=fsync)
+        self.pending_rows = 0
+        return flushed
+
+    def close(self) -> None:
+        if self._fp is not None:
+            self._close_segment()
+
+    def _should_rotate(self) -> bool:
+        if self._raw_bytes >= self._max_bytes:
+            return True
+        return self._rotate_daily and self._opened_on != date.today()
+
+    def _open_segment(self) -> None:
+        manifest = self._load_manifest()
+        for entry in manifest["segments"]:
+            entry["closed"] = True  # 이전 실행의 세그먼트에는 이어 쓰지 않는다(잘린 스트림 뒤에 붙이지 않기 위함).
+        self._opened_on = date.today()
+        file_name = (
+            f"{self._directory.name}-{self._opened_on.strftime('%Y%m%d')}-{len(manifest['segments']) + 1:05d}"
+            f"{self._codec.suffix}"
+        )
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._fp = (self._directory / file_name).open("wb")
+        self._compressor = self._codec.compressor()
+        self._raw_bytes = 0
+        self._rows = 0
+        manifest["segments"].append(
+            {
+                "file": file_name,
+                "rows": 0,
+                "bytes": 0,
+                "raw_bytes": 0,
+                "closed": False,
+                "compression": self._codec.name,
+                "opened_at": datetime.now().isoformat(timespec="seconds"),
+            }
+        )
+        header = io.StringIO()
+        csv.writer(header).writerow(self._fieldnames)
+        data = header.getvalue().encode("utf-8")
+        self._write(data)
+        self._raw_bytes += len(data)
+        self._logger.info("세그먼트 시작 경로=%s", self._directory / file_name)
+
+    def _close_segment(self) -> None:
+        self.flush()
+        assert self._fp is not None
+        self._fp.write(self._codec.finish(self._compressor))
+        self._fp.close()
+        self._fp = None
+        self._compressor = None
+        self._update_current(closed=True)
+
+    def _write(self, data: bytes) -> None:
+        assert self._fp is not None
+        chunk = self._compressor.compress(data)
+        if chunk:
+            self._fp.write(chunk)
+
+    def _update_current(self, closed: bool, fsync: bool = False) -> None:
+        manifest = self._load_manifest()
+        entry = manifest["segments"][-1]
+        entry["rows"] = self._rows
+        entry["raw_bytes"] = self._raw_bytes
+        entry["bytes"] = self._fp.tell() if self._fp is not None else (self._directory / entry["file"]).stat().st_size
+        entry["closed"] = closed
+        self._segments.save_manifest(manifest, fsync)
+
+    def _load_manifest(self) -> dict[str, Any]:
+        if self._manifest is None:
+            manifest = self._segments.manifest()
+            manifest["fieldnames"] = self._fieldnames
+            self._manifest = manifest
+        return self._manifest
+
+
+class SegmentSet:
+    """세그먼트 디렉터리 읽기. 매니페스트에 확정된 행까지만 읽는다."""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._manifest_path = directory / MANIFEST_NAME
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def exists(self) -> bool:
+        return self._manifest_path.exists()
+
+    def manifest(self) -> dict[str, Any]:
+        if not self._manifest_path.exists():
+            return {"segments": []}
+        return json.loads(self._manifest_path.read_text(encoding="utf-8"))
+
+    def save_manifest(self, manifest: dict[str, Any], fsync: bool = False) -> None:
+        """임시 파일에 쓰고 교체한다. `fsync`면 임시 파일과(교체 뒤) 디렉터리 항목까지 디스크에 내린다."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._manifest_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            fp.write(json.dumps(manifest, ensure_ascii=False))
+            if fsync:
+                fp.flush()
+                os.fsync(fp.fileno())
+        tmp_path.replace(self._manifest_path)
+        if fsync:
+            _fsync_dir(self._directory)
+
+    def watermark(self) -> int:
+        """키 인덱스 워터마크 단위(확정 행 수)."""
+        return sum(int(entry["rows"]) for entry in self.manifest()["segments"])
+
+    def fieldnames(self) -> list[str]:
+        return list(self.manifest().get("fieldnames", []))
+
+    def iter_rows(self, skip: int = 0) -> Iterator[dict[str, str]]:
+        """확정된 행을 순서대로 반환한다. 앞의 `skip`행은 건너뛴다. 컬럼은 세그먼트마다 자체 헤더를 따른다."""
+        for entry in self.manifest()["segments"]:
+            rows = int(entry["rows"])
+            if skip >= rows:
+                skip -= rows  # 세그먼트 전체를 건너뛸 때는 압축을 풀지 않는다.
+                continue
+            codec = _Codec(entry.get("compression", "gzip"))
+            reader = csv.reader(_iter_lines(self._directory / entry["file"], codec))
+            header = next(reader, [])
+            for index, record in enumerate(reader):
+                if index >= rows:
+                    break  # 매니페스트 이후 구간은 확정되지 않은 기록이다.
+                if index >= skip:
+                    yield dict(zip(header, record))
+            skip = 0
+
+    def read_keys(self, keys: tuple[str, ...], offset: int) -> Iterable[tuple[str, ...]]:
+        for row in self.iter_rows(offset):
+            yield tuple((row.get(k) or "").strip() for k in keys)
+
+
+def segment_dir(data_dir: Path, csv_name: str) -> Path:
+    """`list.csv` 같은 출력 이름에 대응하는 세그먼트 디렉터리."""
+    return data_dir / "segments" / Path(csv_name).stem
+
+
+class SegmentKeySource:
+    """키 인덱스 원본. 세그먼트로 전환하기 전의 CSV 뒤에 세그먼트를 이어 붙인다.
+
+    두 위치는 단위가 달라(CSV는 바이트, 세그먼트는 행 수) 따로 둔다. CSV 크기는 `base`, 세그먼트 행 수는
+    `watermark`다.
+    """
+
+    def __init__(self, legacy_csv: Path, segments: SegmentSet) -> None:
+        self._legacy = CsvKeySource(legacy_csv)
+        self._segments = segments
+
+    def base(self) -> int:
+        return self._legacy.watermark()
+
+    def watermark(self) -> int:
+        return self._segments.watermark()
+
+    def read_keys(self, keys: tuple[str, ...], offset: int, base: int = 0) -> Iterable[tuple[str, ...]]:
+        if base < self._legacy.watermark():
+            yield from self._legacy.read_keys(keys, base)
+        yield from self._segments.read_keys(keys, offset)
+
+
+def iter_table_rows(path: Path) -> Iterator[dict[str, str]]:
+    """CSV와 대응하는 세그먼트(`data/segments/{이름}/`)를 이어서 같은 dict 행으로 읽는다."""
+    if path.is_dir():
+        yield from SegmentSet(path).iter_rows()
+        return
+    if path.exists():
+        with path.open("r", newline="", encoding="utf-8") as fp:
+            yield from csv.DictReader(fp)
+    segments = SegmentSet(segment_dir(path.parent, path.name))
+    if segments.exists():
+        yield from segments.iter_rows()
+
+
+def _fsync_dir(directory: Path) -> None:
+    """교체(rename)한 디렉터리 항목을 디스크에 내린다. 디렉터리를 열 수 없는 Windows에서는 건너뛴다."""
+    if os.name == "nt":  # pragma: no cover
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _iter_lines(path: Path, codec: _Codec) -> Iterator[str]:
+    decompressor = codec.decompressor()
+    pending = b""
+    with path.open("rb") as fp:
+        while True:
+            chunk = fp.read(_READ_CHUNK)
+            if not chunk:
+                break
+            pending += decompressor.decompress(chunk)
+            lines = pending.split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield (line + b"\n").decode("utf-8")
+    if pending:
+        yield pending.decode("utf-8", errors="ignore")
@@ -1,16 +1,354 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import os
+import re
+import threading
+import zlib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterator, Optional
+
+from src.infrastructure.key_index import connect_sqlite
+
+PACK_DIR = "packs"
+_PACK_SUFFIX = ".pack"
+_INDEX_SUFFIX = ".idx"
+_BLOB_DB = "blobs.db"  # 해시 → blob 위치 표. 팩 디렉터리에 둔다.
+_BLOB_COMMIT_EVERY = 256  # 표는 이만큼 추가마다(그리고 닫을 때) 커밋한다. 잃어도 인덱스에서 다시 따라잡는다.
+# `list_20260206` 같은 저장 이름에서 유형과 날짜를 나눈다.
+_NAME_PATTERN = re.compile(r"^(?P<kind>.+?)_(?P<date>\d{8})$")
+_FILE_PATTERN = re.compile(r"^(?P<kind>[a-z]+)_(?P<date>\d{8})_(?P<key>.+)\.json$")
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    kind: str
+    date: str
+    key: str
+    path: Path  # 본문 blob이 있는 팩 파일 또는 개별 JSON 파일.
+    offset: int = 0
+    length: int = -1  # -1이면 개별 JSON 파일 전체.
+    digest: Optional[str] = None  # 본문 해시. 없으면 blob에 메타까지 함께 든 형식.
+    meta: Optional[dict[str, Any]] = None
+
+
+def body_digest(body: Any) -> tuple[str, bytes]:
+    """본문을 정규화한 JSON(키 정렬)과 그 해시. 키 순서만 다른 같은 응답은 같은 blob이 된다."""
+    blob = json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(blob, digest_size=16).hexdigest(), blob
+
+
+def split_name(name: str) -> tuple[str, str]:
+    match = _NAME_PATTERN.match(name)
+    if match is None:
+        return name, ""
+    return match.group("kind"), match.group("date")
 
 
 class SnapshotStore:
-    def __init__(self, base_dir: str) -> None:
+    """원본 응답 저장소. `files`는 응답마다 `{name}_{key}.json`, `packed`는 일자별 추가 전용 압축 팩에 기록한다."""
+
+    def __init__(self, base_dir: str, snapshot_format: str = "files", max_pack_bytes: int = 256 << 20) -> None:
+        if snapshot_format not in ("files", "packed"):
+            raise ValueError(f"Unsupported snapshot_format: {snapshot_format}")
         self._base_dir = Path(base_dir)
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._archive: Optional[PackedSnapshotArchive] = None
+        if snapshot_format == "packed":
+            self._archive = PackedSnapshotArchive(self._base_dir / PACK_DIR, max_pack_bytes)
 
-    def save(self, name: str, key: str, payload: dict[str, Any]) -> None:
+    def save(self, name: str, key: str, body: Any, meta: Optional[dict[str, Any]] = None) -> None:
+        """`packed`는 본문을 해시로 한 번만 저장하고 항목(유형, 키, 메타)은 인덱스에 남긴다."""
         safe_key = key.replace("/", "_")
+        if self._archive is not None:
+            kind, date = split_name(name)
+            self._archive.append(kind, date, safe_key, body, meta)
+            return
         path = self._base_dir / f"{name}_{safe_key}.json"
-        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        path.write_text(json.dumps({"meta": meta or {}, "body": body}, ensure_ascii=False), encoding="utf-8")
+
+    def close(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+
+
+class PackedSnapshotArchive:
+    """추가 전용, 내용 주소 방식 스냅샷 팩. 본문(blob)은 해시마다 한 번만 압축해 팩에 덧붙이고,
+    사이드카 인덱스(`.idx`, JSONL)에 (유형, 날짜, 키, 메타) → 해시/blob 위치를 남긴다.
+
+    blob을 팩에 쓰고 flush한 뒤에 인덱스를 기록하므로, 중단되더라도 인덱스에 있는 항목은 항상 온전하다.
+    """
+
+    def __init__(self, directory: Path, max_pack_bytes: int = 256 << 20) -> None:
+        self._directory = directory
+        self._max_pack_bytes = max_pack_bytes
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger("snapshot")
+        self._pack: Optional[IO[bytes]] = None
+        self._index: Optional[IO[str]] = None
+        self._pack_path: Optional[Path] = None
+        self._pack_day = ""
+        self._blobs: Optional[BlobTable] = None  # 해시 → (팩 이름, 오프셋, 길이). 처음 추가할 때 연다.
+        self.stored_blobs = 0
+        self.deduplicated = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def append(
+        self, kind: str, date: str, key: str, body: Any, meta: Optional[dict[str, Any]] = None
+    ) -> SnapshotEntry:
+        digest, blob = body_digest(body)
+        with self._lock:
+            blobs = self._blob_table()
+            pack = self._writable(date)
+            location = blobs.get(digest)
+            if location is None:
+                data = zlib.compress(blob, 6)
+                location = (self._pack_path.name, pack.tell(), len(data))  # type: ignore[union-attr]
+                pack.write(data)
+                pack.flush()
+                blobs.add(digest, location)
+                self.stored_blobs += 1
+            else:
+                self.deduplicated += 1
+            record = {
+                "kind": kind,
+                "date": date,
+                "key": key,
+                "hash": digest,
+                "pack": location[0],
+                "offset": location[1],
+                "length": location[2],
+                "meta": meta or {},
+            }
+            assert self._index is not None and self._pack_path is not None
+            self._index.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._index.flush()
+            blobs.cover(self._pack_path.with_suffix(_INDEX_SUFFIX).name, os.fstat(self._index.fileno()).st_size)
+        return SnapshotEntry(kind, date, key, self._directory / location[0], location[1], location[2], digest, meta)
+
+    def entries(self, kind: Optional[str] = None, date: Optional[str] = None) -> Iterator[SnapshotEntry]:
+        """기록 순서(팩 이름 순, 팩 안에서는 추가 순)대로 인덱스 항목을 반환한다."""
+        if not self._directory.exists():
+            return
+        for index_path in sorted(self._directory.glob(f"*{_INDEX_SUFFIX}")):
+            pack_path = index_path.with_suffix(_PACK_SUFFIX)
+            with index_path.open("r", encoding="utf-8") as fp:
+                for line in fp:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # 기록 중 중단된 마지막 줄.
+                    if kind is not None and record["kind"] != kind:
+                        continue
+                    if date is not None and record["date"] != date:
+                        continue
+                    yield SnapshotEntry(
+                        record["kind"],
+                        record["date"],
+                        record["key"],
+                        self._directory / record["pack"] if "pack" in record else pack_path,
+                        record["offset"],
+                        record["length"],
+                        record.get("hash"),
+                        record.get("meta"),
+                    )
+
+    def read(self, entry: SnapshotEntry) -> dict[str, Any]:
+        """`{"meta", "body"}` 형태로 반환한다(개별 JSON 파일 형식과 같음)."""
+        return read_snapshot(entry)
+
+    def records(
+        self, kind: Optional[str] = None, date: Optional[str] = None
+    ) -> Iterator[tuple[SnapshotEntry, dict[str, Any]]]:
+        """`entries`와 같은 순서로 본문까지 읽는다. 팩 파일 핸들은 열어 둔 채 재사용한다."""
+        handles: dict[Path, IO[bytes]] = {}
+        try:
+            for entry in self.entries(kind, date):
+                handle = handles.get(entry.path)
+                if handle is None:
+                    handle = handles[entry.path] = entry.path.open("rb")
+                handle.seek(entry.offset)
+                yield entry, _payload(entry, handle.read(entry.length))
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    def keys(self) -> set[tuple[str, str, str]]:
+        return {(entry.kind, entry.date, entry.key) for entry in self.entries()}
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in (self._pack, self._index):
+                if handle is not None:
+                    handle.close()
+            self._pack = None
+            self._index = None
+            if self._blobs is not None:
+                self._blobs.close()
+                self._blobs = None
+
+    def _blob_table(self) -> BlobTable:
+        if self._blobs is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._blobs = BlobTable(self._directory)
+            self._blobs.catch_up()
+        return self._blobs
+
+    def _writable(self, date: str) -> IO[bytes]:
+        day = date or "00000000"
+        if self._pack is not None and (self._pack_day != day or self._pack.tell() >= self._max_pack_bytes):
+            self._pack.close()
+            assert self._index is not None
+            self._index.close()
+            self._pack = None
+        if self._pack is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._pack_path = self._next_pack(day)
+            self._pack = self._pack_path.open("ab")
+            self._index = self._pack_path.with_suffix(_INDEX_SUFFIX).open("a", encoding="utf-8")
+            self._pack_day = day
+            self._logger.debug("스냅샷 팩 열기 경로=%s", self._pack_path)
+        return self._pack
+
+    def _next_pack(self, day: str) -> Path:
+        """같은 날의 마지막 팩이 여유가 있으면 이어 쓴다. 레코드가 독립 압축이라 덧붙여도 안전하다."""
+        existing = sorted(self._directory.glob(f"snapshots-{day}-*{_PACK_SUFFIX}"))
+        if existing and existing[-1].stat().st_size < self._max_pack_bytes:
+            return existing[-1]
+        return self._directory / f"snapshots-{day}-{len(existing) + 1:05d}{_PACK_SUFFIX}"
+
+
+class BlobTable:
+    """팩 디렉터리의 해시 → blob 위치 표(SQLite `blobs.db`). 해시는 필요할 때 하나씩 찾는다.
+
+    인덱스 파일마다 표에 반영한 바이트 수를 함께 남긴다. 열 때는 그보다 길어진 인덱스(이전 버전, 커밋 전
+    중단)의 꼬리만 읽어 따라잡으므로, 보관소가 커져도 시작 비용은 인덱스 파일 수에 비례한다.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._conn = connect_sqlite(str(directory / _BLOB_DB))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, pack TEXT NOT NULL, "
+            "offset INTEGER NOT NULL, length INTEGER NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS covered (idx TEXT PRIMARY KEY, bytes INTEGER NOT NULL)")
+        self._conn.commit()
+        self._pending = 0
+
+    def catch_up(self) -> int:
+        """표에 반영하지 않은 인덱스 줄의 해시를 넣고, 넣은 줄 수를 반환한다."""
+        covered = dict(self._conn.execute("SELECT idx, bytes FROM covered").fetchall())
+        added = 0
+        for index_path in sorted(self._directory.glob(f"*{_INDEX_SUFFIX}")):
+            start = covered.get(index_path.name, 0)
+            if index_path.stat().st_size <= start:
+                continue
+            records, end = _index_tail(index_path, start)
+            for record in records:
+                if record.get("hash") is not None:
+                    pack = record.get("pack", index_path.with_suffix(_PACK_SUFFIX).name)
+                    self.add(record["hash"], (pack, record["offset"], record["length"]))
+                    added += 1
+            self.cover(index_path.name, end)
+        self.commit()
+        return added
+
+    def get(self, digest: str) -> Optional[tuple[str, int, int]]:
+        row = self._conn.execute("SELECT pack, offset, length FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        return None if row is None else (row[0], row[1], row[2])
+
+    def add(self, digest: str, location: tuple[str, int, int]) -> None:
+        self._conn.execute("INSERT OR IGNORE INTO blobs VALUES (?, ?, ?, ?)", (digest, *location))
+
+    def cover(self, index_name: str, size: int) -> None:
+        """인덱스 파일의 `size` 바이트까지 표에 반영했다고 기록한다."""
+        self._conn.execute(
+            "INSERT INTO covered VALUES (?, ?) ON CONFLICT (idx) DO UPDATE SET bytes = excluded.bytes",
+            (index_name, size),
+        )
+        self._pending += 1
+        if self._pending >= _BLOB_COMMIT_EVERY:
+            self.commit()
+
+    def commit(self) -> None:
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.commit()
+        self._conn.close()
+
+
+def _index_tail(path: Path, start: int) -> tuple[list[dict[str, Any]], int]:
+    """인덱스 파일의 `start` 바이트부터 끝까지 완결된 줄을 읽고, 읽은 마지막 줄 끝의 위치를 반환한다."""
+    records: list[dict[str, Any]] = []
+    with path.open("rb") as fp:
+        fp.seek(start)
+        end = start
+        for line in fp:
+            if not line.endswith(b"\n"):
+                break  # 기록 중인(또는 중단된) 마지막 줄.
+            end += len(line)
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records, end
+
+
+def _payload(entry: SnapshotEntry, data: bytes) -> dict[str, Any]:
+    blob = json.loads(zlib.decompress(data))
+    if entry.digest is None:
+        return blob  # 해시 도입 전 팩은 메타까지 blob에 들어 있다.
+    return {"meta": entry.meta or {}, "body": blob}
+
+
+def read_snapshot(entry: SnapshotEntry) -> dict[str, Any]:
+    """항목 하나를 읽는다. 개별 JSON 파일과 팩 모두 `{"meta", "body"}` 형태(이전 파일은 저장된 그대로)."""
+    if entry.length < 0:
+        return json.loads(entry.path.read_text(encoding="utf-8"))
+    with entry.path.open("rb") as fp:
+        fp.seek(entry.offset)
+        return _payload(entry, fp.read(entry.length))
+
+
+def iter_snapshots(
+    base_dir: str,
+    kind: Optional[str] = None,
+    date: Optional[str] = None,
+) -> Iterator[tuple[SnapshotEntry, dict[str, Any]]]:
+    """개별 JSON 파일(이전 형식)과 팩을 이어서 읽는다. 같은 키가 여러 번 있으면 뒤에 나온 것이 최신이다."""
+    root = Path(base_dir)
+    if root.exists():
+        for entry in iter_file_entries(root, kind, date):
+            yield entry, json.loads(entry.path.read_text(encoding="utf-8"))
+    yield from PackedSnapshotArchive(root / PACK_DIR).records(kind, date)
+
+
+def iter_snapshot_entries(
+    base_dir: str,
+    kind: Optional[str] = None,
+    date: Optional[str] = None,
+) -> Iterator[SnapshotEntry]:
+    """`iter_snapshots`와 같은 순서로 항목만 반환한다. 본문은 `read_snapshot`으로 필요할 때 읽는다."""
+    root = Path(base_dir)
+    if root.exists():
+        yield from iter_file_entries(root, kind, date)
+    yield from PackedSnapshotArchive(root / PACK_DIR).entries(kind, date)
+
+
+def iter_file_entries(root: Path, kind: Optional[str] = None, date: Optional[str] = None) -> Iterator[SnapshotEntry]:
+    with os.scandir(root) as scan:  # glob 정렬 대신 scandir로 한 번만 훑는다.
+        names = sorted(item.name for item in scan if item.is_file() and item.name.endswith(".json"))
+    for name in names:
+        match = _FILE_PATTERN.match(name)
+        if match is None or (kind and match.group("kind") != kind) or (date and match.group("date") != date):
+            continue
+        yield SnapshotEntry(match.group("kind"), match.group("date"), match.group("key"), root / name)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, Optional, Sequence
+
+from src.domain.models import BidNoticeKey
+
+_KEY_FIELDS = tuple(BidNoticeKey.model_fields.keys())
+_STOP = object()
+_RETRY_SEC = 1.0
+
+
+def record_key(item: Any, owner: Optional[tuple[str, str]] = None) -> Optional[dict[str, Any]]:
+    """레코드의 `BidNoticeKey`. 공지/첨부처럼 행에 키가 없으면 소유 공고 키를 쓴다."""
+    if hasattr(item, "bid_pbanc_no"):
+        return {name: getattr(item, name, None) for name in _KEY_FIELDS}
+    if owner is not None:
+        return {"bid_pbanc_no": owner[0], "bid_pbanc_ord": owner[1], "bid_clsf_no": None, "bid_prgrs_ord": None}
+    return None
+
+
+class NdjsonSink:
+    """새로 저장된 레코드를 한 줄 JSON으로 내보낸다. 대상은 `stdout`, `fifo:경로`, `unix:경로`.
+
+    기록은 전용 스레드가 하므로 `emit`은 대기하지 않는다. 버퍼(`buffer_records`)가 차면 `drop`은 버리고,
+    `spill`은 디스크(`spill_path`)에 순서대로 쌓아 두었다가 소비자가 따라오면 이어서 보낸다.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        buffer_records: int = 10_000,
+        overflow: str = "drop",
+        spill_path: Optional[str] = None,
+        opener: Optional[Callable[[], IO[bytes]]] = None,
+    ) -> None:
+        if overflow not in ("drop", "spill"):
+            raise ValueError(f"Unsupported stream_overflow: {overflow}")
+        if overflow == "spill" and not spill_path:
+            raise ValueError("stream_overflow=spill requires stream_spill_path")
+        self._target = target
+        self._opener = opener or _opener(target)
+        self._overflow = overflow
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, buffer_records))
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+        self._spilling = False
+        self._spill_offset = 0
+        self._logger = logging.getLogger("stream")
+        self.emitted = 0
+        self.dropped = 0
+        self.spilled = 0
+        if self._spill_path is not None and self._spill_path.exists() and self._spill_path.stat().st_size:
+            self._spilling = True  # 이전 실행에서 못 보낸 레코드부터 보낸다.
+        self._thread = threading.Thread(target=self._loop, name="ndjson-sink", daemon=True)
+        self._thread.start()
+
+    def emit(self, record_type: str, items: Sequence[Any], owners: Optional[Sequence[Any]] = None) -> None:
+        for position, item in enumerate(items):
+            owner = owners[position] if owners is not None and position < len(owners) else None
+            line = json.dumps(
+                {"type": record_type, "key": record_key(item, owner), "data": item.model_dump(mode="json")},
+                ensure_ascii=False,
+            )
+            self._offer(line.encode("utf-8") + b"\n")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """버퍼에 남은 레코드를 `timeout`초까지 보내고 닫는다. 못 보낸 레코드는 spill 모드면 디스크에 남는다."""
+        self._closing.set()
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            self._logger.warning("NDJSON 종료 시 버퍼 가득 참. 남은 레코드는 버립니다.")
+        self._thread.join(timeout)
+        if self.dropped:
+            self._logger.warning("NDJSON 버려진 레코드=%s", self.dropped)
+
+    def _offer(self, line: bytes) -> None:
+        with self._lock:
+            if self._spilling:
+                self._spill(line)  # 디스크 구간을 다 보낼 때까지는 순서를 지키기 위해 계속 디스크에 쌓는다.
+                return
+            try:
+                self._queue.put_nowait(line)
+                return
+            except queue.Full:
+                pass
+            if self._overflow == "drop":
+                self.dropped += 1
+                return
+            self._spilling = True
+            self._spill(line)
+
+    def _spill(self, line: bytes) -> None:
+        assert self._spill_path is not None
+        self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._spill_path.open("ab") as fp:
+            fp.write(line)
+        self.spilled += 1
+
+    def _loop(self) -> None:
+        stream: Optional[IO[bytes]] = None
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                item = None
+            lines: list[bytes] = []
+            while item is not None:  # 대기 중인 레코드를 모아 한 번에 쓴다.
+                if item is _STOP:
+                    stopping = True
+                    break
+                lines.append(item)
+                if len(lines) >= 512:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            if lines:
+                stream = self._write(stream, lines)
+            if self._spilling and self._queue.empty() and not stopping:
+                stream = self._drain_spill(stream)
+        if stream is not None:
+            _close_quietly(stream)
+
+    def _write(self, stream: Optional[IO[bytes]], lines: list[bytes]) -> Optional[IO[bytes]]:
+        while True:
+            try:
+                if stream is None:
+                    stream = self._opener()
+                stream.write(b"".join(lines))
+                stream.flush()  # 소비자가 바로 읽을 수 있게 배치마다 내보낸다.
+                self.emitted += len(lines)
+                return stream
+            except OSError as exc:
+                self._logger.warning("NDJSON 대상 기록 실패 대상=%s 오류=%s", self._target, exc)
+                if stream is not None:
+                    _close_quietly(stream)
+                    stream = None
+                if self._overflow == "drop":
+                    self.dropped += len(lines)  # 소비자가 없으면 버리고 다음 배치에서 다시 연결한다.
+                    time.sleep(_RETRY_SEC)
+                    return None
+                if self._closing.is_set():
+                    with self._lock:
+                        for line in lines:
+                            self._spill(line)
+                    return None
+                time.sleep(_RETRY_SEC)  # 같은 배치를 다시 보낸다. 그동안 새 레코드는 버퍼가 차면 디스크에 쌓인다.
+
+    def _drain_spill(self, stream: Optional[IO[bytes]]) -> Optional[IO[bytes]]:
+        assert self._spill_path is not None
+        while True:
+            with self._lock:
+                if not self._spill_path.exists():
+                    self._spilling = False
+                    return stream
+                with self._spill_path.open("rb") as fp:
+                    fp.seek(self._spill_offset)
+                    chunk = fp.readlines(1 << 20)
+                if not chunk:  # 다 보냈으면 파일을 비우고 메모리 버퍼로 돌아간다.
+                    self._spill_path.unlink()
+                    self._spill_offset = 0
+                    self._spilling = False
+                    return stream
+            try:
+                if stream is None:
+                    stream = self._opener()
+                stream.write(b"".join(chunk))
+                stream.flush()
+            except OSError as exc:
+                self._logger.warning("NDJSON 디스크 버퍼 전송 실패 대상=%s 오류=%s", self._target, exc)
+                if stream is not None:
+                    _close_quietly(stream)
+                time.sleep(_RETRY_SEC)
+                return None
+            self._spill_offset += sum(len(line) for line in chunk)
+            self.emitted += len(chunk)
+
+
+def _opener(target: str) -> Callable[[], IO[bytes]]:
+    if target == "stdout":
+        return lambda: sys.stdout.buffer
+    kind, sep, path = target.partition(":")
+    if sep and kind == "fifo":
+        return lambda: open(path, "wb")  # 읽는 쪽이 열 때까지 기록 스레드만 대기한다.
+    if sep and kind == "unix":
+
+        def _connect() -> IO[bytes]:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(path)
+                return sock.makefile("wb")
+            finally:
+                sock.close()  # 파일 객체가 닫힐 때 실제 소켓이 닫힌다.
+
+        return _connect
+    raise ValueError(f"Unsupported stream_target: {target} (stdout, fifo:경로, unix:경로)")
+
+
+def _close_quietly(stream: IO[bytes]) -> None:
+    if stream is sys.stdout.buffer:
+        return
+    try:
+        stream.close()
+    except OSError:
+        pass
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import urllib.error
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.infrastructure.hedging import LatencyWindow
+
+
+class AdaptiveTimeouts:
+    """엔드포인트별 타임아웃을 최근 응답 시간으로 정한다.
+
+    타임아웃은 `quantile` 분위수 × `multiplier`이며 [`floor_ms`, `ceiling_ms`] 범위로 자른다.
+    표본이 `min_samples`건 모이기 전의 엔드포인트는 `None`(호출 측 기본 타임아웃)을 돌려준다.
+    타임아웃으로 끝난 호출은 적어도 그 타임아웃만큼 걸린 것으로 기록해(중도 절단 표본), 엔드포인트가 느려지면
+    타임아웃도 따라 늘어난다.
+    최근 표본은 `path`(JSON)에 저장해 다음 실행이 처음부터 다시 배우지 않게 한다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        floor_ms: int,
+        ceiling_ms: int,
+        quantile: float = 0.99,
+        multiplier: float = 3.0,
+        window: int = 500,
+        min_samples: int = 50,
+    ) -> None:
+        self._path = Path(path) if path else None
+        self._floor_ms = floor_ms
+        self._ceiling_ms = max(floor_ms, ceiling_ms)
+        self._quantile = quantile
+        self._multiplier = multiplier
+        self._window_size = window
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+        self._windows: dict[str, LatencyWindow] = {}
+        self._logger = logging.getLogger("timeouts")
+        self._load()
+
+    def observe(self, endpoint: str, latency_sec: float) -> None:
+        """응답을 받은 호출의 지연을 기록한다."""
+        self._window(endpoint).add(latency_sec)
+
+    def observe_timeout(self, endpoint: str, timeout_sec: float) -> None:
+        """타임아웃으로 끝난 호출. 실제 지연은 모르지만 `timeout_sec` 이상이므로 그 값을 표본으로 넣는다.
+
+        넣지 않으면 엔드포인트가 `p99 × multiplier`보다 느려졌을 때 모든 호출이 잘려 새 표본이 없고,
+        저장된 표본 때문에 다음 실행에서도 타임아웃이 낮게 남는다.
+        """
+        self._window(endpoint).add(timeout_sec)
+
+    def timeout_ms(self, endpoint: str) -> Optional[int]:
+        quantile = self._window(endpoint).quantile(self._quantile)
+        if quantile is None:
+            return None
+        return min(self._ceiling_ms, max(self._floor_ms, round(quantile * self._multiplier * 1000)))
+
+    def snapshot(self) -> dict[str, Optional[int]]:
+        with self._lock:
+            endpoints = sorted(self._windows)
+        return {endpoint: self.timeout_ms(endpoint) for endpoint in endpoints}
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        with self._lock:
+            data = {
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+                "endpoints": {
+                    endpoint: [round(sample * 1000, 1) for sample in window.samples()]
+                    for endpoint, window in sorted(self._windows.items())
+                },
+            }
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(self._path.suffix + f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(self._path)
+        self._logger.debug("지연 표본 저장 경로=%s 타임아웃(ms)=%s", self._path, self.snapshot())
+
+    def _load(self) -> None:
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            endpoints = json.loads(self._path.read_text(encoding="utf-8")).get("endpoints", {})
+        except (OSError, ValueError) as exc:  # 표본은 다시 배우면 되므로 실행을 막지 않는다.
+            self._logger.warning("지연 표본을 읽지 못해 새로 시작합니다 경로=%s 오류=%s", self._path, exc)
+            return
+        for endpoint, samples in endpoints.items():
+            window = self._window(endpoint)
+            for sample in samples[-self._window_size :]:
+                window.add(float(sample) / 1000)
+        self._logger.info("지연 표본 불러옴 타임아웃(ms)=%s", self.snapshot())
+
+    def _window(self, endpoint: str) -> LatencyWindow:
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None:
+                window = self._windows[endpoint] = LatencyWindow(self._window_size, self._min_samples)
+            return window
+
+
+def is_timeout(exc: BaseException) -> bool:
+    """전송 계층의 타임아웃 오류인지. urllib(`TimeoutError`, `URLError`)와 Playwright `TimeoutError`를 함께 본다."""
+    if isinstance(exc, urllib.error.URLError):
+        return isinstance(exc.reason, TimeoutError)
+    return isinstance(exc, TimeoutError) or type(exc).__name__ == "TimeoutError"
+
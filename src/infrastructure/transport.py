@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Protocol
+
+
+class Poster(Protocol):  # `page.request`(Playwright APIRequestContext)와 같은 모양. `timeout`은 밀리초.
+    def post(
+        self, url: str, data: Any = None, headers: Optional[dict[str, str]] = None, timeout: Optional[float] = None
+    ) -> Any: ...
+
+
+@dataclass(frozen=True)
+class TransportResponse:
+    """본문을 바이트로 들고 있는 응답. 여러 작업이 같은 응답을 나눠 읽어도 안전하다."""
+
+    status: int
+    content: bytes
+
+    def body(self) -> bytes:
+        return self.content
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class HttpTransport:
+    """표준 라이브러리(urllib) POST. 상태를 두지 않으므로 여러 스레드에서 동시에 호출해도 된다."""
+
+    thread_safe = True
+
+    def __init__(self, user_agent: str, timeout_ms: int) -> None:
+        self._user_agent = user_agent
+        self._timeout = timeout_ms / 1000
+
+    def post(
+        self, url: str, data: Any = None, headers: Optional[dict[str, str]] = None, timeout: Optional[float] = None
+    ) -> TransportResponse:
+        payload = data.encode("utf-8") if isinstance(data, str) else data
+        request = urllib.request.Request(url, data=payload, method="POST")
+        request.add_header("User-Agent", self._user_agent)
+        for name, value in (headers or {}).items():
+            request.add_header(name, value)
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout if timeout is None else timeout / 1000) as resp:
+                return TransportResponse(resp.status, resp.read())
+        except urllib.error.HTTPError as exc:  # Playwright처럼 오류 상태도 응답으로 돌려준다.
+            return TransportResponse(exc.code, exc.read())
+
+
+class InFlightRequests:
+    """진행 중인 요청 맵. 같은 요청(URL, 본문)은 먼저 온 쪽만 보내고 나머지는 그 `Future`를 기다린다.
+
+    여러 `SharedTransport`가 하나를 나눠 쓸 수 있다. 브라우저 슬롯처럼 전송 계층을 스레드마다 따로 두어야 할 때도
+    보내는 일은 각자의 전송 계층이 하고, 결과만 스레드 사이에서 나눈다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[tuple[str, Any], Future[TransportResponse]] = {}
+        self.sent = 0
+        self.shared = 0
+
+    def join(self, key: tuple[str, Any]) -> tuple[Future[TransportResponse], bool]:
+        """`key`의 진행 중 요청과, 호출한 쪽이 직접 보내야 하는지(처음 온 쪽인지)를 돌려준다."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.shared += 1
+                return flight, False
+            flight = self._flights[key] = Future()
+            self.sent += 1
+            return flight, True
+
+    def count_sent(self) -> None:
+        with self._lock:
+            self.sent += 1
+
+    def forget(self, key: tuple[str, Any]) -> None:
+        with self._lock:
+            self._flights.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"sent": self.sent, "shared": self.shared}
+
+
+class SharedTransport:
+    """여러 수집 작업이 함께 쓰는 전송 계층. 같은 요청(URL, 본문)은 한 번만 보낸다.
+
+    진행 중인 요청은 `InFlightRequests`에 `Future`로 두고 같은 요청을 하는 다른 작업은 그 결과를 기다린다.
+    `flights`를 넘기면 다른 전송 계층과 맵을 나눠 쓴다. `reusable`(기본: 2xx)을 만족하는 응답은 맵이 살아 있는
+    동안 재사용하고, 나머지는 맵에서 지워 다음 호출(재시도)이 다시 보낸다.
+    """
+
+    def __init__(
+        self,
+        inner: Poster,
+        reusable: Optional[Callable[[TransportResponse], bool]] = None,
+        flights: Optional[InFlightRequests] = None,
+    ) -> None:
+        self._inner = inner
+        self._reusable = reusable or (lambda response: 200 <= response.status < 300)
+        self._flights = flights or InFlightRequests()
+
+    @property
+    def request(self) -> "SharedTransport":  # 서비스가 `page.request.post`로 호출한다.
+        return self
+
+    @property
+    def thread_safe(self) -> bool:
+        return bool(getattr(self._inner, "thread_safe", False))
+
+    @property
+    def sent(self) -> int:
+        return self._flights.sent
+
+    @property
+    def shared(self) -> int:
+        return self._flights.shared
+
+    def post(
+        self, url: str, data: Any = None, headers: Optional[dict[str, str]] = None, timeout: Optional[float] = None
+    ) -> TransportResponse:
+        key = (url, data)
+        flight, owner = self._flights.join(key)
+        if not owner:
+            return flight.result()
+        try:
+            resp = self._inner.post(url, data=data, headers=headers, **_timeout(timeout))
+            response = TransportResponse(resp.status, resp.body())
+        except BaseException as exc:
+            self._flights.forget(key)
+            flight.set_exception(exc)
+            raise
+        if not self._reusable(response):
+            self._flights.forget(key)  # 기다리던 작업에는 같은 응답을 주되, 다음 호출은 다시 보낸다.
+        flight.set_result(response)
+        return response
+
+    def post_direct(
+        self, url: str, data: Any = None, headers: Optional[dict[str, str]] = None, timeout: Optional[float] = None
+    ) -> TransportResponse:
+        """진행 중인 같은 요청을 기다리지 않고 새로 보낸다(복제 요청용). 결과는 공유하지 않는다."""
+        self._flights.count_sent()
+        resp = self._inner.post(url, data=data, headers=headers, **_timeout(timeout))
+        return TransportResponse(resp.status, resp.body())
+
+    def stats(self) -> dict[str, int]:
+        return self._flights.stats()
+
+
+def _timeout(timeout: Optional[float]) -> dict[str, float]:  # 타임아웃을 받지 않는 전송 계층도 감쌀 수 있게.
+    return {} if timeout is None else {"timeout": timeout}
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src.infrastructure.segments import SegmentSet, segment_dir
+
+LIST_VIEW_COLUMNS = [
+    "bid_pbanc_num",  # 입찰공고번호
+    "bid_pbanc_nm",  # 입찰공고명
+    "pbanc_stts_cd_nm",  # 공고구분
+    "prcm_bsne_se_cd_nm",  # 공고분류
+    "bid_mthd_cd_nm",  # 입찰방식
+    "pbanc_stts_grid_cd_nm",  # 진행상태
+    "pbanc_knd_cd_nm",  # 공고종류
+    "std_ctrt_mthd_cd_nm",  # 계약방법
+    "scsbd_mthd_cd_nm",  # 낙찰방법
+]
+
+OPENING_RESULT_VIEW_COLUMNS = [
+    "ibx_onbs_rnkg",  # 순위/No
+    "ibx_bzmn_reg_no",  # 사업자등록번호
+    "ibx_grp_nm",  # 조달업체명
+    "ibx_rprsv_nm",  # 대표자명
+    "bid_ufns_rsn_nm",  # 사전판정
+    "ibx_evl_scr_prpl",  # 제안서 평가점수
+    "ibx_evl_scr_prce",  # 입찰 가격점수
+    "ibx_evl_scr_ovrl",  # 총점
+    "ibx_bdng_amt",  # 투찰금액(원)
+    "ibx_slpr_rcptn_dt",  # 투찰일시
+    "sfbr_slctn_rslt_cd",  # 낙찰여부(코드)
+]
+
+_RECORD_END = b"\r\n"  # csv 모듈 기본 lineterminator.
+_READ_BYTES = 1 << 20  # 원본을 이 크기씩 읽어 완결된 레코드만 넘긴다.
+
+
+def is_code_column(name: str) -> bool:
+    return name.endswith("_cd")
+
+
+def view_fieldnames(source_name: str, fieldnames: list[str]) -> list[str]:
+    if source_name == "list.csv":
+        return [name for name in LIST_VIEW_COLUMNS if name in fieldnames]
+    if source_name == "opening_result.csv":
+        return [name for name in OPENING_RESULT_VIEW_COLUMNS if name in fieldnames]
+    return [name for name in fieldnames if not is_code_column(name)]
+
+
+class ViewMaterializer:
+    """원본 CSV에서 마지막으로 처리한 바이트 위치 이후의 행만 표시용 CSV에 덧붙인다."""
+
+    def __init__(self, data_dir: Path, view_dir: Optional[Path] = None) -> None:
+        self._data_dir = data_dir
+        self._view_dir = view_dir or data_dir / "view"
+        self._state_path = self._view_dir / ".offsets.json"
+        self._logger = logging.getLogger("view")
+
+    def materialize(self, names: Optional[Iterable[str]] = None) -> dict[str, int]:
+        if names is None:
+            names = sorted(
+                {path.name for path in self._data_dir.glob("*.csv")}
+                | {f"{path.parent.name}.csv" for path in self._data_dir.glob("segments/*/manifest.json")}
+            )
+        state = self._load_state()
+        appended: dict[str, int] = {}
+        for name in names:
+            source = self._data_dir / name
+            if source.exists():
+                appended[name] = self._materialize_one(source, state)
+            segments = SegmentSet(segment_dir(self._data_dir, name))
+            if segments.exists():  # 세그먼트는 같은 표시용 CSV 뒤에 이어 붙인다.
+                appended[name] = appended.get(name, 0) + self._materialize_segments(name, segments, state)
+        self._save_state(state)
+        total = sum(appended.values())
+        if total:
+            self._logger.info("표시용 CSV 반영 행=%s 상세=%s", total, appended)
+        return appended
+
+    def rebuild(self) -> dict[str, int]:
+        if self._state_path.exists():
+            self._state_path.unlink()
+        return self.materialize()
+
+    def _materialize_one(self, source: Path, state: dict[str, dict]) -> int:
+        target = self._view_dir / source.name
+        entry = state.get(source.name, {})
+        offset = int(entry.get("offset", 0))
+        size = source.stat().st_size
+        if size < offset or (offset > 0 and not target.exists()):  # 원본 교체/뷰 삭제 시 처음부터.
+            offset = 0
+        if size == offset:
+            return 0
+        chunks = _complete_chunks(source, offset, size)
+        chunk = next(chunks, None)
+        if chunk is None:
+            return 0  # 아직 완결된 행이 없다(기록 중).
+        records = _records(chunk)
+        self._view_dir.mkdir(parents=True, exist_ok=True)
+        if offset == 0:
+            header = next(records, [])
+            columns = view_fieldnames(source.name, header)
+            entry = {"fieldnames": header, "columns": columns}
+            mode = "w"
+            state.pop(f"{source.name}#segments", None)  # 표시용 파일을 다시 쓰므로 세그먼트분도 다시 붙인다.
+        else:
+            header = entry["fieldnames"]
+            columns = entry["columns"]
+            mode = "a"
+        positions = [header.index(name) for name in columns]
+        count = 0
+        end = offset
+        with target.open(mode, newline="", encoding="utf-8") as out_fp:
+            writer = csv.writer(out_fp)
+            if mode == "w":
+                writer.writerow(columns)
+            while chunk is not None:
+                for record in records:
+                    writer.writerow([record[pos] if pos < len(record) else "" for pos in positions])
+                    count += 1
+                end += len(chunk)
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    records = _records(chunk)
+        entry["offset"] = end
+        state[source.name] = entry
+        self._logger.debug("표시용 CSV 반영 경로=%s 행=%s 위치=%s", target, count, entry["offset"])
+        return count
+
+    def _materialize_segments(self, name: str, segments: SegmentSet, state: dict[str, dict]) -> int:
+        target = self._view_dir / name
+        state_key = f"{name}#segments"
+        entry = state.get(state_key, {})
+        offset = int(entry.get("rows", 0))
+        total = segments.watermark()
+        if total < offset or (offset > 0 and not target.exists()):
+            offset = 0
+        if total == offset:
+            return 0
+        csv_entry = state.get(name)
+        if offset == 0 and csv_entry is not None and target.exists():
+            columns = csv_entry["columns"]  # 세그먼트 전환 전 CSV로 만든 표시용 파일에 이어 쓴다.
+            mode = "a"
+        elif offset == 0:
+            columns = view_fieldnames(name, segments.fieldnames())
+            mode = "w"
+        else:
+            columns = entry["columns"]
+            mode = "a"
+        self._view_dir.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with target.open(mode, newline="", encoding="utf-8") as out_fp:
+            writer = csv.writer(out_fp)
+            if mode == "w":
+                writer.writerow(columns)
+            for row in segments.iter_rows(offset):
+                writer.writerow([row.get(column, "") for column in columns])
+                count += 1
+        state[state_key] = {"rows": offset + count, "columns": columns}
+        self._logger.debug("표시용 CSV 반영 경로=%s 세그먼트 행=%s", target, count)
+        return count
+
+    def _load_state(self) -> dict[str, dict]:
+        if not self._state_path.exists():
+            return {}
+        return json.loads(self._state_path.read_text(encoding="utf-8"))
+
+    def _save_state(self, state: dict[str, dict]) -> None:
+        self._view_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self._state_path)
+
+
+def _complete_chunks(source: Path, start: int, stop: int) -> Iterator[bytes]:
+    """원본의 [start, stop) 구간을 완결된 레코드 단위 조각으로 읽는다. 끝의 미완결 레코드는 넘기지 않는다."""
+    with source.open("rb") as fp:
+        fp.seek(start)
+        remaining = stop - start
+        pending = b""
+        while remaining > 0:
+            block = fp.read(min(_READ_BYTES, remaining))
+            if not block:
+                return
+            remaining -= len(block)
+            pending += block
+            end = _last_record_end(pending)
+            if end > 0:
+                yield pending[:end]
+                pending = pending[end:]
+
+
+def _records(chunk: bytes) -> Iterator[list[str]]:
+    return csv.reader(io.StringIO(chunk.decode("utf-8"), newline=""))
+
+
+def _last_record_end(chunk: bytes) -> int:
+    """완결된 마지막 레코드의 끝 위치. 따옴표 개수가 짝수인 줄바꿈만 레코드 경계로 본다."""
+    end = chunk.rfind(_RECORD_END)
+    while end >= 0:
+        if chunk.count(b'"', 0, end) % 2 == 0:
+            return end + len(_RECORD_END)
+        end = chunk.rfind(_RECORD_END, 0, end)
+    return 0
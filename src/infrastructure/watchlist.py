@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# 감시 대상 필드. 접두어 없는 감시어는 두 필드 모두에 적용한다.
+WATCH_FIELDS = ("bid_pbanc_nm", "grp_nm")
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 패턴 매처. 텍스트 길이에 비례한 한 번의 순회로 모든 감시어를 찾는다."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for pattern in dict.fromkeys(p.lower() for p in patterns if p):
+            self._add(pattern, len(self.patterns))
+            self.patterns.append(pattern)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def find(self, text: Optional[str]) -> set[str]:
+        """`text`에 들어 있는 감시어(소문자 기준). 겹치거나 포함 관계인 감시어도 모두 반환한다."""
+        if not text or not self.patterns:
+            return set()
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return {self.patterns[index] for index in found}
+
+    def _add(self, pattern: str, index: int) -> None:
+        node = 0
+        for char in pattern:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = child
+        self._out[node] += (index,)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())  # 깊이 1 노드의 실패 링크는 루트.
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]  # 접미 감시어 출력을 미리 합쳐 둔다.
+
+
+class Watchlist:
+    """감시어 파일을 자동자로 컴파일해 목록 공고를 검사하고, 새로 일치한 공고를 JSONL로 남긴다.
+
+    파일은 한 줄에 감시어 하나이며 `#`은 주석이다. `grp_nm:조달청`처럼 필드 접두어를 붙이면 그 필드만 검사한다.
+    파일의 수정 시각이 바뀔 때만 자동자를 다시 만든다.
+    """
+
+    def __init__(self, path: str, output_path: str) -> None:
+        self._path = Path(path)
+        self._output_path = Path(output_path)
+        self._logger = logging.getLogger("watchlist")
+        self._mtime_ns: Optional[int] = None
+        self._automata: dict[str, KeywordAutomaton] = {name: KeywordAutomaton(()) for name in WATCH_FIELDS}
+        self._emitted = self._load_emitted()
+
+    @property
+    def size(self) -> int:
+        return sum(len(automaton) for automaton in self._automata.values())
+
+    def scan(self, items: Iterable[Any], observed_at: Optional[datetime] = None) -> list[dict[str, Any]]:
+        """일치한 공고를 기록하고 반환한다. 같은 공고는 이전에 기록하지 않은 감시어가 생길 때만 다시 남긴다."""
+        self.reload_if_changed()
+        if not self.size:
+            return []
+        matched_at = (observed_at or datetime.now()).isoformat(timespec="seconds")
+        matches: list[dict[str, Any]] = []
+        for item in items:
+            fields = {}
+            for name, automaton in self._automata.items():
+                terms = automaton.find(getattr(item, name, None))
+                if terms:
+                    fields[name] = sorted(terms)
+            if not fields:
+                continue
+            key = (item.bid_pbanc_no, item.bid_pbanc_ord)
+            terms = {term for values in fields.values() for term in values}
+            known = self._emitted.setdefault(key, set())
+            if terms <= known:
+                continue
+            known.update(terms)
+            matches.append(
+                {
+                    "bid_pbanc_no": item.bid_pbanc_no,
+                    "bid_pbanc_ord": item.bid_pbanc_ord,
+                    "bid_pbanc_nm": item.bid_pbanc_nm,
+                    "grp_nm": item.grp_nm,
+                    "terms": sorted(terms),
+                    "fields": fields,
+                    "matched_at": matched_at,
+                }
+            )
+        if matches:
+            self._output_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._output_path.open("a", encoding="utf-8") as fp:
+                fp.writelines(json.dumps(match, ensure_ascii=False) + "\n" for match in matches)
+            self._logger.info("감시어 일치 공고=%s", len(matches))
+        return matches
+
+    def reload_if_changed(self) -> bool:
+        try:
+            mtime_ns = self._path.stat().st_mtime_ns
+        except FileNotFoundError:
+            if self._mtime_ns != -1:
+                self._logger.warning("감시어 파일 없음 경로=%s", self._path)
+                self._automata = {name: KeywordAutomaton(()) for name in WATCH_FIELDS}
+                self._mtime_ns = -1
+            return False
+        if mtime_ns == self._mtime_ns:
+            return False
+        patterns: dict[str, list[str]] = {name: [] for name in WATCH_FIELDS}
+        for line in self._path.read_text(encoding="utf-8").splitlines():
+            term = line.strip()
+            if not term or term.startswith("#"):
+                continue
+            field_name, sep, scoped = term.partition(":")
+            if sep and field_name in patterns:
+                patterns[field_name].append(scoped.strip())
+                continue
+            for values in patterns.values():
+                values.append(term)
+        self._automata = {name: KeywordAutomaton(values) for name, values in patterns.items()}
+        self._mtime_ns = mtime_ns
+        self._logger.info("감시어 로드 경로=%s 감시어=%s", self._path, self.size)
+        return True
+
+    def _load_emitted(self) -> dict[tuple[str, str], set[str]]:
+        emitted: dict[tuple[str, str], set[str]] = {}
+        if not self._output_path.exists():
+            return emitted
+        with self._output_path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # 기록 중 중단된 마지막 줄.
+                key = (record["bid_pbanc_no"], record["bid_pbanc_ord"])
+                emitted.setdefault(key, set()).update(record.get("terms", []))
+        return emitted
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Optional
-
-from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
+from typing import Any, Callable, Iterator, Optional
 
 from src.core.config import CrawlConfig
 from src.domain.models import (
@@ -16,10 +19,84 @@ from src.domain.models import (
     BidOpeningSummary,
     NoceItem,
 ) 
-from src.infrastructure.checkpoint import CheckpointStore, CrawlCheckpoint
+from src.infrastructure.checkpoint import CheckpointStore, CrawlCheckpoint, walk_key
 from src.infrastructure.parser import NoticeParser
 from src.infrastructure.repository import NoticeRepository
-from src.infrastructure.snapshot import SnapshotStore
+from src.infrastructure.resilience import (
+    ParseError,
+    ResiliencePolicy,
+    check_error_code,
+    classify,
+    parsing,
+    response_body,
+)
+from src.infrastructure.retry_queue import RetryEntry, RetryQueue
+from src.infrastructure.snapshot import SnapshotEntry, SnapshotStore, iter_snapshot_entries, read_snapshot
+from src.infrastructure.timeouts import is_timeout
+from src.infrastructure.transport import HttpTransport
+from src.infrastructure.watchlist import Watchlist
+from src.service.mapping import NoticeMapper
+from src.service.writer import BackgroundWriter
+
+# 목록 페이로드의 날짜 범위 키(게시일/개찰일 시작·종료).
+_RANGE_DATE_KEYS = ("pbancPstgStDt", "pbancPstgEdDt", "onbsPrnmntStDt", "onbsPrnmntEdDt")
+
+
+@dataclass
+class PageBatch:  # 한 페이지(또는 공고 하나)에서 수집한 저장 단위.
+    page_index: int
+    items: list[BidNoticeListItem]
+    detail_items: list[BidNoticeDetail] = field(default_factory=list)
+    noce_items: list[NoceItem] = field(default_factory=list)
+    noce_owners: list[tuple[str, str]] = field(default_factory=list)  # 공지별 소유 공고 키.
+    attachments: list[AttachmentItem] = field(default_factory=list)
+    attachment_owners: list[tuple[str, str]] = field(default_factory=list)  # 첨부별 소유 공고 키.
+    opening_summaries: list[BidOpeningSummary] = field(default_factory=list)
+    opening_results: list[BidOpeningResult] = field(default_factory=list)
+    list_skipped: int = 0
+    detail_skipped: int = 0  # 재처리에서 스냅샷이 깨져 건너뛴 공고 수.
+    noce_skipped: int = 0
+    attachment_skipped: int = 0
+    opening_summary_skipped: int = 0
+    opening_row_skipped: int = 0
+    notice_keys: list[tuple[str, str]] = field(default_factory=list)  # 이 조각에서 보강을 마친 공고 키.
+    final: bool = True  # 페이지의 마지막 조각이면 True.
+    commit: bool = True  # 저장 후 flush하고 체크포인트를 남길지.
+
+    def collected(self) -> tuple[int, ...]:
+        return (
+            len(self.items),
+            len(self.detail_items),
+            len(self.noce_items),
+            len(self.attachments),
+            len(self.opening_summaries),
+            len(self.opening_results),
+        )
+
+    def skipped(self) -> tuple[int, ...]:
+        return (
+            self.list_skipped,
+            self.noce_skipped,
+            self.attachment_skipped,
+            self.opening_summary_skipped,
+            self.opening_row_skipped,
+        )
+
+
+@dataclass
+class PageProgress:  # 저장이 확정된 페이지 조각을 페이지 단위로 누적한다.
+    page_index: int
+    done_keys: list[tuple[str, str]] = field(default_factory=list)
+    collected: list[int] = field(default_factory=lambda: [0] * 6)
+    saved: list[int] = field(default_factory=lambda: [0] * 6)
+    skipped: list[int] = field(default_factory=lambda: [0] * 5)
+
+    def reset(self, page_index: int) -> None:
+        self.page_index = page_index
+        self.done_keys = []
+        self.collected = [0] * 6
+        self.saved = [0] * 6
+        self.skipped = [0] * 5
 
 
 class CrawlerService:
@@ -29,163 +106,127 @@ class CrawlerService:
         repo: NoticeRepository,
         parser: NoticeParser,
         checkpoint: CheckpointStore,
+        resilience: Optional[ResiliencePolicy] = None,
     ) -> None:
         self._config = config
         self._repo = repo
         self._parser = parser
         self._checkpoint = checkpoint
+        self._mapper = NoticeMapper(config)  # 원본 → 모델 매핑(재처리 워커도 같은 매퍼를 쓴다).
         self._logger = logging.getLogger("service")
-        self._snapshot = SnapshotStore(config.snapshot_dir) if config.snapshot_enabled else None
+        self._owns_resilience = resilience is None
+        self._resilience = resilience or ResiliencePolicy.from_config(config)  # 재시도/차단기(공유 가능).
+        self._hedge_transport: Optional[HttpTransport] = None  # 동기 Playwright 대신 헤지에 쓰는 HTTP 전송.
+        self._hedge_warned = False
+        self._snapshot = (
+            SnapshotStore(config.snapshot_dir, config.snapshot_format, config.snapshot_pack_max_bytes)
+            if config.snapshot_enabled
+            else None
+        )
+        self._watchlist = (
+            Watchlist(config.watchlist_path, config.watchlist_output) if config.watchlist_path else None
+        )
+        self._retry_queue = (
+            RetryQueue(
+                config.retry_queue_path,
+                config.retry_queue_base_sec,
+                config.retry_queue_max_sec,
+                config.retry_queue_max_attempts,
+            )
+            if config.retry_queue_path
+            else None
+        )
+        self._deferred = 0  # 재시도 대기열에 넘긴 보강 호출 수.
+        self._pinned_dates: Optional[dict[str, str]] = None  # 재개 중인 진행의 날짜 범위(상대 날짜 모드).
 
-    def run(self, page: Any, max_pages: Optional[int]) -> None:
+    def run(self, page: Any, max_pages: Optional[int], renew_page: Optional[Callable[[Any], Any]] = None) -> None:
+        """수집 한 번. API 경로는 목록 페이지 사이마다 `renew_page(page)`로 페이지를 바꿀 기회를 준다
+        (`BrowserSlot.renew`: 요청 수/메모리 기준으로 컨텍스트 교체). DOM 경로는 화면 상태가 이어져야 해서 쓰지 않는다.
+        """
         target_pages = self._config.max_pages
         if max_pages is not None:
             target_pages = min(target_pages, max_pages)
+        self._pinned_dates = None
+        checkpoint = self.walk_checkpoint()  # 수집 조건(필터/날짜 범위 설정)별 진행.
         start_page = 1
-        saved = self._checkpoint.load()
+        resume_keys: frozenset[tuple[str, str]] = frozenset()
+        saved = checkpoint.load()
+        if saved is not None and saved.finished:
+            saved = None  # 끝난 진행은 이어받지 않고 처음부터 수집한다.
         if saved is not None:
             start_page = max(1, saved.current_page)
+            resume_keys = frozenset(saved.done_keys)
         if start_page > target_pages:
             self._logger.warning(
                 "체크포인트 페이지(%s)가 최대 페이지(%s)를 초과했습니다. 체크포인트를 초기화합니다.",
                 start_page,
                 target_pages,
             )
-            self._checkpoint.clear()
+            checkpoint.clear()
             start_page = 1
+            resume_keys = frozenset()
+        elif saved is not None and saved.dates and saved.dates != checkpoint.dates:
+            self._pinned_dates = saved.dates  # 자정을 넘긴 재개도 같은 목록 페이지를 이어서 읽는다.
+            checkpoint = self.walk_checkpoint()
+            self._logger.info("이전 날짜 범위로 재개 날짜=%s", saved.dates)
+        if resume_keys:
+            self._logger.info("공고 단위 재개 페이지=%s 완료공고=%s", start_page, len(resume_keys))
         self._logger.info("수집 시작 페이지=%s", target_pages)
         if self._config.list_api_url:
-            total_items = 0
-            total_detail = 0
-            total_noce = 0
-            total_attachments = 0
-            total_opening_summaries = 0
-            total_opening_results = 0
-            total_saved_list = 0
-            total_saved_detail = 0
-            total_saved_noce = 0
-            total_saved_attachments = 0
-            total_saved_opening_summaries = 0
-            total_saved_opening_results = 0
-            for page_index in range(start_page, target_pages + 1):
-                self._checkpoint.save(CrawlCheckpoint(current_page=page_index))
-                raw_rows = self._fetch_list_via_api(page, page_index)
-                if self._config.snapshot_only_list:
-                    self._checkpoint.save(CrawlCheckpoint(current_page=page_index + 1))
-                    continue
-                items, list_skipped = self._build_list_items(raw_rows)
-                items = self._apply_list_filters(items)
-                detail_items: list[BidNoticeDetail] = []
-                opening_summaries: list[BidOpeningSummary] = []
-                opening_results: list[BidOpeningResult] = []
-                attachments: list[AttachmentItem] = []
-                noce_items: list[NoceItem] = []
-                noce_skipped = 0
-                attachment_skipped = 0
-                opening_summary_skipped = 0
-                opening_row_skipped = 0
-                for item in items:  # 상세/부가 데이터 수집.
-                    detail_raw = self._fetch_detail_via_api(page, item)  # 상세 API 호출.
-                    detail_items.append(self._build_detail_from_list(item, detail_raw))  # 상세 모델 생성.
-                    noce_batch, noce_skip = self._build_noce_items(page, item)  # 공지 리스트.
-                    noce_items.extend(noce_batch)
-                    noce_skipped += noce_skip
-                    attachment_batch, attachment_skip = self._build_attachment_items(page, detail_raw)  # 첨부 리스트.
-                    attachments.extend(attachment_batch)
-                    attachment_skipped += attachment_skip
-                    opening_summary, opening_rows, sum_skip, row_skip = self._build_opening_items(page, item)
-                    opening_summary_skipped += sum_skip
-                    opening_row_skipped += row_skip
-                    if opening_summary is not None:
-                        opening_summaries.append(opening_summary)
-                    opening_results.extend(opening_rows)
-                saved_list = self._repo.save_list_items(items) if items else 0
-                saved_detail = self._repo.save_detail_items(detail_items) if detail_items else 0
-                saved_noce = self._repo.save_noce_items(noce_items) if noce_items else 0
-                saved_attachments = self._repo.save_attachment_items(attachments) if attachments else 0
-                saved_opening_summaries = (
-                    self._repo.save_opening_summary_items(opening_summaries) if opening_summaries else 0
-                )
-                saved_opening_results = (
-                    self._repo.save_opening_result_items(opening_results) if opening_results else 0
-                )
-                self._logger.info(
-                    "페이지=%s 수집(목록/상세/공지/첨부/요약/결과)=%s/%s/%s/%s/%s/%s 저장=%s/%s/%s/%s/%s/%s",
-                    page_index,
-                    len(items),
-                    len(detail_items),
-                    len(noce_items),
-                    len(attachments),
-                    len(opening_summaries),
-                    len(opening_results),
-                    saved_list,
-                    saved_detail,
-                    saved_noce,
-                    saved_attachments,
-                    saved_opening_summaries,
-                    saved_opening_results,
-                )
-                self._logger.debug(
-                    "페이지 저장 반영 페이지=%s 목록=%s 상세=%s 공지=%s 첨부=%s 개찰요약=%s 개찰결과=%s",
-                    page_index,
-                    saved_list,
-                    saved_detail,
-                    saved_noce,
-                    saved_attachments,
-                    saved_opening_summaries,
-                    saved_opening_results,
-                )
-                if (
-                    page_index == start_page
-                    and not items
-                    and not detail_items
-                    and not noce_items
-                    and not attachments
-                    and not opening_summaries
-                    and not opening_results
-                ):
-                    self._logger.warning(
-                        "수집 결과가 없습니다. 필터/날짜 범위/체크포인트를 확인하세요."
-                    )
-                self._logger.debug(
-                    "페이지 건너뜀 페이지=%s 목록=%s 공지=%s 첨부=%s 개찰요약=%s 개찰결과=%s",
-                    page_index,
-                    list_skipped,
-                    noce_skipped,
-                    attachment_skipped,
-                    opening_summary_skipped,
-                    opening_row_skipped,
-                )
-                total_items += len(items)
-                total_detail += len(detail_items)
-                total_noce += len(noce_items)
-                total_attachments += len(attachments)
-                total_opening_summaries += len(opening_summaries)
-                total_opening_results += len(opening_results)
-                total_saved_list += saved_list
-                total_saved_detail += saved_detail
-                total_saved_noce += saved_noce
-                total_saved_attachments += saved_attachments
-                total_saved_opening_summaries += saved_opening_summaries
-                total_saved_opening_results += saved_opening_results
-                self._checkpoint.save(CrawlCheckpoint(current_page=page_index + 1))  # 다음 페이지 저장.
+            if self._retry_queue is not None:  # 이전 실행에서 실패한 보강 호출 중 시각이 된 것부터.
+                self.drain_retries(page, limit=self._config.retry_queue_batch)
+            collected_totals = [0] * 6
+            saved_totals = [0] * 6
+            progress = PageProgress(start_page, done_keys=sorted(resume_keys))
+            writer: Optional[BackgroundWriter[PageBatch, tuple[int, ...]]] = None
+            if self._config.async_persistence:
+                writer = BackgroundWriter(self._persist_page, self._config.persistence_queue_size)
+            try:
+                for page_index in range(start_page, target_pages + 1):
+                    if renew_page is not None and page_index > start_page:
+                        page = renew_page(page)  # 목록 페이지 경계: 앞 페이지의 호출은 모두 끝났다.
+                    done_keys = resume_keys if page_index == start_page else frozenset()
+                    if writer is None or not writer.pending:  # 재개 페이지는 완료 공고 목록을 유지한다.
+                        checkpoint.save(CrawlCheckpoint(page_index, tuple(sorted(done_keys))))
+                    raw_rows = self._fetch_list_via_api(page, page_index)
+                    if self._config.snapshot_only_list:
+                        checkpoint.save(CrawlCheckpoint(current_page=page_index + 1))
+                        continue
+                    for batch in self._with_commit_points(self._collect_page(page, page_index, raw_rows, done_keys)):
+                        if writer is None:
+                            saved_counts = self._persist_page(batch)
+                            self._on_page_saved(
+                                batch, saved_counts, start_page, progress, checkpoint, collected_totals, saved_totals
+                            )
+                            continue
+                        writer.submit(batch)  # 큐가 가득 차면 저장이 따라올 때까지 대기한다.
+                        for done, saved_counts in writer.completed():  # 저장 스레드가 확정한 조각만 반영.
+                            self._on_page_saved(
+                                done, saved_counts, start_page, progress, checkpoint, collected_totals, saved_totals
+                            )
+            finally:
+                if writer is not None:  # 중단되더라도 이미 확정된 조각까지는 체크포인트를 전진한다.
+                    for done, saved_counts in writer.drain():
+                        self._on_page_saved(
+                            done, saved_counts, start_page, progress, checkpoint, collected_totals, saved_totals
+                        )
+                    writer.close()
+                if self._snapshot is not None:
+                    self._snapshot.close()  # 팩은 다음 저장 때 다시 열린다.
+                if self._resilience.timeouts is not None:
+                    self._resilience.timeouts.save()  # 다음 실행이 지연 표본을 이어받는다.
+            if writer is not None:
+                writer.check()
+            checkpoint.finish(target_pages + 1)
             self._logger.info("수집 완료")  # 종료 로그.
             self._logger.info(
                 "최종 요약 페이지=%s 수집(목록/상세/공지/첨부/개찰요약/개찰결과)=%s/%s/%s/%s/%s/%s 저장=%s/%s/%s/%s/%s/%s",
                 target_pages,
-                total_items,
-                total_detail,
-                total_noce,
-                total_attachments,
-                total_opening_summaries,
-                total_opening_results,
-                total_saved_list,
-                total_saved_detail,
-                total_saved_noce,
-                total_saved_attachments,
-                total_saved_opening_summaries,
-                total_saved_opening_results,
+                *collected_totals,
+                *saved_totals,
             )
+            if any(self._resilience.metrics.snapshot().values()):
+                self._logger.info("회복력 지표=%s", self._resilience.report())
             return  # API 경로는 여기서 종료.
         page.goto(self._config.list_url, wait_until="networkidle")  # 목록 페이지 이동.
         if self._config.selectors.search_button:  # 검색 버튼이 설정된 경우.
@@ -195,8 +236,10 @@ class CrawlerService:
         page.wait_for_selector(self._config.selectors.list_row)  # 목록 로드 대기.
         for page_index in range(start_page, target_pages + 1):  # 페이지 반복.
             raw_rows = self._parser.parse_list(page)  # 목록 파싱.
-            items, list_skipped = self._build_list_items(raw_rows)  # 목록 모델 생성.
-            items = self._apply_list_filters(items)  # 후처리 필터 적용.
+            items, list_skipped = self._mapper.build_list_items(raw_rows)  # 목록 모델 생성.
+            items = self._mapper.apply_list_filters(items)  # 후처리 필터 적용.
+            if self._watchlist is not None:
+                self._watchlist.scan(items)  # 감시어 일치 공고 기록.
             detail_items: list[BidNoticeDetail] = []  # 상세 모델 리스트.
             detail_skipped = 0
             for row_index, item in enumerate(items):  # 각 행 변환.
@@ -205,7 +248,7 @@ class CrawlerService:
                     detail_data = self._open_detail_and_fetch(page, row_index)  # 상세 응답 확보.
                     self._close_detail(page)  # 상세 팝업 닫기.
                 try:
-                    detail_item = self._build_detail_from_list(item, detail_data)  # 상세 생성.
+                    detail_item = self._mapper.build_detail(item, detail_data)  # 상세 생성.
                 except Exception as exc:
                     self._logger.warning("상세 행 건너뜀 오류=%s 키=%s", exc, item.bid_pbanc_no)
                     detail_skipped += 1
@@ -215,6 +258,7 @@ class CrawlerService:
                 self._repo.save_list_items(items)  # 목록 저장.
             if detail_items:  # 상세 항목이 있으면.
                 self._repo.save_detail_items(detail_items)  # 상세 저장.
+            self._repo.flush()  # 기록 확정.
             self._logger.info(
                 "페이지 건너뜀 페이지=%s 목록=%s 상세=%s", page_index, list_skipped, detail_skipped
             )
@@ -230,36 +274,350 @@ class CrawlerService:
             next_button.first.click()  # 다음 페이지 클릭.
             page.wait_for_load_state("networkidle")  # 로딩 대기.
             page.wait_for_selector(self._config.selectors.list_row)  # 목록 로드 대기.
-            self._checkpoint.save(CrawlCheckpoint(current_page=page_index + 1))  # 다음 페이지 저장.
+            checkpoint.save(CrawlCheckpoint(current_page=page_index + 1))  # 다음 페이지 저장.
         self._logger.info("수집 완료")  # 종료 로그.
 
-    def _fetch_list_via_api(self, page: Any, current_page: int) -> list[dict[str, Any]]:  # 목록 API 호출.
-        @retry(
-            stop=stop_after_attempt(self._config.retry_count),
-            wait=wait_fixed(self._config.retry_backoff_sec),
-            retry=retry_if_exception_type(Exception),
-            reraise=True,
+    @property
+    def resilience(self) -> ResiliencePolicy:
+        return self._resilience
+
+    def close(self) -> None:
+        """직접 만든 회복력 정책의 작업 스레드를 정리한다. 넘겨받은(공유) 정책은 만든 쪽이 정리한다."""
+        if self._owns_resilience:
+            self._resilience.close()
+
+    def walk_query(self) -> dict[str, Any]:
+        """체크포인트를 나누는 수집 조건: 목록 페이로드(페이지 번호 제외)와 후처리 필터.
+
+        상대 날짜 모드(`search_range_days`)는 실제 날짜 대신 일수만 넣어 날짜가 바뀌어도 같은 조건으로 본다.
+        """
+        payload = dict(self._config.list_api_payload)
+        payload.pop("currentPage", None)
+        filters = {
+            "pbancKndCd": self._config.list_filter_pbanc_knd_cd,
+            "pbancSttsCd": self._config.list_filter_pbanc_stts_cd,
+            "bidPbancPgstCd": self._config.list_filter_bid_pbanc_pgst_cd,
+        }
+        search_range = self._config.search_range_days
+        if search_range is None or search_range <= 0:
+            return {"payload": payload, "filters": filters}
+        for key in _RANGE_DATE_KEYS:
+            payload.pop(key, None)
+        return {"payload": payload, "filters": filters, "search_range_days": search_range}
+
+    def walk_dates(self) -> Optional[dict[str, str]]:
+        """이번 실행이 쓰는 실제 날짜 범위(상대 날짜 모드). 재개 중이면 이전 진행의 날짜를 그대로 쓴다."""
+        if self._pinned_dates is not None:
+            return dict(self._pinned_dates)
+        search_range = self._config.search_range_days
+        if search_range is None or search_range <= 0:
+            return None
+        payload = dict(self._config.list_api_payload)
+        self._apply_date_range(payload, search_range)
+        return {key: str(payload[key]) for key in _RANGE_DATE_KEYS if key in payload}
+
+    def walk_checkpoint(self) -> CheckpointStore:
+        query = self.walk_query()
+        return self._checkpoint.for_walk(walk_key(query), query, self.walk_dates())
+
+    def _collect_page(
+        self,
+        page: Any,
+        page_index: int,
+        raw_rows: list[dict[str, Any]],
+        done_keys: frozenset[tuple[str, str]] = frozenset(),
+    ) -> Iterator[PageBatch]:
+        """공고마다 상세/부가 데이터를 모은 조각을 내보내고, 마지막에 페이지 끝 표시(`final`)를 내보낸다.
+
+        `done_keys`에 있는 공고(이전 실행에서 저장까지 끝난 공고)는 다시 호출하지 않는다.
+        """
+        items, list_skipped = self._mapper.build_list_items(raw_rows)
+        items = self._mapper.apply_list_filters(items)
+        if self._watchlist is not None:
+            self._watchlist.scan(items)  # 감시어 일치 공고 기록.
+        for item in items:  # 상세/부가 데이터 수집.
+            key = (item.bid_pbanc_no, item.bid_pbanc_ord)
+            if key in done_keys:
+                continue
+            batch = PageBatch(page_index=page_index, items=[item], notice_keys=[key], final=False)
+            self._collect_detail(page, item, batch)
+            noce_batch, noce_skip = self._build_noce_items(page, item)  # 공지 리스트.
+            batch.noce_items.extend(noce_batch)
+            batch.noce_owners.extend([(item.bid_pbanc_no, item.bid_pbanc_ord)] * len(noce_batch))
+            batch.noce_skipped += noce_skip
+            opening_summary, opening_rows, sum_skip, row_skip = self._build_opening_items(page, item)
+            batch.opening_summary_skipped += sum_skip
+            batch.opening_row_skipped += row_skip
+            if opening_summary is not None:
+                batch.opening_summaries.append(opening_summary)
+            batch.opening_results.extend(opening_rows)
+            yield batch
+        yield PageBatch(page_index=page_index, items=[], list_skipped=list_skipped)
+
+    def _collect_detail(self, page: Any, item: BidNoticeListItem, batch: PageBatch) -> bool:
+        """상세와 첨부를 모은다. 상세 호출이 재시도 대기열로 가면 기본값 상세를 만들지 않고 False를 반환한다."""
+        deferred = self._deferred
+        detail_raw = self._fetch_detail_via_api(page, item)  # 상세 API 호출.
+        if self._deferred != deferred:  # 먼저 저장한 행이 남으므로 재시도 결과가 저장되도록 비워 둔다.
+            return False
+        batch.detail_items.append(self._mapper.build_detail(item, detail_raw))  # 상세 모델 생성.
+        attachment_batch, attachment_skip = self._build_attachment_items(page, detail_raw, item)  # 첨부 리스트.
+        batch.attachments.extend(attachment_batch)
+        batch.attachment_owners.extend([(item.bid_pbanc_no, item.bid_pbanc_ord)] * len(attachment_batch))
+        batch.attachment_skipped += attachment_skip
+        return True
+
+    def drain_retries(self, page: Any, limit: Optional[int] = None, due_only: bool = True) -> dict[str, int]:
+        """재시도 대기열의 보강 호출만 다시 한다. 결과를 저장한 뒤에 대기열에서 지운다.
+
+        `due_only`가 False면 다음 시도 시각을 기다리지 않고 대기 중인 항목을 모두 시도한다.
+        """
+        result = {"attempted": 0, "recovered": 0, "failed": 0}
+        if self._retry_queue is None:
+            return result
+        entries = self._retry_queue.due(limit=limit, include_waiting=not due_only)
+        for entry in entries:
+            result["attempted"] += 1
+            if self._retry_entry(page, entry):
+                result["recovered"] += 1
+            else:
+                result["failed"] += 1
+        if self._resilience.timeouts is not None:
+            self._resilience.timeouts.save()
+        counts = self._retry_queue.counts()
+        if entries or counts["dead"]:
+            self._logger.info(
+                "재시도 대기열 처리 시도=%s 복구=%s 실패=%s 남음=%s 포기=%s",
+                result["attempted"],
+                result["recovered"],
+                result["failed"],
+                counts["pending"],
+                counts["dead"],
+            )
+        return result
+
+    def _retry_entry(self, page: Any, entry: RetryEntry) -> bool:
+        assert self._retry_queue is not None
+        item = BidNoticeListItem(**entry.item)
+        key = (entry.bid_pbanc_no, entry.bid_pbanc_ord)
+        batch = PageBatch(page_index=0, items=[])
+        deferred = self._deferred
+        if entry.endpoint == "detail":  # 상세가 성공하면 첨부가 다시 실패해도 상세는 복구로 본다(첨부는 따로 기록).
+            recovered = self._collect_detail(page, item, batch)
+        elif entry.endpoint == "attachment":
+            attachments, skipped = self._build_attachment_items(page, entry.context, item)
+            batch.attachments.extend(attachments)
+            batch.attachment_owners.extend([key] * len(attachments))
+            batch.attachment_skipped += skipped
+            recovered = self._deferred == deferred
+        elif entry.endpoint == "noce":
+            noce_items, skipped = self._build_noce_items(page, item)
+            batch.noce_items.extend(noce_items)
+            batch.noce_owners.extend([key] * len(noce_items))
+            batch.noce_skipped += skipped
+            recovered = self._deferred == deferred
+        else:
+            summary, rows, _, _ = self._build_opening_items(page, item)
+            if summary is not None:
+                batch.opening_summaries.append(summary)
+            batch.opening_results.extend(rows)
+            recovered = self._deferred == deferred
+        self._persist_page(batch)
+        if recovered:
+            self._retry_queue.resolve(entry.endpoint, key)
+        return recovered
+
+    def _defer(
+        self,
+        endpoint: str,
+        item: Optional[BidNoticeListItem],
+        exc: Exception,
+        context: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """재시도를 다 쓴 보강 호출을 대기열에 남긴다. 대기열이 없거나 공고를 모르면 예전처럼 건너뛴다.
+
+        파싱/검증 오류(`parse`)는 다시 호출해도 같은 응답에서 또 실패하므로 대기열에 넣지 않는다.
+        """
+        if self._retry_queue is None or item is None:
+            return
+        if classify(exc) == "parse":
+            self._logger.warning("파싱 오류는 재시도 대기열에 넣지 않음 호출=%s 키=%s", endpoint, item.bid_pbanc_no)
+            return
+        key = (item.bid_pbanc_no, item.bid_pbanc_ord)
+        attempts = self._retry_queue.record(endpoint, key, item.model_dump(), repr(exc), context)
+        self._deferred += 1
+        self._logger.info("재시도 대기열 기록 호출=%s 키=%s 시도=%s", endpoint, key, attempts)
+
+    def _with_commit_points(self, batches: Iterator[PageBatch]) -> Iterator[PageBatch]:
+        """조각마다 flush/fsync하지 않도록 N건 또는 T초마다, 그리고 페이지 끝에서만 확정 지점을 둔다."""
+        pending = 0
+        last_commit = time.monotonic()
+        for batch in batches:
+            pending += len(batch.notice_keys)
+            now = time.monotonic()
+            batch.commit = (
+                batch.final
+                or pending >= self._config.checkpoint_every_notices
+                or now - last_commit >= self._config.checkpoint_every_sec
+            )
+            if batch.commit:
+                pending = 0
+                last_commit = now
+            yield batch
+
+    def _persist_page(self, batch: PageBatch) -> tuple[int, ...]:  # 저장(비동기 모드에서는 저장 스레드).
+        saved = (
+            self._repo.save_list_items(batch.items) if batch.items else 0,
+            self._repo.save_detail_items(batch.detail_items) if batch.detail_items else 0,
+            self._repo.save_noce_items(batch.noce_items, batch.noce_owners) if batch.noce_items else 0,
+            self._repo.save_attachment_items(batch.attachments, batch.attachment_owners) if batch.attachments else 0,
+            self._repo.save_opening_summary_items(batch.opening_summaries) if batch.opening_summaries else 0,
+            self._repo.save_opening_result_items(batch.opening_results) if batch.opening_results else 0,
+        )
+        if batch.commit:
+            self._repo.flush()  # 기록 확정 후에만 체크포인트를 전진한다.
+        return saved
+
+    def _on_page_saved(
+        self,
+        batch: PageBatch,
+        saved: tuple[int, ...],
+        start_page: int,
+        progress: PageProgress,
+        checkpoint: CheckpointStore,
+        collected_totals: list[int],
+        saved_totals: list[int],
+    ) -> None:
+        if batch.page_index != progress.page_index:
+            progress.reset(batch.page_index)
+        for index, value in enumerate(batch.collected()):
+            progress.collected[index] += value
+            collected_totals[index] += value
+        for index, value in enumerate(saved):
+            progress.saved[index] += value
+            saved_totals[index] += value
+        for index, value in enumerate(batch.skipped()):
+            progress.skipped[index] += value
+        progress.done_keys.extend(batch.notice_keys)
+        if not batch.final:
+            if batch.commit:  # 페이지 중간: 저장이 확정된 공고까지 기록한다.
+                checkpoint.save(CrawlCheckpoint(batch.page_index, tuple(progress.done_keys)))
+            return
+        self._logger.info(
+            "페이지=%s 수집(목록/상세/공지/첨부/요약/결과)=%s/%s/%s/%s/%s/%s 저장=%s/%s/%s/%s/%s/%s",
+            batch.page_index,
+            *progress.collected,
+            *progress.saved,
+        )
+        if batch.page_index == start_page and not any(progress.collected) and not progress.done_keys:
+            self._logger.warning(
+                "수집 결과가 없습니다. 필터/날짜 범위/체크포인트를 확인하세요."
+            )
+        self._logger.debug(
+            "페이지 건너뜀 페이지=%s 목록=%s 공지=%s 첨부=%s 개찰요약=%s 개찰결과=%s",
+            batch.page_index,
+            *progress.skipped,
+        )
+        checkpoint.save(CrawlCheckpoint(current_page=batch.page_index + 1))  # 다음 페이지 저장.
+        progress.reset(batch.page_index + 1)
+
+    def reprocess(self, snapshot_dir: str, workers: Optional[int] = None, chunk_pages: int = 32) -> dict[str, int]:
+        """스냅샷 보관소의 목록/상세/개찰 원본을 네트워크 호출 없이 다시 매핑·검증해 저장소에 기록한다.
+
+        목록 페이지를 `chunk_pages`개씩 묶어 프로세스 풀의 워커에 나누고, 결과는 스냅샷 기록 순서대로
+        이 서비스의 저장소에 병합한다. 상세/개찰은 같은 공고의 가장 최근 스냅샷을 쓴다.
+        """
+        details = _latest_entries(snapshot_dir, "detail")
+        openings = _latest_entries(snapshot_dir, "opening")
+        pages = [entry for entry in iter_snapshot_entries(snapshot_dir, "list") if entry.key.startswith("page_")]
+        chunks = [pages[start : start + chunk_pages] for start in range(0, len(pages), max(1, chunk_pages))]
+        workers = min(workers or os.cpu_count() or 1, len(chunks))
+        self._logger.info(
+            "재처리 시작 목록페이지=%s 상세=%s 개찰=%s 묶음=%s 워커=%s",
+            len(pages),
+            len(details),
+            len(openings),
+            len(chunks),
+            workers,
+        )
+        collected_totals = [0] * 6
+        saved_totals = [0] * 6
+        processed = 0
+        detail_skipped = 0
+
+        def _merge(batches: list[PageBatch]) -> None:
+            nonlocal processed, detail_skipped
+            for batch in batches:
+                detail_skipped += batch.detail_skipped
+                for index, value in enumerate(batch.collected()):
+                    collected_totals[index] += value
+                for index, value in enumerate(self._persist_page(batch)):
+                    saved_totals[index] += value
+                processed += 1
+
+        if workers <= 1:
+            for chunk in chunks:
+                _merge(_reprocess_pages(self._mapper, self._parser, chunk, details, openings))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_reprocess_worker,
+                initargs=(self._config, details, openings),
+            ) as executor:
+                remaining = iter(chunks)
+                pending: deque[Future[list[PageBatch]]] = deque()
+                for chunk in remaining:  # 병합이 밀려도 메모리에 쌓이는 결과는 워커 수의 두 배 묶음까지.
+                    pending.append(executor.submit(_reprocess_chunk, chunk))
+                    if len(pending) >= workers * 2:
+                        break
+                while pending:
+                    batches = pending.popleft().result()
+                    following = next(remaining, None)
+                    if following is not None:
+                        pending.append(executor.submit(_reprocess_chunk, following))
+                    _merge(batches)
+        self._logger.info(
+            "재처리 완료 페이지=%s/%s 수집(목록/상세/공지/첨부/개찰요약/개찰결과)=%s/%s/%s/%s/%s/%s "
+            "저장=%s/%s/%s/%s/%s/%s 건너뜀공고=%s",
+            processed,
+            len(pages),
+            *collected_totals,
+            *saved_totals,
+            detail_skipped,
         )
+        return {
+            "pages": len(pages),
+            "processed_pages": processed,
+            "list": saved_totals[0],
+            "detail": saved_totals[1],
+            "opening_summary": saved_totals[4],
+            "opening_result": saved_totals[5],
+            "detail_skipped": detail_skipped,
+        }
+
+    def _fetch_list_via_api(self, page: Any, current_page: int) -> list[dict[str, Any]]:  # 목록 API 호출.
         def _call() -> list[dict[str, Any]]:
             self._logger.debug("목록 API 호출 시작 페이지=%s", current_page)  # 호출 시작 로그.
-            payload = self._build_list_payload(current_page)  # 유효성 검증 포함 페이로드 구성.
-            resp = page.request.post(  # API 호출.
+            payload = parsing(self._build_list_payload, current_page)  # 유효성 검증 포함 페이로드 구성.
+            resp = self._post(  # API 호출.
+                "list",
+                page,
                 self._config.list_api_url,
-                data=json.dumps({"dlParamM": payload}),
-                headers=self._config.list_api_headers,
+                json.dumps({"dlParamM": payload}),
+                self._config.list_api_headers,
+                hedge=False,
             )
             self._logger.debug("목록 API 응답 페이지=%s 상태=%s", current_page, resp.status)  # 응답 상태 로그.
-            body = resp.json()  # JSON 파싱.
-            self._maybe_snapshot_list(current_page, body)  # 원본 스냅샷 저장.
-            if body.get("ErrorCode") != 0:  # 오류 처리.
-                raise RuntimeError(f"list_api_error code={body.get('ErrorCode')} msg={body.get('ErrorMsg')}")
+            body = response_body("list", resp)  # JSON 파싱.
+            self._maybe_snapshot_list(current_page, body)  # 원본 스냅샷 저장(오류 응답 포함).
+            check_error_code("list", body)  # 오류 처리.
             result = body.get("result", [])  # 결과 리스트.
             if not isinstance(result, list):
-                raise RuntimeError("list_api_invalid_result")
+                raise ParseError("list_api_invalid_result")
             return result
 
         try:
-            return _call()
+            return self._resilience.call("list", _call)
         except Exception as exc:
             self._logger.warning("목록 API 실패 건너뜀 오류=%s 페이지=%s", exc, current_page, exc_info=True)
             return []
@@ -272,6 +630,8 @@ class CrawlerService:
             if search_range <= 0:  # 유효성 검사.
                 raise ValueError("search_range_days must be positive")  # 잘못된 범위 차단.
             self._apply_date_range(payload, search_range)  # 날짜 계산 적용.
+            if self._pinned_dates is not None:  # 재개 중이면 이전 진행의 날짜 범위를 유지.
+                payload.update(self._pinned_dates)
         else:  # 고정 날짜 모드면.
             self._validate_payload_dates(payload)  # 날짜 형식 검증.
         return payload  # 최종 페이로드 반환.
@@ -288,7 +648,7 @@ class CrawlerService:
 
     def _validate_payload_dates(self, payload: dict[str, Any]) -> None:  # 날짜 유효성 검증.
         parsed: dict[str, datetime] = {}  # 파싱된 날짜 보관.
-        for key in ("pbancPstgStDt", "pbancPstgEdDt", "onbsPrnmntStDt", "onbsPrnmntEdDt"):  # 날짜 키.
+        for key in _RANGE_DATE_KEYS:  # 날짜 키.
             raw = payload.get(key)  # 원본 값.
             if raw in (None, ""):  # 값이 없으면 스킵.
                 continue  # 다음 키로.
@@ -311,42 +671,6 @@ class CrawlerService:
         if parsed[start_key] > parsed[end_key]:  # 시작일이 종료일보다 늦으면.
             raise ValueError(f"{start_key} must be <= {end_key}")  # 범위 오류.
 
-    def _build_list_items(  # 목록 모델 생성.
-        self, raw_rows: list[dict[str, Any]]
-    ) -> tuple[list[BidNoticeListItem], int]:
-        items: list[BidNoticeListItem] = []  # 변환된 모델 리스트.
-        skipped = 0
-        for raw in raw_rows:  # 각 행 변환.
-            mapped = self._map_list_row(raw)  # 필드 매핑.
-            try:  # 검증 실패를 대비.
-                list_item = BidNoticeListItem(**mapped)  # 모델 생성.
-                items.append(list_item)  # 목록 추가.
-            except Exception as exc:  # 검증 실패.
-                self._logger.warning("목록 행 건너뜀 오류=%s raw=%s", exc, raw)  # 스킵 로그.
-                skipped += 1
-                continue  # 다음 행.
-        return items, skipped
-
-    def _apply_list_filters(self, items: list[BidNoticeListItem]) -> list[BidNoticeListItem]:  # 목록 필터.
-        filtered = items  # 기본은 전체.
-        if self._config.list_filter_pbanc_knd_cd:  # 공고종류 필터가 있으면.
-            filtered = [
-                item for item in filtered if item.pbanc_knd_cd == self._config.list_filter_pbanc_knd_cd
-            ]
-        if self._config.list_filter_pbanc_stts_cd:  # 공고구분 필터가 있으면.
-            filtered = [
-                item for item in filtered if item.pbanc_stts_cd == self._config.list_filter_pbanc_stts_cd
-            ]
-        if self._config.list_filter_bid_pbanc_pgst_cd:  # 진행상태 필터가 있으면.
-            filtered = [
-                item
-                for item in filtered
-                if item.bid_pbanc_pgst_cd == self._config.list_filter_bid_pbanc_pgst_cd
-            ]
-        if len(filtered) != len(items):  # 필터로 줄어들었으면.
-            self._logger.info("목록 필터 적용 전=%s 후=%s", len(items), len(filtered))
-        return filtered
-
     def _fetch_detail_via_api(self, page: Any, item: BidNoticeListItem) -> dict[str, Any]:  # 상세 API 호출.
         if not self._config.detail_api_url:  # 설정이 없으면.
             return {}  # 빈 결과.
@@ -361,30 +685,79 @@ class CrawlerService:
             }
         )
 
-        @retry(
-            stop=stop_after_attempt(self._config.retry_count),
-            wait=wait_fixed(self._config.retry_backoff_sec),
-            retry=retry_if_exception_type(Exception),
-            reraise=True,
-        )
         def _call() -> dict[str, Any]:
-            resp = page.request.post(
+            resp = self._post(
+                "detail",
+                page,
                 self._config.detail_api_url,
-                data=json.dumps({"dlSrchCndtM": payload}),
-                headers=self._config.detail_api_headers,
+                json.dumps({"dlSrchCndtM": payload}),
+                self._config.detail_api_headers,
             )
-            body = resp.json()
+            body = response_body("detail", resp)
             self._maybe_snapshot_detail(item, body)  # 미확정 항목이 있으면 스냅샷 저장.
-            if body.get("ErrorCode") != 0:
-                raise RuntimeError(f"detail_api_error code={body.get('ErrorCode')} msg={body.get('ErrorMsg')}")
-            return self._parser.parse_detail(body)
+            check_error_code("detail", body)
+            return parsing(self._parser.parse_detail, body)
 
         try:
-            return _call()
+            return self._resilience.call("detail", _call)
         except Exception as exc:
             self._logger.warning("상세 API 실패 건너뜀 오류=%s 키=%s", exc, item.bid_pbanc_no)
+            self._defer("detail", item, exc)
             return {}
 
+    def _post(
+        self, endpoint: str, page: Any, url: str, data: str, headers: dict[str, str], hedge: bool = True
+    ) -> Any:
+        """API POST. 적응 타임아웃이 있으면 엔드포인트별 타임아웃으로 보내고 응답 지연을 기록한다.
+
+        `hedge`이고 복제 요청이 켜져 있으면 느린 호출을 헤지한다. 동기 Playwright처럼 스레드 안전하지 않은
+        전송 계층이면 `hedge_via_http`일 때 원 호출과 복제 요청을 모두 HTTP 전송으로 보내고, 아니면 헤지하지
+        않는다(처음 한 번 경고). 동기 페이지 호출은 호출 스레드를 끝날 때까지 막으므로, 원 호출만 페이지에
+        남기면 복제 요청이 먼저 와도 기다려야 해서 헤지가 꼬리 지연을 줄이지 못한다.
+        """
+        poster = page.request
+        timeouts = self._resilience.timeouts
+        options: dict[str, Any] = {}
+        timeout_ms = timeouts.timeout_ms(endpoint) if timeouts is not None else None
+        if timeout_ms is not None:
+            options["timeout"] = timeout_ms
+
+        def _send(post: Any) -> Any:
+            started = time.monotonic()
+            try:
+                resp = post(url, data=data, headers=headers, **options)
+            except Exception as exc:
+                if timeouts is not None and timeout_ms is not None and is_timeout(exc):
+                    timeouts.observe_timeout(endpoint, timeout_ms / 1000)  # 잘린 호출도 표본에 넣어 타임아웃을 늘린다.
+                raise
+            if timeouts is not None:
+                timeouts.observe(endpoint, time.monotonic() - started)
+            return resp
+
+        hedger = self._resilience.hedger if hedge else None
+        hedged = self._hedge_poster(poster) if hedger is not None else None
+        if hedger is None or hedged is None:
+            return _send(poster.post)
+        direct = getattr(hedged, "post_direct", hedged.post)
+        return hedger.call(endpoint, lambda: _send(hedged.post), lambda: _send(direct))
+
+    def _hedge_poster(self, poster: Any) -> Optional[Any]:
+        """헤지에 쓸 스레드 안전한 전송 계층. 없으면 None."""
+        if getattr(poster, "thread_safe", False):
+            return poster
+        if self._config.hedge_via_http:
+            if self._hedge_transport is None:
+                self._hedge_transport = HttpTransport(self._config.user_agent, self._config.timeout_ms)
+                self._logger.info("헤지 대상 호출(원 호출 포함)을 브라우저 대신 HTTP 전송으로 보냅니다(쿠키/세션 미사용).")
+            return self._hedge_transport
+        if not self._hedge_warned:
+            self._hedge_warned = True
+            self._logger.warning(
+                "hedge_enabled이지만 전송 계층이 스레드 안전하지 않아(동기 Playwright) 헤지하지 않습니다. "
+                "crawl.hedge_via_http를 켜면 보강 호출을 HTTP 전송으로 헤지합니다."
+            )
+        return None
+
     def _build_noce_items(self, page: Any, item: BidNoticeListItem) -> tuple[list[NoceItem], int]:
         if not self._config.noce_api_url:
             return [], 0
@@ -399,27 +772,22 @@ class CrawlerService:
             }
         )
 
-        @retry(
-            stop=stop_after_attempt(self._config.retry_count),
-            wait=wait_fixed(self._config.retry_backoff_sec),
-            retry=retry_if_exception_type(Exception),
-            reraise=True,
-        )
         def _call() -> list[dict[str, Any]]:
-            resp = page.request.post(
+            resp = self._post(
+                "noce",
+                page,
                 self._config.noce_api_url,
-                data=json.dumps({"dlSrchCndtM": payload}),
-                headers=self._config.noce_api_headers,
+                json.dumps({"dlSrchCndtM": payload}),
+                self._config.noce_api_headers,
             )
-            body = resp.json()
-            if body.get("ErrorCode") != 0:
-                raise RuntimeError(f"noce_api_error code={body.get('ErrorCode')} msg={body.get('ErrorMsg')}")
-            return self._parser.parse_noce(body)
+            body = check_error_code("noce", response_body("noce", resp))
+            return parsing(self._parser.parse_noce, body)
 
         try:
-            rows = _call()
+            rows = self._resilience.call("noce", _call)
         except Exception as exc:
             self._logger.warning("공지 API 실패 건너뜀 오류=%s 키=%s", exc, item.bid_pbanc_no)
+            self._defer("noce", item, exc)
             return [], 0
         results: list[NoceItem] = []
         skipped = 0
@@ -442,7 +810,7 @@ class CrawlerService:
         return results, skipped
 
     def _build_attachment_items(
-        self, page: Any, detail_raw: dict[str, Any]
+        self, page: Any, detail_raw: dict[str, Any], owner: Optional[BidNoticeListItem] = None
     ) -> tuple[list[AttachmentItem], int]:
         if not self._config.attachment_api_url:
             return [], 0
@@ -452,29 +820,22 @@ class CrawlerService:
         payload = dict(self._config.attachment_api_payload)
         payload["untyAtchFileNo"] = unty_atch_file_no
 
-        @retry(
-            stop=stop_after_attempt(self._config.retry_count),
-            wait=wait_fixed(self._config.retry_backoff_sec),
-            retry=retry_if_exception_type(Exception),
-            reraise=True,
-        )
         def _call() -> list[dict[str, Any]]:
-            resp = page.request.post(
+            resp = self._post(
+                "attachment",
+                page,
                 self._config.attachment_api_url,
-                data=json.dumps({"dlUntyAtchFileM": payload}),
-                headers=self._config.attachment_api_headers,
+                json.dumps({"dlUntyAtchFileM": payload}),
+                self._config.attachment_api_headers,
             )
-            body = resp.json()
-            if body.get("ErrorCode") != 0:
-                raise RuntimeError(
-                    f"attachment_api_error code={body.get('ErrorCode')} msg={body.get('ErrorMsg')}"
-                )
-            return self._parser.parse_attachments(body)
+            body = check_error_code("attachment", response_body("attachment", resp))
+            return parsing(self._parser.parse_attachments, body)
 
         try:
-            rows = _call()
+            rows = self._resilience.call("attachment", _call)
         except Exception as exc:
             self._logger.warning("첨부 API 실패 건너뜀 오류=%s 키=%s", exc, unty_atch_file_no)
+            self._defer("attachment", owner, exc, {"untyAtchFileNo": unty_atch_file_no})
             return [], 0
         results: list[AttachmentItem] = []
         skipped = 0
@@ -525,127 +886,28 @@ class CrawlerService:
             }
         )
 
-        @retry(
-            stop=stop_after_attempt(self._config.retry_count),
-            wait=wait_fixed(self._config.retry_backoff_sec),
-            retry=retry_if_exception_type(Exception),
-            reraise=True,
-        )
         def _call() -> tuple[dict[str, Any], list[dict[str, Any]]]:
-            resp = page.request.post(
+            resp = self._post(
+                "opening",
+                page,
                 self._config.opening_api_url,
-                data=json.dumps({"dlSrchCndtM": payload}),
-                headers=self._config.opening_api_headers,
+                json.dumps({"dlSrchCndtM": payload}),
+                self._config.opening_api_headers,
             )
-            body = resp.json()
+            body = response_body("opening", resp)
             self._maybe_snapshot_opening(item, body)  # 미확정 항목이 있으면 스냅샷 저장.
-            if body.get("ErrorCode") != 0:
-                raise RuntimeError(f"opening_api_error code={body.get('ErrorCode')} msg={body.get('ErrorMsg')}")
-            return self._parser.parse_opening(body)
+            check_error_code("opening", body)
+            return parsing(self._parser.parse_opening, body)
 
         try:
-            summary_raw, rows_raw = _call()
+            summary_raw, rows_raw = self._resilience.call("opening", _call)
         except Exception as exc:
             self._logger.warning("개찰 API 실패 건너뜀 오류=%s 키=%s", exc, item.bid_pbanc_no)
+            self._defer("opening", item, exc)
             return None, [], 0, 0
-        summary = None
-        summary_skipped = 0
-        if summary_raw:
-            mapped = self._map_opening_summary(summary_raw)
-            try:
-                summary = BidOpeningSummary(**mapped)
-            except Exception as exc:
-                self._logger.warning("개찰 요약 건너뜀 오류=%s raw=%s", exc, summary_raw)
-                summary_skipped += 1
-        results: list[BidOpeningResult] = []
-        row_skipped = 0
-        for row in rows_raw:
-            mapped = self._map_opening_result(row)
-            try:
-                results.append(BidOpeningResult(**mapped))
-            except Exception as exc:
-                self._logger.warning("개찰 행 건너뜀 오류=%s raw=%s", exc, row)
-                row_skipped += 1
-        return summary, results, summary_skipped, row_skipped
-
-    def _map_opening_summary(self, raw: dict[str, Any]) -> dict[str, Any]:  # 개찰 요약 매핑.
-        mapping = {
-            "bidPbancNo": "bid_pbanc_no",
-            "bidPbancOrd": "bid_pbanc_ord",
-            "bidClsfNo": "bid_clsf_no",
-            "bidPrgrsOrd": "bid_prgrs_ord",
-            "bidPbancNm": "bid_pbanc_nm",
-            "bidPbancNum": "bid_pbanc_num",
-            "pbancSttsCd": "pbanc_stts_cd",
-            "pbancSttsCdNm": "pbanc_stts_cd_nm",
-            "prcmBsneSeCd": "prcm_bsne_se_cd",
-            "prcmBsneSeCdNm": "prcm_bsne_se_cd_nm",
-            "bidMthdCd": "bid_mthd_cd",
-            "bidMthdCdNm": "bid_mthd_cd_nm",
-            "stdCtrtMthdCd": "std_ctrt_mthd_cd",
-            "stdCtrtMthdCdNm": "std_ctrt_mthd_cd_nm",
-            "scsbdMthdCd": "scsbd_mthd_cd",
-            "scsbdMthdCdNm": "scsbd_mthd_cd_nm",
-            "pbancInstUntyGrpNo": "pbanc_inst_unty_grp_no",
-            "pbancInstUntyGrpNoNm": "pbanc_inst_unty_grp_no_nm",
-            "grpNm": "grp_nm",
-            "bidBlffId": "bid_blff_id",
-            "bidBlffIdNm": "bid_blff_id_nm",
-            "ibxOnbsPrnmntDt": "ibx_onbs_prnmnt_dt",
-            "ibxOnbsDt": "ibx_onbs_dt",
-            "edocNo": "edoc_no",
-            "usrDocNoVal": "usr_doc_no_val",
-        }
-        mapped: dict[str, Any] = {}
-        for key, value in raw.items():
-            target = mapping.get(key)
-            if target:
-                mapped[target] = value
-        return mapped
-
-    def _map_opening_result(self, raw: dict[str, Any]) -> dict[str, Any]:  # 개찰 결과 매핑.
-        mapping = {
-            "bidPbancNo": "bid_pbanc_no",
-            "bidPbancOrd": "bid_pbanc_ord",
-            "bidClsfNo": "bid_clsf_no",
-            "bidPrgrsOrd": "bid_prgrs_ord",
-            "ibxOnbsRnkg": "ibx_onbs_rnkg",
-            "ibxGrpNm": "ibx_grp_nm",
-            "ibxBdngAmt": "ibx_bdng_amt",
-            "ibxSlprRcptnDt": "ibx_slpr_rcptn_dt",
-            "ibxBzmnRegNo": "ibx_bzmn_reg_no",
-            "ibxRprsvNm": "ibx_rprsv_nm",
-            "bidrPrsnNo": "bidr_prsn_no",
-            "bidrPrsnNm": "bidr_prsn_nm",
-            "bidUfnsRsnCd": "bid_ufns_rsn_cd",
-            "bidUfnsRsnNm": "bid_ufns_rsn_nm",
-            "ufnsYn": "ufns_yn",
-            "ibxEvlScrPrpl": "ibx_evl_scr_prpl",
-            "ibxEvlScrPrce": "ibx_evl_scr_prce",
-            "ibxEvlScrOvrl": "ibx_evl_scr_ovrl",
-            "sfbrSlctnOrd": "sfbr_slctn_ord",
-            "sfbrSlctnRsltCd": "sfbr_slctn_rslt_cd",
-        }
-        mapped: dict[str, Any] = {}
-        for key, value in raw.items():
-            target = mapping.get(key)
-            if target:
-                mapped[target] = value
-            if key == "ibxEvlScrPrpl":
-                mapped["ibx_evl_scr_prpl_num"] = value
-            if key == "ibxEvlScrPrce":
-                mapped["ibx_evl_scr_prce_num"] = value
-            if key == "ibxEvlScrOvrl":
-                mapped["ibx_evl_scr_ovrl_num"] = value
-        return mapped
+        return self._mapper.map_opening_items(summary_raw, rows_raw)
 
     def _open_detail_and_fetch(self, page: Any, index: int) -> dict[str, Any]:  # 상세 팝업 열기.
-        @retry(
-            stop=stop_after_attempt(self._config.retry_count),
-            wait=wait_fixed(self._config.retry_backoff_sec),
-            retry=retry_if_exception_type(Exception),
-            reraise=True,
-        )
         def _call() -> dict[str, Any]:
             link = page.locator(self._config.selectors.list_link).nth(index)  # 해당 행 링크.
             with page.expect_response(  # 상세 API 응답 대기.
@@ -655,10 +917,10 @@ class CrawlerService:
                 link.click()  # 상세 클릭.
             page.wait_for_selector(self._config.selectors.detail_popup)  # 팝업 로드 대기.
             payload = response_info.value.json()  # 응답 JSON 파싱.
-            return self._parser.parse_detail(payload)  # 상세 원본 맵 반환.
+            return parsing(self._parser.parse_detail, payload)  # 상세 원본 맵 반환.
 
         try:
-            return _call()
+            return self._resilience.call("detail_popup", _call)
         except Exception as exc:
             self._logger.warning("상세 가져오기 건너뜀 오류=%s index=%s", exc, index)
             return {}
@@ -668,63 +930,6 @@ class CrawlerService:
         close_btn.click()  # 팝업 닫기.
         page.wait_for_timeout(300)  # DOM 반영 대기.
 
-    def _map_list_row(self, raw: dict[str, Any]) -> dict[str, Any]:  # 목록 필드 매핑.
-        mapping = {  # col_id -> snake_case.
-            "bidPbancNo": "bid_pbanc_no",
-            "bidPbancOrd": "bid_pbanc_ord",
-            "bidPbancNm": "bid_pbanc_nm",
-            "bidPbancNum": "bid_pbanc_num",
-            "pbancSttsCd": "pbanc_stts_cd",
-            "pbancSttsCdNm": "pbanc_stts_cd_nm",
-            "prcmBsneSeCd": "prcm_bsne_se_cd",
-            "prcmBsneSeCdNm": "prcm_bsne_se_cd_nm",
-            "bidMthdCd": "bid_mthd_cd",
-            "bidMthdCdNm": "bid_mthd_cd_nm",
-            "stdCtrtMthdCd": "std_ctrt_mthd_cd",
-            "stdCtrtMthdCdNm": "std_ctrt_mthd_cd_nm",
-            "scsbdMthdCd": "scsbd_mthd_cd",
-            "scsbdMthdCdNm": "scsbd_mthd_cd_nm",
-            "pbancPstgDt": "pbanc_pstg_dt",
-            "pbancKndCd": "pbanc_knd_cd",
-            "pbancKndCdNm": "pbanc_knd_cd_nm",
-            "grpNm": "grp_nm",
-            "slprRcptDdlnDt": "slpr_rcpt_ddln_dt",
-            "pbancSttsGridCdNm": "pbanc_stts_grid_cd_nm",
-            "rowNum": "row_num",
-            "totCnt": "tot_cnt",
-            "currentPage": "current_page",
-            "recordCountPerPage": "record_count_per_page",
-            "nextRowYn": "next_row_yn",
-            "edocNo": "edoc_no",
-            "usrDocNoVal": "usr_doc_no_val",
-            "pbancInstUntyGrpNo": "pbanc_inst_unty_grp_no",
-            "pbancPstgYn": "pbanc_pstg_yn",
-            "pbancDscrTrgtYn": "pbanc_dscr_trgt_yn",
-            "slprRcptBgngYn": "slpr_rcpt_bgng_yn",
-            "slprRcptDdlnYn": "slpr_rcpt_ddln_yn",
-            "onbsPrnmntYn": "onbs_prnmnt_yn",
-            "bidQlfcEndYn": "bid_qlfc_end_yn",
-            "pbancBfssYn": "pbanc_bfss_yn",
-            "bidClsfNo": "bid_clsf_no",
-            "bidPrgrsOrd": "bid_prgrs_ord",
-            "bidPbancPgstCd": "bid_pbanc_pgst_cd",
-            "bidPbancPgstCdNm": "bid_pbanc_pgst_cd_nm",
-            "sfbrSlctnOrd": "sfbr_slctn_ord",
-            "sfbrSlctnRsltCd": "sfbr_slctn_rslt_cd",
-            "docSbmsnDdlnDt": "doc_sbmsn_ddln_dt",
-            "cvlnQlemCrtrNo": "cvln_qlem_crtr_no",
-            "cvlnQlemPgstCd": "cvln_qlem_pgst_cd",
-            "objtdmdTermDt": "objtdmd_term_dt",
-            "bdngAmtYnNm": "bdng_amt_yn_nm",
-            "slprRcptDdlnDt1": "slpr_rcpt_ddln_dt1",
-        }
-        mapped: dict[str, Any] = {}  # 매핑 결과.
-        for key, value in raw.items():  # 원본 순회.
-            target = mapping.get(key)  # 매핑 키 확인.
-            if target:  # 매핑 대상이면.
-                mapped[target] = value  # 변환 저장.
-        return mapped  # 변환 결과 반환.
-
     def _maybe_snapshot_detail(self, item: BidNoticeListItem, body: dict[str, Any]) -> None:  # 상세 스냅샷.
         if not self._snapshot:  # 스냅샷 비활성.
             return  # 종료.
@@ -746,11 +951,11 @@ class CrawlerService:
                 "bsamtMap",
             },
         )
-        if not unexpected:  # 예상 외 키가 없으면.
+        if not unexpected and self._config.snapshot_mode != "all":  # 전체 저장 모드가 아니면.
             return  # 저장 생략.
         key = f"{item.bid_pbanc_no}_{item.bid_pbanc_ord}"  # 파일 키 구성.
-        payload = self._wrap_snapshot_payload(body, unexpected)  # 메타 포함 래핑.
-        self._snapshot.save(f"detail_{datetime.now().strftime('%Y%m%d')}", key, payload)  # 스냅샷 저장.
+        meta = self._snapshot_meta(unexpected)  # 본문과 분리해 둘 메타.
+        self._snapshot.save(f"detail_{datetime.now().strftime('%Y%m%d')}", key, body, meta)  # 스냅샷 저장.
         self._logger.info("스냅샷 저장 완료 유형=상세 키=%s 예기치않은키=%s", key, unexpected)  # 저장 로그.
 
     def _maybe_snapshot_opening(self, item: BidNoticeListItem, body: dict[str, Any]) -> None:  # 개찰 스냅샷.
@@ -758,11 +963,11 @@ class CrawlerService:
             return  # 종료.
         result = body.get("result", {}) if isinstance(body, dict) else {}  # 응답 안전 처리.
         unexpected = self._find_unexpected_keys(result, {"pbancMap", "grdLisList", "oobsRsltList"})
-        if not unexpected:  # 예상 외 키가 없으면.
+        if not unexpected and self._config.snapshot_mode != "all":  # 전체 저장 모드가 아니면.
             return  # 저장 생략.
         key = f"{item.bid_pbanc_no}_{item.bid_pbanc_ord}"  # 파일 키 구성.
-        payload = self._wrap_snapshot_payload(body, unexpected)  # 메타 포함 래핑.
-        self._snapshot.save(f"opening_{datetime.now().strftime('%Y%m%d')}", key, payload)  # 스냅샷 저장.
+        meta = self._snapshot_meta(unexpected)  # 본문과 분리해 둘 메타.
+        self._snapshot.save(f"opening_{datetime.now().strftime('%Y%m%d')}", key, body, meta)  # 스냅샷 저장.
         self._logger.info("스냅샷 저장 완료 유형=개찰 키=%s 예기치않은키=%s", key, unexpected)  # 저장 로그.
 
     def _find_unexpected_keys(self, result: dict[str, Any], expected: set[str]) -> list[str]:  # 예상 외 키 탐지.
@@ -771,13 +976,10 @@ class CrawlerService:
         unexpected = [key for key in result.keys() if key not in expected]  # 예상 외 키 수집.
         return sorted(unexpected)  # 정렬 반환.
 
-    def _wrap_snapshot_payload(self, body: dict[str, Any], unexpected: list[str]) -> dict[str, Any]:  # 스냅샷 래핑.
+    def _snapshot_meta(self, unexpected: list[str]) -> dict[str, Any]:  # 스냅샷 메타(본문 blob 밖에 저장).
         return {
-            "meta": {
-                "timestamp": datetime.now().isoformat(),
-                "unexpected_keys": unexpected,
-            },
-            "body": body,
+            "timestamp": datetime.now().isoformat(),
+            "unexpected_keys": unexpected,
         }
 
     def _maybe_snapshot_list(self, page_index: int, body: dict[str, Any]) -> None:  # 목록 스냅샷.
@@ -786,84 +988,87 @@ class CrawlerService:
         if self._config.snapshot_mode != "all":  # 전체 저장 모드가 아니면.
             return  # 저장 생략.
         key = f"page_{page_index}"  # 파일 키 구성.
-        payload = self._wrap_snapshot_payload(body, [])  # 메타 포함 래핑.
-        self._snapshot.save(f"list_{datetime.now().strftime('%Y%m%d')}", key, payload)  # 스냅샷 저장.
+        meta = self._snapshot_meta([])  # 본문과 분리해 둘 메타.
+        self._snapshot.save(f"list_{datetime.now().strftime('%Y%m%d')}", key, body, meta)  # 스냅샷 저장.
         self._logger.info("스냅샷 저장 완료 유형=목록 키=%s 모드=%s", key, self._config.snapshot_mode)
 
-    def _build_detail_from_list(  # 상세 기본값 생성.
-        self,
-        item: BidNoticeListItem,  # 목록 아이템.
-        detail_raw: dict[str, Any],  # 상세 원본 맵.
-    ) -> BidNoticeDetail:
-        mapping = {  # 상세 응답 필드 매핑.
-            "bidPbancNo": "bid_pbanc_no",
-            "bidPbancOrd": "bid_pbanc_ord",
-            "bidClsfNo": "bid_clsf_no",
-            "bidPrgrsOrd": "bid_prgrs_ord",
-            "bidPbancNm": "bid_pbanc_nm",
-            "bidPbancNum": "bid_pbanc_num",
-            "pbancSttsCd": "pbanc_stts_cd",
-            "pbancSttsCdNm": "pbanc_stts_cd_nm",
-            "prcmBsneSeCd": "prcm_bsne_se_cd",
-            "prcmBsneSeCdNm": "prcm_bsne_se_cd_nm",
-            "bidMthdCd": "bid_mthd_cd",
-            "bidMthdCdNm": "bid_mthd_cd_nm",
-            "stdCtrtMthdCd": "std_ctrt_mthd_cd",
-            "stdCtrtMthdCdNm": "std_ctrt_mthd_cd_nm",
-            "scsbdMthdCd": "scsbd_mthd_cd",
-            "scsbdMthdCdNm": "scsbd_mthd_cd_nm",
-            "pbancInstUntyGrpNo": "pbanc_inst_unty_grp_no",
-            "pbancInstUntyGrpNoNm": "pbanc_inst_unty_grp_no_nm",
-            "grpNm": "grp_nm",
-            "picId": "pic_id",
-            "picIdNm": "pic_id_nm",
-            "bidBlffId": "bid_blff_id",
-            "bidBlffIdNm": "bid_blff_id_nm",
-            "bsneTlphNo": "bsne_tlph_no",
-            "bsneFaxNo": "bsne_fax_no",
-            "bsneEml": "bsne_eml",
-            "pbancPstgDt": "pbanc_pstg_dt",
-            "slprRcptBgngDt": "slpr_rcpt_bgng_dt",
-            "slprRcptDdlnDt": "slpr_rcpt_ddln_dt",
-            "onbsPrnmntDt": "onbs_prnmnt_dt",
-            "bidQlfcRegDt": "bid_qlfc_reg_dt",
-            "onbsPlacNm": "onbs_plac_nm",
-            "zip": "zip",
-            "baseAddr": "base_addr",
-            "dtlAddr": "dtl_addr",
-            "untyAddr": "unty_addr",
-            "edocNo": "edoc_no",
-            "usrDocNoVal": "usr_doc_no_val",
-            "rbidPrmsYn": "rbid_prms_yn",
-            "pbancPstgYn": "pbanc_pstg_yn",
-            "rgnLmtYn": "rgn_lmt_yn",
-            "lcnsLmtYn": "lcns_lmt_yn",
-            "pnprUseYn": "pnpr_use_yn",
-            "pnprRlsYn": "pnpr_rls_yn",
-            "untyAtchFileNo": "unty_atch_file_no",
-        }
-        mapped = self._map_detail_row(detail_raw, mapping)  # 상세 매핑.
-        fallback = {  # 목록 기반 필수값 보정.
-            "bid_pbanc_no": item.bid_pbanc_no,
-            "bid_pbanc_ord": item.bid_pbanc_ord,
-            "bid_clsf_no": item.bid_clsf_no,
-            "bid_prgrs_ord": item.bid_prgrs_ord,
-            "bid_pbanc_nm": item.bid_pbanc_nm,
-            "bid_pbanc_num": item.bid_pbanc_num,
-            "pbanc_stts_cd": item.pbanc_stts_cd,
-            "pbanc_stts_cd_nm": item.pbanc_stts_cd_nm,
-        }
-        merged = {**fallback, **mapped}  # 상세 우선값 병합.
-        return BidNoticeDetail(**merged)  # 상세 모델 생성.
 
-    def _map_detail_row(  # 상세 필드 매핑.
-        self,
-        raw: dict[str, Any],  # 원본 맵.
-        mapping: dict[str, str],  # 매핑 규칙.
-    ) -> dict[str, Any]:
-        mapped: dict[str, Any] = {}  # 매핑 결과.
-        for key, value in raw.items():  # 원본 순회.
-            target = mapping.get(key)  # 매핑 키 확인.
-            if target:  # 매핑 대상이면.
-                mapped[target] = value  # 변환 저장.
-        return mapped  # 변환 결과 반환.
+_ReprocessWorker = tuple[NoticeMapper, NoticeParser, dict[str, SnapshotEntry], dict[str, SnapshotEntry]]
+_REPROCESS_WORKER: Optional[_ReprocessWorker] = None
+
+
+def _init_reprocess_worker(
+    config: CrawlConfig,
+    details: dict[str, SnapshotEntry],
+    openings: dict[str, SnapshotEntry],
+) -> None:  # 워커 프로세스마다 한 번. 상세/개찰 색인도 이때 한 번만 넘겨받는다.
+    global _REPROCESS_WORKER
+    _REPROCESS_WORKER = (NoticeMapper(config), NoticeParser(config.selectors), details, openings)
+
+
+def _reprocess_chunk(entries: list[SnapshotEntry]) -> list[PageBatch]:  # 워커에서 목록 페이지 묶음 처리.
+    assert _REPROCESS_WORKER is not None
+    return _reprocess_pages(*_REPROCESS_WORKER[:2], entries, *_REPROCESS_WORKER[2:])
+
+
+def _reprocess_pages(
+    mapper: NoticeMapper,
+    parser: NoticeParser,
+    entries: list[SnapshotEntry],
+    details: dict[str, SnapshotEntry],
+    openings: dict[str, SnapshotEntry],
+) -> list[PageBatch]:
+    return [batch for entry in entries if (batch := _reprocess_page(mapper, parser, entry, details, openings))]
+
+
+def _reprocess_page(
+    mapper: NoticeMapper,
+    parser: NoticeParser,
+    entry: SnapshotEntry,
+    details: dict[str, SnapshotEntry],
+    openings: dict[str, SnapshotEntry],
+) -> Optional[PageBatch]:  # 목록 스냅샷 한 페이지 재처리.
+    logger = logging.getLogger("service")
+    body = _snapshot_body(entry)
+    if body is None or not isinstance(body.get("result"), list):
+        logger.warning("재처리 목록 스냅샷 건너뜀 날짜=%s 키=%s", entry.date, entry.key)
+        return None
+    items, list_skipped = mapper.build_list_items(body["result"])
+    items = mapper.apply_list_filters(items)
+    suffix = entry.key[len("page_") :]
+    page_index = int(suffix) if suffix.isdigit() else 0
+    batch = PageBatch(page_index=page_index, items=items, list_skipped=list_skipped)
+    for item in items:
+        key = f"{item.bid_pbanc_no}_{item.bid_pbanc_ord}"  # 스냅샷 저장 키와 같은 형식.
+        try:  # 스냅샷 하나가 깨져도 재구성 전체를 멈추지 않는다(수집 경로와 같이 공고 단위로 건너뜀).
+            detail_body = _snapshot_body(details[key]) if key in details else None
+            detail_raw = parser.parse_detail(detail_body) if detail_body is not None else {}
+            detail = mapper.build_detail(item, detail_raw)
+            opening_body = _snapshot_body(openings[key]) if key in openings else None
+            opening = mapper.map_opening_items(*parser.parse_opening(opening_body)) if opening_body else None
+        except Exception as exc:
+            logger.warning("재처리 공고 건너뜀 오류=%s 키=%s", exc, key)
+            batch.detail_skipped += 1
+            continue
+        batch.detail_items.append(detail)
+        if opening is None:
+            continue
+        summary, rows, summary_skipped, row_skipped = opening
+        batch.opening_summary_skipped += summary_skipped
+        batch.opening_row_skipped += row_skipped
+        if summary is not None:
+            batch.opening_summaries.append(summary)
+        batch.opening_results.extend(rows)
+    return batch
+
+
+def _latest_entries(snapshot_dir: str, kind: str) -> dict[str, SnapshotEntry]:  # 공고 키 → 최근 스냅샷 항목.
+    return {entry.key: entry for entry in iter_snapshot_entries(snapshot_dir, kind)}
+
+
+def _snapshot_body(entry: SnapshotEntry) -> Optional[dict[str, Any]]:  # 정상 응답 본문만 반환.
+    payload = read_snapshot(entry)
+    body = payload.get("body") if isinstance(payload, dict) and "body" in payload else payload
+    if not isinstance(body, dict) or body.get("ErrorCode", 0) != 0:
+        return None  # 오류 응답은 수집 때도 버렸다.
+    return body
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from src.core.config import CrawlConfig
+from src.domain.models import BidNoticeDetail, BidNoticeListItem, BidOpeningResult, BidOpeningSummary
+
+
+class NoticeMapper:
+    """API/화면 원본 행을 도메인 모델로 바꾸고 목록 필터를 적용한다. 네트워크/저장소/체크포인트 없이 동작하므로
+    수집 경로와 재처리 워커 프로세스가 함께 쓴다."""
+
+    def __init__(self, config: CrawlConfig) -> None:
+        self._config = config
+        self._logger = logging.getLogger("service")
+
+    def build_list_items(  # 목록 모델 생성.
+        self, raw_rows: list[dict[str, Any]]
+    ) -> tuple[list[BidNoticeListItem], int]:
+        items: list[BidNoticeListItem] = []  # 변환된 모델 리스트.
+        skipped = 0
+        for raw in raw_rows:  # 각 행 변환.
+            mapped = self._map_list_row(raw)  # 필드 매핑.
+            try:  # 검증 실패를 대비.
+                list_item = BidNoticeListItem(**mapped)  # 모델 생성.
+                items.append(list_item)  # 목록 추가.
+            except Exception as exc:  # 검증 실패.
+                self._logger.warning("목록 행 건너뜀 오류=%s raw=%s", exc, raw)  # 스킵 로그.
+                skipped += 1
+                continue  # 다음 행.
+        return items, skipped
+
+    def apply_list_filters(self, items: list[BidNoticeListItem]) -> list[BidNoticeListItem]:  # 목록 필터.
+        filtered = items  # 기본은 전체.
+        if self._config.list_filter_pbanc_knd_cd:  # 공고종류 필터가 있으면.
+            filtered = [
+                item for item in filtered if item.pbanc_knd_cd == self._config.list_filter_pbanc_knd_cd
+            ]
+        if self._config.list_filter_pbanc_stts_cd:  # 공고구분 필터가 있으면.
+            filtered = [
+                item for item in filtered if item.pbanc_stts_cd == self._config.list_filter_pbanc_stts_cd
+            ]
+        if self._config.list_filter_bid_pbanc_pgst_cd:  # 진행상태 필터가 있으면.
+            filtered = [
+                item
+                for item in filtered
+                if item.bid_pbanc_pgst_cd == self._config.list_filter_bid_pbanc_pgst_cd
+            ]
+        if len(filtered) != len(items):  # 필터로 줄어들었으면.
+            self._logger.info("목록 필터 적용 전=%s 후=%s", len(items), len(filtered))
+        return filtered
+
+    def _map_list_row(self, raw: dict[str, Any]) -> dict[str, Any]:  # 목록 필드 매핑.
+        mapping = {  # col_id -> snake_case.
+            "bidPbancNo": "bid_pbanc_no",
+            "bidPbancOrd": "bid_pbanc_ord",
+            "bidPbancNm": "bid_pbanc_nm",
+            "bidPbancNum": "bid_pbanc_num",
+            "pbancSttsCd": "pbanc_stts_cd",
+            "pbancSttsCdNm": "pbanc_stts_cd_nm",
+            "prcmBsneSeCd": "prcm_bsne_se_cd",
+            "prcmBsneSeCdNm": "prcm_bsne_se_cd_nm",
+            "bidMthdCd": "bid_mthd_cd",
+            "bidMthdCdNm": "bid_mthd_cd_nm",
+            "stdCtrtMthdCd": "std_ctrt_mthd_cd",
+            "stdCtrtMthdCdNm": "std_ctrt_mthd_cd_nm",
+            "scsbdMthdCd": "scsbd_mthd_cd",
+            "scsbdMthdCdNm": "scsbd_mthd_cd_nm",
+            "pbancPstgDt": "pbanc_pstg_dt",
+            "pbancKndCd": "pbanc_knd_cd",
+            "pbancKndCdNm": "pbanc_knd_cd_nm",
+            "grpNm": "grp_nm",
+            "slprRcptDdlnDt": "slpr_rcpt_ddln_dt",
+            "pbancSttsGridCdNm": "pbanc_stts_grid_cd_nm",
+            "rowNum": "row_num",
+            "totCnt": "tot_cnt",
+            "currentPage": "current_page",
+            "recordCountPerPage": "record_count_per_page",
+            "nextRowYn": "next_row_yn",
+            "edocNo": "edoc_no",
+            "usrDocNoVal": "usr_doc_no_val",
+            "pbancInstUntyGrpNo": "pbanc_inst_unty_grp_no",
+            "pbancPstgYn": "pbanc_pstg_yn",
+            "pbancDscrTrgtYn": "pbanc_dscr_trgt_yn",
+            "slprRcptBgngYn": "slpr_rcpt_bgng_yn",
+            "slprRcptDdlnYn": "slpr_rcpt_ddln_yn",
+            "onbsPrnmntYn": "onbs_prnmnt_yn",
+            "bidQlfcEndYn": "bid_qlfc_end_yn",
+            "pbancBfssYn": "pbanc_bfss_yn",
+            "bidClsfNo": "bid_clsf_no",
+            "bidPrgrsOrd": "bid_prgrs_ord",
+            "bidPbancPgstCd": "bid_pbanc_pgst_cd",
+            "bidPbancPgstCdNm": "bid_pbanc_pgst_cd_nm",
+            "sfbrSlctnOrd": "sfbr_slctn_ord",
+            "sfbrSlctnRsltCd": "sfbr_slctn_rslt_cd",
+            "docSbmsnDdlnDt": "doc_sbmsn_ddln_dt",
+            "cvlnQlemCrtrNo": "cvln_qlem_crtr_no",
+            "cvlnQlemPgstCd": "cvln_qlem_pgst_cd",
+            "objtdmdTermDt": "objtdmd_term_dt",
+            "bdngAmtYnNm": "bdng_amt_yn_nm",
+            "slprRcptDdlnDt1": "slpr_rcpt_ddln_dt1",
+        }
+        mapped: dict[str, Any] = {}  # 매핑 결과.
+        for key, value in raw.items():  # 원본 순회.
+            target = mapping.get(key)  # 매핑 키 확인.
+            if target:  # 매핑 대상이면.
+                mapped[target] = value  # 변환 저장.
+        return mapped  # 변환 결과 반환.
+
+    def build_detail(  # 상세 기본값 생성.
+        self,
+        item: BidNoticeListItem,  # 목록 아이템.
+        detail_raw: dict[str, Any],  # 상세 원본 맵.
+    ) -> BidNoticeDetail:
+        mapping = {  # 상세 응답 필드 매핑.
+            "bidPbancNo": "bid_pbanc_no",
+            "bidPbancOrd": "bid_pbanc_ord",
+            "bidClsfNo": "bid_clsf_no",
+            "bidPrgrsOrd": "bid_prgrs_ord",
+            "bidPbancNm": "bid_pbanc_nm",
+            "bidPbancNum": "bid_pbanc_num",
+            "pbancSttsCd": "pbanc_stts_cd",
+            "pbancSttsCdNm": "pbanc_stts_cd_nm",
+            "prcmBsneSeCd": "prcm_bsne_se_cd",
+            "prcmBsneSeCdNm": "prcm_bsne_se_cd_nm",
+            "bidMthdCd": "bid_mthd_cd",
+            "bidMthdCdNm": "bid_mthd_cd_nm",
+            "stdCtrtMthdCd": "std_ctrt_mthd_cd",
+            "stdCtrtMthdCdNm": "std_ctrt_mthd_cd_nm",
+            "scsbdMthdCd": "scsbd_mthd_cd",
+            "scsbdMthdCdNm": "scsbd_mthd_cd_nm",
+            "pbancInstUntyGrpNo": "pbanc_inst_unty_grp_no",
+            "pbancInstUntyGrpNoNm": "pbanc_inst_unty_grp_no_nm",
+            "grpNm": "grp_nm",
+            "picId": "pic_id",
+            "picIdNm": "pic_id_nm",
+            "bidBlffId": "bid_blff_id",
+            "bidBlffIdNm": "bid_blff_id_nm",
+            "bsneTlphNo": "bsne_tlph_no",
+            "bsneFaxNo": "bsne_fax_no",
+            "bsneEml": "bsne_eml",
+            "pbancPstgDt": "pbanc_pstg_dt",
+            "slprRcptBgngDt": "slpr_rcpt_bgng_dt",
+            "slprRcptDdlnDt": "slpr_rcpt_ddln_dt",
+            "onbsPrnmntDt": "onbs_prnmnt_dt",
+            "bidQlfcRegDt": "bid_qlfc_reg_dt",
+            "onbsPlacNm": "onbs_plac_nm",
+            "zip": "zip",
+            "baseAddr": "base_addr",
+            "dtlAddr": "dtl_addr",
+            "untyAddr": "unty_addr",
+            "edocNo": "edoc_no",
+            "usrDocNoVal": "usr_doc_no_val",
+            "rbidPrmsYn": "rbid_prms_yn",
+            "pbancPstgYn": "pbanc_pstg_yn",
+            "rgnLmtYn": "rgn_lmt_yn",
+            "lcnsLmtYn": "lcns_lmt_yn",
+            "pnprUseYn": "pnpr_use_yn",
+            "pnprRlsYn": "pnpr_rls_yn",
+            "untyAtchFileNo": "unty_atch_file_no",
+        }
+        mapped = self._map_detail_row(detail_raw, mapping)  # 상세 매핑.
+        fallback = {  # 목록 기반 필수값 보정.
+            "bid_pbanc_no": item.bid_pbanc_no,
+            "bid_pbanc_ord": item.bid_pbanc_ord,
+            "bid_clsf_no": item.bid_clsf_no,
+            "bid_prgrs_ord": item.bid_prgrs_ord,
+            "bid_pbanc_nm": item.bid_pbanc_nm,
+            "bid_pbanc_num": item.bid_pbanc_num,
+            "pbanc_stts_cd": item.pbanc_stts_cd,
+            "pbanc_stts_cd_nm": item.pbanc_stts_cd_nm,
+        }
+        merged = {**fallback, **mapped}  # 상세 우선값 병합.
+        return BidNoticeDetail(**merged)  # 상세 모델 생성.
+
+    def _map_detail_row(  # 상세 필드 매핑.
+        self,
+        raw: dict[str, Any],  # 원본 맵.
+        mapping: dict[str, str],  # 매핑 규칙.
+    ) -> dict[str, Any]:
+        mapped: dict[str, Any] = {}  # 매핑 결과.
+        for key, value in raw.items():  # 원본 순회.
+            target = mapping.get(key)  # 매핑 키 확인.
+            if target:  # 매핑 대상이면.
+                mapped[target] = value  # 변환 저장.
+        return mapped  # 변환 결과 반환.
+
+    def map_opening_items(
+        self, summary_raw: dict[str, Any], rows_raw: list[dict[str, Any]]
+    ) -> tuple[Optional[BidOpeningSummary], list[BidOpeningResult], int, int]:  # 개찰 응답 → 모델.
+        summary = None
+        summary_skipped = 0
+        if summary_raw:
+            mapped = self._map_opening_summary(summary_raw)
+            try:
+                summary = BidOpeningSummary(**mapped)
+            except Exception as exc:
+                self._logger.warning("개찰 요약 건너뜀 오류=%s raw=%s", exc, summary_raw)
+                summary_skipped += 1
+        results: list[BidOpeningResult] = []
+        row_skipped = 0
+        for row in rows_raw:
+            mapped = self._map_opening_result(row)
+            try:
+                results.append(BidOpeningResult(**mapped))
+            except Exception as exc:
+                self._logger.warning("개찰 행 건너뜀 오류=%s raw=%s", exc, row)
+                row_skipped += 1
+        return summary, results, summary_skipped, row_skipped
+
+    def _map_opening_summary(self, raw: dict[str, Any]) -> dict[str, Any]:  # 개찰 요약 매핑.
+        mapping = {
+            "bidPbancNo": "bid_pbanc_no",
+            "bidPbancOrd": "bid_pbanc_ord",
+            "bidClsfNo": "bid_clsf_no",
+            "bidPrgrsOrd": "bid_prgrs_ord",
+            "bidPbancNm": "bid_pbanc_nm",
+            "bidPbancNum": "bid_pbanc_num",
+            "pbancSttsCd": "pbanc_stts_cd",
+            "pbancSttsCdNm": "pbanc_stts_cd_nm",
+            "prcmBsneSeCd": "prcm_bsne_se_cd",
+            "prcmBsneSeCdNm": "prcm_bsne_se_cd_nm",
+            "bidMthdCd": "bid_mthd_cd",
+            "bidMthdCdNm": "bid_mthd_cd_nm",
+            "stdCtrtMthdCd": "std_ctrt_mthd_cd",
+            "stdCtrtMthdCdNm": "std_ctrt_mthd_cd_nm",
+            "scsbdMthdCd": "scsbd_mthd_cd",
+            "scsbdMthdCdNm": "scsbd_mthd_cd_nm",
+            "pbancInstUntyGrpNo": "pbanc_inst_unty_grp_no",
+            "pbancInstUntyGrpNoNm": "pbanc_inst_unty_grp_no_nm",
+            "grpNm": "grp_nm",
+            "bidBlffId": "bid_blff_id",
+            "bidBlffIdNm": "bid_blff_id_nm",
+            "ibxOnbsPrnmntDt": "ibx_onbs_prnmnt_dt",
+            "ibxOnbsDt": "ibx_onbs_dt",
+            "edocNo": "edoc_no",
+            "usrDocNoVal": "usr_doc_no_val",
+        }
+        mapped: dict[str, Any] = {}
+        for key, value in raw.items():
+            target = mapping.get(key)
+            if target:
+                mapped[target] = value
+        return mapped
+
+    def _map_opening_result(self, raw: dict[str, Any]) -> dict[str, Any]:  # 개찰 결과 매핑.
+        mapping = {
+            "bidPbancNo": "bid_pbanc_no",
+            "bidPbancOrd": "bid_pbanc_ord",
+            "bidClsfNo": "bid_clsf_no",
+            "bidPrgrsOrd": "bid_prgrs_ord",
+            "ibxOnbsRnkg": "ibx_onbs_rnkg",
+            "ibxGrpNm": "ibx_grp_nm",
+            "ibxBdngAmt": "ibx_bdng_amt",
+            "ibxSlprRcptnDt": "ibx_slpr_rcptn_dt",
+            "ibxBzmnRegNo": "ibx_bzmn_reg_no",
+            "ibxRprsvNm": "ibx_rprsv_nm",
+            "bidrPrsnNo": "bidr_prsn_no",
+            "bidrPrsnNm": "bidr_prsn_nm",
+            "bidUfnsRsnCd": "bid_ufns_rsn_cd",
+            "bidUfnsRsnNm": "bid_ufns_rsn_nm",
+            "ufnsYn": "ufns_yn",
+            "ibxEvlScrPrpl": "ibx_evl_scr_prpl",
+            "ibxEvlScrPrce": "ibx_evl_scr_prce",
+            "ibxEvlScrOvrl": "ibx_evl_scr_ovrl",
+            "sfbrSlctnOrd": "sfbr_slctn_ord",
+            "sfbrSlctnRsltCd": "sfbr_slctn_rslt_cd",
+        }
+        mapped: dict[str, Any] = {}
+        for key, value in raw.items():
+            target = mapping.get(key)
+            if target:
+                mapped[target] = value
+            if key == "ibxEvlScrPrpl":
+                mapped["ibx_evl_scr_prpl_num"] = value
+            if key == "ibxEvlScrPrce":
+                mapped["ibx_evl_scr_prce_num"] = value
+            if key == "ibxEvlScrOvrl":
+                mapped["ibx_evl_scr_ovrl_num"] = value
+        return mapped
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_STOP = object()
+
+
+class BackgroundWriter(Generic[T, R]):
+    """저장 작업을 전용 스레드에서 순서대로 처리한다. 큐가 가득 차면 `submit`이 대기한다(역압)."""
+
+    def __init__(self, handler: Callable[[T], R], maxsize: int = 4) -> None:
+        self._handler = handler
+        self._tasks: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+        self._done: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._pending = 0
+        self._logger = logging.getLogger("writer")
+        self._thread = threading.Thread(target=self._loop, name="repository-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, task: T) -> None:
+        self.check()
+        self._tasks.put(task)
+        self._pending += 1
+
+    def completed(self) -> list[tuple[T, R]]:
+        """이미 확정된 작업을 제출 순서대로 반환한다(대기하지 않음)."""
+        results: list[tuple[T, R]] = []
+        while True:
+            try:
+                results.append(self._done.get_nowait())
+            except queue.Empty:
+                break
+        self._pending -= len(results)
+        return results
+
+    def drain(self) -> list[tuple[T, R]]:
+        """제출한 작업이 모두 확정되거나 저장이 실패할 때까지 기다린다."""
+        results: list[tuple[T, R]] = []
+        while self._pending > len(results) and self._error is None:
+            try:
+                results.append(self._done.get(timeout=0.5))
+            except queue.Empty:
+                continue
+        self._pending -= len(results)
+        return results + self.completed()
+
+    def check(self) -> None:
+        """저장 스레드에서 난 오류를 호출 스레드로 다시 던진다."""
+        if self._error is not None:
+            raise RuntimeError("background persistence failed") from self._error
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._tasks.put(_STOP)
+            self._thread.join()
+
+    def _loop(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is _STOP:
+                return
+            if self._error is not None:
+                continue  # 실패 이후 작업은 버린다. 체크포인트가 전진하지 않으므로 재실행 시 다시 수집된다.
+            try:
+                self._done.put((task, self._handler(task)))
+            except BaseException as exc:  # noqa: BLE001 - 호출 스레드에서 다시 던진다.
+                self._logger.error("백그라운드 저장 실패 오류=%s", exc)
+                self._error = exc
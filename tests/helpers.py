@@ -0,0 +1,96 @@
+"""여러 테스트 모듈이 함께 쓰는 설정/원본 행/모델 생성기와 가짜 응답."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.config import CrawlConfig, Selectors
+from src.domain.models import BidNoticeListItem
+
+
+def make_config() -> CrawlConfig:
+    return CrawlConfig(
+        base_url="https://example.com",
+        list_url="https://example.com/list",
+        list_api_url="https://example.com/list-api",
+        detail_api_url="https://example.com/detail",
+        max_pages=1,
+        timeout_ms=5000,
+        retry_count=1,
+        retry_backoff_sec=0.1,
+        user_agent="test-agent",
+        selectors=Selectors(list_row="#list tr", list_link="#list a"),
+    )
+
+
+def api_row(number: int, name: str = "테스트 공고") -> dict:
+    """목록 API 응답의 행 하나(camelCase 원본)."""
+    return {
+        "bidPbancNo": f"R26BK{number:08d}",
+        "bidPbancOrd": "000",
+        "bidClsfNo": "0",
+        "bidPrgrsOrd": "000",
+        "bidPbancNm": name,
+        "bidPbancNum": f"R26BK{number:08d}-000",
+        "pbancSttsCd": "공400001",
+        "pbancSttsCdNm": "등록공고",
+        "prcmBsneSeCd": "A",
+        "prcmBsneSeCdNm": "용역",
+        "bidMthdCd": "B",
+        "bidMthdCdNm": "일반경쟁",
+        "stdCtrtMthdCd": "C",
+        "stdCtrtMthdCdNm": "일반",
+        "scsbdMthdCd": "D",
+        "scsbdMthdCdNm": "적격심사",
+        "pbancPstgDt": "2026/02/06 19:11",
+        "pbancKndCd": "공440002",
+        "pbancKndCdNm": "실공고",
+        "grpNm": "테스트기관",
+        "slprRcptDdlnDt": "2026/02/07 10:00",
+        "pbancSttsGridCdNm": "입찰개시",
+        "rowNum": str(number),
+        "totCnt": "9",
+        "currentPage": "1",
+        "recordCountPerPage": "10",
+        "nextRowYn": "N",
+    }
+
+
+def list_item(bid_pbanc_no: str) -> BidNoticeListItem:
+    return BidNoticeListItem(
+        bid_pbanc_no=bid_pbanc_no,
+        bid_pbanc_ord="000",
+        bid_pbanc_nm="테스트 공고",
+        bid_pbanc_num=f"{bid_pbanc_no}000",
+        pbanc_stts_cd="공400001",
+        pbanc_stts_cd_nm="등록공고",
+        prcm_bsne_se_cd="A",
+        prcm_bsne_se_cd_nm="용역",
+        bid_mthd_cd="B",
+        bid_mthd_cd_nm="일반경쟁",
+        std_ctrt_mthd_cd="C",
+        std_ctrt_mthd_cd_nm="일반",
+        scsbd_mthd_cd="D",
+        scsbd_mthd_cd_nm="적격심사",
+        grp_nm="테스트기관",
+        pbanc_pstg_dt="2026/02/06 19:11",
+        slpr_rcpt_ddln_dt="2026/02/07 10:00",
+        pbanc_knd_cd="공440002",
+        pbanc_knd_cd_nm="실공고",
+        pbanc_stts_grid_cd_nm="입찰개시",
+        row_num=1,
+        tot_cnt=1,
+        current_page=1,
+        record_count_per_page=10,
+        next_row_yn="N",
+    )
+
+
+@dataclass
+class FakeResponse:
+    body: dict[str, Any]
+    status: int = 200
+
+    def json(self) -> dict[str, Any]:
+        return self.body
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from src.core.config import CrawlConfig, Selectors
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.service.crawler_service import CrawlerService, PageBatch
+
+
+@dataclass
+class RecordingRepository:  # 저장 스레드에서 호출되는 저장소 스텁.
+    fail_on: str | None = None
+    saved_items: list[Any] = field(default_factory=list)
+    flushes: int = 0
+
+    def save_list_items(self, items: list[Any]) -> int:
+        if self.fail_on in items:
+            raise OSError("disk full")
+        self.saved_items.extend(items)
+        return len(items)
+
+    def flush(self) -> int:
+        self.flushes += 1
+        return 0
+
+
+def _build_service(tmp_path: Path, repo: RecordingRepository) -> tuple[CrawlerService, CheckpointStore]:
+    config = CrawlConfig(
+        base_url="https://example.com",
+        list_url="https://example.com/list",
+        list_api_url="https://example.com/list-api",
+        detail_api_url="https://example.com/detail",
+        max_pages=5,
+        timeout_ms=5000,
+        retry_count=1,
+        retry_backoff_sec=0.1,
+        user_agent="test-agent",
+        async_persistence=True,
+        persistence_queue_size=2,
+        selectors=Selectors(list_row="#list tr", list_link="#list a"),
+    )
+    checkpoint = CheckpointStore(str(tmp_path / "checkpoint.json"))
+    service = CrawlerService(config, cast(NoticeRepository, repo), cast(NoticeParser, None), checkpoint)
+    service._fetch_list_via_api = lambda page, current_page: []  # type: ignore[method-assign]
+    service._collect_page = lambda page, page_index, raw_rows, done_keys: iter(  # type: ignore[method-assign]
+        [PageBatch(page_index=page_index, items=[f"page-{page_index}"])]
+    )
+    return service, checkpoint
+
+
+def test_async_persistence_saves_pages_in_order(tmp_path: Path) -> None:
+    repo = RecordingRepository()
+    service, checkpoint = _build_service(tmp_path, repo)
+
+    service.run(None, max_pages=None)
+
+    assert repo.saved_items == [f"page-{index}" for index in range(1, 6)]
+    assert repo.flushes == 5
+    loaded = service.walk_checkpoint().load()
+    assert loaded is not None and loaded.current_page == 6
+
+
+def test_async_persistence_checkpoint_stops_at_failed_page(tmp_path: Path) -> None:
+    repo = RecordingRepository(fail_on="page-3")
+    service, checkpoint = _build_service(tmp_path, repo)
+
+    with pytest.raises(RuntimeError):
+        service.run(None, max_pages=None)
+
+    assert repo.saved_items == ["page-1", "page-2"]
+    loaded = service.walk_checkpoint().load()
+    assert loaded is not None and loaded.current_page == 3
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.infrastructure.browser import BrowserPool, BrowserSlot
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.service.crawler_service import CrawlerService
+from tests.helpers import make_config
+
+
+class _FakeRequest:
+    def __init__(self) -> None:
+        self.posts = 0
+
+    def post(self, url: str, data: Any = None) -> int:
+        self.posts += 1
+        return 200
+
+
+class _FakePage:
+    def __init__(self, owner: "_FakeContext") -> None:
+        self.owner = owner
+        self.thread = threading.get_ident()
+        self.closed = False
+        self.request = _FakeRequest()
+        self.handlers: dict[str, Callable[[Any], None]] = {}
+
+    def on(self, event: str, handler: Callable[[Any], None]) -> None:
+        self.handlers[event] = handler
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def crash(self) -> None:
+        self.handlers["crash"](self)
+
+
+class _FakeCdp:
+    def __init__(self, context: "_FakeContext") -> None:
+        self._context = context
+
+    def send(self, method: str) -> Any:
+        if method == "Performance.getMetrics":
+            return {"metrics": [{"name": "JSHeapUsedSize", "value": self._context.heap_mb * 1024 * 1024}]}
+        return {}
+
+
+class _FakeContext:
+    def __init__(self, browser: "_FakeBrowser") -> None:
+        self.browser = browser
+        self.heap_mb = 10.0
+        self.closed = False
+
+    def set_default_timeout(self, timeout: int) -> None:
+        pass
+
+    def new_page(self) -> _FakePage:
+        return _FakePage(self)
+
+    def new_cdp_session(self, page: _FakePage) -> _FakeCdp:
+        return _FakeCdp(self)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts: list[_FakeContext] = []
+        self.connected = True
+
+    def new_context(self, user_agent: str) -> _FakeContext:
+        context = _FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def close(self) -> None:
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self, launched: list[_FakeBrowser]) -> None:
+        self._launched = launched
+        self.chromium = self
+
+    def launch(self) -> _FakeBrowser:
+        browser = _FakeBrowser()
+        self._launched.append(browser)
+        return browser
+
+    def stop(self) -> None:
+        pass
+
+
+def _slot(launched: list[_FakeBrowser], **overrides: Any) -> BrowserSlot:
+    config = make_config()
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return BrowserSlot(config, start=lambda: _FakePlaywright(launched))
+
+
+def test_slot_recycles_context_after_max_requests_and_on_memory() -> None:
+    launched: list[_FakeBrowser] = []
+    slot = _slot(launched, browser_context_max_requests=2, browser_context_max_memory_mb=100)
+
+    def _post(page: _FakePage) -> _FakePage:
+        page.request.post("https://example.com/api", "{}")
+        return page
+
+    pages = [slot.run(_post) for _ in range(4)]
+
+    assert len(launched) == 1
+    assert len(launched[0].contexts) == 2  # 요청 2건마다 새 컨텍스트.
+    assert pages[0] is pages[1] and pages[1] is not pages[2]
+    assert all(context.closed for context in launched[0].contexts)
+    assert slot.stats()["requests"] == 4
+
+    def _leak(page: _FakePage) -> None:
+        page.owner.heap_mb = 300
+
+    slot.run(_leak)  # 새 컨텍스트의 첫 작업에서 메모리가 기준을 넘는다.
+    assert slot.memory_mb == 300
+    assert launched[0].contexts[2].closed
+    assert slot.stats()["recycles"] == 3
+
+
+def test_slot_counts_page_requests_and_recycles_between_jobs() -> None:
+    launched: list[_FakeBrowser] = []
+    slot = _slot(launched, browser_context_max_requests=3)
+
+    def _crawl(page: _FakePage) -> _FakePage:  # 한 작업이 크롤 전체를 돈다.
+        for _ in range(5):
+            page.request.post("https://example.com/api", "{}")
+        return page
+
+    page = slot.run(_crawl)
+    assert page.request.posts == 5  # 작업 중에는 컨텍스트를 바꾸지 않는다.
+    assert launched[0].contexts[0].closed  # 작업이 끝나면 요청 수를 보고 바꾼다.
+    assert slot.run(lambda page: page.owner) is launched[0].contexts[1]
+    assert slot.stats()["jobs"] == 2
+    assert slot.stats()["requests"] == 5
+
+
+def test_api_crawl_renews_context_between_list_pages(tmp_path: Path) -> None:
+    launched: list[_FakeBrowser] = []
+    slot = _slot(launched, browser_context_max_requests=3)
+    config = make_config().model_copy(update={"max_pages": 4})
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="off"))
+    service = CrawlerService(config, repo, NoticeParser(config.selectors), CheckpointStore(str(tmp_path / "cp.json")))
+    contexts: list[_FakeContext] = []
+
+    def fetch_list(page: Any, current_page: int) -> list[dict[str, Any]]:
+        contexts.append(page.owner)
+        for _ in range(2):  # 목록 한 페이지 분량의 요청.
+            page.request.post("https://example.com/api", "{}")
+        return []
+
+    service._fetch_list_via_api = fetch_list  # type: ignore[method-assign]
+    slot.run(lambda page: service.run(page, None, slot.renew))
+    repo.close()
+
+    assert len(launched[0].contexts) == 2  # 요청 4건이 쌓인 세 번째 페이지 앞에서 한 번 교체.
+    assert contexts == [launched[0].contexts[0]] * 2 + [launched[0].contexts[1]] * 2
+    assert launched[0].contexts[0].closed and slot.stats()["jobs"] == 1
+    other = object()
+    assert slot.renew(other) is other  # 슬롯이 준 페이지가 아니면 그대로 돌려준다.
+
+
+def test_slot_restarts_browser_on_crash_and_recycles_after_errors() -> None:
+    launched: list[_FakeBrowser] = []
+    slot = _slot(launched, browser_context_max_errors=2)
+
+    def _crash(page: _FakePage) -> None:
+        page.crash()
+        raise RuntimeError("Target crashed")
+
+    with pytest.raises(RuntimeError):
+        slot.run(_crash)
+    assert slot.run(lambda page: page.owner.browser) is launched[1]
+    assert slot.restarts == 1
+
+    def _fail(page: _FakePage) -> None:
+        raise TimeoutError("navigation timeout")
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            slot.run(_fail)
+    assert len(launched) == 2  # 연속 오류는 컨텍스트만 바꾼다.
+    assert launched[1].contexts[0].closed
+
+    launched[1].connected = False  # 작업 사이에 브라우저가 죽었다.
+    assert slot.run(lambda page: page.owner.browser) is launched[2]
+    assert slot.stats()["errors"] == 3
+    assert slot.stats()["restarts"] == 2
+
+
+def test_pool_runs_jobs_concurrently_on_slot_threads() -> None:
+    launched: list[_FakeBrowser] = []
+    config = make_config()
+    seen: list[tuple[int, int]] = []
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def _job(page: _FakePage) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+            seen.append((page.thread, threading.get_ident()))
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return id(page)
+
+    with BrowserPool(config, 3, start=lambda: _FakePlaywright(launched)) as pool:
+        futures = [pool.submit(_job) for _ in range(6)]
+        page_ids = {future.result() for future in futures}
+        stats = pool.stats()
+
+    assert peak == 3
+    assert all(page_thread == worker for page_thread, worker in seen)  # 페이지는 만든 스레드에서만 쓴다.
+    assert len(launched) == len(page_ids) == 3
+    assert sum(slot["jobs"] for slot in stats) == 6
+    assert all(not browser.connected for browser in launched)  # 풀을 닫으면 브라우저도 닫힌다.
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional, cast
+
+import pytest
+
+from src.infrastructure.checkpoint import CheckpointStore, CrawlCheckpoint
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.service import crawler_service
+from src.service.crawler_service import CrawlerService
+from tests.helpers import make_config
+
+
+def _advance(path: str, walk: str, pages: int) -> None:
+    store = CheckpointStore(path).for_walk(walk)
+    for page in range(1, pages + 1):
+        store.save(CrawlCheckpoint(page, ((f"R{page}", "000"),)))
+
+
+def _service(tmp_path: Path, repo: Optional[NoticeRepository] = None, **update: object) -> CrawlerService:
+    config = make_config().model_copy(update=update)
+    return CrawlerService(
+        config, cast(NoticeRepository, repo), NoticeParser(config.selectors), CheckpointStore(str(tmp_path / "cp.json"))
+    )
+
+
+def _walk(tmp_path: Path, **update: object) -> CheckpointStore:
+    return _service(tmp_path, **update).walk_checkpoint()
+
+
+class _Tomorrow(datetime):
+    @classmethod
+    def now(cls, tz: Any = None) -> "_Tomorrow":
+        moved = datetime.now(tz) + timedelta(days=1)
+        return cls.combine(moved.date(), moved.time(), moved.tzinfo)
+
+
+def test_walks_keep_independent_progress_under_concurrent_updates(tmp_path: Path) -> None:
+    path = str(tmp_path / "checkpoint.json")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_advance, [path] * 4, [f"walk-{n}" for n in range(4)], [30, 40, 50, 60]))
+
+    store = CheckpointStore(path)
+    assert sorted(store.walks()) == [f"walk-{n}" for n in range(4)]  # 동시에 갱신해도 잃어버린 항목이 없다.
+    assert store.for_walk("walk-2").load() == CrawlCheckpoint(50, (("R50", "000"),))
+    store.for_walk("walk-2").clear()
+    assert store.for_walk("walk-2").load() is None
+    assert store.for_walk("walk-3").load() == CrawlCheckpoint(60, (("R60", "000"),))
+
+
+def test_walk_key_follows_filters_and_range_setting(tmp_path: Path) -> None:
+    real = _walk(tmp_path, list_filter_pbanc_knd_cd="공440002")
+    assert real.walk == _walk(tmp_path, list_filter_pbanc_knd_cd="공440002").walk
+    assert real.walk != _walk(tmp_path, list_filter_pbanc_stts_cd="공400003").walk
+    assert _walk(tmp_path, search_range_days=7).walk != _walk(tmp_path, search_range_days=30).walk
+
+    real.save(CrawlCheckpoint(4))
+    assert _walk(tmp_path, list_filter_pbanc_stts_cd="공400003").load() is None  # 다른 조건은 처음부터.
+    saved = json.loads((tmp_path / "cp.json").read_text(encoding="utf-8"))["walks"][real.walk]
+    assert saved["query"]["filters"]["pbancKndCd"] == "공440002"
+
+
+def test_relative_range_walk_survives_midnight_and_resumes_its_dates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    today = _walk(tmp_path, search_range_days=7)
+    assert today.dates is not None
+    today.save(CrawlCheckpoint(1, (("R26BK00000001", "000"),)))
+
+    monkeypatch.setattr(crawler_service, "datetime", _Tomorrow)
+    repo = NoticeRepository(str(tmp_path / "nuri.db"))
+    service = _service(tmp_path, repo, search_range_days=7)
+    tomorrow = service.walk_checkpoint()
+    assert tomorrow.walk == today.walk  # 날짜가 바뀌어도 같은 조건이다.
+    assert tomorrow.dates != today.dates
+    loaded = tomorrow.load()
+    assert loaded is not None and loaded.dates == today.dates
+
+    payloads: list[dict[str, Any]] = []
+
+    def fetch_list(page: Any, current_page: int) -> list[dict[str, Any]]:
+        payloads.append(service._build_list_payload(current_page))
+        return []
+
+    service._fetch_list_via_api = fetch_list  # type: ignore[method-assign]
+    service.run(None, max_pages=None)
+    assert payloads[0]["pbancPstgStDt"] == today.dates["pbancPstgStDt"]  # 재개는 이전 날짜 범위로 읽는다.
+    finished = tomorrow.load()
+    assert finished is not None and finished.finished
+
+    service.run(None, max_pages=None)  # 끝난 진행은 이어받지 않고 오늘 날짜로 처음부터.
+    assert payloads[1]["pbancPstgStDt"] == tomorrow.dates["pbancPstgStDt"]
+    repo.close()
+
+
+def test_finished_and_stale_walks_are_pruned(tmp_path: Path) -> None:
+    store = CheckpointStore(str(tmp_path / "cp.json"), stale_days=7)
+    store.for_walk("done").finish(3)
+    store.for_walk("active").save(CrawlCheckpoint(2))
+    data = json.loads((tmp_path / "cp.json").read_text(encoding="utf-8"))
+    assert sorted(data["walks"]) == ["active"]
+
+    data["walks"]["old"] = {"current_page": 5, "updated_at": (datetime.now() - timedelta(days=8)).isoformat()}
+    (tmp_path / "cp.json").write_text(json.dumps(data), encoding="utf-8")
+    store.for_walk("active").save(CrawlCheckpoint(3))
+    assert sorted(store.walks()) == ["active"]
+
+
+def test_legacy_checkpoint_moves_only_to_its_recorded_walk(tmp_path: Path) -> None:
+    path = tmp_path / "cp.json"
+    path.write_text(json.dumps({"current_page": 4}), encoding="utf-8")
+    walk = _walk(tmp_path)
+    assert walk.load() is None  # 조건을 모르는 진행은 아무 조건에도 넘기지 않는다.
+    assert not CheckpointStore(str(path)).walks()
+
+    other = _walk(tmp_path, list_filter_pbanc_stts_cd="공400003")
+    recorded = json.loads(json.dumps(_service(tmp_path).walk_query()))
+    path.write_text(json.dumps({"walks": {"": {"current_page": 4, "query": recorded}}}), encoding="utf-8")
+    assert other.load() is None  # 다른 조건이 먼저 읽으면 버려진다.
+    assert walk.load() is None
+
+    path.write_text(json.dumps({"walks": {"": {"current_page": 4, "query": recorded}}}), encoding="utf-8")
+    loaded: Optional[CrawlCheckpoint] = walk.load()
+    assert loaded == CrawlCheckpoint(4)  # 기록된 조건과 같으면 이어받는다.
+    assert sorted(CheckpointStore(str(path)).walks()) == [walk.walk]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.domain.models import BidOpeningResult
+from src.infrastructure.repository import NoticeRepository
+from tests.helpers import list_item
+
+
+def _opening_result(bid_pbanc_no: str) -> BidOpeningResult:
+    return BidOpeningResult(
+        bid_pbanc_no=bid_pbanc_no,
+        bid_pbanc_ord="000",
+        bid_clsf_no="0",
+        bid_prgrs_ord="000",
+        ibx_onbs_rnkg=1,
+        ibx_grp_nm="테스트업체",
+        ibx_bdng_amt="1,000",
+        ibx_slpr_rcptn_dt="2026/03/09 10:00:00",
+    )
+
+
+def test_parquet_sink_partitions_by_posting_month(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(parquet_enabled=True))
+    february = list_item("R26BK00000001")
+    march = list_item("R26BK00000002").model_copy(update={"pbanc_pstg_dt": datetime(2026, 3, 2, 9, 0)})
+    repo.save_list_items([february, march])
+    repo.save_opening_result_items([_opening_result("R26BK00000002")])
+    repo.close()
+
+    parquet_dir = tmp_path / "parquet"
+    assert (parquet_dir / "list" / "year=2026" / "month=03").is_dir()
+    assert (parquet_dir / "opening_result" / "year=2026" / "month=03").is_dir()
+
+    dataset = ds.dataset(parquet_dir / "list", format="parquet", partitioning="hive")
+    table = dataset.to_table(
+        columns=["bid_pbanc_no", "pbanc_pstg_dt", "next_row_yn"],
+        filter=ds.field("month") == 3,
+    )
+    assert table.column("bid_pbanc_no").to_pylist() == ["R26BK00000002"]
+    assert table.column("pbanc_pstg_dt").to_pylist() == [datetime(2026, 3, 2, 9, 0)]
+    assert table.column("next_row_yn").to_pylist() == [False]
+
+    results = ds.dataset(parquet_dir / "opening_result", format="parquet", partitioning="hive").to_table()
+    assert results.column("ibx_bdng_amt").to_pylist() == [1000]
+
+
+def test_opening_results_of_earlier_runs_find_posting_month(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    storage = StorageConfig(parquet_enabled=True, view_mode="off")
+    march = {"pbanc_pstg_dt": datetime(2026, 3, 2, 9, 0)}
+    first = NoticeRepository(str(tmp_path / "nuri.db"), storage)
+    first.save_list_items([list_item(f"R26BK0000000{index}").model_copy(update=march) for index in (1, 2)])
+    first.close()
+
+    second = NoticeRepository(str(tmp_path / "nuri.db"), storage)
+    assert second.save_list_items([list_item("R26BK00000001").model_copy(update=march)]) == 0  # 이미 본 공고.
+    second.save_opening_result_items([_opening_result("R26BK00000001")])  # 이번 실행에서 관측한 목록 행.
+    second.save_opening_result_items([_opening_result("R26BK00000002")])  # 목록에 다시 나오지 않은 공고는 색인에서.
+    second.close()
+
+    results = tmp_path / "parquet" / "opening_result"
+    assert [path.name for path in results.iterdir()] == ["year=2026"]
+    assert len(list((results / "year=2026" / "month=03").glob("*.parquet"))) == 1
+
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from scripts.compare_list_snapshot import build_mapping, compare, normalize_row
+from src.core.config import StorageConfig
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.snapshot import SnapshotStore
+from tests.helpers import api_row
+
+
+def test_partitioned_compare_streams_report(tmp_path: Path) -> None:
+    store = SnapshotStore(str(tmp_path / "raw"), "packed")
+    store.save("list_20260206", "page_1", {"result": [api_row(n) for n in range(1, 21)]})
+    store.save("list_20260207", "page_1", {"result": [api_row(1, "바뀐 공고명"), {"bidPbancNo": "R26BK99999999"}]})
+    store.close()
+    mapping = build_mapping()
+    saved = [normalize_row(api_row(n), mapping) for n in range(2, 21)]  # 1번은 CSV에 없다.
+    saved[0] = saved[0].model_copy(update={"grp_nm": "다른기관"})
+    saved.append(normalize_row(api_row(30), mapping))  # 스냅샷에 없는 행.
+    repo = NoticeRepository(str(tmp_path / "data" / "nuri.db"), StorageConfig(view_mode="off"))
+    repo.save_list_items(saved)
+    repo.close()
+
+    report_path = tmp_path / "report.jsonl"
+    summary = compare(
+        tmp_path / "raw", tmp_path / "data" / "list.csv", partitions=4, workers=2, report_path=report_path
+    )
+
+    assert {name: summary[name] for name in ("snapshot_rows", "csv_rows", "raw_dupes", "invalid_rows")} == {
+        "snapshot_rows": 20,
+        "csv_rows": 20,
+        "raw_dupes": 1,
+        "invalid_rows": 1,
+    }
+    assert (summary["missing_in_csv"], summary["extra_in_csv"]) == (1, 1)
+    assert summary["mismatch_fields"] == {"grp_nm": 1}
+    assert summary["mismatch_samples"]["grp_nm"] == [["R26BK00000002", "000"], "테스트기관", "다른기관"]
+    lines = [json.loads(line) for line in report_path.read_text(encoding="utf-8").splitlines()]
+    assert sorted((line["type"], tuple(line["key"])) for line in lines[:-1]) == [
+        ("extra_in_csv", ("R26BK00000030", "000")),
+        ("invalid", ("R26BK99999999", None)),
+        ("missing_in_csv", ("R26BK00000001", "000")),
+    ]
+    assert lines[-1]["type"] == "summary"
+
+    inline = compare(tmp_path / "raw", tmp_path / "data" / "list.csv", partitions=3, workers=1, ignore_extra=True)
+    assert {k: v for k, v in inline.items() if k != "partitions"} == {
+        k: v for k, v in summary.items() if k != "partitions"
+    }
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, cast
+
+import pytest
+
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.hedging import HedgeBudget, Hedger
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.transport import SharedTransport, TransportResponse
+from src.service import crawler_service
+from src.service.crawler_service import CrawlerService
+from tests.helpers import make_config
+
+
+def _warm(hedger: Hedger, endpoint: str, count: int = 20) -> None:
+    for _ in range(count):
+        hedger.call(endpoint, lambda: "fast")
+
+
+def test_slow_call_is_hedged_and_first_response_wins() -> None:
+    hedger = Hedger(budget_ratio=1.0, min_delay_sec=0.01, min_samples=20)
+    _warm(hedger, "detail")
+    assert hedger.delay("detail") == 0.01
+
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow() -> str:
+        calls.append("primary")
+        release.wait(2)
+        return "primary"
+
+    def duplicate() -> str:
+        calls.append("hedge")
+        return "hedge"
+
+    started = time.monotonic()
+    assert hedger.call("detail", slow, duplicate) == "hedge"
+    assert time.monotonic() - started < 1
+    release.set()
+
+    assert calls == ["primary", "hedge"]
+    assert hedger.stats() == {"calls": 21, "hedged": 1, "hedge_wins": 1, "denied": 0}
+
+
+def test_failed_duplicate_falls_back_to_primary() -> None:
+    hedger = Hedger(budget_ratio=1.0, min_delay_sec=0.01)
+    _warm(hedger, "opening")
+
+    def slow() -> str:
+        time.sleep(0.1)
+        return "primary"
+
+    def broken() -> str:
+        raise ConnectionError("reset")
+
+    assert hedger.call("opening", slow, broken) == "primary"
+    assert hedger.stats()["hedge_wins"] == 0
+
+
+def test_budget_caps_extra_load() -> None:
+    budget = HedgeBudget(ratio=0.05)
+    granted = 0
+    for _ in range(200):
+        budget.earn()
+        granted += budget.spend()
+    assert granted == 10
+
+    hedger = Hedger(budget_ratio=0.0, min_delay_sec=0.01)
+    _warm(hedger, "noce")
+    assert hedger.call("noce", lambda: time.sleep(0.05) or "slow") == "slow"
+    assert hedger.stats()["hedged"] == 0
+    assert hedger.stats()["denied"] == 1
+
+
+class _CountingPoster:
+    thread_safe = True
+
+    def __init__(self) -> None:
+        self.posts = 0
+        self._lock = threading.Lock()
+
+    def post(self, url: str, data: Any = None, headers: Optional[dict[str, str]] = None) -> TransportResponse:
+        with self._lock:
+            self.posts += 1
+        time.sleep(0.05)
+        return TransportResponse(200, b"{}")
+
+
+def test_shared_transport_direct_post_skips_in_flight_sharing() -> None:
+    inner = _CountingPoster()
+    transport = SharedTransport(inner, lambda response: False)
+    assert transport.thread_safe
+
+    results: list[TransportResponse] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(transport.post("u", "d"))),
+        threading.Thread(target=lambda: results.append(transport.post_direct("u", "d"))),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert inner.posts == 2
+    assert len(results) == 2
+
+
+def test_close_stops_workers_and_next_call_reopens() -> None:
+    hedger = Hedger(budget_ratio=1.0, min_delay_sec=0.01)
+    _warm(hedger, "detail")
+    assert hedger.call("detail", lambda: "pooled") == "pooled"
+    hedger.close()
+    hedger.close()
+    assert hedger.call("detail", lambda: "reopened") == "reopened"
+    hedger.close()
+
+
+class _SyncPoster:  # 동기 Playwright처럼 호출 스레드에서만 쓸 수 있는 전송 계층.
+    def __init__(self) -> None:
+        self.posts = 0
+
+    @property
+    def request(self) -> "_SyncPoster":
+        return self
+
+    def post(self, url: str, data: Any = None, headers: Optional[dict[str, str]] = None) -> TransportResponse:
+        self.posts += 1
+        return TransportResponse(200, b"{}")
+
+
+def _hedging_service(tmp_path: Path, **update: object) -> CrawlerService:
+    config = make_config().model_copy(update={"hedge_enabled": True, **update})
+    return CrawlerService(
+        config, cast(NoticeRepository, None), NoticeParser(config.selectors), CheckpointStore(str(tmp_path / "cp.json"))
+    )
+
+
+def test_service_warns_once_when_transport_cannot_hedge(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    service = _hedging_service(tmp_path)
+    page = _SyncPoster()
+    with caplog.at_level(logging.WARNING, logger="service"):
+        for _ in range(3):
+            service._post("detail", page, "https://example.com/detail", "{}", {})
+    assert page.posts == 3
+    assert sum("hedge_via_http" in record.getMessage() for record in caplog.records) == 1
+    assert service.resilience.hedger is not None and service.resilience.hedger.stats()["calls"] == 0
+    service.close()
+
+
+def test_service_hedges_sync_pages_through_http_transport(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    http = _CountingPoster()
+    monkeypatch.setattr(crawler_service, "HttpTransport", lambda user_agent, timeout_ms: http)
+    service = _hedging_service(tmp_path, hedge_via_http=True)
+    page = _SyncPoster()
+
+    service._post("detail", page, "https://example.com/detail", "{}", {})
+    service._post("list", page, "https://example.com/list-api", "{}", {}, hedge=False)
+
+    assert http.posts == 1 and page.posts == 1  # 헤지 대상만 HTTP 전송으로 보낸다.
+    assert service.resilience.hedger is not None and service.resilience.hedger.stats()["calls"] == 1
+    service.close()
+
+
+def test_http_hedging_sends_primary_and_duplicate_over_http(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    http = _CountingPoster()
+    monkeypatch.setattr(crawler_service, "HttpTransport", lambda user_agent, timeout_ms: http)
+    service = _hedging_service(tmp_path, hedge_via_http=True, hedge_budget_ratio=1.0, hedge_min_delay_sec=0.01)
+    hedger = service.resilience.hedger
+    assert hedger is not None
+    _warm(hedger, "detail")
+    page = _SyncPoster()
+
+    with caplog.at_level(logging.INFO, logger="service"):
+        for _ in range(2):
+            service._post("detail", page, "https://example.com/detail", "{}", {})
+    time.sleep(0.1)  # 진 쪽 호출도 끝까지 돈다.
+
+    assert page.posts == 0  # 원 호출도 브라우저가 아니라 HTTP 전송으로 간다.
+    assert http.posts == 4 and hedger.stats()["hedged"] == 2
+    assert sum("HTTP 전송으로 보냅니다" in record.getMessage() for record in caplog.records) == 1
+    service.close()
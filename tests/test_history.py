@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+from src.core.config import StorageConfig
+from src.infrastructure.history import NoticeHistory
+from src.infrastructure.repository import NoticeRepository
+from tests.helpers import list_item
+
+_KEY = ("R26BK00000001", "000")
+
+
+def test_history_keeps_superseded_versions(tmp_path: Path) -> None:
+    history = NoticeHistory(str(tmp_path / "nuri.db"))
+    original = list_item("R26BK00000001")
+    amended = original.model_copy(update={"pbanc_stts_grid_cd_nm": "개찰완료"})
+    paged = original.model_copy(update={"row_num": 7, "current_page": 3})
+
+    assert history.record("list", ("bid_pbanc_no", "bid_pbanc_ord"), [original], datetime(2026, 2, 6, 9)) == 1
+    assert history.record("list", ("bid_pbanc_no", "bid_pbanc_ord"), [paged], datetime(2026, 2, 7, 9)) == 0
+    assert history.record("list", ("bid_pbanc_no", "bid_pbanc_ord"), [amended], datetime(2026, 2, 8, 9)) == 1
+
+    versions = history.versions("list", _KEY)
+    assert [version["valid_from"] for version in versions] == [
+        "2026-02-06T09:00:00.000000",
+        "2026-02-08T09:00:00.000000",
+    ]
+    assert versions[0]["valid_to"] == "2026-02-08T09:00:00.000000"
+    assert history.as_of("list", _KEY, datetime(2026, 2, 7))["data"]["pbanc_stts_grid_cd_nm"] == "입찰개시"
+    assert history.as_of("list", _KEY, datetime(2026, 2, 9))["data"]["pbanc_stts_grid_cd_nm"] == "개찰완료"
+    assert history.as_of("list", _KEY, datetime(2026, 2, 1)) is None
+    history.close()
+
+
+def test_repository_records_changes_for_seen_keys(tmp_path: Path) -> None:
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(history_enabled=True))
+    original = list_item("R26BK00000001")
+    assert repo.save_list_items([original]) == 1
+    amended = original.model_copy(update={"pbanc_stts_grid_cd_nm": "개찰완료"})
+    assert repo.save_list_items([amended]) == 0  # CSV는 최초 관측만 유지한다.
+    assert repo.history is not None
+    assert repo.history.current("list", _KEY)["data"]["pbanc_stts_grid_cd_nm"] == "개찰완료"
+    assert len(repo.history.versions("list", _KEY)) == 2
+    repo.close()
+
+
+def test_versions_within_one_timestamp_are_all_kept(tmp_path: Path) -> None:
+    history = NoticeHistory(str(tmp_path / "nuri.db"))
+    observed = datetime(2026, 2, 6, 9)
+    for status in ("입찰개시", "정정", "개찰완료"):
+        item = list_item("R26BK00000001").model_copy(update={"pbanc_stts_grid_cd_nm": status})
+        assert history.record("list", ("bid_pbanc_no", "bid_pbanc_ord"), [item], observed) == 1
+
+    versions = history.versions("list", _KEY)
+    assert [version["data"]["pbanc_stts_grid_cd_nm"] for version in versions] == ["입찰개시", "정정", "개찰완료"]
+    assert [version["valid_from"][-6:] for version in versions] == ["000000", "000001", "000002"]
+    assert versions[0]["valid_to"] == versions[1]["valid_from"]
+    history.close()
+
+
+def test_history_shares_key_transaction_until_flush(tmp_path: Path) -> None:
+    storage = StorageConfig(history_enabled=True, writer_mode="buffered", view_mode="off")
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), storage)
+    original = list_item("R26BK00000001")
+    assert repo.save_list_items([original]) == 1
+    amended = original.model_copy(update={"pbanc_stts_grid_cd_nm": "개찰완료"})
+    assert repo.save_list_items([amended]) == 0  # flush 전 두 번째 저장도 잠금에 걸리지 않는다.
+    repo.close()
+
+    reopened = NoticeRepository(str(tmp_path / "nuri.db"), storage)
+    assert reopened.history is not None
+    assert len(reopened.history.versions("list", _KEY)) == 2
+    reopened.close()
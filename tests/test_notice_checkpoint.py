@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.service.crawler_service import CrawlerService
+from tests.helpers import api_row, make_config
+
+
+def _service(tmp_path: Path, repo: NoticeRepository) -> CrawlerService:
+    config = make_config().model_copy(update={"checkpoint_every_notices": 1, "checkpoint_every_sec": 60.0})
+    return CrawlerService(config, repo, NoticeParser(config.selectors), CheckpointStore(str(tmp_path / "cp.json")))
+
+
+def _run(tmp_path: Path, fail_on: str | None = None) -> list[str]:
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="off"))
+    service = _service(tmp_path, repo)
+    fetched: list[str] = []
+
+    def fetch_detail(page: Any, item: Any) -> dict[str, Any]:
+        if item.bid_pbanc_no == fail_on:
+            raise RuntimeError("detail timeout")
+        fetched.append(item.bid_pbanc_no)
+        return {}
+
+    rows = [api_row(n) for n in (1, 2, 3)]
+    service._fetch_list_via_api = lambda page, current_page: rows  # type: ignore[method-assign]
+    service._fetch_detail_via_api = fetch_detail  # type: ignore[method-assign]
+    service._build_noce_items = lambda page, item: ([], 0)  # type: ignore[method-assign]
+    service._build_attachment_items = lambda page, detail_raw, owner: ([], 0)  # type: ignore[method-assign]
+    service._build_opening_items = lambda page, item: (None, [], 0, 0)  # type: ignore[method-assign]
+    try:
+        service.run(None, max_pages=None)
+    finally:
+        repo.close()
+    return fetched
+
+
+def test_resume_redoes_only_unfinished_notices(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError):
+        _run(tmp_path, fail_on="R26BK00000003")
+
+    loaded = _service(tmp_path, cast(NoticeRepository, None)).walk_checkpoint().load()
+    assert loaded is not None and loaded.current_page == 1
+    assert loaded.done_keys == (("R26BK00000001", "000"), ("R26BK00000002", "000"))
+
+    assert _run(tmp_path) == ["R26BK00000003"]  # 저장까지 끝난 공고는 다시 호출하지 않는다.
+    loaded = _service(tmp_path, cast(NoticeRepository, None)).walk_checkpoint().load()
+    assert loaded is not None and loaded.current_page == 2 and loaded.done_keys == ()
+    with (tmp_path / "list.csv").open(encoding="utf-8-sig", newline="") as fp:
+        assert [row["bid_pbanc_no"] for row in csv.DictReader(fp)] == [f"R26BK{n:08d}" for n in (1, 2, 3)]
@@ -21,10 +21,10 @@ class StubRepository:  # 저장소 스텁.
     def save_detail_items(self, items: list[Any]) -> None:
         return None
 
-    def save_noce_items(self, items: list[Any]) -> None:
+    def save_noce_items(self, items: list[Any], owners: Any = None) -> None:
         return None
 
-    def save_attachment_items(self, items: list[Any]) -> None:
+    def save_attachment_items(self, items: list[Any], owners: Any = None) -> None:
         return None
 
     def save_opening_summary_items(self, items: list[Any]) -> None:
@@ -33,6 +33,9 @@ class StubRepository:  # 저장소 스텁.
     def save_opening_result_items(self, items: list[Any]) -> None:
         return None
 
+    def flush(self) -> int:
+        return 0
+
 
 @dataclass
 class StubParser:  # 파서 스텁.
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.infrastructure.query import NoticeQuery
+from src.infrastructure.repository import NoticeRepository
+from tests.helpers import list_item
+
+
+def _items() -> list:
+    items = []
+    for index in range(30):
+        item = list_item(f"R26BK{index:08d}")
+        items.append(
+            item.model_copy(
+                update={
+                    "grp_nm": "조달청" if index % 2 == 0 else "테스트기관",
+                    "slpr_rcpt_ddln_dt": datetime(2026, 2, 1 + index % 20, 10),
+                }
+            )
+        )
+    return items
+
+
+def test_query_filters_and_paginates(tmp_path: Path) -> None:
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="off"))
+    repo.save_list_items(_items())
+    query = NoticeQuery(
+        grp_nm="조달청",
+        closing_from=datetime(2026, 2, 5),
+        closing_to=datetime(2026, 2, 12),
+    )
+
+    first = repo.query(query, limit=2)
+    assert len(first.rows) == 2 and first.next_cursor is not None
+    rest = repo.query(query, limit=100, cursor=first.next_cursor)
+    rows = first.rows + rest.rows
+    assert rest.next_cursor is None
+    assert [row["slpr_rcpt_ddln_dt"][8:10] for row in rows] == ["05", "05", "07", "07", "09", "09", "11"]
+    assert list(repo.iter_notices(query, page_size=1)) == rows
+    assert repo.query(NoticeQuery(bid_pbanc_no="R26BK00000003")).rows[0]["grp_nm"] == "테스트기관"
+    repo.close()
+
+
+def test_reindex_rebuilds_from_list_csv(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    legacy = NoticeRepository(db_path, StorageConfig(query_index_enabled=False, view_mode="off"))
+    legacy.save_list_items(_items())
+    legacy.close()
+
+    repo = NoticeRepository(db_path, StorageConfig(view_mode="off"))
+    assert repo.query(NoticeQuery()).rows == []
+    assert repo.reindex() == 30
+    assert len(list(repo.iter_notices(NoticeQuery(grp_nm="조달청")))) == 15
+    repo.close()
+
+
+def test_index_shares_key_transaction_until_flush(tmp_path: Path) -> None:
+    for mode, storage in (
+        ("buffered", StorageConfig(view_mode="off", writer_mode="buffered")),
+        ("segments", StorageConfig(view_mode="off", output_format="segments")),
+    ):
+        db_path = str(tmp_path / mode / "nuri.db")
+        repo = NoticeRepository(db_path, storage)
+        items = _items()
+        assert repo.save_list_items(items[:10]) == 10
+        assert repo.save_list_items(items[5:20]) == 10  # flush 전 두 번째 저장도 잠금에 걸리지 않는다.
+        assert len(repo.query(NoticeQuery(), limit=100).rows) == 20
+        repo.close()
+
+        reopened = NoticeRepository(db_path, storage)
+        assert len(reopened.query(NoticeQuery(), limit=100).rows) == 20
+        reopened.close()
+
+
+def test_failed_save_leaves_no_index_history_or_search_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for mode in ("simple", "buffered"):
+        db_path = str(tmp_path / mode / "nuri.db")
+        storage = StorageConfig(view_mode="off", writer_mode=mode, history_enabled=True, search_enabled=True)
+        repo = NoticeRepository(db_path, storage)
+
+        def _fail(*args: object) -> int:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(repo, "_write_csv", _fail)
+        monkeypatch.setattr(repo, "_append_csv", _fail)
+        with pytest.raises(OSError):
+            repo.save_list_items([list_item("R26BK00000001")])
+        monkeypatch.undo()
+
+        assert not (tmp_path / mode / "list.csv").exists()
+        assert repo.query(NoticeQuery()).rows == []
+        assert repo.history is not None and repo.history.versions("list", ("R26BK00000001", "000")) == []
+        assert repo.search("테스트") == []
+        repo.close()
+
+        reopened = NoticeRepository(db_path, storage)  # 닫을 때 확정된 것도 없다.
+        assert reopened.query(NoticeQuery()).rows == []
+        assert reopened.save_list_items([list_item("R26BK00000001")]) == 1
+        assert len(reopened.query(NoticeQuery()).rows) == 1
+        reopened.close()
+
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.ratelimit import NEUTRAL, OK, OVERLOAD, AimdLimiter, Governor, TokenBucket
+from src.infrastructure.resilience import HttpStatusError, ResiliencePolicy
+
+
+class _FakeTime:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_spaces_calls_at_configured_rate() -> None:
+    fake = _FakeTime()
+    bucket = TokenBucket(rate=4.0, burst=2, clock=fake.clock, sleep=fake.sleep)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits[:2] == [0.0, 0.0]  # 버스트만큼은 바로 보낸다.
+    assert waits[2:] == [0.25, 0.25, 0.25]
+    assert fake.now == 0.75
+
+
+def _governed(limiter: AimdLimiter) -> int:
+    return math.floor(limiter.limit)
+
+
+def test_aimd_grows_additively_and_halves_on_overload() -> None:
+    limiter = AimdLimiter("detail", initial=2, minimum=1, maximum=4)
+
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(OK, 0.1)
+    assert _governed(limiter) == 3  # 대략 한도만큼 성공하면 +1.
+
+    for _ in range(6):
+        limiter.acquire()
+        limiter.release(OK, 0.1)
+    assert limiter.limit == 4.0  # 최대에서 멈춘다.
+
+    limiter.acquire()
+    limiter.release(NEUTRAL, 0.1)
+    assert limiter.limit == 4.0
+
+    limiter.acquire()
+    limiter.release(OVERLOAD, 0.1)
+    assert limiter.limit == 2.0
+    assert limiter.decreases == 1
+
+
+def test_aimd_halves_when_p95_exceeds_learned_baseline() -> None:
+    limiter = AimdLimiter("detail", initial=8, minimum=1, maximum=8, window=20, min_samples=20)
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(OK, 0.1)
+    assert limiter.p95() == 0.1
+    assert limiter.decreases == 0
+
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release(OK, 0.5)  # 20건 중 2건이 느려지면 p95가 기준의 2배를 넘는다.
+
+    assert limiter.decreases == 1
+    assert limiter.limit == 4.0
+    assert limiter.p95() is None  # 줄인 한도에서 기준을 다시 배운다.
+
+
+def test_aimd_decreases_once_per_window() -> None:
+    limiter = AimdLimiter("detail", initial=8, minimum=1, maximum=8)
+    generations = [limiter.acquire() for _ in range(8)]  # 8건이 함께 나갔다가 모두 과부하로 돌아온다.
+
+    for generation in generations:
+        limiter.release(OVERLOAD, 0.1, generation)
+    assert limiter.limit == 4.0 and limiter.decreases == 1  # 1까지 떨어지지 않는다.
+
+    limiter.release(OVERLOAD, 0.1, limiter.acquire())  # 줄인 뒤에 보낸 호출은 다시 줄인다.
+    assert limiter.limit == 2.0 and limiter.decreases == 2
+
+
+def test_governor_rejects_unknown_rate_limit_endpoints() -> None:
+    with pytest.raises(ValueError, match="detial"):
+        Governor(rates={"detial": 2.0})
+    assert Governor(rates={"detail": 2.0, "detail_popup": 1.0}).limits() == {}
+
+
+def test_governor_caps_concurrent_calls_per_endpoint() -> None:
+    governor = Governor(initial=2, minimum=1, maximum=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal active, peak
+        with governor.slot("detail") as slot:
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            slot.outcome = OK
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert governor.limits() == {"detail": 2}
+
+
+def test_policy_reports_reduced_limit_after_overload() -> None:
+    policy = ResiliencePolicy(attempts=2, base_delay_sec=0, max_delay_sec=0, sleep=lambda _: None)
+    responses = iter([HttpStatusError("detail", 503), "ok"])
+
+    def fn() -> str:
+        value = next(responses)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    assert policy.call("detail", fn) == "ok"
+    assert policy.call("list", lambda: "ok") == "ok"
+
+    report = policy.report()
+    assert report["concurrency_limit"]["detail"] == 2  # 4 → 2 → (성공 한 번은 정수 한도를 올리지 못함)
+    assert report["concurrency_limit"]["list"] == 4
+    assert report["retries"] == {"detail": 1}
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.domain.models import NoceItem
+from src.infrastructure.repository import NoticeRepository
+from tests.helpers import list_item
+
+
+def test_key_index_persists_between_runs(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    repo = NoticeRepository(db_path)
+    assert repo.save_list_items([list_item("R26BK00000001"), list_item("R26BK00000001")]) == 1
+    repo.close()
+
+    repo = NoticeRepository(db_path)
+    assert repo.save_list_items([list_item("R26BK00000001"), list_item("R26BK00000002")]) == 1
+    repo.close()
+
+
+def test_key_index_catches_up_and_rebuilds(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    repo = NoticeRepository(db_path)
+    repo.save_list_items([list_item("R26BK00000001")])
+    repo.close()
+
+    legacy = NoticeRepository(db_path, StorageConfig(dedupe_backend="memory"))  # 인덱스 없이 추가 기록.
+    legacy.save_list_items([list_item("R26BK00000002")])
+
+    repo = NoticeRepository(db_path)
+    assert repo.save_list_items([list_item("R26BK00000002")]) == 0
+    repo.close()
+
+    (tmp_path / "list.csv").unlink()
+    repo = NoticeRepository(db_path)
+    assert repo.save_list_items([list_item("R26BK00000001")]) == 1
+    repo.close()
+
+
+def test_bloom_prefilter_persists_and_confirms_exactly(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    storage = StorageConfig(dedupe_bloom_enabled=True, dedupe_bloom_capacity=1000)
+    repo = NoticeRepository(db_path, storage)
+    assert repo.save_list_items([list_item(f"R26BK{index:08d}") for index in range(50)]) == 50
+    repo.close()
+    assert (tmp_path / "bloom" / "list.bloom").exists()
+
+    repo = NoticeRepository(db_path, storage)
+    assert repo.save_list_items([list_item(f"R26BK{index:08d}") for index in range(60)]) == 10
+    repo.close()
+
+
+def test_buffered_writer_commits_keys_on_flush(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    storage = StorageConfig(writer_mode="buffered", group_commit_rows=3)
+    repo = NoticeRepository(db_path, storage)
+    assert repo.save_list_items([list_item("R26BK00000001"), list_item("R26BK00000002")]) == 2
+    assert repo.flush() == 2
+    assert repo.save_list_items([list_item(f"R26BK{index:08d}") for index in range(1, 6)]) == 3
+    assert repo.flush() == 0  # group_commit_rows 도달로 이미 확정됨.
+    repo.close()
+
+    with (tmp_path / "list.csv").open(encoding="utf-8") as fp:
+        assert len(fp.readlines()) == 6  # 헤더 + 5행.
+    repo = NoticeRepository(db_path, storage)
+    assert repo.save_list_items([list_item("R26BK00000005"), list_item("R26BK00000006")]) == 1
+    repo.close()
+
+
+def test_failed_save_rolls_back_only_its_own_keys(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    storage = StorageConfig(writer_mode="buffered", view_mode="off")
+    repo = NoticeRepository(db_path, storage)
+    assert repo.save_list_items([list_item("R26BK00000001")]) == 1  # flush 전이라 키가 대기 중이다.
+    notice = NoceItem(pst_no="1", bbs_no="9", pst_nm="변경 공고")
+    append_csv = repo._append_csv
+
+    def _fail_notice(name, path, items, model_type):  # type: ignore[no-untyped-def]
+        if name == "notice":
+            raise OSError("disk full")
+        return append_csv(name, path, items, model_type)
+
+    monkeypatch.setattr(repo, "_append_csv", _fail_notice)
+    with pytest.raises(OSError):
+        repo.save_noce_items([notice])
+    monkeypatch.undo()
+    assert repo.save_noce_items([notice]) == 1  # 실패한 공지 키만 되돌려졌다.
+    repo.close()
+
+    repo = NoticeRepository(db_path, storage)
+    assert repo.save_list_items([list_item("R26BK00000001")]) == 0  # 다른 테이블의 대기 중인 키는 남았다.
+    assert repo.save_noce_items([notice]) == 0
+    repo.close()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+from src.core.config import StorageConfig
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.snapshot import SnapshotStore
+from src.service.crawler_service import CrawlerService
+from tests.helpers import api_row, make_config
+
+
+def _write_archive(snapshot_dir: Path) -> None:
+    store = SnapshotStore(str(snapshot_dir), "packed")
+    store.save("list_20260206", "page_1", {"ErrorCode": 0, "result": [api_row(1), api_row(2)]})
+    store.save("list_20260206", "page_2", {"ErrorCode": 0, "result": [api_row(3), {"bidPbancNo": "broken"}]})
+    store.save("list_20260206", "page_3", {"ErrorCode": 500, "ErrorMsg": "busy"})  # 수집 때도 버린 응답.
+    store.save("list_20260207", "page_1", {"ErrorCode": 0, "result": [api_row(1, "바뀐 공고명"), api_row(4)]})
+    for date, name in (("20260206", "담당"), ("20260207", "새담당")):
+        detail = {"ErrorCode": 0, "result": {"bidPbancMap": {"picIdNm": name}}}
+        store.save(f"detail_{date}", "R26BK00000002_000", detail)
+    store.save(
+        "opening_20260207",
+        "R26BK00000003_000",
+        {
+            "ErrorCode": 0,
+            "result": {
+                "pbancMap": {k: v for k, v in api_row(3).items() if k.startswith(("bid", "pbancStts"))},
+                "oobsRsltList": [
+                    {
+                        "bidPbancNo": "R26BK00000003",
+                        "bidPbancOrd": "000",
+                        "bidClsfNo": "0",
+                        "bidPrgrsOrd": "000",
+                        "ibxOnbsRnkg": 1,
+                        "ibxGrpNm": "업체",
+                        "ibxBdngAmt": "1,000",
+                        "ibxSlprRcptnDt": "2026/02/09 10:00:00",
+                    },
+                    {"bidPbancNo": "R26BK00000003", "ibxGrpNm": "검증 실패"},
+                ],
+            },
+        },
+    )
+    store.close()
+
+
+def _reprocess(snapshot_dir: Path, output: Path, workers: int) -> dict[str, int]:
+    repo = NoticeRepository(str(output / "nuri.db"), StorageConfig(view_mode="off"))
+    service = CrawlerService(
+        make_config(), repo, NoticeParser(make_config().selectors), CheckpointStore(str(output / "checkpoint.json"))
+    )
+    try:
+        return service.reprocess(str(snapshot_dir), workers=workers, chunk_pages=1)
+    finally:
+        repo.close()
+
+
+def _read(path: Path) -> list[dict[str, str]]:
+    with path.open(encoding="utf-8-sig", newline="") as fp:
+        return list(csv.DictReader(fp))
+
+
+def test_reprocess_rebuilds_repository_from_snapshots(tmp_path: Path) -> None:
+    snapshot_dir = tmp_path / "raw"
+    _write_archive(snapshot_dir)
+
+    result = _reprocess(snapshot_dir, tmp_path / "pool", workers=2)
+
+    assert result == {
+        "pages": 4,
+        "processed_pages": 3,
+        "list": 4,
+        "detail": 4,
+        "opening_summary": 1,
+        "opening_result": 1,
+        "detail_skipped": 0,
+    }
+    rows = _read(tmp_path / "pool" / "list.csv")
+    assert [row["bid_pbanc_no"] for row in rows] == [f"R26BK{n:08d}" for n in (1, 2, 3, 4)]
+    assert rows[0]["bid_pbanc_nm"] == "테스트 공고"  # 수집 때처럼 먼저 저장한 버전이 남는다.
+    details = {row["bid_pbanc_no"]: row for row in _read(tmp_path / "pool" / "detail.csv")}
+    assert details["R26BK00000002"]["pic_id_nm"] == "새담당"  # 가장 최근 상세 스냅샷.
+    assert _read(tmp_path / "pool" / "opening_result.csv")[0]["ibx_grp_nm"] == "업체"
+
+    _reprocess(snapshot_dir, tmp_path / "inline", workers=1)
+    for name in ("list.csv", "detail.csv", "opening_summary.csv", "opening_result.csv"):
+        assert (tmp_path / "inline" / name).read_bytes() == (tmp_path / "pool" / name).read_bytes()
+
+
+def test_broken_detail_snapshot_skips_only_that_notice(tmp_path: Path) -> None:
+    snapshot_dir = tmp_path / "raw"
+    _write_archive(snapshot_dir)
+    store = SnapshotStore(str(snapshot_dir), "packed")
+    store.save("detail_20260207", "R26BK00000004_000", {"ErrorCode": 0, "result": "깨진 응답"})  # 파싱 중 예외.
+    store.close()
+
+    for workers in (1, 2):
+        output = tmp_path / f"workers{workers}"
+        result = _reprocess(snapshot_dir, output, workers=workers)
+
+        assert (result["list"], result["detail"], result["detail_skipped"]) == (4, 3, 1)
+        assert "R26BK00000004" not in {row["bid_pbanc_no"] for row in _read(output / "detail.csv")}
+        assert len(_read(output / "opening_result.csv")) == 1
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.resilience import (
+    ApiError,
+    CircuitOpenError,
+    HttpStatusError,
+    ResiliencePolicy,
+    classify,
+    parsing,
+)
+from src.service.crawler_service import CrawlerService
+from tests.helpers import FakeResponse, api_row, make_config
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _failing(exc: Exception) -> Any:
+    calls: list[int] = []
+
+    def fn() -> None:
+        calls.append(1)
+        raise exc
+
+    return fn, calls
+
+
+def test_classification_decides_retries() -> None:
+    assert classify(HttpStatusError("detail", 503)) == classify(HttpStatusError("detail", 429)) == "http_status"
+    assert classify(HttpStatusError("detail", 404)) == "http_client"
+    assert classify(TimeoutError("read timeout")) == "transport"
+
+    sleeps: list[float] = []
+    policy = ResiliencePolicy(4, 1.0, 5.0, failure_threshold=10, sleep=sleeps.append)
+    fn, calls = _failing(KeyError("bidPbancMap"))
+    with pytest.raises(ValueError):
+        policy.call("detail", lambda: parsing(fn))
+    assert (len(calls), sleeps) == (1, [])  # 파싱 오류는 같은 응답을 다시 받아도 같다.
+
+    fn, calls = _failing(ApiError("detail", 500, "busy"))
+    with pytest.raises(ApiError):
+        policy.call("detail", fn)
+    assert len(calls) == 4 and len(sleeps) == 3
+    assert all(1.0 <= sleep <= 5.0 for sleep in sleeps)
+    assert policy.metrics.snapshot()["failures"] == {"detail:parse": 1, "detail:api_error": 4}
+    assert policy.metrics.snapshot()["retries"] == {"detail": 3}
+
+
+def test_breaker_fails_fast_then_probes_to_recover() -> None:
+    clock = _Clock()
+    policy = ResiliencePolicy(1, 0.0, 0.0, failure_threshold=2, reset_timeout_sec=10.0, clock=clock)
+    fn, calls = _failing(HttpStatusError("opening", 503))
+    for _ in range(2):
+        with pytest.raises(HttpStatusError):
+            policy.call("opening", fn)
+    with pytest.raises(CircuitOpenError):
+        policy.call("opening", fn)
+    assert len(calls) == 2 and policy.states() == {"opening": "open"}
+    assert policy.call("detail", lambda: "ok") == "ok"  # 다른 엔드포인트는 영향이 없다.
+
+    clock.now = 10.0
+    with pytest.raises(HttpStatusError):  # 시험 호출이 실패하면 다시 연다.
+        policy.call("opening", fn)
+    clock.now = 20.0
+    assert policy.call("opening", lambda: "ok") == "ok"
+    assert policy.states() == {"opening": "closed", "detail": "closed"}
+    assert policy.metrics.snapshot()["transitions"] == {
+        "opening:closed->open": 1,
+        "opening:open->half_open": 2,
+        "opening:half_open->open": 1,
+        "opening:half_open->closed": 1,
+    }
+    assert policy.metrics.snapshot()["short_circuited"] == {"opening": 1}
+
+
+class _DownDetailApi:
+    def __init__(self) -> None:
+        self.detail_calls = 0
+
+    @property
+    def request(self) -> "_DownDetailApi":
+        return self
+
+    def post(self, url: str, data: str, headers: Any = None) -> FakeResponse:
+        if url.endswith("list-api"):
+            return FakeResponse({"ErrorCode": 0, "result": [api_row(n) for n in range(1, 6)]})
+        self.detail_calls += 1
+        return FakeResponse({}, status=503)
+
+
+def test_open_breaker_stops_hammering_detail_endpoint(tmp_path: Path) -> None:
+    config = make_config().model_copy(update={"circuit_failure_threshold": 2, "circuit_reset_sec": 60.0})
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="off"))
+    service = CrawlerService(config, repo, NoticeParser(config.selectors), CheckpointStore(str(tmp_path / "cp.json")))
+    api = _DownDetailApi()
+    try:
+        service.run(api, max_pages=None)
+    finally:
+        repo.close()
+
+    assert api.detail_calls == 2  # 나머지 3건은 차단기가 바로 실패시킨다.
+    assert service.resilience.metrics.snapshot()["short_circuited"] == {"detail": 3}
+    assert len((tmp_path / "list.csv").read_text(encoding="utf-8-sig").splitlines()) == 6  # 목록은 모두 저장.
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any
+
+from src.core.config import StorageConfig
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.retry_queue import RetryQueue
+from src.service.crawler_service import CrawlerService
+from tests.helpers import FakeResponse, api_row, make_config
+
+
+class FakeApi:  # `down`인 동안 공고 2의 상세와 공고 1의 첨부(F1)가 실패하는 서버.
+    def __init__(self) -> None:
+        self.down = True
+        self.calls: list[str] = []
+
+    @property
+    def request(self) -> "FakeApi":
+        return self
+
+    def post(self, url: str, data: str, headers: Any = None) -> FakeResponse:
+        payload = next(iter(json.loads(data).values()))
+        self.calls.append(url.rsplit("/", 1)[-1])
+        if url.endswith("list-api"):
+            return FakeResponse({"ErrorCode": 0, "result": [api_row(1), api_row(2)]})
+        if url.endswith("detail"):
+            if self.down and payload["bidPbancNo"] == "R26BK00000002":
+                return FakeResponse({"ErrorCode": 500, "ErrorMsg": "busy"})
+            detail = {"picIdNm": "담당", "untyAtchFileNo": f"F{payload['bidPbancNo'][-1]}"}
+            return FakeResponse({"ErrorCode": 0, "result": {"bidPbancMap": detail}})
+        if self.down and payload["untyAtchFileNo"] == "F1":
+            raise TimeoutError("attachment timeout")
+        row = {
+            "untyAtchFileNo": payload["untyAtchFileNo"],
+            "atchFileSqno": 1,
+            "atchFileNm": "A1.hwp",
+            "orgnlAtchFileNm": "공고서.hwp",
+            "fileExtnNm": "hwp",
+            "fileSz": 1024,
+        }
+        return FakeResponse({"ErrorCode": 0, "dlUntyAtchFileL": [row]})
+
+
+def _read(path: Path) -> list[dict[str, str]]:
+    with path.open(encoding="utf-8-sig", newline="") as fp:
+        return list(csv.DictReader(fp))
+
+
+def test_queue_backs_off_exponentially_and_gives_up(tmp_path: Path) -> None:
+    queue = RetryQueue(str(tmp_path / "retry.db"), base_delay_sec=10, max_delay_sec=25, max_attempts=4)
+    for attempt, now in enumerate((1000.0, 1010.0, 1030.0), start=1):
+        assert queue.record("noce", ("R1", "000"), {"bid_pbanc_no": "R1"}, "timeout", now=now) == attempt
+    assert queue.due(now=1054.0) == []  # 세 번째 실패 뒤 min(10 * 2^2, 25)초.
+    entry = queue.due(now=1055.0)[0]
+    assert (entry.endpoint, entry.attempts, entry.item) == ("noce", 3, {"bid_pbanc_no": "R1"})
+    assert len(queue.due(now=0.0, include_waiting=True)) == 1
+
+    queue.record("noce", ("R1", "000"), {}, "timeout", now=1055.0)
+    assert queue.due(now=10**9) == [] and queue.counts() == {"pending": 0, "dead": 1}
+    queue.close()
+
+
+def test_failed_enrichment_is_queued_and_drained(tmp_path: Path) -> None:
+    config = make_config().model_copy(
+        update={
+            "attachment_api_url": "https://example.com/attachment",
+            "retry_queue_path": str(tmp_path / "retry.db"),
+        }
+    )
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="off"))
+    service = CrawlerService(config, repo, NoticeParser(config.selectors), CheckpointStore(str(tmp_path / "cp.json")))
+    api = FakeApi()
+
+    service.run(api, max_pages=None)
+
+    assert [row["bid_pbanc_no"] for row in _read(tmp_path / "detail.csv")] == ["R26BK00000001"]
+    assert not (tmp_path / "attachments.csv").exists()  # F1은 실패, 공고 2의 첨부는 상세 재시도에서.
+    queued = RetryQueue(str(tmp_path / "retry.db")).due(include_waiting=True)
+    assert [(entry.endpoint, entry.bid_pbanc_no, entry.context) for entry in queued] == [
+        ("attachment", "R26BK00000001", {"untyAtchFileNo": "F1"}),
+        ("detail", "R26BK00000002", {}),
+    ]
+
+    api.down = False
+    api.calls.clear()
+    assert service.drain_retries(api) == {"attempted": 0, "recovered": 0, "failed": 0}  # 아직 시도 시각 전.
+    assert service.drain_retries(api, due_only=False) == {"attempted": 2, "recovered": 2, "failed": 0}
+    repo.close()
+
+    assert "list-api" not in api.calls  # 페이지는 다시 받지 않는다.
+    assert [row["bid_pbanc_no"] for row in _read(tmp_path / "detail.csv")] == ["R26BK00000001", "R26BK00000002"]
+    assert sorted(row["unty_atch_file_no"] for row in _read(tmp_path / "attachments.csv")) == ["F1", "F2"]
+    assert RetryQueue(str(tmp_path / "retry.db")).counts() == {"pending": 0, "dead": 0}
+
+
+class BrokenDetailApi(FakeApi):  # 공고 2의 상세 본문이 JSON 객체가 아니다(파싱 오류).
+    def post(self, url: str, data: str, headers: Any = None) -> FakeResponse:
+        if url.endswith("detail") and json.loads(data)["dlSrchCndtM"]["bidPbancNo"] == "R26BK00000002":
+            self.calls.append("detail")
+            return FakeResponse(["not", "an", "object"])  # type: ignore[arg-type]
+        return super().post(url, data, headers)
+
+
+def test_parse_errors_are_not_queued(tmp_path: Path) -> None:
+    config = make_config().model_copy(update={"retry_queue_path": str(tmp_path / "retry.db")})
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="off"))
+    service = CrawlerService(config, repo, NoticeParser(config.selectors), CheckpointStore(str(tmp_path / "cp.json")))
+    api = BrokenDetailApi()
+    api.down = False
+
+    service.run(api, max_pages=None)
+    repo.close()
+
+    assert api.calls.count("detail") == 2  # 파싱 오류는 같은 호출을 되풀이하지 않는다.
+    assert RetryQueue(str(tmp_path / "retry.db")).counts() == {"pending": 0, "dead": 0}
+    details = {row["bid_pbanc_no"]: row for row in _read(tmp_path / "detail.csv")}
+    assert sorted(details) == ["R26BK00000001", "R26BK00000002"]  # 대기열이 없을 때처럼 기본값 상세.
+    assert details["R26BK00000002"]["pic_id_nm"] == ""
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.core.config import StorageConfig
+from src.domain.models import AttachmentItem, NoceItem
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.search import NoticeSearch, bigram_text, match_expression
+from tests.helpers import list_item
+
+
+def test_bigram_tokens_cover_two_syllable_terms() -> None:
+    assert bigram_text("정보시스템 구축 SW") == "정보 보시 시스 스템 구축 sw"
+    assert match_expression("시스템 용역") == '"시스 스템" AND "용역"'
+    assert match_expression("<p>") == '"p"*'
+
+
+def test_repository_search_ranks_titles_and_links_notices(tmp_path: Path) -> None:
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="off", search_enabled=True))
+    repo.save_list_items(
+        [
+            list_item("R26BK00000001").model_copy(update={"bid_pbanc_nm": "정보시스템 유지관리 용역"}),
+            list_item("R26BK00000002").model_copy(update={"bid_pbanc_nm": "청사 시설 공사"}),
+        ]
+    )
+    notice = NoceItem(pst_no="1", bbs_no="9", pst_nm="변경 공고", bulk_pst_cn="<p>정보시스템 보안 요건 추가</p>")
+    repo.save_noce_items([notice], [("R26BK00000002", "000")])
+    repo.save_noce_items([notice], [("R26BK00000002", "000")])  # 이미 저장한 공지는 같은 문서로 덮어쓴다.
+
+    hits = repo.search("정보시스템")
+    assert [hit.bid_pbanc_no for hit in hits] == ["R26BK00000001", "R26BK00000002"]
+    assert hits[0].sources == ("list",) and hits[1].sources == ("notice",)
+    assert hits[0].key.bid_pbanc_ord == "000"
+    assert [hit.bid_pbanc_no for hit in repo.search("공사")] == ["R26BK00000002"]
+    assert repo.search("유지 용역")[0].bid_pbanc_no == "R26BK00000001"
+    assert repo.search("없는단어") == []
+    repo.close()
+
+
+def test_attachments_resolve_owner_through_detail_group_key(tmp_path: Path) -> None:
+    search = NoticeSearch(str(tmp_path / "nuri.db"))
+    attachment = AttachmentItem(
+        unty_atch_file_no="F1",
+        atch_file_sqno=1,
+        atch_file_nm="a.hwp",
+        orgnl_atch_file_nm="과업지시서.hwp",
+        file_extn_nm="hwp",
+        file_sz=10,
+    )
+    assert search.index("attachments", [attachment]) == 0  # 상세를 보기 전에는 공고를 알 수 없다.
+    search.link_attachments([SimpleNamespace(unty_atch_file_no="F1", bid_pbanc_no="R26BK1", bid_pbanc_ord="001")])
+    assert search.index("attachments", [attachment]) == 1
+    assert search.index("attachments", [attachment]) == 1
+    assert search.count() == 1
+    assert [(hit.bid_pbanc_no, hit.sources) for hit in search.search("과업")] == [("R26BK1", ("attachments",))]
+    search.close()
+
+
+def test_search_shares_key_transaction_until_flush(tmp_path: Path) -> None:
+    storage = StorageConfig(view_mode="off", output_format="segments", search_enabled=True)
+    repo = NoticeRepository(str(tmp_path / "nuri.db"), storage)
+    repo.save_list_items([list_item("R26BK00000001").model_copy(update={"bid_pbanc_nm": "정보시스템 구축"})])
+    repo.save_list_items([list_item("R26BK00000002").model_copy(update={"bid_pbanc_nm": "정보시스템 감리"})])
+    assert len(repo.search("정보시스템")) == 2  # flush 전 두 번째 저장도 잠금에 걸리지 않는다.
+    repo.close()
+
+    reopened = NoticeRepository(str(tmp_path / "nuri.db"), storage)
+    assert len(reopened.search("정보시스템")) == 2
+    reopened.close()
+
+
+def test_amended_titles_are_reindexed_and_existing_data_backfilled(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    legacy = NoticeRepository(db_path, StorageConfig(view_mode="off"))  # 검색 색인 도입 전 수집.
+    legacy.save_list_items([list_item("R26BK00000001").model_copy(update={"bid_pbanc_nm": "청사 시설 공사"})])
+    legacy.close()
+
+    repo = NoticeRepository(db_path, StorageConfig(view_mode="off", search_enabled=True))
+    assert repo.search("청사") == []
+    amended = list_item("R26BK00000002").model_copy(update={"bid_pbanc_nm": "정보시스템 구축"})
+    repo.save_list_items([amended])
+    assert repo.save_list_items([amended.model_copy(update={"bid_pbanc_nm": "정보시스템 감리"})]) == 0
+    assert [hit.bid_pbanc_no for hit in repo.search("감리")] == ["R26BK00000002"]  # 같은 키라도 정정된 제목.
+    assert repo.search("구축") == []
+
+    assert repo.reindex_search() == 1  # 빠진 문서만 채운다.
+    assert [hit.bid_pbanc_no for hit in repo.search("청사")] == ["R26BK00000001"]
+    assert repo.search("구축") == []  # CSV의 최초 제목으로 되돌리지 않는다.
+    repo.close()
+
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.domain.models import BidNoticeListItem
+from src.infrastructure import key_index, segments
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.segments import SegmentSet, SegmentWriter, iter_table_rows
+from tests.helpers import list_item
+
+
+def test_segments_rotate_and_dedupe_across_runs(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    storage = StorageConfig(output_format="segments", segment_max_bytes=2000)
+    repo = NoticeRepository(db_path, storage)
+    for start in range(0, 40, 10):
+        repo.save_list_items([list_item(f"R26BK{index:08d}") for index in range(start, start + 10)])
+        repo.flush()
+    repo.close()
+
+    manifest = json.loads((tmp_path / "segments" / "list" / "manifest.json").read_text(encoding="utf-8"))
+    assert len(manifest["segments"]) > 1
+    assert sum(entry["rows"] for entry in manifest["segments"]) == 40
+    assert all(entry["closed"] for entry in manifest["segments"])
+    assert not (tmp_path / "list.csv").exists()
+
+    repo = NoticeRepository(db_path, storage)
+    assert repo.save_list_items([list_item(f"R26BK{index:08d}") for index in range(35, 45)]) == 5
+    repo.end_run()
+    repo.close()
+    rows = list(iter_table_rows(tmp_path / "list.csv"))
+    assert len(rows) == 45
+    assert (tmp_path / "view" / "list.csv").read_text(encoding="utf-8").count("\n") == 46
+
+
+def test_unclosed_segment_reads_up_to_last_flush(tmp_path: Path) -> None:
+    directory = tmp_path / "segments" / "list"
+    writer = SegmentWriter(directory, BidNoticeListItem)
+    writer.append([list_item("R26BK00000001"), list_item("R26BK00000002")])
+    writer.flush()
+    writer.append([list_item("R26BK00000003")])  # flush 전 중단을 가정한다.
+
+    rows = list(SegmentSet(directory).iter_rows())
+    assert [row["bid_pbanc_no"] for row in rows] == ["R26BK00000001", "R26BK00000002"]
+    assert [row["bid_pbanc_no"] for row in SegmentSet(directory).iter_rows(skip=1)] == ["R26BK00000002"]
+
+
+def test_fsync_flush_syncs_segment_manifest_and_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    synced: list[int] = []
+    real_fsync = segments.os.fsync
+    monkeypatch.setattr(segments.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    writer = SegmentWriter(tmp_path / "segments" / "list", BidNoticeListItem)
+    writer.append([list_item("R26BK00000001")])
+
+    writer.flush()
+    assert synced == []
+    writer.flush(fsync=True)
+    assert len(synced) == 3  # 세그먼트, 매니페스트 임시 파일, 디렉터리.
+    writer.close()
+
+
+def test_switching_to_segments_keeps_csv_keys(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_path = str(tmp_path / "nuri.db")
+    repo = NoticeRepository(db_path)
+    repo.save_list_items([list_item("R26BK00000001")])
+    repo.close()
+
+    repo = NoticeRepository(db_path, StorageConfig(output_format="segments"))
+    assert repo.save_list_items([list_item("R26BK00000001"), list_item("R26BK00000002")]) == 1
+    repo.end_run()
+    repo.close()
+    assert [row["bid_pbanc_no"] for row in iter_table_rows(tmp_path / "list.csv")] == [
+        "R26BK00000001",
+        "R26BK00000002",
+    ]
+    assert (tmp_path / "view" / "list.csv").read_text(encoding="utf-8").count("\n") == 3
+
+    with sqlite3.connect(db_path) as conn:
+        base, watermark = conn.execute("SELECT base, watermark FROM key_index_meta WHERE name = 'list'").fetchone()
+    assert (base, watermark) == ((tmp_path / "list.csv").stat().st_size, 1)  # CSV 바이트와 세그먼트 행 수를 따로.
+
+    offsets: list[Any] = []
+    read_keys = key_index._read_keys
+    monkeypatch.setattr(
+        key_index, "_read_keys", lambda path, keys, offset: offsets.append(offset) or read_keys(path, keys, offset)
+    )
+    repo = NoticeRepository(db_path, StorageConfig(output_format="segments"))
+    assert repo.save_list_items([list_item("R26BK00000002"), list_item("R26BK00000003")]) == 1
+    repo.close()
+    assert offsets == []  # 이미 반영한 전환 전 CSV는 다시 읽지 않는다.
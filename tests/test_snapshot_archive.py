@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.migrate_snapshots import migrate
+from src.infrastructure import snapshot
+from src.infrastructure.snapshot import PACK_DIR, SnapshotStore, iter_snapshots
+
+
+def _page(page: int) -> dict:
+    return {"result": [{"bidPbancNo": f"R26BK{page:08d}"}]}
+
+
+def test_packed_store_appends_and_iterates_in_order(tmp_path: Path) -> None:
+    store = SnapshotStore(str(tmp_path), "packed", max_pack_bytes=64)
+    for page in range(1, 4):
+        store.save("list_20260206", f"page_{page}", _page(page), {"unexpected_keys": []})
+    store.save("detail_20260207", "R26BK1/000", {})
+    store.close()
+
+    assert not list(tmp_path.glob("*.json"))
+    assert len(list((tmp_path / PACK_DIR).glob("*.pack"))) >= 2  # 크기 기준 교체.
+    listed = [(entry.kind, entry.date, entry.key) for entry, _ in iter_snapshots(str(tmp_path))]
+    assert listed == [
+        ("list", "20260206", "page_1"),
+        ("list", "20260206", "page_2"),
+        ("list", "20260206", "page_3"),
+        ("detail", "20260207", "R26BK1_000"),
+    ]
+    pages = [payload["body"]["result"][0]["bidPbancNo"] for _, payload in iter_snapshots(str(tmp_path), kind="list")]
+    assert pages == ["R26BK00000001", "R26BK00000002", "R26BK00000003"]
+
+    reopened = SnapshotStore(str(tmp_path), "packed")
+    reopened.save("list_20260206", "page_4", _page(4))
+    reopened.close()
+    assert len(list(iter_snapshots(str(tmp_path), kind="list", date="20260206"))) == 4
+
+
+def test_migration_moves_files_into_packs_idempotently(tmp_path: Path) -> None:
+    for page in (1, 2):
+        payload = {"meta": {"timestamp": f"t{page}"}, "body": _page(1)}  # 같은 본문을 두 번 저장한 이전 형식.
+        (tmp_path / f"list_20260206_page_{page}.json").write_text(json.dumps(payload), encoding="utf-8")
+    (tmp_path / "opening_20260206_R26BK1_000.json").write_text("{}", encoding="utf-8")
+
+    assert migrate(tmp_path) == {"files": 3, "migrated": 3, "skipped": 0, "blobs": 2, "deduplicated": 1}
+    assert migrate(tmp_path, delete=True)["skipped"] == 3
+    assert not list(tmp_path.glob("*.json"))
+    entries = [(entry.kind, entry.key, payload["meta"]) for entry, payload in iter_snapshots(str(tmp_path))]
+    assert entries == [
+        ("list", "page_1", {"timestamp": "t1"}),
+        ("list", "page_2", {"timestamp": "t2"}),
+        ("opening", "R26BK1_000", {}),
+    ]
+
+
+def test_identical_bodies_are_stored_once(tmp_path: Path) -> None:
+    store = SnapshotStore(str(tmp_path), "packed")
+    body = {"result": [{"b": 1, "a": 2}]}
+    store.save("list_20260206", "page_1", body, {"timestamp": "run1"})
+    size = sum(path.stat().st_size for path in (tmp_path / PACK_DIR).glob("*.pack"))
+    store.save("list_20260206", "page_1", {"result": [{"a": 2, "b": 1}]}, {"timestamp": "run2"})  # 키 순서만 다름.
+    store.save("list_20260207", "page_1", body, {"timestamp": "run3"})  # 날짜가 바뀌어도 같은 blob.
+    store.close()
+    reopened = SnapshotStore(str(tmp_path), "packed")
+    reopened.save("list_20260208", "page_1", body, {"timestamp": "run4"})  # 재시작 후에도 해시를 이어받는다.
+    reopened.close()
+
+    assert sum(path.stat().st_size for path in (tmp_path / PACK_DIR).glob("*.pack")) == size
+    snapshots = list(iter_snapshots(str(tmp_path), kind="list"))
+    assert [payload["meta"]["timestamp"] for _, payload in snapshots] == ["run1", "run2", "run3", "run4"]
+    assert all(payload["body"] == body for _, payload in snapshots)
+    assert len({entry.digest for entry, _ in snapshots}) == 1
+
+
+def test_blob_table_is_persisted_and_only_catches_up_with_new_index_lines(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = SnapshotStore(str(tmp_path), "packed")
+    for page in range(1, 4):
+        store.save("list_20260206", f"page_{page}", _page(page))
+    store.close()
+    packs = tmp_path / PACK_DIR
+    assert (packs / "blobs.db").exists()
+    size = sum(path.stat().st_size for path in packs.glob("*.pack"))
+
+    tails: list[int] = []
+    read_tail = snapshot._index_tail
+    monkeypatch.setattr(snapshot, "_index_tail", lambda path, start: tails.append(start) or read_tail(path, start))
+    reopened = SnapshotStore(str(tmp_path), "packed")
+    reopened.save("list_20260207", "page_1", _page(2))  # 인덱스를 다시 훑지 않고 표에서 해시를 찾는다.
+    reopened.close()
+    assert tails == []
+    assert sum(path.stat().st_size for path in packs.glob("*.pack")) == size
+
+    (packs / "blobs.db").unlink()  # 표가 없던 이전 보관소: 처음 한 번 인덱스에서 만든다.
+    rebuilt = SnapshotStore(str(tmp_path), "packed")
+    rebuilt.save("list_20260208", "page_1", _page(3))
+    rebuilt.close()
+    assert tails == [0, 0]  # 인덱스 파일 두 개를 처음부터.
+    assert sum(path.stat().st_size for path in packs.glob("*.pack")) == size
+    assert len(list(iter_snapshots(str(tmp_path), kind="list"))) == 5
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+
+from src.core.config import StorageConfig
+from src.domain.models import NoceItem
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.stream import NdjsonSink
+from tests.helpers import list_item
+
+
+def _wait(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_repository_streams_new_records_to_unix_socket(tmp_path: Path) -> None:
+    sock_path = tmp_path / "sink.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    server.listen(1)
+    received: list[bytes] = []
+
+    def _consume() -> None:
+        conn, _ = server.accept()
+        with conn:
+            while chunk := conn.recv(65536):
+                received.append(chunk)
+
+    consumer = threading.Thread(target=_consume, daemon=True)
+    consumer.start()
+    repo = NoticeRepository(
+        str(tmp_path / "nuri.db"), StorageConfig(view_mode="off", stream_target=f"unix:{sock_path}")
+    )
+    repo.save_list_items([list_item("R26BK00000001"), list_item("R26BK00000002")])
+    repo.save_list_items([list_item("R26BK00000001")])  # 이미 저장한 공고는 다시 내보내지 않는다.
+    repo.save_noce_items([NoceItem(pst_no="1", bbs_no="9", pst_nm="변경")], [("R26BK00000002", "000")])
+    _wait(lambda: b"".join(received).count(b"\n") == 3)  # 종료 전에 바로 도착해야 한다.
+    repo.close()
+    consumer.join(5)
+    server.close()
+
+    records = [json.loads(line) for line in b"".join(received).splitlines()]
+    assert [(r["type"], r["key"]["bid_pbanc_no"]) for r in records] == [
+        ("list", "R26BK00000001"),
+        ("list", "R26BK00000002"),
+        ("notice", "R26BK00000002"),
+    ]
+    assert records[2]["key"]["bid_pbanc_ord"] == "000" and records[2]["data"]["pst_nm"] == "변경"
+
+
+class _SlowStream(io.BytesIO):
+    def __init__(self, gate: threading.Event) -> None:
+        super().__init__()
+        self._gate = gate
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._gate.wait()
+        return super().write(data)
+
+    def close(self) -> None:
+        pass
+
+
+def test_slow_consumer_spills_in_order_without_blocking(tmp_path: Path) -> None:
+    gate = threading.Event()
+    stream = _SlowStream(gate)
+    spill = tmp_path / "spill.jsonl"
+    sink = NdjsonSink("stdout", buffer_records=2, overflow="spill", spill_path=str(spill), opener=lambda: stream)
+    items = [list_item(f"R26BK{index:08d}") for index in range(50)]
+    started = time.monotonic()
+    sink.emit("list", items)
+    assert time.monotonic() - started < 1.0  # 소비자가 멈춰 있어도 수집 쪽은 대기하지 않는다.
+    assert sink.spilled > 0 and spill.exists()
+    gate.set()
+    _wait(lambda: sink.emitted == 50)
+    sink.close()
+    keys = [json.loads(line)["key"]["bid_pbanc_no"] for line in stream.getvalue().splitlines()]
+    assert keys == [item.bid_pbanc_no for item in items]
+    assert not spill.exists()
+
+
+def test_drop_policy_counts_overflow() -> None:
+    gate = threading.Event()
+    sink = NdjsonSink("stdout", buffer_records=1, overflow="drop", opener=lambda: _SlowStream(gate))
+    sink.emit("list", [list_item(f"R26BK{index:08d}") for index in range(20)])
+    assert sink.dropped > 0
+    gate.set()
+    sink.close()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import urllib.error
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.infrastructure.checkpoint import CheckpointStore
+from src.infrastructure.parser import NoticeParser
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.resilience import ResiliencePolicy
+from src.infrastructure.timeouts import AdaptiveTimeouts, is_timeout
+from src.service.crawler_service import CrawlerService
+from tests.helpers import FakeResponse, api_row, make_config
+
+
+def test_timeout_follows_quantile_within_floor_and_ceiling(tmp_path: Path) -> None:
+    timeouts = AdaptiveTimeouts(str(tmp_path / "latency.json"), floor_ms=500, ceiling_ms=4000, min_samples=10)
+    assert timeouts.timeout_ms("detail") is None  # 표본이 모자라면 기본 타임아웃.
+
+    for _ in range(10):
+        timeouts.observe("detail", 0.4)
+        timeouts.observe("attachment", 0.01)
+        timeouts.observe("list", 3.0)
+
+    assert timeouts.timeout_ms("detail") == 1200  # p99 0.4초 × 3
+    assert timeouts.timeout_ms("attachment") == 500  # 하한
+    assert timeouts.timeout_ms("list") == 4000  # 상한
+
+
+def test_samples_survive_restart(tmp_path: Path) -> None:
+    path = tmp_path / "state" / "latency.json"
+    first = AdaptiveTimeouts(str(path), floor_ms=100, ceiling_ms=10000, min_samples=5)
+    for latency in (0.2, 0.3, 0.25, 0.5, 0.2):
+        first.observe("opening", latency)
+    first.save()
+
+    second = AdaptiveTimeouts(str(path), floor_ms=100, ceiling_ms=10000, min_samples=5)
+    assert second.timeout_ms("opening") == first.timeout_ms("opening") == 1500
+
+    path.write_text("{broken", encoding="utf-8")
+    assert AdaptiveTimeouts(str(path), floor_ms=100, ceiling_ms=10000).snapshot() == {}
+
+
+class _TimedApi:
+    def __init__(self) -> None:
+        self.timeouts: list[tuple[str, Optional[float]]] = []
+
+    @property
+    def request(self) -> "_TimedApi":
+        return self
+
+    def post(self, url: str, data: str, headers: Any = None, timeout: Optional[float] = None) -> FakeResponse:
+        endpoint = url.rsplit("/", 1)[-1]
+        self.timeouts.append((endpoint, timeout))
+        if endpoint == "list-api":
+            return FakeResponse({"ErrorCode": 0, "result": [api_row(1), api_row(2), api_row(3)]})
+        return FakeResponse({"ErrorCode": 0, "result": {"bidPbancMap": {"picIdNm": "담당"}}})
+
+
+def test_service_sends_per_endpoint_timeouts_and_persists_samples(tmp_path: Path) -> None:
+    config = make_config()
+    config.adaptive_timeout_path = str(tmp_path / "latency.json")
+    timeouts = AdaptiveTimeouts(config.adaptive_timeout_path, floor_ms=800, ceiling_ms=5000, min_samples=1)
+    policy = ResiliencePolicy(1, 0.0, 0.0, timeouts=timeouts)
+    repo = NoticeRepository(str(tmp_path / "db.sqlite3"), StorageConfig(output_dir=str(tmp_path / "out")))
+    service = CrawlerService(
+        config, repo, NoticeParser(config.selectors), CheckpointStore(str(tmp_path / "cp.json")), policy
+    )
+    api = _TimedApi()
+
+    service.run(api, 1)
+
+    assert api.timeouts == [("list-api", None), ("detail", None), ("detail", 800), ("detail", 800)]
+    saved = json.loads((tmp_path / "latency.json").read_text(encoding="utf-8"))
+    assert sorted(saved["endpoints"]) == ["detail", "list"]
+    assert len(saved["endpoints"]["detail"]) == 3
+    assert policy.report()["timeouts_ms"] == {"detail": 800, "list": 800}
+
+
+class _SlowApi:  # 엔드포인트가 1초로 느려졌다. 그보다 짧은 타임아웃은 잘린다.
+    def __init__(self) -> None:
+        self.timeouts: list[Optional[float]] = []
+
+    @property
+    def request(self) -> "_SlowApi":
+        return self
+
+    def post(self, url: str, data: str, headers: Any = None, timeout: Optional[float] = None) -> FakeResponse:
+        self.timeouts.append(timeout)
+        if timeout is not None and timeout < 1000:
+            raise TimeoutError(f"Timeout {timeout}ms exceeded.")
+        return FakeResponse({"ErrorCode": 0})
+
+
+def test_timeouts_grow_when_endpoint_slows_down(tmp_path: Path) -> None:
+    config = make_config()
+    timeouts = AdaptiveTimeouts(str(tmp_path / "latency.json"), floor_ms=100, ceiling_ms=10000, min_samples=10)
+    for _ in range(10):
+        timeouts.observe("detail", 0.1)
+    service = CrawlerService(
+        config,
+        NoticeRepository(str(tmp_path / "db.sqlite3"), StorageConfig(output_dir=str(tmp_path / "out"))),
+        NoticeParser(config.selectors),
+        CheckpointStore(str(tmp_path / "cp.json")),
+        ResiliencePolicy(1, 0.0, 0.0, timeouts=timeouts),
+    )
+    api = _SlowApi()
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            service._post("detail", api, "https://example.com/detail", "{}", {})
+    service._post("detail", api, "https://example.com/detail", "{}", {})
+
+    assert api.timeouts == [300, 900, 2700]  # 잘린 호출을 타임아웃 값으로 기록해 p99 × 3씩 늘어난다.
+    timeouts.save()
+    assert AdaptiveTimeouts(str(tmp_path / "latency.json"), 100, 10000, min_samples=10).timeout_ms("detail") == 2700
+
+
+class _PlaywrightTimeout(Exception):  # Playwright `TimeoutError`는 내장 TimeoutError를 상속하지 않는다.
+    pass
+
+
+_PlaywrightTimeout.__name__ = "TimeoutError"
+
+
+def test_is_timeout_covers_urllib_and_playwright_errors() -> None:
+    assert is_timeout(TimeoutError("timed out"))
+    assert is_timeout(urllib.error.URLError(TimeoutError("timed out")))
+    assert is_timeout(_PlaywrightTimeout("Timeout 300ms exceeded."))
+    assert not is_timeout(urllib.error.URLError(ConnectionRefusedError()))
+    assert not is_timeout(ConnectionResetError())
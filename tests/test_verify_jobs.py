@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, cast
+
+from scripts.verify_live_filters import FilterCombo, response_ok, run_browser_jobs, run_jobs
+from src.core.config import AppConfig, StorageConfig
+from src.infrastructure.browser import BrowserPool
+from src.infrastructure.transport import SharedTransport, TransportResponse
+from tests.helpers import api_row, make_config
+
+
+class _FakeApi:  # 목록은 조합마다 같은 공고를 돌려주고, 상세 호출 수를 센다.
+    def __init__(self) -> None:
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def post(self, url: str, data: Any = None, headers: Any = None) -> TransportResponse:
+        with self._lock:
+            self.calls[url] += 1
+        time.sleep(0.02)  # 다른 작업이 같은 요청을 기다리게 만든다.
+        if url.endswith("list-api"):
+            rows = [api_row(1, "A &foo; B"), api_row(2)]
+            return TransportResponse(200, json.dumps({"ErrorCode": 0, "result": rows}).encode("utf-8"))
+        key = json.loads(data)["dlSrchCndtM"]["bidPbancNo"]
+        body = {"ErrorCode": 0, "result": {"bidPbancMap": {"bidPbancNo": key, "picIdNm": "담당"}}}
+        return TransportResponse(200, json.dumps(body).encode("utf-8"))
+
+
+def test_concurrent_combos_share_requests_and_scan_inline(tmp_path: Path) -> None:
+    api = _FakeApi()
+    transport = SharedTransport(api, response_ok)
+    storage = StorageConfig(view_mode="off")
+    config = AppConfig(crawl=make_config(), sqlite_path="unused.db", log_level="INFO", storage=storage)
+    combos = [FilterCombo(None, "공400001", None), FilterCombo("공440002", None, None)]
+
+    results = run_jobs(config, combos, tmp_path, transport, max_pages=1, jobs=2)
+
+    assert api.calls["https://example.com/list-api"] == 2  # 조건이 달라 목록은 조합마다 보낸다.
+    assert api.calls["https://example.com/detail"] == 2  # 두 조합에 모두 나온 공고 상세는 한 번만.
+    assert transport.stats() == {"sent": 4, "shared": 2}
+    for result, combo in zip(results, combos):
+        assert result["combo"] == combo.label()
+        assert result["entity_hits"] == {"list.csv": 1, "detail.csv": 1}
+        assert len((tmp_path / combo.label() / "list.csv").read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_failed_responses_are_not_reused() -> None:
+    class _Flaky:
+        calls = 0
+
+        def post(self, url: str, data: Any = None, headers: Any = None) -> TransportResponse:
+            self.calls += 1
+            code = 500 if self.calls == 1 else 0
+            return TransportResponse(200, json.dumps({"ErrorCode": code}).encode("utf-8"))
+
+    inner = _Flaky()
+    transport = SharedTransport(inner, response_ok)
+    assert transport.post("u", data="x").json()["ErrorCode"] == 500
+    assert transport.post("u", data="x").json()["ErrorCode"] == 0  # 재시도는 다시 보낸다.
+    assert transport.post("u", data="x").json()["ErrorCode"] == 0
+    assert inner.calls == 2
+
+
+class _FakePool:  # 슬롯마다 스레드와 페이지(전송 계층)를 따로 둔다.
+    def __init__(self, size: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=size)
+        self._pages: dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[[Any], Any]) -> Future:
+        return self._executor.submit(lambda: fn(self._page()))
+
+    def apis(self) -> list[_FakeApi]:
+        return [page.request for page in self._pages.values()]
+
+    def _page(self) -> Any:
+        with self._lock:
+            page = self._pages.get(threading.get_ident())
+            if page is None:
+                page = self._pages[threading.get_ident()] = type("_Page", (), {"request": _FakeApi()})()
+            return page
+
+
+def test_browser_slots_share_in_flight_requests_across_slots(tmp_path: Path) -> None:
+    pool = _FakePool(2)
+    storage = StorageConfig(view_mode="off")
+    config = AppConfig(crawl=make_config(), sqlite_path="unused.db", log_level="INFO", storage=storage)
+    combos = [FilterCombo(None, "공400001", None), FilterCombo("공440002", None, None)]
+
+    results, requests = run_browser_jobs(config, combos, tmp_path, cast(BrowserPool, pool), max_pages=1)
+
+    calls = sum((api.calls for api in pool.apis()), Counter())
+    assert len(pool.apis()) == 2  # 조합마다 다른 슬롯의 페이지로 보냈다.
+    assert calls["https://example.com/detail"] == 2  # 슬롯이 달라도 같은 공고 상세는 한 번만.
+    assert requests == {"sent": 4, "shared": 2}
+    assert [result["entity_hits"] for result in results] == [{"list.csv": 1, "detail.csv": 1}] * 2
+
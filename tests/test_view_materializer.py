@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.infrastructure import view
+from src.infrastructure.repository import NoticeRepository
+from src.infrastructure.view import LIST_VIEW_COLUMNS, ViewMaterializer
+from tests.helpers import list_item
+
+
+def _read_rows(path: Path) -> list[dict[str, str]]:
+    with path.open(newline="", encoding="utf-8") as fp:
+        return list(csv.DictReader(fp))
+
+
+def test_views_are_materialized_at_end_of_run(tmp_path: Path) -> None:
+    repo = NoticeRepository(str(tmp_path / "nuri.db"))
+    repo.save_list_items([list_item("R26BK00000001")])
+    assert not (tmp_path / "view" / "list.csv").exists()  # 저장 경로에서는 표시용 파일을 쓰지 않는다.
+
+    repo.end_run()
+    repo.save_list_items([list_item("R26BK00000002")])
+    repo.end_run()
+    repo.close()
+
+    rows = _read_rows(tmp_path / "view" / "list.csv")
+    assert [row["bid_pbanc_num"] for row in rows] == ["R26BK00000001000", "R26BK00000002000"]
+    assert list(rows[0].keys()) == LIST_VIEW_COLUMNS
+
+
+def test_materializer_skips_incomplete_trailing_record(tmp_path: Path) -> None:
+    source = tmp_path / "notice.csv"
+    source.write_bytes(
+        'pst_no,bbs_no,pst_nm,bulk_pst_cn\r\n1,B,제목,"첫 줄\r\n둘째 줄"\r\n2,B,제목,"기록 중\r\n'.encode("utf-8")
+    )
+    materializer = ViewMaterializer(tmp_path)
+    assert materializer.materialize(["notice.csv"]) == {"notice.csv": 1}
+
+    with source.open("ab") as fp:
+        fp.write('끝"\r\n'.encode("utf-8"))
+    assert materializer.materialize(["notice.csv"]) == {"notice.csv": 1}
+    rows = _read_rows(tmp_path / "view" / "notice.csv")
+    assert [row["bulk_pst_cn"] for row in rows] == ["첫 줄\r\n둘째 줄", "기록 중\r\n끝"]
+
+
+def test_materializer_streams_source_in_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(view, "_READ_BYTES", 7)  # 레코드보다 작은 블록으로 읽어도 행이 잘리지 않는다.
+    source = tmp_path / "notice.csv"
+    source.write_bytes('pst_no,pst_nm\r\n1,"첫 줄\r\n둘째 줄"\r\n2,두 번째\r\n3,기록'.encode("utf-8"))
+
+    assert ViewMaterializer(tmp_path).materialize(["notice.csv"]) == {"notice.csv": 2}
+    assert [row["pst_nm"] for row in _read_rows(tmp_path / "view" / "notice.csv")] == ["첫 줄\r\n둘째 줄", "두 번째"]
+
+
+def test_inline_and_deferred_views_share_columns_and_close_does_not_materialize(tmp_path: Path) -> None:
+    inline = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="inline"))
+    inline.save_list_items([list_item("R26BK00000001")])
+    inline.close()
+
+    deferred = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="deferred"))
+    deferred.save_list_items([list_item("R26BK00000002")])
+    deferred.close()  # 조회/검색처럼 닫기만 하면 표시용 CSV를 건드리지 않는다.
+    assert [row["bid_pbanc_num"] for row in _read_rows(tmp_path / "view" / "list.csv")] == ["R26BK00000001000"]
+
+    reopened = NoticeRepository(str(tmp_path / "nuri.db"), StorageConfig(view_mode="deferred"))
+    reopened.end_run()
+    reopened.close()
+    rows = _read_rows(tmp_path / "view" / "list.csv")
+    assert list(rows[0].keys()) == LIST_VIEW_COLUMNS  # inline 모드도 deferred 모드와 같은 컬럼을 쓴다.
+    assert [row["bid_pbanc_num"] for row in rows] == ["R26BK00000001000", "R26BK00000002000"]
+
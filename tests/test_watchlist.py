@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from src.infrastructure.watchlist import KeywordAutomaton, Watchlist
+from tests.helpers import list_item
+
+
+def test_automaton_finds_overlapping_terms() -> None:
+    automaton = KeywordAutomaton(["he", "she", "his", "hers", "시스템", "정보시스템", "SW"])
+    assert automaton.find("ushers") == {"he", "she", "hers"}
+    assert automaton.find("정보시스템 sw 구축") == {"시스템", "정보시스템", "sw"}
+    assert automaton.find("무관한 공고") == set()
+
+
+def test_watchlist_emits_new_matches_and_reloads_on_change(tmp_path: Path) -> None:
+    terms = tmp_path / "watchlist.txt"
+    terms.write_text("# 감시어\n유지관리\ngrp_nm:조달청\n", encoding="utf-8")
+    output = tmp_path / "matches.jsonl"
+    items = [
+        list_item("R26BK00000001").model_copy(update={"bid_pbanc_nm": "정보시스템 유지관리 용역"}),
+        list_item("R26BK00000002").model_copy(update={"bid_pbanc_nm": "조달청 청사 공사", "grp_nm": "서울시"}),
+        list_item("R26BK00000003").model_copy(update={"grp_nm": "조달청"}),
+    ]
+    watchlist = Watchlist(str(terms), str(output))
+
+    matches = watchlist.scan(items)
+    assert [(m["bid_pbanc_no"], m["fields"]) for m in matches] == [
+        ("R26BK00000001", {"bid_pbanc_nm": ["유지관리"]}),
+        ("R26BK00000003", {"grp_nm": ["조달청"]}),
+    ]
+    assert watchlist.scan(items) == []  # 이미 기록한 공고/감시어는 다시 남기지 않는다.
+
+    terms.write_text("유지관리\n용역\n", encoding="utf-8")
+    stat = terms.stat()
+    os.utime(terms, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert [m["terms"] for m in watchlist.scan(items)] == [["용역", "유지관리"]]
+
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 3
+    assert Watchlist(str(terms), str(output)).scan(items) == []  # 재시작해도 기록을 이어받는다.